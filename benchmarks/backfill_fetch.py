@@ -0,0 +1,125 @@
+"""
+Backfill fetch benchmark: LIMIT paging vs. server-side streaming cursor.
+
+Runs each mode in a fresh subprocess (peak RSS is per-process and only ever
+grows) against the database configured by the EXECALC_DB_* variables, and
+reports records/sec and peak RSS.
+
+    python -m benchmarks.backfill_fetch --limit 20000 --batch-size 50 --itersize 500
+    python -m benchmarks.backfill_fetch --fetch-only
+
+--fetch-only times record retrieval alone; otherwise each mode runs a full
+dry-run backfill (extraction included, no writes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Optional
+
+_MODES = ("paged", "stream")
+
+
+def _run_mode(
+    mode: str,
+    *,
+    tenant_id: Optional[str],
+    batch_size: int,
+    itersize: int,
+    limit: Optional[int],
+    fetch_only: bool,
+) -> Dict[str, Any]:
+    from src.service.db.postgres import connection
+    from src.service.gaqp import backfill
+
+    started = time.monotonic()
+    if fetch_only:
+        records = 0
+        with connection() as conn:
+            if mode == "stream":
+                it = backfill._stream_records(
+                    conn=conn, after_record_id=0, tenant_id=tenant_id, itersize=itersize,
+                )
+            else:
+                it = backfill._paged_records(
+                    conn=conn, after_record_id=0, tenant_id=tenant_id, batch_size=batch_size,
+                )
+            for _ in it:
+                records += 1
+                if limit is not None and records >= limit:
+                    break
+    else:
+        summary = backfill.run_backfill(
+            tenant_id=tenant_id,
+            batch_size=batch_size,
+            dry_run=True,
+            limit=limit,
+            stream=(mode == "stream"),
+            itersize=itersize,
+        )
+        records = summary.records_read
+    elapsed = time.monotonic() - started
+
+    return {
+        "mode": mode,
+        "records": records,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_sec": round(records / elapsed, 1) if elapsed > 0 else 0.0,
+        # ru_maxrss is KiB on Linux.
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Compare backfill paging vs. streaming fetch.")
+    p.add_argument("--tenant-id", default=None)
+    p.add_argument("--batch-size", type=int, default=50, help="Page size for paged mode.")
+    p.add_argument("--itersize", type=int, default=500, help="Rows per round trip for stream mode.")
+    p.add_argument("--limit", type=int, default=None, help="Max records per mode.")
+    p.add_argument("--fetch-only", action="store_true", help="Time retrieval only, skip extraction.")
+    p.add_argument("--mode", choices=_MODES, default=None, help=argparse.SUPPRESS)
+    return p
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = _build_arg_parser().parse_args(argv)
+    opts = dict(
+        tenant_id=args.tenant_id,
+        batch_size=args.batch_size,
+        itersize=args.itersize,
+        limit=args.limit,
+        fetch_only=args.fetch_only,
+    )
+
+    if args.mode:
+        # Child process: one mode, one JSON line on stdout.
+        print(json.dumps(_run_mode(args.mode, **opts)))
+        return 0
+
+    passthrough = list(argv if argv is not None else sys.argv[1:])
+    results = []
+    for mode in _MODES:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.backfill_fetch", *passthrough, "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f"{'mode':<8} {'records':>10} {'seconds':>10} {'rec/s':>10} {'peak RSS MB':>12}")
+    for r in results:
+        print(
+            f"{r['mode']:<8} {r['records']:>10} {r['elapsed_seconds']:>10.2f} "
+            f"{r['records_per_sec']:>10.1f} {r['peak_rss_mb']:>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Minimal benchmark harness: timing, allocation accounting, baseline comparison.
+
+Timing and allocation passes run separately — tracemalloc slows every
+allocation, so it never runs while latencies are being recorded.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchResult:
+    name: str
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    peak_alloc_bytes: float        # per-call high-water mark of traced allocations
+    retained_bytes_per_op: float   # net growth left behind per call
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float   # fractional, +0.25 = 25% worse
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    *,
+    iterations: int,
+    warmup: int = 10,
+    alloc_iterations: Optional[int] = None,
+) -> BenchResult:
+    """Run fn repeatedly and summarise latency and allocations per call."""
+    for _ in range(warmup):
+        fn()
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples: List[float] = []
+        perf = time.perf_counter
+        started = perf()
+        for _ in range(iterations):
+            t0 = perf()
+            fn()
+            samples.append(perf() - t0)
+        total = perf() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    alloc_iterations = alloc_iterations or max(1, min(iterations, 50))
+    tracemalloc.start()
+    try:
+        peaks = 0
+        start_current, _ = tracemalloc.get_traced_memory()
+        for _ in range(alloc_iterations):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks += peak - current
+        end_current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return BenchResult(
+        name=name,
+        iterations=iterations,
+        ops_per_sec=round(iterations / total, 1) if total > 0 else 0.0,
+        mean_us=round(total / iterations * 1e6, 2),
+        p50_us=round(_percentile(samples, 50) * 1e6, 2),
+        p99_us=round(_percentile(samples, 99) * 1e6, 2),
+        peak_alloc_bytes=round(peaks / alloc_iterations, 1),
+        retained_bytes_per_op=round(max(0, end_current - start_current) / alloc_iterations, 1),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+# metric -> True if larger is worse
+_COMPARED_METRICS = {
+    "p50_us": True,
+    "p99_us": True,
+    "ops_per_sec": False,
+    "peak_alloc_bytes": True,
+}
+
+
+def compare(
+    results: List[BenchResult],
+    baseline: Dict[str, Dict[str, Any]],
+    *,
+    threshold: float,
+) -> List[Regression]:
+    """
+    Return every metric that got worse than baseline by more than threshold
+    (a fraction: 0.15 = 15%). Benchmarks missing from the baseline are skipped.
+    """
+    regressions: List[Regression] = []
+    for r in results:
+        base = baseline.get(r.name)
+        if not base:
+            continue
+        current = r.to_dict()
+        for metric, larger_is_worse in _COMPARED_METRICS.items():
+            old = float(base.get(metric) or 0.0)
+            new = float(current[metric])
+            if old <= 0:
+                continue
+            change = (new - old) / old if larger_is_worse else (old - new) / old
+            if change > threshold:
+                regressions.append(Regression(
+                    name=r.name, metric=metric, baseline=old, current=new, change=round(change, 3),
+                ))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {r["name"]: r for r in data.get("results", [])}
+
+
+def write_results(path: str, results: List[BenchResult], meta: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": [r.to_dict() for r in results]}, f, indent=2)
+        f.write("\n")
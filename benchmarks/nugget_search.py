@@ -0,0 +1,194 @@
+"""
+QCR nugget search benchmark: full-text (infra/migrations/008) vs. ILIKE.
+
+Seeds one tenant with --nuggets synthetic nuggets (1M by default) in the
+database configured by EXECALC_DB_*, then times search_claims_page for a
+spread of query selectivities — first page and a deep keyset page — against
+the per-word ILIKE scan it replaced.
+
+    python -m benchmarks.nugget_search --seed                 # seed 1M, then run
+    python -m benchmarks.nugget_search --iterations 50        # reuse seeded rows
+    python -m benchmarks.nugget_search --skip-legacy --output search.json
+    python -m benchmarks.nugget_search --cleanup
+
+Rows are generated server-side with generate_series. Claim text is one of
+the synthetic sentences plus three tokens drawn from a skewed vocabulary
+(term0000 is in most rows, term1999 in a handful), so the queries below
+span roughly 10^5 down to 10^1 matching rows per tenant.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks import synthetic
+from benchmarks.harness import BenchResult, measure, write_results
+
+TENANT_ID = "bench-search-tenant"
+EVENT_ID = "bench-search-event"
+
+_VOCABULARY = [f"term{i:04d}" for i in range(2000)]
+_SEED_CHUNK = 100_000
+_DEEP_PAGE = 5
+
+# (case name, query)
+_QUERIES = [
+    ("common_word", "liquidity"),
+    ("medium_token", "term0200"),
+    ("rare_token", "term1900"),
+    ("two_words", "liquidity term0040"),
+    ("phrase", '"pricing power"'),
+]
+
+_SEED_SQL = """
+INSERT INTO qcr_atomic_nuggets
+    (nugget_id, tenant_id, session_id, source_event_id, claim_text, claim_type, domain,
+     confidence_level, confidence_score, provenance_source, activation_scope,
+     polarity, durability_class, evidence_status, freshness_class,
+     selection_method, generation_depth, created_at)
+SELECT
+    'bench-search-' || i, %(tenant_id)s, 'bench-session-' || (i %% 500), %(event_id)s,
+    v.sentences[1 + i %% cardinality(v.sentences)]
+        || ' ' || v.words[1 + floor(power(random(), 3) * cardinality(v.words))::int]
+        || ' ' || v.words[1 + floor(power(random(), 3) * cardinality(v.words))::int]
+        || ' ' || v.words[1 + floor(power(random(), 3) * cardinality(v.words))::int],
+    v.types[1 + i %% cardinality(v.types)], 'strategy',
+    'seed', round(random()::numeric, 2)::float, 'benchmark', 'tenant_specific',
+    'neutral', 'enduring', 'argued', 'timeless',
+    'machine_extracted', 1, NOW() - make_interval(secs => i)
+FROM generate_series(%(start)s, %(end)s) AS i,
+     (SELECT %(sentences)s::text[] AS sentences, %(words)s::text[] AS words, %(types)s::text[] AS types) v
+ON CONFLICT (nugget_id) DO NOTHING
+"""
+
+
+def _seed(n: int) -> None:
+    from src.service.db.postgres import connection, upsert_tenant
+
+    upsert_tenant(tenant_id=TENANT_ID, tenant_name=TENANT_ID)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_conversation_events
+                (event_id, tenant_id, session_id, user_id, role, message_text)
+            VALUES (%s, %s, 'bench-session-0', 'bench', 'operator', 'benchmark seed')
+            ON CONFLICT (event_id) DO NOTHING
+            """,
+            (EVENT_ID, TENANT_ID),
+        )
+    started = time.monotonic()
+    for start in range(0, n, _SEED_CHUNK):
+        end = min(start + _SEED_CHUNK, n) - 1
+        with connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT setseed(%s)", (start / n,))
+            cur.execute(_SEED_SQL, {
+                "tenant_id": TENANT_ID,
+                "event_id": EVENT_ID,
+                "start": start,
+                "end": end,
+                "sentences": synthetic._SENTENCES,
+                "words": _VOCABULARY,
+                "types": synthetic._CLAIM_TYPES,
+            })
+        print(f"seeded {end + 1:,}/{n:,} ({time.monotonic() - started:.0f}s)", flush=True)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute("ANALYZE qcr_atomic_nuggets")
+
+
+def _cleanup() -> None:
+    from src.service.db.postgres import connection
+
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM qcr_atomic_nuggets WHERE tenant_id = %s", (TENANT_ID,))
+        cur.execute("DELETE FROM qcr_session_summaries WHERE tenant_id = %s", (TENANT_ID,))
+        cur.execute("DELETE FROM qcr_conversation_events WHERE tenant_id = %s", (TENANT_ID,))
+
+
+def _legacy_ilike_search(query: str, limit: int) -> List[Any]:
+    """The search_nuggets query before migration 008: one ILIKE per word."""
+    from src.service.db.postgres import connection
+
+    words = query.replace('"', "").split()
+    sql = (
+        "SELECT nugget_id, claim_text, confidence_score FROM qcr_atomic_nuggets WHERE tenant_id = %s"
+        + " AND claim_text ILIKE %s" * len(words)
+        + " ORDER BY confidence_score DESC, created_at DESC LIMIT %s"
+    )
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, [TENANT_ID, *(f"%{w}%" for w in words), limit])
+        return cur.fetchall()
+
+
+def _deep_cursor(query: str, limit: int) -> Optional[str]:
+    """Walk to page _DEEP_PAGE once, so the timed call is a single keyset hop."""
+    from src.service.qualitative_capture.retrieval import search_claims_page
+
+    cursor = None
+    for _ in range(_DEEP_PAGE - 1):
+        page = search_claims_page(tenant_id=TENANT_ID, query=query, cursor=cursor, limit=limit)
+        if page.next_cursor is None:
+            return None
+        cursor = page.next_cursor
+    return cursor
+
+
+def run(*, iterations: int, limit: int, skip_legacy: bool) -> List[BenchResult]:
+    from src.service.qualitative_capture.retrieval import search_claims_page
+
+    results: List[BenchResult] = []
+    for name, query in _QUERIES:
+        ops: Dict[str, Callable[[], Any]] = {
+            f"fts_{name}": lambda q=query: search_claims_page(tenant_id=TENANT_ID, query=q, limit=limit),
+        }
+        cursor = _deep_cursor(query, limit)
+        if cursor is not None:
+            ops[f"fts_{name}_page{_DEEP_PAGE}"] = lambda q=query, c=cursor: search_claims_page(
+                tenant_id=TENANT_ID, query=q, cursor=c, limit=limit,
+            )
+        if not skip_legacy:
+            ops[f"ilike_{name}"] = lambda q=query: _legacy_ilike_search(q, limit)
+        for op_name, op in ops.items():
+            results.append(measure(op_name, op, iterations=iterations, warmup=2, alloc_iterations=3))
+    return results
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="QCR nugget search: full-text vs. ILIKE at scale.")
+    p.add_argument("--nuggets", type=int, default=1_000_000, help="Rows to seed. Default: 1,000,000.")
+    p.add_argument("--seed", action="store_true", help="Seed the benchmark tenant before running.")
+    p.add_argument("--cleanup", action="store_true", help="Delete the benchmark tenant's rows and exit.")
+    p.add_argument("--iterations", type=int, default=20)
+    p.add_argument("--limit", type=int, default=20, help="Page size.")
+    p.add_argument("--skip-legacy", action="store_true", help="Do not time the ILIKE scan (slow at 1M).")
+    p.add_argument("--output", help="Write results JSON here")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_arg_parser().parse_args(argv)
+    if args.cleanup:
+        _cleanup()
+        return 0
+    if args.seed:
+        _seed(args.nuggets)
+
+    logging.disable(logging.WARNING)
+    try:
+        results = run(iterations=args.iterations, limit=args.limit, skip_legacy=args.skip_legacy)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    print(f"{'benchmark':<28} {'ops/sec':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for r in results:
+        print(f"{r.name:<28} {r.ops_per_sec:>10,.1f} {r.p50_us / 1000:>10.2f} {r.p99_us / 1000:>10.2f}")
+    if args.output:
+        write_results(args.output, results, {"nuggets": args.nuggets, "limit": args.limit})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Decision-loop microbenchmark runner.
+
+    python -m benchmarks.run                           # all cases, compare to baseline
+    python -m benchmarks.run --corpus-size 50000 --only activate
+    python -m benchmarks.run --save-baseline           # record this machine's baseline
+    python -m benchmarks.run --output results.json --threshold 0.10
+    python -m benchmarks.run --live-db                 # real reads via EXECALC_DB_*
+
+Prints a table, optionally writes results as JSON, and compares p50/p99,
+ops/sec and peak allocation per call against the stored baseline. Exits 1
+if any metric regressed by more than --threshold.
+
+Baselines are machine-specific: record one with --save-baseline on the
+same host (or CI runner class) that will run the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import platform
+import sys
+from datetime import UTC, datetime
+from typing import List, Optional
+
+from benchmarks import suite
+from benchmarks.harness import BenchResult, compare, load_baseline, measure, write_results
+
+_DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def run(
+    *,
+    corpus_size: int,
+    iterations: int,
+    only: Optional[List[str]] = None,
+    live_db: bool = False,
+) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for case in suite.select(only):
+        with contextlib.ExitStack() as stack:
+            op = case.build(corpus_size, live_db, stack)
+            results.append(measure(case.name, op, iterations=iterations))
+    return results
+
+
+def _print_table(results: List[BenchResult]) -> None:
+    header = f"{'benchmark':<28} {'ops/sec':>12} {'p50 us':>10} {'p99 us':>10} {'peak B/op':>11} {'kept B/op':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.name:<28} {r.ops_per_sec:>12,.1f} {r.p50_us:>10.1f} {r.p99_us:>10.1f} "
+            f"{r.peak_alloc_bytes:>11,.0f} {r.retained_bytes_per_op:>10,.0f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Decision-loop microbenchmarks")
+    parser.add_argument("--corpus-size", type=int, default=5000, help="Synthetic claims/nuggets per corpus")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Run only these benchmarks")
+    parser.add_argument("--live-db", action="store_true", help="Do not stub DB reads")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", default=_DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed regression fraction")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    # Hot paths log at INFO; keep the timing loop off the console.
+    logging.disable(logging.WARNING)
+    try:
+        results = run(
+            corpus_size=args.corpus_size,
+            iterations=args.iterations,
+            only=args.only,
+            live_db=args.live_db,
+        )
+    finally:
+        logging.disable(logging.NOTSET)
+    _print_table(results)
+
+    meta = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "corpus_size": args.corpus_size,
+        "iterations": args.iterations,
+        "live_db": args.live_db,
+    }
+    if args.output:
+        write_results(args.output, results, meta)
+    if args.save_baseline:
+        write_results(args.baseline, results, meta)
+        print(f"\nbaseline written: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), threshold=args.threshold)
+    if not regressions:
+        print(f"\nno regressions beyond {args.threshold:.0%}")
+        return 0
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+    for reg in regressions:
+        print(f"  {reg.name:<28} {reg.metric:<17} {reg.baseline:>12,.1f} -> {reg.current:>12,.1f} ({reg.change:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Benchmark cases for the decision-loop hot paths.
+
+Each case is a factory: given a corpus size it builds its synthetic inputs
+once and returns a zero-argument callable that performs one operation. DB
+reads are stubbed with the synthetic corpus for as long as the caller's
+ExitStack is open, unless live_db is set, in which case the functions run
+unpatched against EXECALC_DB_* (seed the database first — the suite does
+not write fixtures).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+from benchmarks import synthetic
+from src.service.decision_loop.compare import compare_decision_artifacts
+from src.service.decision_loop.engine import run_decision_loop
+from src.service.gaqp import activation_index, claim_graph, structural_corpus
+from src.service.gaqp.activation import activate
+from src.service.gaqp.extraction import _run_admission_tests, extract_claims
+from src.service.gaqp.ingress import evaluate_type_gate
+from src.service.gaqp.records import ClaimRecord
+from src.service.qualitative_capture import session_packet
+from src.service.qualitative_capture.deconstructor import deconstruct_event
+from src.service.qualitative_capture.session_packet import generate_session_packet
+
+Op = Callable[[], Any]
+
+
+@dataclass
+class Case:
+    name: str
+    build: Callable[[int, bool, contextlib.ExitStack], Op]   # (corpus_size, live_db, stubs) -> op
+
+
+def _cycle(items: List[Any]) -> Callable[[], Any]:
+    it = itertools.cycle(items)
+    return lambda: next(it)
+
+
+# ---------------------------------------------------------------------------
+# Pure cases
+# ---------------------------------------------------------------------------
+
+def _build_run_decision_loop(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    nxt = _cycle(synthetic.scenarios(8))
+    return lambda: run_decision_loop(tenant_id=synthetic.TENANT_ID, user_id="bench", scenario=nxt())
+
+
+def _build_extract_claims(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    nxt = _cycle([synthetic.decision_report(i) for i in range(8)])
+    return lambda: extract_claims(
+        report=nxt(), tenant_id=synthetic.TENANT_ID, source_envelope_id="env-bench", actor_id="bench",
+    )
+
+
+def _build_admission_tests(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    nxt = _cycle([row["content"] for row in synthetic.claim_rows(min(size, 1000))])
+    return lambda: _run_admission_tests(nxt())
+
+
+def _build_type_gate(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    nxt = _cycle([(row["content"], row["claim_type"]) for row in synthetic.claim_rows(min(size, 1000))])
+
+    def op() -> Any:
+        content, claim_type = nxt()
+        return evaluate_type_gate(content, claim_type)
+    return op
+
+
+def _build_deconstruct_event(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    nxt = _cycle(synthetic.conversation_events(min(size, 1000)))
+    return lambda: deconstruct_event(nxt())
+
+
+def _build_compare(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    artifacts = synthetic.decision_artifacts(8)
+    return lambda: compare_decision_artifacts(
+        tenant_id=synthetic.TENANT_ID,
+        artifacts=artifacts,
+        comparison_objective="Preserve runway while growing margin",
+        requested_depth="standard",
+    )
+
+
+# ---------------------------------------------------------------------------
+# DB-backed cases
+# ---------------------------------------------------------------------------
+
+def _stub(stack: contextlib.ExitStack, targets: Dict[str, Any], live_db: bool) -> None:
+    if live_db:
+        return
+    for target, value in targets.items():
+        stack.enter_context(patch(target, value))
+
+
+def _build_activate(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    """Warm path: the tenant index is loaded once, then served from memory."""
+    rows = [ClaimRecord.from_dict(r) for r in synthetic.claim_rows(size)]
+    by_id = {r.claim_id: r for r in rows}
+    links = [
+        (r.claim_id, r.contradiction_refs, r.support_refs)
+        for r in rows if r.contradiction_refs or r.support_refs
+    ]
+    _stub(stack, {
+        "src.service.gaqp.activation_index.list_admitted_claims": lambda *, tenant_id: rows,
+        "src.service.gaqp.claim_graph.list_claim_links": lambda *, tenant_id: links,
+        "src.service.qualitative_capture.repository.list_nugget_links": lambda *, tenant_id: [],
+        "src.service.gaqp.activation.get_structural_corpus": lambda: None,
+        "src.service.gaqp.activation.get_claims": lambda *, claim_ids, tenant_id: {
+            cid: by_id[cid] for cid in claim_ids if cid in by_id
+        },
+    }, live_db)
+    activation_index.invalidate()
+    claim_graph.invalidate()
+    structural_corpus.reset()
+    stack.callback(activation_index.invalidate)
+    stack.callback(claim_graph.invalidate)
+    stack.callback(structural_corpus.reset)
+
+    nxt = _cycle(synthetic.scenarios(8))
+    return lambda: activate(scenario=nxt(), tenant_id=synthetic.TENANT_ID)
+
+
+def _stub_session_packet(size: int, live_db: bool, stack: contextlib.ExitStack) -> None:
+    summary = synthetic.session_summary(size)
+    _stub(stack, {
+        "src.service.qualitative_capture.session_packet.load_session_packet_sources": lambda **_: {
+            "summary": summary, "preserved_ideas": [], "pending_promotions": [], "conclusions": [],
+        },
+    }, live_db)
+    session_packet.clear_cache()
+    stack.callback(session_packet.clear_cache)
+
+
+def _build_session_packet(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    """Cold path: every call rebuilds the packet."""
+    _stub_session_packet(size, live_db, stack)
+
+    def op() -> Any:
+        session_packet.clear_cache()
+        return generate_session_packet(
+            tenant_id=synthetic.TENANT_ID, session_id=synthetic.SESSION_ID, domain="strategy",
+        )
+    return op
+
+
+def _build_session_packet_warm(size: int, live_db: bool, stack: contextlib.ExitStack) -> Op:
+    """Warm path: a polled packet with no intervening writes."""
+    _stub_session_packet(size, live_db, stack)
+    return lambda: generate_session_packet(
+        tenant_id=synthetic.TENANT_ID, session_id=synthetic.SESSION_ID, domain="strategy",
+    )
+
+
+CASES: List[Case] = [
+    Case("run_decision_loop", _build_run_decision_loop),
+    Case("extract_claims", _build_extract_claims),
+    Case("_run_admission_tests", _build_admission_tests),
+    Case("evaluate_type_gate", _build_type_gate),
+    Case("deconstruct_event", _build_deconstruct_event),
+    Case("activate", _build_activate),
+    Case("compare_decision_artifacts", _build_compare),
+    Case("generate_session_packet", _build_session_packet),
+    Case("generate_session_packet_warm", _build_session_packet_warm),
+]
+
+
+def select(only: Optional[List[str]] = None) -> List[Case]:
+    if not only:
+        return list(CASES)
+    unknown = set(only) - {c.name for c in CASES}
+    if unknown:
+        raise ValueError(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+    return [c for c in CASES if c.name in only]
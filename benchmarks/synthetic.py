@@ -0,0 +1,184 @@
+"""
+Deterministic synthetic fixtures for the benchmark suite.
+
+Everything is generated from a seeded Random so two runs at the same corpus
+size exercise the same data — required for a baseline comparison to mean
+anything.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List
+
+from src.service.decision_loop.engine import run_decision_loop
+from src.service.decision_loop.models import Scenario
+from src.service.qualitative_capture.models import ConversationEvent
+
+TENANT_ID = "bench-tenant"
+SESSION_ID = "bench-session"
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+_TRIGGERS = [
+    "acquisition", "pricing", "margin", "liquidity", "hiring", "salary cap",
+    "churn", "expansion", "debt", "supplier", "regulation", "brand",
+    "retention", "runway", "valuation", "headcount", "inventory", "capex",
+]
+
+_CLAIM_TYPES = [
+    "tradeoff", "causal_claim", "observation", "principle", "doctrine",
+    "constraint", "threshold_condition", "objective", "diagnostic_signal",
+]
+
+_SENTENCES = [
+    "Pricing power erodes because discounting trains customers to wait for the next promotion.",
+    "We believe liquidity buys optionality when the market turns against leveraged competitors.",
+    "If churn exceeds four percent in a quarter, then escalate the retention review immediately.",
+    "Headcount growth must not exceed revenue growth for more than two consecutive periods.",
+    "The data shows supplier concentration is an early warning signal for margin compression.",
+    "Expansion into adjacent markets trades near-term margin against long-term distribution reach.",
+    "Our doctrine is that we never sacrifice balance-sheet strength for a single acquisition.",
+    "The primary objective is to preserve runway while we pursue the regulated segment.",
+    "Capex decisions should always be tied to a measurable payback threshold.",
+    "Brand trust is a durable competitive advantage that compounds over several cycles.",
+]
+
+_PROMPTS = [
+    "Should we pursue the acquisition given our liquidity and the current pricing pressure?",
+    "How should we balance hiring against runway while churn is rising?",
+    "Evaluate supplier risk and inventory exposure ahead of the expansion.",
+    "Is the debt refinancing worth the margin hit relative to capex needs?",
+]
+
+
+def claim_rows(n: int, *, seed: int = 7) -> List[Dict[str, Any]]:
+    """n admitted gaqp_claims rows in row-dict shape (ClaimRecord.from_dict input)."""
+    rng = random.Random(seed)
+    rows: List[Dict[str, Any]] = []
+    for i in range(n):
+        universal = i % 25 == 0
+        created = (_EPOCH + timedelta(minutes=i)).isoformat()
+        rows.append({
+            "claim_id": f"claim-{i:07d}",
+            "tenant_id": TENANT_ID,
+            "source_envelope_id": f"env-{i // 8:06d}",
+            "claim_type": rng.choice(_CLAIM_TYPES),
+            "domain": "strategy",
+            "content": rng.choice(_SENTENCES),
+            "confidence_level": "developing",
+            "confidence_score": rng.choice((0.5, 0.72, 0.91, 1.0)),
+            "admission_status": "admitted",
+            "corpus_scope": "tenant",
+            "extraction_method": "direct_field",
+            "provenance": {"source_kind": "decision_artifact", "source_ref": f"env-{i // 8:06d}", "actor_id": "bench"},
+            "activation_scope": "universal" if universal else "domain_specific",
+            "activation_triggers": [] if universal else rng.sample(_TRIGGERS, 2) + [f"term-{i}"],
+            "corroboration_profile": {"independent_sources": 1},
+            "contradiction_refs": [],
+            "support_refs": [],
+            "fingerprint": f"fp-{i:07d}",
+            "schema_version": "stage9_v1",
+            "inference_flag": False,
+            "source_location": None,
+            "standards_package_version": "gaqp_v1.0",
+            "created_at": created,
+            "updated_at": created,
+        })
+    # Sprinkle contradiction refs between existing claims so the alert path runs.
+    for i in range(0, n - 1, 50):
+        rows[i]["contradiction_refs"] = [rows[i + 1]["claim_id"]]
+    return rows
+
+
+def scenario(i: int = 0) -> Scenario:
+    return Scenario(
+        scenario_type="capital_allocation",
+        governing_objective="Preserve runway while growing margin",
+        prompt=_PROMPTS[i % len(_PROMPTS)],
+        facts={"cash_on_hand": 12_500_000, "monthly_burn": 900_000},
+        constraints={"max_dilution": "10%"},
+        decision_horizon="18 months",
+        stakeholder_scope="board and executive team",
+        risk_surface="financing and customer concentration",
+        tenant_id=TENANT_ID,
+    )
+
+
+def scenarios(n: int) -> List[Scenario]:
+    return [scenario(i) for i in range(n)]
+
+
+def decision_report(i: int = 0):
+    return run_decision_loop(tenant_id=TENANT_ID, user_id="bench", scenario=scenario(i))
+
+
+def conversation_events(n: int, *, sentences_per_event: int = 6, seed: int = 11) -> List[ConversationEvent]:
+    rng = random.Random(seed)
+    return [
+        ConversationEvent(
+            event_id=f"event-{i:06d}",
+            tenant_id=TENANT_ID,
+            session_id=SESSION_ID,
+            user_id="bench",
+            role="operator",
+            message_text=" ".join(rng.choice(_SENTENCES) for _ in range(sentences_per_event)),
+            created_at=_EPOCH + timedelta(seconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+def nugget_rows(n: int, *, seed: int = 13) -> List[Dict[str, Any]]:
+    """n qc_nuggets rows, shaped like repository.list_nuggets output."""
+    rng = random.Random(seed)
+    return [
+        {
+            "nugget_id": f"nugget-{i:07d}",
+            "tenant_id": TENANT_ID,
+            "session_id": SESSION_ID,
+            "claim_text": rng.choice(_SENTENCES),
+            "claim_type": rng.choice(_CLAIM_TYPES),
+            "domain": "strategy",
+            "confidence_score": rng.choice((0.5, 0.72, 0.91, 1.0)),
+            "confidence_level": "developing",
+            "polarity": rng.choice(("positive", "negative", "neutral", "cautionary")),
+            "rail_candidate": rng.random() < 0.2,
+            "selection_method": "rule_based_v1",
+            "created_at": (_EPOCH + timedelta(seconds=i)).isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+def session_summary(n: int) -> Dict[str, Any]:
+    """A qcr_session_summaries row for a session of n nuggets (sections hold 10)."""
+    entries = nugget_rows(min(n, 100))
+    counts: Dict[str, int] = {}
+    for e in entries:
+        counts[e["claim_type"]] = counts.get(e["claim_type"], 0) + 1
+    ranked = sorted(entries, key=lambda e: (e["rail_candidate"], e["confidence_score"]), reverse=True)
+    return {
+        "tenant_id": TENANT_ID,
+        "session_id": SESSION_ID,
+        "nugget_count": n,
+        "claim_type_counts": counts,
+        "top_nuggets": ranked[:10],
+        "doctrine_candidates": [e for e in ranked if e["claim_type"] in ("doctrine", "principle")][:10],
+        "decisions_made": [e for e in ranked if e["claim_type"] == "objective"][:10],
+        "open_questions": [e for e in ranked if e["claim_type"] == "threshold_condition"][:10],
+        "core_breakthrough": ranked[:1],
+    }
+
+
+def decision_artifacts(n: int) -> List[Dict[str, Any]]:
+    """n stored decision artifacts, shaped like the /decision/compare input."""
+    artifacts: List[Dict[str, Any]] = []
+    for i in range(n):
+        artifacts.append({
+            "tenant_id": TENANT_ID,
+            "envelope_id": f"{i:08d}-0000-4000-8000-000000000000",
+            "result": decision_report(i).to_dict(),
+        })
+    return artifacts
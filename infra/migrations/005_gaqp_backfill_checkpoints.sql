@@ -0,0 +1,26 @@
+-- GAQP backfill checkpoints
+-- One row per record_id range of a parallel backfill run. Workers advance
+-- cursor after each committed page, so an interrupted run resumes from the
+-- last committed page of every range instead of from record_id 0.
+
+CREATE TABLE IF NOT EXISTS gaqp_backfill_checkpoints (
+    run_id           TEXT        NOT NULL,
+    range_start      BIGINT      NOT NULL,   -- exclusive: record_id > range_start
+    range_end        BIGINT      NOT NULL,   -- inclusive: record_id <= range_end
+    cursor           BIGINT      NOT NULL,   -- last record_id processed in this range
+    status           TEXT        NOT NULL DEFAULT 'pending'
+                                 CHECK (status IN ('pending', 'running', 'complete')),
+    tenant_id        TEXT,                   -- NULL: all tenants
+
+    records_read     BIGINT      NOT NULL DEFAULT 0,
+    records_skipped  BIGINT      NOT NULL DEFAULT 0,
+    claims_extracted BIGINT      NOT NULL DEFAULT 0,
+    claims_inserted  BIGINT      NOT NULL DEFAULT 0,
+    claims_skipped   BIGINT      NOT NULL DEFAULT 0,
+    claims_failed    BIGINT      NOT NULL DEFAULT 0,
+
+    created_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (run_id, range_start)
+);
@@ -0,0 +1,111 @@
+-- GAQP structural corpus: cross-tenant, de-identified read model
+-- One row per admitted structural-scope claim, shared across tenants.
+-- Identifying columns (tenant_id, source_envelope_id, provenance,
+-- contradiction/support refs, corroborating actor keys) are not copied.
+--
+-- Maintained incrementally by a trigger on gaqp_claims: every change that
+-- affects a structural claim bumps its row to the next version. Claims that
+-- leave the structural tier stay as withdrawn tombstones, so readers can
+-- apply "version > last_seen" deltas without a full reload.
+
+CREATE SEQUENCE IF NOT EXISTS gaqp_structural_corpus_version_seq;
+
+CREATE TABLE IF NOT EXISTS gaqp_structural_corpus (
+    claim_id                  TEXT        NOT NULL,
+    claim_type                TEXT        NOT NULL,
+    domain                    TEXT        NOT NULL,
+    content                   TEXT        NOT NULL,
+    confidence_level          TEXT        NOT NULL,
+    confidence_score          FLOAT       NOT NULL,
+    extraction_method         TEXT        NOT NULL,
+    activation_scope          TEXT        NOT NULL,
+    activation_triggers       JSONB       NOT NULL DEFAULT '[]',
+    corroboration_profile     JSONB       NOT NULL DEFAULT '{}',  -- counts only
+    fingerprint               TEXT        NOT NULL,
+    schema_version            TEXT        NOT NULL,
+    standards_package_version TEXT        NOT NULL,
+    inference_flag            BOOLEAN     NOT NULL DEFAULT FALSE,
+    created_at                TIMESTAMPTZ NOT NULL,
+    updated_at                TIMESTAMPTZ NOT NULL,
+
+    withdrawn                 BOOLEAN     NOT NULL DEFAULT FALSE,
+    version                   BIGINT      NOT NULL DEFAULT nextval('gaqp_structural_corpus_version_seq'),
+
+    PRIMARY KEY (claim_id)
+);
+
+-- Incremental refresh: SELECT ... WHERE version > last_seen ORDER BY version
+CREATE INDEX IF NOT EXISTS idx_gaqp_structural_corpus_version
+  ON gaqp_structural_corpus (version);
+
+
+CREATE OR REPLACE FUNCTION gaqp_structural_corpus_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'DELETE'
+       AND NEW.corpus_scope = 'structural'
+       AND NEW.admission_status = 'admitted' THEN
+        INSERT INTO gaqp_structural_corpus (
+            claim_id, claim_type, domain, content,
+            confidence_level, confidence_score, extraction_method,
+            activation_scope, activation_triggers, corroboration_profile,
+            fingerprint, schema_version, standards_package_version, inference_flag,
+            created_at, updated_at, withdrawn, version
+        ) VALUES (
+            NEW.claim_id, NEW.claim_type, NEW.domain, NEW.content,
+            NEW.confidence_level, NEW.confidence_score, NEW.extraction_method,
+            NEW.activation_scope, NEW.activation_triggers,
+            NEW.corroboration_profile - 'corroborating_actors',
+            NEW.fingerprint, NEW.schema_version, NEW.standards_package_version, NEW.inference_flag,
+            NEW.created_at, NEW.updated_at, FALSE, nextval('gaqp_structural_corpus_version_seq')
+        )
+        ON CONFLICT (claim_id) DO UPDATE SET
+            claim_type                = EXCLUDED.claim_type,
+            domain                    = EXCLUDED.domain,
+            content                   = EXCLUDED.content,
+            confidence_level          = EXCLUDED.confidence_level,
+            confidence_score          = EXCLUDED.confidence_score,
+            extraction_method         = EXCLUDED.extraction_method,
+            activation_scope          = EXCLUDED.activation_scope,
+            activation_triggers       = EXCLUDED.activation_triggers,
+            corroboration_profile     = EXCLUDED.corroboration_profile,
+            fingerprint               = EXCLUDED.fingerprint,
+            schema_version            = EXCLUDED.schema_version,
+            standards_package_version = EXCLUDED.standards_package_version,
+            inference_flag            = EXCLUDED.inference_flag,
+            updated_at                = EXCLUDED.updated_at,
+            withdrawn                 = FALSE,
+            version                   = EXCLUDED.version;
+    ELSE
+        UPDATE gaqp_structural_corpus
+        SET withdrawn = TRUE,
+            version = nextval('gaqp_structural_corpus_version_seq')
+        WHERE claim_id = CASE WHEN TG_OP = 'DELETE' THEN OLD.claim_id ELSE NEW.claim_id END
+          AND withdrawn = FALSE;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_gaqp_structural_corpus_sync ON gaqp_claims;
+CREATE TRIGGER trg_gaqp_structural_corpus_sync
+    AFTER INSERT OR UPDATE OR DELETE ON gaqp_claims
+    FOR EACH ROW EXECUTE FUNCTION gaqp_structural_corpus_sync();
+
+
+-- Seed from existing structural claims (idempotent).
+INSERT INTO gaqp_structural_corpus (
+    claim_id, claim_type, domain, content,
+    confidence_level, confidence_score, extraction_method,
+    activation_scope, activation_triggers, corroboration_profile,
+    fingerprint, schema_version, standards_package_version, inference_flag,
+    created_at, updated_at
+)
+SELECT claim_id, claim_type, domain, content,
+       confidence_level, confidence_score, extraction_method,
+       activation_scope, activation_triggers,
+       corroboration_profile - 'corroborating_actors',
+       fingerprint, schema_version, standards_package_version, inference_flag,
+       created_at, updated_at
+FROM gaqp_claims
+WHERE corpus_scope = 'structural' AND admission_status = 'admitted'
+ON CONFLICT (claim_id) DO NOTHING;
@@ -0,0 +1,18 @@
+-- QCR capture queue
+-- qcr_conversation_events doubles as a durable work queue for sentence
+-- deconstruction. An event is pending while capture_queued_at is set and
+-- capture_completed_at is NULL. Workers claim batches with
+-- FOR UPDATE SKIP LOCKED and take a lease (capture_leased_until); a worker
+-- that dies mid-batch leaves leases that simply expire and are reclaimed.
+-- Events that fail capture_attempts times stay pending with capture_error
+-- set and are no longer claimed.
+
+ALTER TABLE qcr_conversation_events
+    ADD COLUMN IF NOT EXISTS capture_attempts     INTEGER     NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS capture_leased_until TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS capture_error        TEXT;
+
+-- Claim scan: oldest pending first, over pending rows only.
+CREATE INDEX IF NOT EXISTS idx_qcr_events_capture_pending
+    ON qcr_conversation_events (capture_queued_at)
+    WHERE capture_queued_at IS NOT NULL AND capture_completed_at IS NULL;
@@ -0,0 +1,18 @@
+-- QCR nugget full-text search
+-- claim_tsv is a stored generated column, so every insert path (capture
+-- workers, batch ingest, memorialize, second-order) keeps it current with
+-- no application code. The GIN index leads with tenant_id (btree_gin), so
+-- one index scan applies both the tenant filter and the text match instead
+-- of intersecting a tenant btree with a corpus-wide text index.
+--
+-- Queries must use the same configuration ('english') for the planner to
+-- match the index: see repository.search_nuggets.
+
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+ALTER TABLE qcr_atomic_nuggets
+    ADD COLUMN IF NOT EXISTS claim_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', claim_text)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_qcr_nuggets_tenant_claim_tsv
+    ON qcr_atomic_nuggets USING GIN (tenant_id, claim_tsv);
@@ -0,0 +1,181 @@
+-- QCR session summaries
+-- One row per (tenant_id, session_id) holding everything a Session
+-- Intelligence Packet shows about the session's nuggets: the nugget count,
+-- per-claim_type counters, and each section's best entries, bounded and
+-- already ordered. A statement-level trigger folds every batch of inserted
+-- nuggets into it, so reading a packet costs O(section size) however long
+-- the session runs, and counts are no longer truncated at 500 nuggets.
+--
+-- The section rules live here (session_packet.py only formats them):
+--   floor               confidence_score >= 0.50, else ignored entirely
+--   top_nuggets         rail candidates first, then confidence, newest
+--   doctrine_candidates doctrine / principle / declaration_of_value / axiom
+--   decisions_made      objective / tactic / best_practice
+--   open_questions      confidence_score <= 0.50 or threshold_condition
+--   core_breakthrough   best rail candidate (any nugget if none), doctrine
+--                       class first, then confidence, newest
+-- Sections keep 10 entries (core_breakthrough: 1).
+--
+-- The application never updates or deletes nuggets. If rows are removed by
+-- hand, delete the session's summary row and re-run the seed statement at
+-- the end of this file.
+
+BEGIN;
+
+-- Block nugget writes until the trigger and seed are both in place, so no
+-- insert is counted twice or missed.
+LOCK TABLE qcr_atomic_nuggets IN SHARE MODE;
+
+CREATE TABLE IF NOT EXISTS qcr_session_summaries (
+    tenant_id           TEXT        NOT NULL REFERENCES tenants(tenant_id),
+    session_id          TEXT        NOT NULL,
+    nugget_count        INTEGER     NOT NULL DEFAULT 0,
+    claim_type_counts   JSONB       NOT NULL DEFAULT '{}',
+    top_nuggets         JSONB       NOT NULL DEFAULT '[]',
+    doctrine_candidates JSONB       NOT NULL DEFAULT '[]',
+    decisions_made      JSONB       NOT NULL DEFAULT '[]',
+    open_questions      JSONB       NOT NULL DEFAULT '[]',
+    core_breakthrough   JSONB       NOT NULL DEFAULT '[]',
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (tenant_id, session_id)
+);
+
+
+-- Packet display fields plus the sort keys the sections are ordered by.
+CREATE OR REPLACE FUNCTION qcr_nugget_summary_entry(
+    nugget_id TEXT, claim_text TEXT, claim_type TEXT, domain TEXT,
+    confidence_score FLOAT, confidence_level TEXT, polarity TEXT,
+    rail_candidate BOOLEAN, selection_method TEXT, created_at TIMESTAMPTZ
+) RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'nugget_id', nugget_id, 'claim_text', claim_text, 'claim_type', claim_type,
+        'domain', domain, 'confidence_score', confidence_score,
+        'confidence_level', confidence_level, 'polarity', polarity,
+        'rail_candidate', rail_candidate, 'selection_method', selection_method,
+        'created_epoch', extract(epoch FROM created_at)
+    )
+$$ LANGUAGE sql IMMUTABLE;
+
+
+-- The k best entries, best first: confidence then newest, optionally
+-- preceded by rail candidates first and doctrine-class claims first.
+CREATE OR REPLACE FUNCTION qcr_summary_top_k(
+    items JSONB, k INTEGER, by_rail BOOLEAN, by_doctrine BOOLEAN
+) RETURNS JSONB AS $$
+    SELECT COALESCE(jsonb_agg(e ORDER BY pos), '[]'::jsonb)
+    FROM (
+        SELECT e, row_number() OVER (ORDER BY
+            CASE WHEN by_rail THEN (e->>'rail_candidate')::boolean ELSE FALSE END DESC,
+            CASE WHEN by_doctrine
+                 THEN e->>'claim_type' IN ('doctrine', 'principle', 'declaration_of_value', 'axiom')
+                 ELSE FALSE END DESC,
+            (e->>'confidence_score')::float DESC,
+            (e->>'created_epoch')::numeric DESC,
+            e->>'nugget_id' DESC
+        ) AS pos
+        FROM jsonb_array_elements(COALESCE(items, '[]'::jsonb)) AS e
+    ) ranked
+    WHERE pos <= k
+$$ LANGUAGE sql IMMUTABLE;
+
+
+CREATE OR REPLACE FUNCTION qcr_summary_add_counts(a JSONB, b JSONB) RETURNS JSONB AS $$
+    SELECT COALESCE(jsonb_object_agg(k, total), '{}'::jsonb)
+    FROM (
+        SELECT k, SUM(v::int) AS total
+        FROM (SELECT * FROM jsonb_each_text(a) UNION ALL SELECT * FROM jsonb_each_text(b)) AS kv(k, v)
+        GROUP BY k
+    ) summed
+$$ LANGUAGE sql IMMUTABLE;
+
+
+-- Fold one session's new entries into its summary row.
+CREATE OR REPLACE FUNCTION qcr_session_summary_fold(
+    p_tenant_id TEXT, p_session_id TEXT, p_entries JSONB
+) RETURNS VOID AS $$
+    WITH kept AS (
+        SELECT e FROM jsonb_array_elements(p_entries) AS e
+        WHERE (e->>'confidence_score')::float >= 0.50
+    ), batch AS (
+        SELECT
+            count(*) AS n,
+            jsonb_agg(e) AS entries,
+            jsonb_agg(e) FILTER (
+                WHERE e->>'claim_type' IN ('doctrine', 'principle', 'declaration_of_value', 'axiom')
+            ) AS doctrine,
+            jsonb_agg(e) FILTER (
+                WHERE e->>'claim_type' IN ('objective', 'tactic', 'best_practice')
+            ) AS decisions,
+            jsonb_agg(e) FILTER (
+                WHERE (e->>'confidence_score')::float <= 0.50 OR e->>'claim_type' = 'threshold_condition'
+            ) AS open_q
+        FROM kept
+    ), counts AS (
+        SELECT jsonb_object_agg(claim_type, n) AS by_type
+        FROM (SELECT e->>'claim_type' AS claim_type, count(*) AS n FROM kept GROUP BY 1) c
+    )
+    INSERT INTO qcr_session_summaries AS s (
+        tenant_id, session_id, nugget_count, claim_type_counts,
+        top_nuggets, doctrine_candidates, decisions_made, open_questions, core_breakthrough,
+        updated_at
+    )
+    SELECT
+        p_tenant_id, p_session_id, batch.n, counts.by_type,
+        qcr_summary_top_k(batch.entries, 10, TRUE, FALSE),
+        qcr_summary_top_k(batch.doctrine, 10, FALSE, FALSE),
+        qcr_summary_top_k(batch.decisions, 10, FALSE, FALSE),
+        qcr_summary_top_k(batch.open_q, 10, FALSE, FALSE),
+        qcr_summary_top_k(batch.entries, 1, TRUE, TRUE),
+        NOW()
+    FROM batch, counts
+    WHERE batch.n > 0
+    ON CONFLICT (tenant_id, session_id) DO UPDATE SET
+        nugget_count        = s.nugget_count + EXCLUDED.nugget_count,
+        claim_type_counts   = qcr_summary_add_counts(s.claim_type_counts, EXCLUDED.claim_type_counts),
+        top_nuggets         = qcr_summary_top_k(s.top_nuggets || EXCLUDED.top_nuggets, 10, TRUE, FALSE),
+        doctrine_candidates = qcr_summary_top_k(s.doctrine_candidates || EXCLUDED.doctrine_candidates, 10, FALSE, FALSE),
+        decisions_made      = qcr_summary_top_k(s.decisions_made || EXCLUDED.decisions_made, 10, FALSE, FALSE),
+        open_questions      = qcr_summary_top_k(s.open_questions || EXCLUDED.open_questions, 10, FALSE, FALSE),
+        core_breakthrough   = qcr_summary_top_k(s.core_breakthrough || EXCLUDED.core_breakthrough, 1, TRUE, TRUE),
+        updated_at          = NOW();
+$$ LANGUAGE sql;
+
+
+-- One fold per session per INSERT statement, so a multi-row insert
+-- (ingest_events, capture batches) updates each summary row once.
+CREATE OR REPLACE FUNCTION qcr_session_summary_sync() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM qcr_session_summary_fold(tenant_id, session_id, entries)
+    FROM (
+        SELECT tenant_id, session_id,
+               jsonb_agg(qcr_nugget_summary_entry(
+                   nugget_id, claim_text, claim_type, domain, confidence_score,
+                   confidence_level, polarity, rail_candidate, selection_method, created_at
+               )) AS entries
+        FROM inserted_nuggets
+        GROUP BY tenant_id, session_id
+    ) per_session;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_qcr_session_summary_sync ON qcr_atomic_nuggets;
+CREATE TRIGGER trg_qcr_session_summary_sync
+    AFTER INSERT ON qcr_atomic_nuggets
+    REFERENCING NEW TABLE AS inserted_nuggets
+    FOR EACH STATEMENT EXECUTE FUNCTION qcr_session_summary_sync();
+
+
+-- Seed from existing nuggets (sessions that already have a row are skipped).
+SELECT qcr_session_summary_fold(n.tenant_id, n.session_id, jsonb_agg(qcr_nugget_summary_entry(
+           n.nugget_id, n.claim_text, n.claim_type, n.domain, n.confidence_score,
+           n.confidence_level, n.polarity, n.rail_candidate, n.selection_method, n.created_at
+       )))
+FROM qcr_atomic_nuggets n
+WHERE NOT EXISTS (
+    SELECT 1 FROM qcr_session_summaries s
+    WHERE s.tenant_id = n.tenant_id AND s.session_id = n.session_id
+)
+GROUP BY n.tenant_id, n.session_id;
+
+COMMIT;
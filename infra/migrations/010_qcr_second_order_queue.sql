@@ -0,0 +1,23 @@
+-- QCR second-order deconstruction queue
+-- qcr_rail_artifacts doubles as the work queue for second-order workers,
+-- the same way 007 turned qcr_conversation_events into the capture queue.
+-- Workers claim pending artifacts across all tenants with
+-- FOR UPDATE SKIP LOCKED, flip them to 'in_progress' under a lease, and
+-- write a whole batch's nuggets, audit events, and status marks in one
+-- transaction. An 'in_progress' artifact whose lease has expired belonged
+-- to a worker that died and is claimable again. Completing or releasing a
+-- claimed artifact only takes effect while the worker still holds its
+-- lease ('in_progress' at the attempt it claimed). Artifacts that use up
+-- their attempts stay pending with deconstruction_error set; one whose
+-- final lease expires is put back to pending by the next claim.
+
+ALTER TABLE qcr_rail_artifacts
+    ADD COLUMN IF NOT EXISTS deconstruction_attempts     INTEGER     NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS deconstruction_leased_until TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS deconstruction_error        TEXT;
+
+-- Claim scan: oldest actioned first, over claimable rows only. The
+-- per-tenant pending index from 004 still serves process_pending_artifacts.
+CREATE INDEX IF NOT EXISTS idx_qcr_artifacts_deconstruction_queue
+    ON qcr_rail_artifacts (actioned_at)
+    WHERE second_order_deconstruction_status IN ('pending', 'in_progress');
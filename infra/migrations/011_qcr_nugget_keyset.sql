@@ -0,0 +1,14 @@
+-- QCR nugget keyset pagination and export
+-- list_nuggets pages on (confidence_score, created_at, nugget_id) DESC with
+-- a row-value comparison against the previous page's last row; this index
+-- matches that order exactly, so every page is an index range scan however
+-- deep it is. It supersedes the (tenant_id, confidence_score DESC) index
+-- from 004. The export streams oldest first on (created_at, nugget_id).
+
+CREATE INDEX IF NOT EXISTS idx_qcr_nuggets_tenant_keyset
+    ON qcr_atomic_nuggets (tenant_id, confidence_score DESC, created_at DESC, nugget_id DESC);
+
+DROP INDEX IF EXISTS idx_qcr_nuggets_tenant_confidence;
+
+CREATE INDEX IF NOT EXISTS idx_qcr_nuggets_tenant_created
+    ON qcr_atomic_nuggets (tenant_id, created_at, nugget_id);
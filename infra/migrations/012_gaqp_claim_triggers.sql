@@ -0,0 +1,87 @@
+-- GAQP activation trigger inverted index
+-- One row per (claim, activation trigger) for admitted, non-universal
+-- claims, so activation can match a scenario in SQL instead of loading the
+-- tenant's whole corpus (corpus.match_claims_by_scenario, used when
+-- EXECALC_ACTIVATION_MODE=sql).
+--
+--   trigger     lowercased trigger text, verified as a substring of the
+--               lowercased scenario
+--   lead_token  the trigger's first [a-z0-9]+ run; the scenario is split on
+--               the same rule and joined here on equality, so a trigger is
+--               only verified when its first word is a whole scenario word:
+--               "cap" does not match "caps" or "capital" (the in-process
+--               index, a plain substring match, does), and a trigger with
+--               no [a-z0-9] (lead_token '') never matches
+--   ordinal     1-based position in activation_triggers, so the rationale
+--               names the claim's first matching trigger, as the in-process
+--               index does
+--
+-- Maintained by a row trigger on gaqp_claims, in the style of 006.
+
+CREATE TABLE IF NOT EXISTS gaqp_claim_triggers (
+    tenant_id   TEXT    NOT NULL,
+    trigger     TEXT    NOT NULL,
+    claim_id    TEXT    NOT NULL REFERENCES gaqp_claims(claim_id) ON DELETE CASCADE,
+    lead_token  TEXT    NOT NULL,
+    ordinal     INTEGER NOT NULL,
+    PRIMARY KEY (tenant_id, trigger, claim_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gaqp_claim_triggers_lead_token
+    ON gaqp_claim_triggers (tenant_id, lead_token);
+
+CREATE INDEX IF NOT EXISTS idx_gaqp_claim_triggers_claim
+    ON gaqp_claim_triggers (claim_id);
+
+-- Universal-scope claims fire on every scenario; read them without a scan.
+CREATE INDEX IF NOT EXISTS idx_gaqp_claims_tenant_universal
+    ON gaqp_claims (tenant_id, confidence_score DESC)
+    WHERE activation_scope = 'universal' AND admission_status = 'admitted';
+
+
+CREATE OR REPLACE FUNCTION gaqp_claim_trigger_rows(
+    p_tenant_id TEXT, p_claim_id TEXT, p_triggers JSONB
+) RETURNS TABLE (tenant_id TEXT, trigger TEXT, claim_id TEXT, lead_token TEXT, ordinal INTEGER) AS $$
+    SELECT DISTINCT ON (lower(t.value))
+           p_tenant_id, lower(t.value), p_claim_id,
+           COALESCE(substring(lower(t.value) FROM '[a-z0-9]+'), ''), t.ordinal::int
+    FROM jsonb_array_elements_text(COALESCE(p_triggers, '[]'::jsonb)) WITH ORDINALITY AS t(value, ordinal)
+    WHERE t.value <> ''
+    ORDER BY lower(t.value), t.ordinal
+$$ LANGUAGE sql IMMUTABLE;
+
+
+CREATE OR REPLACE FUNCTION gaqp_claim_triggers_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.activation_triggers IS NOT DISTINCT FROM OLD.activation_triggers
+       AND NEW.activation_scope IS NOT DISTINCT FROM OLD.activation_scope
+       AND NEW.admission_status IS NOT DISTINCT FROM OLD.admission_status THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM gaqp_claim_triggers WHERE claim_id = OLD.claim_id;
+    END IF;
+    IF NEW.admission_status = 'admitted' AND NEW.activation_scope <> 'universal' THEN
+        INSERT INTO gaqp_claim_triggers (tenant_id, trigger, claim_id, lead_token, ordinal)
+        SELECT * FROM gaqp_claim_trigger_rows(NEW.tenant_id, NEW.claim_id, NEW.activation_triggers)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Deletes are handled by ON DELETE CASCADE.
+DROP TRIGGER IF EXISTS trg_gaqp_claim_triggers_sync ON gaqp_claims;
+CREATE TRIGGER trg_gaqp_claim_triggers_sync
+    AFTER INSERT OR UPDATE ON gaqp_claims
+    FOR EACH ROW EXECUTE FUNCTION gaqp_claim_triggers_sync();
+
+
+-- Seed from existing claims (idempotent).
+INSERT INTO gaqp_claim_triggers (tenant_id, trigger, claim_id, lead_token, ordinal)
+SELECT r.*
+FROM gaqp_claims c,
+     LATERAL gaqp_claim_trigger_rows(c.tenant_id, c.claim_id, c.activation_triggers) r
+WHERE c.admission_status = 'admitted' AND c.activation_scope <> 'universal'
+ON CONFLICT DO NOTHING;
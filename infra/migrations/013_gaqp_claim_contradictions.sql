@@ -0,0 +1,43 @@
+-- GAQP contradiction edges
+-- One row per contradicting pair of claims, stored once with the ids in
+-- order (claim_a < claim_b). The edge is the source of truth for whether
+-- two claims are linked; gaqp_claims.contradiction_refs and the
+-- corroboration_profile 'contradictions' count are kept as a projection of
+-- it, written in the same statement as the edge (corpus.link_contradictions
+-- / corpus.unlink_contradictions), so both endpoints change together or not
+-- at all.
+--
+-- claim_a and claim_b are COLLATE "C" so "in order" means codepoint order
+-- whatever the database's default collation: the order corpus.py puts a
+-- pair in before it writes, the order the CHECK enforces, and the order
+-- the seed below uses all agree.
+--
+-- The primary key makes linking idempotent under concurrency: two sessions
+-- linking the same pair conflict on the edge, and only the winner touches
+-- the claims. The claim_b index serves "who contradicts X" lookups from
+-- either end without scanning the JSONB arrays.
+
+CREATE TABLE IF NOT EXISTS gaqp_claim_contradictions (
+    tenant_id   TEXT        NOT NULL,
+    claim_a     TEXT        COLLATE "C" NOT NULL REFERENCES gaqp_claims(claim_id) ON DELETE CASCADE,
+    claim_b     TEXT        COLLATE "C" NOT NULL REFERENCES gaqp_claims(claim_id) ON DELETE CASCADE,
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (tenant_id, claim_a, claim_b),
+    CHECK (claim_a < claim_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_gaqp_claim_contradictions_claim_b
+    ON gaqp_claim_contradictions (tenant_id, claim_b);
+
+
+-- Seed from existing contradiction_refs (idempotent). Refs to claims that
+-- no longer exist, or that belong to another tenant, are not carried over.
+INSERT INTO gaqp_claim_contradictions (tenant_id, claim_a, claim_b)
+SELECT DISTINCT c.tenant_id,
+       LEAST(c.claim_id COLLATE "C", r.ref COLLATE "C"),
+       GREATEST(c.claim_id COLLATE "C", r.ref COLLATE "C")
+FROM gaqp_claims c
+CROSS JOIN LATERAL jsonb_array_elements_text(COALESCE(c.contradiction_refs, '[]'::jsonb)) AS r(ref)
+JOIN gaqp_claims o ON o.claim_id = r.ref AND o.tenant_id = c.tenant_id
+WHERE r.ref <> c.claim_id
+ON CONFLICT DO NOTHING;
@@ -1,9 +1,11 @@
 import logging
 import os
 import secrets
+import time
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request, stream_with_context
 
+from src.service import telemetry
 from src.service.auth.claims import AuthError, VerifiedClaims, claims_from_request
 
 from src.service.ingress_runner import execute_ingress
@@ -12,10 +14,12 @@ from src.service.tenant.registry import ensure_tenant_registered, enforcement_en
 
 # Optional DB persistence (enabled via env var)
 try:
-    from src.service.db.postgres import get_conn, insert_execution_record, get_execution_record, list_execution_records, upsert_tenant
+    from src.service.db.postgres import get_conn, connection, pool_stats, insert_execution_record, get_execution_record, list_execution_records, upsert_tenant
 except Exception as _db_import_err:
     logging.warning("DB module not available: %s", _db_import_err)
     get_conn = None  # type: ignore
+    connection = None  # type: ignore
+    pool_stats = None  # type: ignore
     insert_execution_record = None  # type: ignore
     get_execution_record = None  # type: ignore
     list_execution_records = None  # type: ignore
@@ -118,6 +122,28 @@ def _require_api_key_or_dev_harness():
     return True, None
 
 
+def _require_metrics_token_or_dev_harness():
+    """
+    Gate for /metrics:
+      - If dev harness enabled: allow (dev/test only)
+      - Else: require "Authorization: Bearer <EXECALC_METRICS_TOKEN>"
+    Disabled (403) when no token is configured.
+    """
+    if _dev_harness_enabled():
+        return True, None
+
+    expected = os.getenv("EXECALC_METRICS_TOKEN", "").strip()
+    if not expected:
+        return False, ({"ok": False, "error": "forbidden"}, 403)
+
+    auth = (request.headers.get("Authorization") or "").strip()
+    provided = auth[len("Bearer "):].strip() if auth.startswith("Bearer ") else ""
+    if not provided or not secrets.compare_digest(provided, expected):
+        return False, ({"ok": False, "error": "forbidden"}, 403)
+
+    return True, None
+
+
 def _claims_or_denial():
     """Return (claims, denial) where denial is a (payload, status) tuple."""
     try:
@@ -284,14 +310,43 @@ def readyz():
     """
     if _persist_enabled():
         try:
-            conn = get_conn()
-            conn.close()
+            with connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT 1")
         except Exception as e:
             return jsonify({"ok": False, "error": "db_unavailable", "detail": str(e)}), 503
 
     return jsonify({"ok": True, "ready": True}), 200
 
 
+@app.get("/metrics")
+def metrics():
+    """
+    Prometheus text exposition of stage and request latency histograms.
+    - Bearer-token guarded (EXECALC_METRICS_TOKEN), or dev harness
+    - No tenant context
+    """
+    allowed, denial = _require_metrics_token_or_dev_harness()
+    if not allowed:
+        return denial
+    return Response(telemetry.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started_at = time.perf_counter()
+
+
+@app.after_request
+def _observe_request_duration(response):
+    started = g.get("request_started_at")
+    if started is not None and request.endpoint != "metrics":
+        telemetry.HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            endpoint=request.endpoint or "unmatched",
+        )
+    return response
+
+
 @app.route("/status", methods=["GET"])
 def status():
     logging.info("Received status request")
@@ -332,6 +387,7 @@ def status():
         "envelope_id": record.envelope_id,
         **record.result,
         **_persist_execution(record),
+        "db_pool": pool_stats() if pool_stats is not None else None,
     }
     status_code = 200 if response.get("ok") else 400
     return jsonify(response), status_code
@@ -584,31 +640,28 @@ def db_info():
         return info
 
     try:
-        conn = get_conn()
-        try:
-            with conn, conn.cursor() as cur:
-                cur.execute(
-                    "SELECT table_schema, table_name "
-                    "FROM information_schema.tables "
-                    "WHERE table_schema NOT IN ('pg_catalog','information_schema') "
-                    "ORDER BY table_schema, table_name;"
-                )
-                rows = cur.fetchall()
-                info["tables"] = [{"schema": r[0], "name": r[1]} for r in rows]
-
-                cur.execute(
-                    "SELECT ordinal_position, column_name, data_type "
-                    "FROM information_schema.columns "
-                    "WHERE table_schema='public' AND table_name='execution_records' "
-                    "ORDER BY ordinal_position;"
-                )
-                cols = cur.fetchall()
-                if cols:
-                    info["execution_records_columns"] = [
-                        {"pos": c[0], "name": c[1], "type": c[2]} for c in cols
-                    ]
-        finally:
-            conn.close()
+        with connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT table_schema, table_name "
+                "FROM information_schema.tables "
+                "WHERE table_schema NOT IN ('pg_catalog','information_schema') "
+                "ORDER BY table_schema, table_name;"
+            )
+            rows = cur.fetchall()
+            info["tables"] = [{"schema": r[0], "name": r[1]} for r in rows]
+
+            cur.execute(
+                "SELECT ordinal_position, column_name, data_type "
+                "FROM information_schema.columns "
+                "WHERE table_schema='public' AND table_name='execution_records' "
+                "ORDER BY ordinal_position;"
+            )
+            cols = cur.fetchall()
+            if cols:
+                info["execution_records_columns"] = [
+                    {"pos": c[0], "name": c[1], "type": c[2]} for c in cols
+                ]
+        info["db_pool"] = pool_stats()
     except Exception as e:
         logging.exception("Unhandled error in /db-info")
         return {"ok": False, "error_type": e.__class__.__name__, "error": str(e)}, 500
@@ -813,26 +866,32 @@ from src.service.qualitative_capture import (
     generate_session_packet,
     get_session_rail,
     ingest_event,
+    ingest_events,
     memorialize,
     nominate_for_promotion,
     approve_candidate,
     reject_candidate,
+    export_claims_ndjson,
+    list_claims_page,
     process_pending_artifacts,
-    retrieve_doctrine,
-    retrieve_risks,
-    retrieve_opportunities,
-    retrieve_decisions,
-    retrieve_open_questions,
-    search_claims,
+    retrieve_categories,
+    search_claims_page,
     retrieve_session_conclusions,
 )
+from src.service.qualitative_capture import capture_queue
 from src.service.qualitative_capture.deconstructor import deconstruct_event
 from src.service.qualitative_capture.repository import insert_nugget
 
 
 @app.post("/qcr/events")
 def qcr_ingest_event():
-    """Ingest a conversation event and extract GAQP claims into the corpus."""
+    """
+    Ingest a conversation event and queue it for GAQP claim capture.
+
+    Returns 202 once the event is stored; capture workers deconstruct it
+    asynchronously (see qualitative_capture.capture_queue). If the event
+    could not be stored, nothing is queued and capture runs inline (200).
+    """
     allowed, denial = _require_api_key_or_dev_harness()
     if not allowed:
         return denial
@@ -863,10 +922,19 @@ def qcr_ingest_event():
             user_id=claims.user_id,
             role=role,
             message_text=message_text,
+            domain=domain,
         )
     except ValueError as e:
         return {"ok": False, "error": str(e)}, 400
 
+    if event.capture_queued_at is not None:
+        capture_queue.notify()
+        return {
+            "ok": True,
+            "event_id": event.event_id,
+            "capture_status": "queued",
+        }, 202
+
     nuggets = deconstruct_event(event, domain=domain)
     nuggets_persisted = 0
     for nugget in nuggets:
@@ -879,11 +947,67 @@ def qcr_ingest_event():
     return {
         "ok": True,
         "event_id": event.event_id,
+        "capture_status": "inline",
         "nuggets_extracted": len(nuggets),
         "nuggets_persisted": nuggets_persisted,
     }, 200
 
 
+_DEFAULT_QCR_BATCH_MAX_EVENTS = 500
+
+
+@app.post("/qcr/events:batch")
+def qcr_ingest_events():
+    """
+    Ingest a batch of conversation events (e.g. a transcript replay) and
+    capture their nuggets in one transaction.
+
+    Body: {"session_id", "domain", "events": [{"role", "message_text",
+    "event_id"?, "session_id"?, "domain"?, "token_count"?}, ...]}. Returns
+    one result per event in submission order; invalid events do not block
+    the rest. Client event_ids are scoped to the caller's tenant; each
+    result carries the stored event_id alongside it. 503 if the batch could
+    not be stored (nothing was written).
+    """
+    allowed, denial = _require_api_key_or_dev_harness()
+    if not allowed:
+        return denial
+
+    claims, denial = _claims_or_denial()
+    if denial:
+        return denial
+    if not claims.tenant_id:
+        return {"ok": False, "error": "tenant_id is required"}, 400
+    if claims.role not in ("admin", "operator"):
+        return {"ok": False, "error": "forbidden"}, 403
+
+    body = request.get_json(force=True, silent=False) or {}
+    events = body.get("events")
+    if not isinstance(events, list) or not events:
+        return {"ok": False, "error": "events must be a non-empty list"}, 400
+    max_events = int(os.getenv("EXECALC_QCR_BATCH_MAX_EVENTS", str(_DEFAULT_QCR_BATCH_MAX_EVENTS)))
+    if len(events) > max_events:
+        return {"ok": False, "error": f"batch exceeds {max_events} events"}, 413
+
+    results = ingest_events(
+        tenant_id=claims.tenant_id,
+        user_id=claims.user_id,
+        events=events,
+        session_id=str(body.get("session_id") or "") or None,
+        domain=str(body.get("domain") or "strategy"),
+    )
+
+    counts = {"ingested": 0, "duplicate": 0, "invalid": 0, "failed": 0}
+    for r in results:
+        counts[r.status] += 1
+    failed = counts["failed"] > 0
+    return {
+        "ok": not failed,
+        "summary": {**counts, "nuggets_persisted": sum(r.nuggets_persisted for r in results)},
+        "results": [r.to_dict() for r in results],
+    }, 503 if failed else 200
+
+
 @app.post("/qcr/ideas")
 def qcr_memorialize():
     """Memorialize a human-selected idea from a session."""
@@ -979,8 +1103,13 @@ def qcr_get_nuggets():
     Retrieve nuggets from the corpus.
 
     Query params:
-      category — doctrine | risks | opportunities | decisions | open
-      q        — keyword search (takes precedence over category)
+      category — doctrine | risks | opportunities | decisions | causal |
+                 structural | open, or several comma-separated (answered in
+                 one query, returned under "categories"); limit per category
+                 (default 20, max 100)
+      q        — full-text search (takes precedence over category); ranked,
+                 paged with limit (default 20, max 100) and cursor, the
+                 next_cursor of the previous page
       session_id, domain — optional scope filters
     """
     allowed, denial = _require_api_key_or_dev_harness()
@@ -1002,23 +1131,120 @@ def qcr_get_nuggets():
     category = (request.args.get("category") or "").lower()
 
     if query.strip():
-        nuggets = search_claims(
-            tenant_id=tenant_id, query=query, session_id=session_id, domain=domain
-        )
-    elif category == "doctrine":
-        nuggets = retrieve_doctrine(tenant_id=tenant_id, session_id=session_id)
-    elif category == "risks":
-        nuggets = retrieve_risks(tenant_id=tenant_id, session_id=session_id)
-    elif category == "opportunities":
-        nuggets = retrieve_opportunities(tenant_id=tenant_id, session_id=session_id)
-    elif category == "decisions":
-        nuggets = retrieve_decisions(tenant_id=tenant_id, session_id=session_id)
-    elif category == "open":
-        nuggets = retrieve_open_questions(tenant_id=tenant_id, session_id=session_id)
-    else:
+        try:
+            limit = max(1, min(int(request.args.get("limit") or 20), 100))
+            page = search_claims_page(
+                tenant_id=tenant_id,
+                query=query,
+                session_id=session_id,
+                domain=domain,
+                cursor=request.args.get("cursor") or None,
+                limit=limit,
+            )
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}, 400
+        return {
+            "ok": True,
+            "nuggets": page.nuggets,
+            "count": len(page.nuggets),
+            "next_cursor": page.next_cursor,
+        }, 200
+    elif not category:
         return {"ok": False, "error": "category or q is required"}, 400
 
-    return {"ok": True, "nuggets": nuggets, "count": len(nuggets)}, 200
+    names = [c.strip() for c in category.split(",") if c.strip()]
+    try:
+        limit = max(1, min(int(request.args.get("limit") or 20), 100))
+        by_category = retrieve_categories(
+            tenant_id=tenant_id, categories=names, session_id=session_id, limit=limit,
+        )
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}, 400
+    if len(names) == 1:
+        nuggets = by_category[names[0]]
+        return {"ok": True, "nuggets": nuggets, "count": len(nuggets)}, 200
+    return {
+        "ok": True,
+        "categories": by_category,
+        "count": sum(len(v) for v in by_category.values()),
+    }, 200
+
+
+@app.get("/qcr/nuggets:page")
+def qcr_page_nuggets():
+    """
+    Page through the corpus, best first (confidence, newest, nugget_id).
+
+    Query params:
+      limit          — page size (default 50, max 500)
+      cursor         — the next_cursor of the previous page
+      session_id, claim_type, min_confidence — optional filters
+    """
+    allowed, denial = _require_api_key_or_dev_harness()
+    if not allowed:
+        return denial
+
+    claims, denial = _claims_or_denial()
+    if denial:
+        return denial
+    if not claims.tenant_id:
+        return {"ok": False, "error": "tenant_id is required"}, 400
+    if claims.role not in ("admin", "operator"):
+        return {"ok": False, "error": "forbidden"}, 403
+
+    try:
+        limit = max(1, min(int(request.args.get("limit") or 50), 500))
+        min_confidence = float(request.args.get("min_confidence") or 0.0)
+        page = list_claims_page(
+            tenant_id=claims.tenant_id,
+            session_id=request.args.get("session_id") or None,
+            claim_type=request.args.get("claim_type") or None,
+            min_confidence=min_confidence,
+            cursor=request.args.get("cursor") or None,
+            limit=limit,
+        )
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}, 400
+    return {
+        "ok": True,
+        "nuggets": page.nuggets,
+        "count": len(page.nuggets),
+        "next_cursor": page.next_cursor,
+    }, 200
+
+
+@app.get("/qcr/nuggets:export")
+def qcr_export_nuggets():
+    """
+    Stream every nugget for the tenant as NDJSON, oldest first.
+
+    Rows come from a server-side cursor and are written as they arrive, so
+    memory stays flat for any corpus size. Optional filters: session_id,
+    claim_type. A final {"error": "export_failed"} line marks a truncated
+    export.
+    """
+    allowed, denial = _require_api_key_or_dev_harness()
+    if not allowed:
+        return denial
+
+    claims, denial = _claims_or_denial()
+    if denial:
+        return denial
+    if not claims.tenant_id:
+        return {"ok": False, "error": "tenant_id is required"}, 400
+    if claims.role != "admin":
+        return {"ok": False, "error": "forbidden"}, 403
+
+    lines = export_claims_ndjson(
+        tenant_id=claims.tenant_id,
+        session_id=request.args.get("session_id") or None,
+        claim_type=request.args.get("claim_type") or None,
+    )
+    return Response(
+        stream_with_context(lines),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="nuggets-{claims.tenant_id}.ndjson"'},
+    )
 
 
 @app.post("/qcr/second-order/run")
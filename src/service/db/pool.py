@@ -0,0 +1,260 @@
+"""
+Process-wide Postgres connection pool.
+
+One pool per process, shared by every repository module through
+src.service.db.postgres.connection(). Tenant isolation stays in the SQL
+predicates of each repository — pooled connections carry no tenant state.
+
+Behavior:
+- Bounded: at most max_size connections are open at once; callers block
+  for up to acquire_timeout seconds, then PoolTimeout is raised.
+- Health-checked: a connection idle longer than ping_after seconds is
+  pinged (SELECT 1) before it is handed out; broken ones are discarded.
+- Recycled: connections older than max_age seconds are closed on return.
+- Fork-safe: a child process never reuses connections inherited from its
+  parent (gunicorn --preload); it starts with an empty pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(RuntimeError):
+    """Raised when no pooled connection became available within acquire_timeout."""
+
+
+@dataclass
+class _Slot:
+    conn: Any
+    created_at: float
+    last_used_at: float
+
+
+_live_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        max_size: int = 10,
+        acquire_timeout: float = 10.0,
+        max_age: float = 1800.0,
+        ping_after: float = 30.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_age = max_age
+        self.ping_after = ping_after
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: Deque[_Slot] = deque()
+        self._in_use: Dict[int, _Slot] = {}
+        self._pending = 0
+        self._waiting = 0
+        self._pid = os.getpid()
+        # Connections inherited across fork are kept referenced, never closed:
+        # closing them in the child would terminate the parent's sessions.
+        self._inherited: List[Any] = []
+        self._disposed = False
+
+        self._created = 0
+        self._discarded = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._peak_in_use = 0
+
+        _live_pools.add(self)
+
+    # -- checkout / return -------------------------------------------------
+
+    def acquire(self) -> Any:
+        """Check out a healthy connection, opening a new one if capacity allows."""
+        self._check_pid()
+        deadline = time.monotonic() + self.acquire_timeout
+
+        with self._cond:
+            waited = False
+            while True:
+                if self._idle:
+                    slot: Optional[_Slot] = self._idle.pop()
+                    break
+                if len(self._in_use) + self._pending < self.max_size:
+                    slot = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"No DB connection available within {self.acquire_timeout:.1f}s "
+                        f"(max_size={self.max_size})"
+                    )
+                if not waited:
+                    self._waits += 1
+                    waited = True
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            # Counted against max_size while health-checking or connecting.
+            self._pending += 1
+
+        try:
+            if slot is not None and not self._healthy(slot):
+                self._close(slot.conn)
+                with self._cond:
+                    self._discarded += 1
+                slot = None
+            if slot is None:
+                conn = self._factory()
+                now = time.monotonic()
+                slot = _Slot(conn=conn, created_at=now, last_used_at=now)
+                with self._cond:
+                    self._created += 1
+        except Exception:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._pending -= 1
+            self._in_use[id(slot.conn)] = slot
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, len(self._in_use))
+        return slot.conn
+
+    def release(self, conn: Any) -> None:
+        """Return a connection to the pool, discarding it if broken or expired."""
+        if os.getpid() != self._pid:
+            return
+
+        with self._cond:
+            slot = self._in_use.pop(id(conn), None)
+        if slot is None:
+            logger.warning("release() called with a connection not checked out from this pool")
+            return
+
+        now = time.monotonic()
+        keep = (
+            not self._disposed
+            and not getattr(conn, "closed", 0)
+            and (now - slot.created_at) < self.max_age
+        )
+        if keep:
+            keep = self._reset(conn)
+
+        with self._cond:
+            if keep:
+                slot.last_used_at = now
+                self._idle.append(slot)
+            else:
+                self._discarded += 1
+            self._cond.notify()
+
+        if not keep:
+            self._close(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection. Checked-out connections close on release."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._disposed = True
+        for slot in idle:
+            self._close(slot.conn)
+
+    # -- metrics -----------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            in_use = len(self._in_use)
+            return {
+                "max_size": self.max_size,
+                "size": in_use + len(self._idle),
+                "in_use": in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "saturation": round(in_use / self.max_size, 3),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "connections_created": self._created,
+                "connections_discarded": self._discarded,
+            }
+
+    # -- internals ---------------------------------------------------------
+
+    def _healthy(self, slot: _Slot) -> bool:
+        conn = slot.conn
+        if getattr(conn, "closed", 0):
+            return False
+        now = time.monotonic()
+        if now - slot.created_at >= self.max_age:
+            return False
+        if now - slot.last_used_at < self.ping_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            logger.warning("Discarding pooled DB connection that failed its health check")
+            return False
+
+    @staticmethod
+    def _reset(conn: Any) -> bool:
+        # Leave no open transaction behind for the next borrower.
+        try:
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _check_pid(self) -> None:
+        if os.getpid() != self._pid:
+            self._after_fork()
+
+    def _after_fork(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._inherited.extend(s.conn for s in self._idle)
+        self._inherited.extend(s.conn for s in self._in_use.values())
+        self._idle.clear()
+        self._in_use.clear()
+        self._pending = 0
+        self._waiting = 0
+        self._pid = os.getpid()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_live_pools):
+        pool._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
@@ -1,17 +1,32 @@
 """
 Postgres DB helpers (Cloud SQL via local proxy or Cloud Run connector)
 
-This module is intentionally minimal:
-- One connection factory
-- One insert function for execution_records
+This module provides:
+- get_conn(), the connection factory, fronted by a process-wide pool
+  (get_pool / connection())
+- unit_of_work(): one connection and one transaction shared by every
+  connection() block in the current context, with per-block savepoints
+  before the write phase and all-or-nothing writes after it
+- after_commit() hooks that run once the current transaction commits
+- DB round-trip counting per statement, reported to telemetry
+- Insert/read helpers for execution_records and tenants
 
 All configuration comes from environment variables.
 """
 
 from __future__ import annotations
 
+import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.service import telemetry
+from src.service.db.pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
 
 
 def _env(name: str, default: Optional[str] = None) -> str:
@@ -59,9 +74,315 @@ def get_conn():
         dbname=dbname,
         user=user,
         password=password,
+        connection_factory=_counting_connection_class(psycopg2),
     )
 
 
+_CountingConnection: Any = None
+
+
+def _counting_connection_class(psycopg2: Any) -> Any:
+    """
+    psycopg2 connection subclass that reports each statement to telemetry as
+    one DB round trip (per-stage counts in execution_trace), plus explicit
+    commit/rollback calls that end an open transaction. Not counted: a
+    commit/rollback with no transaction open (psycopg2 sends nothing — e.g.
+    the pool's reset on release), and the closing commit/rollback of a
+    `with conn:` block, which belongs to the block's statements — so one
+    SELECT in a connection() block is one round trip. Built on first use so
+    psycopg2 stays a lazy import.
+    """
+    global _CountingConnection
+    if _CountingConnection is not None:
+        return _CountingConnection
+
+    ext = psycopg2.extensions
+
+    class _CountingCursor(ext.cursor):
+        def execute(self, query, vars=None):
+            telemetry.note_db_round_trip()
+            return super().execute(query, vars)
+
+        def executemany(self, query, vars_list):
+            # psycopg2 sends one statement per parameter set.
+            vars_list = list(vars_list)
+            telemetry.note_db_round_trip(len(vars_list))
+            return super().executemany(query, vars_list)
+
+    class CountingConnection(ext.connection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.cursor_factory = _CountingCursor
+            self._closing_block = False
+
+        def __exit__(self, exc_type, exc, tb):
+            # psycopg2 ends the block through commit()/rollback() by name.
+            self._closing_block = True
+            try:
+                return super().__exit__(exc_type, exc, tb)
+            finally:
+                self._closing_block = False
+
+        def _note_transaction_end(self):
+            if not self._closing_block and self.status != ext.STATUS_READY:
+                telemetry.note_db_round_trip()
+
+        def commit(self):
+            self._note_transaction_end()
+            return super().commit()
+
+        def rollback(self):
+            self._note_transaction_end()
+            return super().rollback()
+
+    _CountingConnection = CountingConnection
+    return _CountingConnection
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    Optional:
+    EXECALC_DB_POOL_MAX_SIZE (default 10)
+    EXECALC_DB_POOL_TIMEOUT_SECONDS (default 10) — max wait for a free connection
+    EXECALC_DB_POOL_MAX_AGE_SECONDS (default 1800) — recycle connections older than this
+    EXECALC_DB_POOL_PING_AFTER_SECONDS (default 30) — health-check connections idle this long
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    get_conn,
+                    max_size=int(os.getenv("EXECALC_DB_POOL_MAX_SIZE", "10")),
+                    acquire_timeout=float(os.getenv("EXECALC_DB_POOL_TIMEOUT_SECONDS", "10")),
+                    max_age=float(os.getenv("EXECALC_DB_POOL_MAX_AGE_SECONDS", "1800")),
+                    ping_after=float(os.getenv("EXECALC_DB_POOL_PING_AFTER_SECONDS", "30")),
+                )
+    return _pool
+
+
+def reset_pool() -> None:
+    """Close idle pooled connections and drop the pool (tests, config reload)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+
+
+def pool_stats() -> Optional[Dict[str, Any]]:
+    """Saturation metrics for the process-wide pool, or None if no pool exists yet."""
+    pool = _pool
+    return pool.stats() if pool is not None else None
+
+
+@contextmanager
+def connection() -> Iterator[Any]:
+    """
+    Check out a pooled connection for one transaction.
+
+    Commits when the block exits cleanly, rolls back on exception, and
+    always returns the connection to the pool:
+
+        with connection() as conn, conn.cursor() as cur:
+            cur.execute(...)
+    """
+    uow = _current_uow.get()
+    if uow is not None:
+        with uow.block() as conn:
+            yield conn
+        return
+
+    pool = get_pool()
+    conn = pool.acquire()
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.release(conn)
+
+
+class UnitOfWorkAborted(RuntimeError):
+    """Raised when using a unit of work whose transaction was rolled back by a failed write."""
+
+
+class UnitOfWork:
+    """
+    One pooled connection and one transaction shared by every connection()
+    block opened in the current context.
+
+    The connection is checked out lazily, on the first connection() block, so
+    a request that never reaches the DB never holds one. Nested blocks do not
+    commit; the owner commits once.
+
+    Failure handling:
+    - Before begin_writes(): a failed block is undone on its own and the
+      request carries on. A block that joins an open transaction starts
+      with a SAVEPOINT and a failure rolls back to it, so earlier blocks'
+      work and their on_commit callbacks survive; the first block has
+      nothing earlier to lose and rolls back plainly. If the savepoint
+      cannot be restored the unit aborts rather than commit a partial
+      transaction.
+    - After begin_writes(): a failed block aborts the unit. The transaction is
+      rolled back and every later block raises UnitOfWorkAborted, so the
+      writes land together or not at all.
+    """
+
+    def __init__(self) -> None:
+        self._pool: Optional[ConnectionPool] = None
+        self._conn: Any = None
+        self.writing = False
+        self.aborted = False
+        self.blocks = 0
+        self._in_transaction = False
+        self._after_commit: List[Callable[[], None]] = []
+
+    @contextmanager
+    def block(self) -> Iterator[Any]:
+        if self.aborted:
+            raise UnitOfWorkAborted("unit of work aborted by an earlier failed write")
+        if self._conn is None:
+            pool = get_pool()
+            self._conn = pool.acquire()
+            self._pool = pool
+        self.blocks += 1
+        savepoint = None
+        if self._in_transaction and not self.writing:
+            savepoint = f"uow_block_{self.blocks}"
+            with self._conn.cursor() as cur:
+                cur.execute(f"SAVEPOINT {savepoint}")
+        callbacks_before = len(self._after_commit)
+        self._in_transaction = True
+        try:
+            yield self._conn
+        except BaseException:
+            if self.writing:
+                self._rollback()
+                self.aborted = True
+            elif savepoint is not None:
+                self._rollback_to(savepoint, callbacks_before)
+            else:
+                self._rollback()
+            raise
+
+    def begin_writes(self) -> None:
+        """Mark the start of the all-or-nothing write phase."""
+        self.writing = True
+
+    def on_commit(self, fn: Callable[[], None]) -> None:
+        """Run fn once the shared transaction commits; dropped on rollback."""
+        self._after_commit.append(fn)
+
+    def commit(self) -> None:
+        """Commit the shared transaction. Raises UnitOfWorkAborted if a write failed."""
+        if self.aborted:
+            raise UnitOfWorkAborted("unit of work aborted by an earlier failed write")
+        if self._conn is not None and self._in_transaction:
+            try:
+                self._conn.commit()
+                self._in_transaction = False
+            except BaseException:
+                self.aborted = True
+                self._rollback()
+                raise
+        callbacks, self._after_commit = self._after_commit, []
+        for fn in callbacks:
+            try:
+                fn()
+            except Exception:
+                logger.exception("after-commit callback failed")
+
+    def _rollback(self) -> None:
+        self._in_transaction = False
+        self._after_commit.clear()
+        if self._conn is not None:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+
+    def _rollback_to(self, savepoint: str, callbacks_before: int) -> None:
+        """Undo one failed pre-write block, keeping the work before it."""
+        del self._after_commit[callbacks_before:]
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+        except Exception:
+            logger.exception("rollback to savepoint failed; aborting unit of work")
+            self._rollback()
+            self.aborted = True
+
+    def _release(self) -> None:
+        if self._conn is not None and self._pool is not None:
+            self._pool.release(self._conn)
+        self._conn = None
+        self._pool = None
+
+
+_current_uow: ContextVar[Optional[UnitOfWork]] = ContextVar("db_unit_of_work", default=None)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """
+    Run every connection() block inside this context on one connection and
+    one transaction, committed once on clean exit.
+
+    Nested unit_of_work() calls join the outermost unit.
+    """
+    outer = _current_uow.get()
+    if outer is not None:
+        yield outer
+        return
+
+    uow = UnitOfWork()
+    token = _current_uow.set(uow)
+    try:
+        try:
+            yield uow
+        finally:
+            # Leave the context before the final commit, so after-commit
+            # callbacks that write get their own transaction instead of
+            # joining one that has already committed.
+            _current_uow.reset(token)
+        if uow.aborted:
+            uow._rollback()
+        else:
+            uow.commit()
+    except BaseException:
+        uow._rollback()
+        raise
+    finally:
+        uow._release()
+
+
+def in_unit_of_work() -> bool:
+    """True while a unit_of_work() is open in the current context."""
+    return _current_uow.get() is not None
+
+
+def after_commit(fn: Callable[[], None]) -> None:
+    """
+    Run fn after the current transaction commits.
+
+    Inside a unit of work, fn is deferred until the unit commits and dropped
+    if it rolls back. Outside one, connection() blocks have already committed
+    by the time their caller returns, so fn runs immediately. Used to keep
+    in-process caches from observing writes that never landed.
+    """
+    uow = _current_uow.get()
+    if uow is None:
+        fn()
+    else:
+        uow.on_commit(fn)
+
+
 def insert_execution_record(
     *,
     tenant_id: str,
@@ -76,19 +397,15 @@ def insert_execution_record(
     _psycopg2, Json = _load_psycopg2()
     ok = bool(result.get("ok"))
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO execution_records (tenant_id, envelope_id, ok, result)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (tenant_id, envelope_id) DO NOTHING
-                """,
-                (tenant_id, envelope_id, ok, Json(result)),
-            )
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO execution_records (tenant_id, envelope_id, ok, result)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (tenant_id, envelope_id) DO NOTHING
+            """,
+            (tenant_id, envelope_id, ok, Json(result)),
+        )
 
 
 def get_execution_record(*, tenant_id: str, envelope_id: str) -> Optional[Dict[str, Any]]:
@@ -96,30 +413,26 @@ def get_execution_record(*, tenant_id: str, envelope_id: str) -> Optional[Dict[s
     Fetch a single execution record by (tenant_id, envelope_id).
     Returns None if not found.
     """
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT tenant_id, envelope_id, ok, result, created_at
-                FROM execution_records
-                WHERE tenant_id = %s AND envelope_id = %s
-                """,
-                (tenant_id, envelope_id),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            t_id, e_id, ok, result, created_at = row
-            return {
-                "tenant_id": t_id,
-                "envelope_id": e_id,
-                "ok": bool(ok),
-                "result": result,
-                "created_at": created_at.isoformat(),
-            }
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT tenant_id, envelope_id, ok, result, created_at
+            FROM execution_records
+            WHERE tenant_id = %s AND envelope_id = %s
+            """,
+            (tenant_id, envelope_id),
+        )
+        row = cur.fetchone()
+        if not row:
+            return None
+        t_id, e_id, ok, result, created_at = row
+        return {
+            "tenant_id": t_id,
+            "envelope_id": e_id,
+            "ok": bool(ok),
+            "result": result,
+            "created_at": created_at.isoformat(),
+        }
 
 
 def list_execution_records(*, tenant_id: str, limit: int = 25):
@@ -132,33 +445,29 @@ def list_execution_records(*, tenant_id: str, limit: int = 25):
     if limit > 100:
         limit = 100
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT tenant_id, envelope_id, ok, created_at
-                FROM execution_records
-                WHERE tenant_id = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-                """,
-                (tenant_id, limit),
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT tenant_id, envelope_id, ok, created_at
+            FROM execution_records
+            WHERE tenant_id = %s
+            ORDER BY created_at DESC
+            LIMIT %s
+            """,
+            (tenant_id, limit),
+        )
+        rows = cur.fetchall() or []
+        out = []
+        for t_id, e_id, ok, created_at in rows:
+            out.append(
+                {
+                    "tenant_id": t_id,
+                    "envelope_id": e_id,
+                    "ok": bool(ok),
+                    "created_at": created_at.isoformat(),
+                }
             )
-            rows = cur.fetchall() or []
-            out = []
-            for t_id, e_id, ok, created_at in rows:
-                out.append(
-                    {
-                        "tenant_id": t_id,
-                        "envelope_id": e_id,
-                        "ok": bool(ok),
-                        "created_at": created_at.isoformat(),
-                    }
-                )
-            return out
-    finally:
-        conn.close()
+        return out
 
 
 def upsert_tenant(*, tenant_id: str, tenant_name: str) -> None:
@@ -167,20 +476,16 @@ def upsert_tenant(*, tenant_id: str, tenant_name: str) -> None:
 
     This prevents FK failures when persisting execution_records.
     """
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO tenants (tenant_id, tenant_name, created_at)
-                VALUES (%s, %s, now())
-                ON CONFLICT (tenant_id) DO UPDATE
-                SET tenant_name = CASE
-                    WHEN tenants.tenant_name = tenants.tenant_id THEN EXCLUDED.tenant_name
-                    ELSE tenants.tenant_name
-                END
-                """,
-                (tenant_id, tenant_name),
-            )
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO tenants (tenant_id, tenant_name, created_at)
+            VALUES (%s, %s, now())
+            ON CONFLICT (tenant_id) DO UPDATE
+            SET tenant_name = CASE
+                WHEN tenants.tenant_name = tenants.tenant_id THEN EXCLUDED.tenant_name
+                ELSE tenants.tenant_name
+            END
+            """,
+            (tenant_id, tenant_name),
+        )
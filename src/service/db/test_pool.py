@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.db import postgres
+from src.service.db.pool import ConnectionPool, PoolTimeout
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _fake_conn() -> MagicMock:
+    conn = MagicMock()
+    conn.closed = 0
+    conn.__enter__ = lambda s: s
+    conn.__exit__ = MagicMock(return_value=False)
+    return conn
+
+
+def _pool(**kwargs) -> tuple:
+    created = []
+
+    def factory():
+        c = _fake_conn()
+        created.append(c)
+        return c
+
+    return ConnectionPool(factory, **kwargs), created
+
+
+# ---------------------------------------------------------------------------
+# ConnectionPool
+# ---------------------------------------------------------------------------
+
+class TestConnectionPool:
+    def test_released_connection_is_reused(self):
+        pool, created = _pool(max_size=2)
+        c1 = pool.acquire()
+        pool.release(c1)
+        c2 = pool.acquire()
+        assert c2 is c1
+        assert len(created) == 1
+
+    def test_release_rolls_back_open_transaction(self):
+        pool, _ = _pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.rollback.assert_called_once()
+
+    def test_bounded_size_times_out(self):
+        pool, created = _pool(max_size=1, acquire_timeout=0.01)
+        pool.acquire()
+        with pytest.raises(PoolTimeout):
+            pool.acquire()
+        assert len(created) == 1
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waiter_receives_released_connection(self):
+        pool, created = _pool(max_size=1, acquire_timeout=2.0)
+        held = pool.acquire()
+        got = []
+
+        t = threading.Thread(target=lambda: got.append(pool.acquire()))
+        t.start()
+        pool.release(held)
+        t.join(timeout=2.0)
+
+        assert got == [held]
+        assert len(created) == 1
+        assert pool.stats()["waits"] == 1
+
+    def test_closed_connection_discarded_on_release(self):
+        pool, created = _pool()
+        conn = pool.acquire()
+        conn.closed = 1
+        pool.release(conn)
+        assert pool.acquire() is not conn
+        assert len(created) == 2
+
+    def test_expired_connection_recycled(self):
+        pool, created = _pool(max_age=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close.assert_called_once()
+        assert pool.stats()["idle"] == 0
+
+    def test_idle_connection_pinged_and_replaced_when_broken(self):
+        pool, created = _pool(ping_after=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = Exception("gone")
+        fresh = pool.acquire()
+        assert fresh is not conn
+        assert pool.stats()["connections_discarded"] == 1
+
+    def test_factory_failure_frees_capacity(self):
+        pool = ConnectionPool(MagicMock(side_effect=RuntimeError("db down")), max_size=1)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        assert pool.stats()["size"] == 0
+
+    def test_after_fork_drops_inherited_connections_without_closing(self):
+        pool, created = _pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        pool._after_fork()
+        assert pool.stats()["idle"] == 0
+        conn.close.assert_not_called()
+
+    def test_stats_report_saturation(self):
+        pool, _ = _pool(max_size=4)
+        pool.acquire()
+        pool.acquire()
+        stats = pool.stats()
+        assert stats["in_use"] == 2
+        assert stats["saturation"] == 0.5
+        assert stats["peak_in_use"] == 2
+
+
+# ---------------------------------------------------------------------------
+# postgres.connection()
+# ---------------------------------------------------------------------------
+
+class TestConnectionContextManager:
+    def setup_method(self):
+        postgres.reset_pool()
+
+    def teardown_method(self):
+        postgres.reset_pool()
+
+    def test_connection_returned_to_pool(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with postgres.connection() as c:
+                assert c is conn
+            stats = postgres.pool_stats()
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 1
+
+    def test_connection_returned_on_exception(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with pytest.raises(ValueError):
+                with postgres.connection():
+                    raise ValueError("boom")
+        assert postgres.pool_stats()["in_use"] == 0
+
+    def test_pool_stats_none_before_first_use(self):
+        assert postgres.pool_stats() is None
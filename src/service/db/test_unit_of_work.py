@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.db import postgres
+from src.service.db.postgres import UnitOfWorkAborted, connection, unit_of_work
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _fake_conn() -> MagicMock:
+    conn = MagicMock()
+    conn.closed = 0
+    conn.__enter__ = lambda s: s
+    conn.__exit__ = MagicMock(return_value=False)
+    return conn
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    postgres.reset_pool()
+    yield
+    postgres.reset_pool()
+
+
+# ---------------------------------------------------------------------------
+# unit_of_work
+# ---------------------------------------------------------------------------
+
+class TestUnitOfWork:
+    def test_blocks_share_one_connection_and_commit_once(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn) as factory:
+            with unit_of_work() as uow:
+                with connection() as c1:
+                    pass
+                with connection() as c2:
+                    pass
+        assert c1 is conn and c2 is conn
+        assert factory.call_count == 1
+        assert uow.blocks == 2
+        conn.commit.assert_called_once()
+        conn.__exit__.assert_not_called()
+
+    def test_connection_not_acquired_when_unused(self):
+        with patch("src.service.db.postgres.get_conn") as factory:
+            with unit_of_work():
+                pass
+        factory.assert_not_called()
+
+    def test_connection_returned_to_pool_on_exit(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work():
+                with connection():
+                    pass
+        assert postgres.pool_stats()["in_use"] == 0
+
+    def test_failed_read_rolls_back_and_continues(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work() as uow:
+                with pytest.raises(ValueError):
+                    with connection():
+                        raise ValueError("read failed")
+                with connection():
+                    pass
+        assert uow.aborted is False
+        conn.commit.assert_called_once()
+
+    def test_failed_read_after_earlier_work_rolls_back_to_savepoint(self):
+        conn = _fake_conn()
+        cur = conn.cursor.return_value.__enter__.return_value
+        kept, dropped = MagicMock(), MagicMock()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work() as uow:
+                with connection():
+                    postgres.after_commit(kept)
+                with pytest.raises(ValueError):
+                    with connection():
+                        postgres.after_commit(dropped)
+                        raise ValueError("read failed")
+        statements = [c.args[0] for c in cur.execute.call_args_list]
+        assert statements == ["SAVEPOINT uow_block_2", "ROLLBACK TO SAVEPOINT uow_block_2"]
+        assert uow.aborted is False
+        conn.commit.assert_called_once()
+        kept.assert_called_once()
+        dropped.assert_not_called()
+
+    def test_failed_savepoint_restore_aborts_unit(self):
+        conn = _fake_conn()
+        cur = conn.cursor.return_value.__enter__.return_value
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work() as uow:
+                with connection():
+                    pass
+                cur.execute.side_effect = [None, RuntimeError("connection lost")]
+                with pytest.raises(ValueError):
+                    with connection():
+                        raise ValueError("read failed")
+                with pytest.raises(UnitOfWorkAborted):
+                    uow.commit()
+        assert uow.aborted is True
+        conn.commit.assert_not_called()
+
+    def test_write_phase_blocks_take_no_savepoint(self):
+        conn = _fake_conn()
+        cur = conn.cursor.return_value.__enter__.return_value
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work() as uow:
+                uow.begin_writes()
+                with connection():
+                    pass
+                with connection():
+                    pass
+        cur.execute.assert_not_called()
+
+    def test_failed_write_aborts_unit(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work() as uow:
+                uow.begin_writes()
+                with pytest.raises(ValueError):
+                    with connection():
+                        raise ValueError("write failed")
+                with pytest.raises(UnitOfWorkAborted):
+                    with connection():
+                        pass
+                with pytest.raises(UnitOfWorkAborted):
+                    uow.commit()
+        assert uow.aborted is True
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called()
+
+    def test_exception_in_body_rolls_back(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with pytest.raises(RuntimeError):
+                with unit_of_work():
+                    with connection():
+                        pass
+                    raise RuntimeError("boom")
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called()
+
+    def test_nested_unit_joins_outer(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn) as factory:
+            with unit_of_work() as outer:
+                with unit_of_work() as inner:
+                    with connection():
+                        pass
+        assert inner is outer
+        assert factory.call_count == 1
+        conn.commit.assert_called_once()
+
+    def test_connection_outside_unit_commits_per_block(self):
+        conn = _fake_conn()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with connection():
+                pass
+        conn.__exit__.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# after_commit
+# ---------------------------------------------------------------------------
+
+class TestAfterCommit:
+    def test_runs_immediately_outside_unit(self):
+        fn = MagicMock()
+        postgres.after_commit(fn)
+        fn.assert_called_once()
+
+    def test_deferred_until_unit_commits(self):
+        conn = _fake_conn()
+        fn = MagicMock()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work():
+                with connection():
+                    postgres.after_commit(fn)
+                fn.assert_not_called()
+        fn.assert_called_once()
+
+    def test_dropped_when_unit_rolls_back(self):
+        conn = _fake_conn()
+        fn = MagicMock()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with pytest.raises(RuntimeError):
+                with unit_of_work():
+                    with connection():
+                        postgres.after_commit(fn)
+                    raise RuntimeError("boom")
+        fn.assert_not_called()
+
+    def test_callback_failure_does_not_fail_commit(self):
+        conn = _fake_conn()
+        later = MagicMock()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work():
+                with connection():
+                    postgres.after_commit(MagicMock(side_effect=RuntimeError("cache")))
+                    postgres.after_commit(later)
+        conn.commit.assert_called_once()
+        later.assert_called_once()
+
+    def test_callbacks_run_outside_the_committed_unit(self):
+        conn = _fake_conn()
+        seen = []
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            with unit_of_work():
+                with connection():
+                    postgres.after_commit(lambda: seen.append(postgres.in_unit_of_work()))
+        assert seen == [False]
+
+
+# ---------------------------------------------------------------------------
+# Round-trip counting
+# ---------------------------------------------------------------------------
+
+class _FakeExtensions:
+    """The slice of psycopg2.extensions the counting classes use, with real status tracking."""
+    STATUS_READY = 1
+    STATUS_BEGIN = 2
+
+    class cursor:
+        def __init__(self, conn):
+            self.connection = conn
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, query, vars=None):
+            self.connection.status = _FakeExtensions.STATUS_BEGIN
+
+        def executemany(self, query, vars_list):
+            self.connection.status = _FakeExtensions.STATUS_BEGIN
+
+    class connection:
+        closed = 0
+
+        def __init__(self):
+            self.status = _FakeExtensions.STATUS_READY
+
+        def cursor(self):
+            return self.cursor_factory(self)
+
+        def commit(self):
+            self.status = _FakeExtensions.STATUS_READY
+
+        def rollback(self):
+            self.status = _FakeExtensions.STATUS_READY
+
+        def close(self):
+            self.closed = 1
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            # Like psycopg2: ends the transaction via the methods, by name.
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+            return False
+
+
+class _FakePsycopg2:
+    extensions = _FakeExtensions
+
+
+@pytest.fixture
+def counting_conn():
+    with patch.object(postgres, "_CountingConnection", None):
+        cls = postgres._counting_connection_class(_FakePsycopg2)
+        conn = cls()
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            yield conn
+
+
+class TestRoundTripCounting:
+    def test_empty_block_counts_nothing(self, counting_conn):
+        from src.service import telemetry
+
+        with telemetry.trace() as t:
+            with connection():
+                pass
+        assert t.db_round_trips == 0
+
+    def test_one_select_counts_exactly_one(self, counting_conn):
+        from src.service import telemetry
+
+        with telemetry.trace() as t:
+            with connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT 1")
+        assert t.db_round_trips == 1
+
+    def test_explicit_commit_of_open_transaction_counts(self, counting_conn):
+        from src.service import telemetry
+
+        with telemetry.trace() as t:
+            with unit_of_work():
+                with connection() as conn, conn.cursor() as cur:
+                    cur.execute("INSERT ...")
+        assert t.db_round_trips == 2
+
+    def test_executemany_counts_one_per_parameter_set(self, counting_conn):
+        from src.service import telemetry
+
+        with telemetry.trace() as t:
+            with connection() as conn, conn.cursor() as cur:
+                cur.executemany("INSERT ...", iter([(1,), (2,), (3,)]))
+        assert t.db_round_trips == 3
+
+    def test_counting_connection_class_wraps_psycopg2(self):
+        psycopg2 = pytest.importorskip("psycopg2")
+        cls = postgres._counting_connection_class(psycopg2)
+        assert issubclass(cls, psycopg2.extensions.connection)
+        assert postgres._counting_connection_class(psycopg2) is cls
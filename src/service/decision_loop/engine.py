@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from src.service import telemetry
 from src.service.decision_loop.models import DecisionReport, Scenario, SensitivityVariable
 from src.service.decision_loop.support_stack import support_stack_trace
 from src.service.gaqp.models import ActivationBundle
@@ -392,21 +393,24 @@ def run_decision_loop(
     if scenario.stakeholder_scope:
         next_actions.append("Map stakeholder reactions and identify who benefits, resists, or loses leverage.")
 
-    prime = _build_prime_directive_assessments(scenario, sensitivity)
-    polymorphia = _build_polymorphia_fields(scenario, sensitivity)
-
-    gaqp_pre = _apply_gaqp_preconditioning(
-        bundle=activation_bundle,
-        upside=upside,
-        downside=downside,
-        rationale=rationale,
-        next_actions=next_actions,
-        confidence=confidence,
-    ) if activation_bundle is not None else {
-        "upside": upside, "downside": downside, "rationale": rationale,
-        "next_actions": next_actions, "confidence": confidence,
-        "trace": {"claims_applied": 0, "claim_types": [], "bundle_size": 0},
-    }
+    with telemetry.span("prime_directive"):
+        prime = _build_prime_directive_assessments(scenario, sensitivity)
+    with telemetry.span("polymorphia"):
+        polymorphia = _build_polymorphia_fields(scenario, sensitivity)
+
+    with telemetry.span("gaqp_preconditioning"):
+        gaqp_pre = _apply_gaqp_preconditioning(
+            bundle=activation_bundle,
+            upside=upside,
+            downside=downside,
+            rationale=rationale,
+            next_actions=next_actions,
+            confidence=confidence,
+        ) if activation_bundle is not None else {
+            "upside": upside, "downside": downside, "rationale": rationale,
+            "next_actions": next_actions, "confidence": confidence,
+            "trace": {"claims_applied": 0, "claim_types": [], "bundle_size": 0},
+        }
 
     upside = gaqp_pre["upside"]
     downside = gaqp_pre["downside"]
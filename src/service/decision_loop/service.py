@@ -5,12 +5,14 @@ import secrets
 from datetime import UTC, datetime, timedelta
 from typing import Any, Callable, Dict
 
+from src.service import telemetry
+from src.service.db.postgres import UnitOfWork, unit_of_work
 from src.service.decision_loop.engine import run_decision_loop
 from src.service.decision_loop.execution_boundary_engine import evaluate_execution_boundary
-from src.service.decision_loop.models import ActionProposal, ExecutionSnapshot, Scenario
+from src.service.decision_loop.models import ActionProposal, BoundaryDecision, ExecutionSnapshot, Scenario
 from src.service.execution_record import ExecutionRecord
 from src.service.gaqp.activation import activate
-from src.service.gaqp.corpus import insert_claim
+from src.service.gaqp.corpus import insert_claims
 from src.service.gaqp.extraction import admitted_claims, extract_claims
 from src.service.gaqp.models import ActivationBundle
 
@@ -33,6 +35,8 @@ def run_decision_service(
     - invoke decision engine
     - assemble canonical ExecutionRecord
     - call persistence abstraction
+    - run all DB work for the decision in one unit of work
+    - time each stage into report.execution_trace["timings"]
     - return final API-ready payload
     """
     if not isinstance(scenario_in, dict):
@@ -68,8 +72,44 @@ def run_decision_service(
 
     envelope_id = secrets.token_hex(16)
 
+    with telemetry.trace() as trace, unit_of_work() as uow:
+        return _run_decision_pipeline(
+            uow=uow,
+            trace=trace,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            scenario=scenario,
+            scenario_in=scenario_in,
+            envelope_id=envelope_id,
+            persist_fn=persist_fn,
+        )
+
+
+def _run_decision_pipeline(
+    *,
+    uow: UnitOfWork,
+    trace: telemetry.Trace,
+    tenant_id: str,
+    user_id: str,
+    scenario: Scenario,
+    scenario_in: Dict[str, Any],
+    envelope_id: str,
+    persist_fn: Callable[[ExecutionRecord], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Activation → PEM → engine → boundary → extraction → persistence, on one
+    DB connection and one transaction (see UnitOfWork).
+
+    Corpus and PEM reads and the corpus write are best-effort, each undone
+    on its own savepoint if it fails. The execution record is the atomic
+    write phase, and everything is committed once at the end.
+
+    Each stage runs in a telemetry span. The persisted record carries the
+    timings up to persistence; the returned payload carries all of them.
+    """
     try:
-        activation_bundle = activate(scenario=scenario, tenant_id=tenant_id)
+        with telemetry.span("activation"):
+            activation_bundle = activate(scenario=scenario, tenant_id=tenant_id)
     except Exception:
         logger.exception("GAQP activation failed for tenant %s; proceeding without preconditioning", tenant_id)
         activation_bundle = ActivationBundle(
@@ -79,52 +119,26 @@ def run_decision_service(
 
     try:
         from src.service.memory import get_upstream_context
-        memory_context = get_upstream_context(
-            tenant_id=tenant_id,
-            scenario_type=scenario.scenario_type,
-            domain=scenario_in.get("domain"),
-        )
+        with telemetry.span("pem"):
+            memory_context = get_upstream_context(
+                tenant_id=tenant_id,
+                scenario_type=scenario.scenario_type,
+                domain=scenario_in.get("domain"),
+            )
     except Exception:
         logger.exception("PEM context assembly failed for tenant %s; proceeding without memory", tenant_id)
         memory_context = None
 
-    report = run_decision_loop(
-        tenant_id=tenant_id, user_id=user_id,
-        scenario=scenario, activation_bundle=activation_bundle,
-    )
+    with telemetry.span("engine"):
+        report = run_decision_loop(
+            tenant_id=tenant_id, user_id=user_id,
+            scenario=scenario, activation_bundle=activation_bundle,
+        )
 
-    issued_at = datetime.now(UTC)
-    proposal = ActionProposal(
-        proposal_id=f"proposal_{envelope_id[:12]}",
-        tenant_id=tenant_id,
-        user_id=user_id,
-        action_type="decision_artifact_ready",
-        target_ref=envelope_id,
-        payload={
-            "scenario_type": scenario.scenario_type,
-            "governing_objective": scenario.governing_objective,
-            "requested_depth": scenario.requested_depth,
-        },
-        decision_envelope_id=envelope_id,
-        issued_at=issued_at,
-        expires_at=issued_at + timedelta(minutes=15),
-        authority_context={"user_id": user_id, "tenant_id": tenant_id, "role": "operator"},
-        risk_level="medium",
-        requires_human_review=False,
-    )
-    snapshot = ExecutionSnapshot(
-        snapshot_time=issued_at,
-        tenant_id=tenant_id,
-        user_id=user_id,
-        current_authority={"user_id": user_id, "tenant_id": tenant_id, "role": "operator"},
-        current_state_hash=f"scenario:{scenario.scenario_type}:{scenario.requested_depth}",
-        constraint_flags=[],
-        policy_flags=[],
-        required_inputs_present=True,
-        risk_posture="normal",
-        execution_window_open=True,
-    )
-    boundary = evaluate_execution_boundary(proposal, snapshot)
+    with telemetry.span("boundary"):
+        boundary = _evaluate_boundary(
+            tenant_id=tenant_id, user_id=user_id, scenario=scenario, envelope_id=envelope_id,
+        )
 
     boundary_dict = boundary.to_dict()
     boundary_status = boundary_dict["status"]
@@ -194,34 +208,99 @@ def run_decision_service(
     out["audit"]["execution_boundary"] = boundary_dict
 
     try:
-        new_claims = extract_claims(
-            report=report,
-            tenant_id=tenant_id,
-            source_envelope_id=envelope_id,
-            actor_id=user_id,
-        )
-        for claim in admitted_claims(new_claims):
-            try:
-                insert_claim(claim)
-            except Exception:
-                logger.exception("GAQP corpus write failed for claim %s envelope %s", claim.claim_id, envelope_id)
+        with telemetry.span("extraction"):
+            new_claims = extract_claims(
+                report=report,
+                tenant_id=tenant_id,
+                source_envelope_id=envelope_id,
+                actor_id=user_id,
+            )
     except Exception:
         logger.exception("GAQP extraction failed for envelope %s", envelope_id)
+        new_claims = []
 
     out["gaqp_activation"] = activation_bundle.to_dict()
     out["pem_context"] = memory_context.to_dict() if memory_context is not None else {"item_count": 0, "items": []}
+    execution_trace = out["report"]["execution_trace"]
+    execution_trace["timings"] = trace.to_dict()
+
+    with telemetry.span("persistence"):
+        # The corpus write runs before begin_writes(), so a failure rolls back
+        # to its own savepoint and the decision is persisted without its
+        # claims. Claims that were written commit or roll back with the record.
+        to_insert = admitted_claims(new_claims)
+        if to_insert:
+            try:
+                insert_claims(to_insert)
+            except Exception:
+                logger.exception(
+                    "GAQP corpus write failed for envelope %s; persisting the decision without its claims",
+                    envelope_id,
+                )
 
-    record = ExecutionRecord(
-        tenant_id=tenant_id,
-        envelope_id=envelope_id,
-        result=out,
-    )
-    persisted = persist_fn(record)
+        uow.begin_writes()
+        record = ExecutionRecord(
+            tenant_id=tenant_id,
+            envelope_id=envelope_id,
+            result=out,
+        )
+        persisted = persist_fn(record)
+
+        try:
+            uow.commit()
+        except Exception as e:
+            logger.exception("Decision unit of work failed to commit for envelope %s", envelope_id)
+            if persisted.get("persisted"):
+                persisted = {**persisted, "persisted": False, "persist_error": str(e)}
 
+    execution_trace["timings"] = trace.to_dict()
     out["audit"]["envelope_id"] = envelope_id
     out["audit"]["persist"] = persisted
     return out
 
+
+def _evaluate_boundary(
+    *,
+    tenant_id: str,
+    user_id: str,
+    scenario: Scenario,
+    envelope_id: str,
+) -> BoundaryDecision:
+    """Build the action proposal and snapshot for the artifact and evaluate the boundary."""
+    issued_at = datetime.now(UTC)
+    proposal = ActionProposal(
+        proposal_id=f"proposal_{envelope_id[:12]}",
+        tenant_id=tenant_id,
+        user_id=user_id,
+        action_type="decision_artifact_ready",
+        target_ref=envelope_id,
+        payload={
+            "scenario_type": scenario.scenario_type,
+            "governing_objective": scenario.governing_objective,
+            "requested_depth": scenario.requested_depth,
+        },
+        decision_envelope_id=envelope_id,
+        issued_at=issued_at,
+        expires_at=issued_at + timedelta(minutes=15),
+        authority_context={"user_id": user_id, "tenant_id": tenant_id, "role": "operator"},
+        risk_level="medium",
+        requires_human_review=False,
+    )
+    snapshot = ExecutionSnapshot(
+        snapshot_time=issued_at,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        current_authority={"user_id": user_id, "tenant_id": tenant_id, "role": "operator"},
+        current_state_hash=f"scenario:{scenario.scenario_type}:{scenario.requested_depth}",
+        constraint_flags=[],
+        policy_flags=[],
+        required_inputs_present=True,
+        risk_posture="normal",
+        execution_window_open=True,
+    )
+    return evaluate_execution_boundary(proposal, snapshot)
+
+
 def get_decision_service(
     *,
     tenant_id: str,
@@ -1,5 +1,8 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
+from src.service.db import postgres
+from src.service.db.postgres import connection
 from src.service.decision_loop.service import (
     compare_decisions_service,
     get_decision_service,
@@ -111,6 +114,101 @@ class TestDecisionService(unittest.TestCase):
         self.assertIn("governing_objective:unspecified", out["audit"]["drift"]["anomalies"])
         self.assertEqual(out["audit"]["execution_boundary"]["status"], "ALLOW")
 
+    def test_run_decision_service_uses_one_connection_and_one_commit(self):
+        cur = MagicMock()
+        cur.rowcount = 1
+        cur.fetchall.return_value = []
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.__enter__.return_value = cur
+
+        def persist_fn(record: ExecutionRecord):
+            with connection() as c, c.cursor() as cur_:
+                cur_.execute("INSERT INTO execution_records ...", (record.envelope_id,))
+            return {"persisted": True, "persist_table": "execution_records"}
+
+        postgres.reset_pool()
+        try:
+            with patch("src.service.db.postgres.get_conn", return_value=conn) as factory:
+                out = run_decision_service(
+                    tenant_id="tenant_test_001",
+                    user_id="test_user",
+                    scenario_in={
+                        "scenario_type": "draft_trade",
+                        "governing_objective": "cut_payroll",
+                        "prompt": "Pick 8 vs 18 trade-down scenario under payroll mandate",
+                    },
+                    persist_fn=persist_fn,
+                )
+        finally:
+            postgres.reset_pool()
+
+        self.assertEqual(factory.call_count, 1)
+        conn.commit.assert_called_once()
+        self.assertTrue(out["audit"]["persist"]["persisted"])
+
+    def test_run_decision_service_reports_unpersisted_when_write_phase_aborts(self):
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+        def persist_fn(record: ExecutionRecord):
+            try:
+                with connection():
+                    raise RuntimeError("insert failed")
+            except RuntimeError:
+                pass
+            return {"persisted": True}
+
+        postgres.reset_pool()
+        try:
+            with patch("src.service.db.postgres.get_conn", return_value=conn), \
+                 patch("src.service.decision_loop.service.insert_claims"):
+                out = run_decision_service(
+                    tenant_id="tenant_test_001",
+                    user_id="test_user",
+                    scenario_in={"prompt": "Need a quick governed read"},
+                    persist_fn=persist_fn,
+                )
+        finally:
+            postgres.reset_pool()
+
+        conn.commit.assert_not_called()
+        self.assertFalse(out["audit"]["persist"]["persisted"])
+        self.assertIn("persist_error", out["audit"]["persist"])
+
+    def test_run_decision_service_corpus_write_failure_rolls_back_to_savepoint(self):
+        cur = MagicMock()
+        cur.fetchall.return_value = []
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.__enter__.return_value = cur
+        persist_fn = MagicMock(return_value={"persisted": True})
+
+        def failing_insert(claims):
+            with connection():
+                raise RuntimeError("corpus insert failed")
+
+        postgres.reset_pool()
+        try:
+            with patch("src.service.db.postgres.get_conn", return_value=conn), \
+                 patch("src.service.decision_loop.service.admitted_claims", return_value=["claim"]), \
+                 patch("src.service.decision_loop.service.insert_claims", side_effect=failing_insert):
+                out = run_decision_service(
+                    tenant_id="tenant_test_001",
+                    user_id="test_user",
+                    scenario_in={"prompt": "Need a quick governed read"},
+                    persist_fn=persist_fn,
+                )
+        finally:
+            postgres.reset_pool()
+
+        statements = [c.args[0] for c in cur.execute.call_args_list]
+        self.assertTrue(any(sql.startswith("ROLLBACK TO SAVEPOINT") for sql in statements))
+        persist_fn.assert_called_once()
+        conn.commit.assert_called_once()
+        self.assertTrue(out["audit"]["persist"]["persisted"])
+
     def test_run_decision_service_rejects_non_object_scenario(self):
         def persist_fn(record: ExecutionRecord):
             return {"persisted": True}
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import Dict, List, Optional, Protocol, Tuple
 
-from src.service.gaqp.corpus import get_claim, list_claims
-from src.service.gaqp.models import (
-    ActivationBundle,
-    ClaimProvenance,
-    ContradictionAlert,
-    CorroborationProfile,
-    GAQPClaim,
-)
+from src.service.gaqp import claim_graph
+from src.service.gaqp.activation_index import ActivationIndex, get_index
+from src.service.gaqp.corpus import get_claims, match_claims_by_scenario
+from src.service.gaqp.structural_corpus import get_structural_corpus
+from src.service.gaqp.models import ActivationBundle, ConflictCluster, ContradictionAlert
+from src.service.gaqp.records import ClaimRecord
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_CONFIDENCE_FLOOR = 0.50  # Seed — include all admitted claims by default
 _DEFAULT_MAX_CLAIMS = 20
-_CORPUS_FETCH_LIMIT = 200  # fetch wide, filter in Python
+_DEFAULT_ACTIVATION_MODE = "index"
+_DEFAULT_CONFLICT_CLUSTER_HOPS = 2
+_NO_TIMESTAMP = datetime.min.replace(tzinfo=UTC)
 
 
 class _ScenarioLike(Protocol):
@@ -45,9 +46,34 @@ def activate(
     - Universal-scope claims always fire.
     - Other scopes fire when any activation_trigger keyword matches scenario text.
     - Sorted by confidence_score DESC, capped at max_claims.
+
+    Candidates come from two in-process indexes, each matched in one
+    Aho-Corasick pass with no DB round trip once warm:
+    - the tenant's own admitted claims (ActivationIndex), and
+    - the shared, de-identified structural corpus of every tenant
+      (best-effort: if it is unavailable, tenant claims still activate).
+
+    With EXECALC_ACTIVATION_MODE=sql the tenant's claims are matched in the
+    database instead (corpus.match_claims_by_scenario over the
+    gaqp_claim_triggers index), so no process holds a tenant's whole corpus.
+    That mode is stricter: a trigger's first [a-z0-9]+ word must also be a
+    whole word of the scenario, so "cap" no longer fires on "caps" or
+    "capital" (the in-process index matches any substring), and a trigger
+    with no letters or digits never fires.
     """
+    search_text = _build_search_text(scenario)
+    index: Optional[ActivationIndex] = None
     try:
-        candidates = _fetch_candidates(tenant_id, confidence_floor)
+        if _activation_mode() == "sql":
+            matched = match_claims_by_scenario(
+                tenant_id=tenant_id,
+                search_text=search_text,
+                confidence_floor=confidence_floor,
+                limit=max_claims,
+            )
+        else:
+            index = get_index(tenant_id)
+            matched = index.match(search_text, confidence_floor)
     except Exception:
         logger.exception("Corpus fetch failed during activation for tenant %s", tenant_id)
         return ActivationBundle(
@@ -57,166 +83,140 @@ def activate(
             confidence_floor=confidence_floor,
         )
 
-    search_text = _build_search_text(scenario)
-    matched: List[Tuple[Dict[str, Any], str]] = []
+    matched.extend(_match_structural(search_text, confidence_floor, {row.claim_id for row, _ in matched}))
 
-    for row in candidates:
-        rationale = _match_rationale(row, search_text)
-        if rationale:
-            matched.append((row, rationale))
-
-    matched.sort(key=lambda pair: pair[0].get("confidence_score", 0.0), reverse=True)
+    matched.sort(
+        key=lambda pair: (pair[0].confidence_score, pair[0].created_at or _NO_TIMESTAMP),
+        reverse=True,
+    )
     matched = matched[:max_claims]
 
-    contradiction_alerts = _build_contradiction_alerts(matched, tenant_id)
+    contradiction_alerts = _build_contradiction_alerts(matched, tenant_id, index)
 
     return ActivationBundle(
-        activated_claims=[_dict_to_claim(row) for row, _ in matched],
+        activated_claims=[row.to_claim() for row, _ in matched],
         activation_rationale=[r for _, r in matched],
         contradiction_alerts=contradiction_alerts,
+        conflict_clusters=_build_conflict_clusters(matched, tenant_id),
         corpus_scope="structural",
         confidence_floor=confidence_floor,
     )
 
 
-def _fetch_candidates(tenant_id: str, confidence_floor: float) -> List[Dict[str, Any]]:
-    """
-    Fetch admitted claims from all applicable scopes, deduplicated by claim_id.
-
-    private + tenant: scoped to this tenant.
-    structural: cross-tenant de-identified claims.
-    """
-    seen: set = set()
-    candidates: List[Dict[str, Any]] = []
+def _activation_mode() -> str:
+    return os.getenv("EXECALC_ACTIVATION_MODE", _DEFAULT_ACTIVATION_MODE).strip().lower()
 
-    for scope in ("private", "tenant", "structural"):
-        rows = list_claims(
-            tenant_id=tenant_id,
-            corpus_scope=scope,
-            confidence_floor=confidence_floor,
-            limit=_CORPUS_FETCH_LIMIT,
-        )
-        for row in rows:
-            cid = row["claim_id"]
-            if cid not in seen:
-                seen.add(cid)
-                candidates.append(row)
 
-    return candidates
+def _match_structural(
+    search_text: str,
+    confidence_floor: float,
+    seen: set,
+) -> List[Tuple[ClaimRecord, str]]:
+    """Structural corpus matches not already activated from the tenant's own corpus."""
+    try:
+        corpus = get_structural_corpus()
+    except Exception:
+        logger.exception("Structural corpus unavailable during activation")
+        return []
+    if corpus is None:
+        return []
+    return [
+        (row, rationale)
+        for row, rationale in corpus.index.match(search_text, confidence_floor)
+        if row.claim_id not in seen
+    ]
 
 
-def _build_search_text(scenario: _ScenarioLike) -> str:
-    """Combine scenario fields into a single lowercase search surface."""
-    parts = [scenario.scenario_type, scenario.governing_objective, scenario.prompt]
-    return " ".join(p for p in parts if p).lower()
+def _conflict_cluster_hops() -> int:
+    return int(os.getenv("EXECALC_CONFLICT_CLUSTER_HOPS", str(_DEFAULT_CONFLICT_CLUSTER_HOPS)))
 
 
-def _match_rationale(row: Dict[str, Any], search_text: str) -> Optional[str]:
+def _build_conflict_clusters(
+    matched: List[Tuple[ClaimRecord, str]],
+    tenant_id: str,
+) -> List[ConflictCluster]:
     """
-    Return a rationale string if the claim activates for this scenario, None otherwise.
+    Whole contradiction clusters around the activated claims, from the
+    tenant's in-process claim graph (EXECALC_CONFLICT_CLUSTER_HOPS hops,
+    default 2). The graph is only consulted when some activated claim
+    carries contradiction_refs, so an activation with no contradictions
+    never loads it.
 
-    Universal scope always fires. Other scopes require a trigger keyword match.
+    Best-effort: a failed graph load drops the clusters, not the activation.
     """
-    activation_scope: str = row.get("activation_scope", "")
-    triggers: List[str] = row.get("activation_triggers") or []
-
-    if activation_scope == "universal":
-        return "Universal activation: claim fires on all scenarios."
+    if not any(row.contradiction_refs for row, _ in matched):
+        return []
+    activated_ids = [row.claim_id for row, _ in matched]
+    try:
+        graph = claim_graph.get_graph(tenant_id)
+    except Exception:
+        logger.exception("Claim graph unavailable during activation for tenant %s", tenant_id)
+        return []
+    return [
+        ConflictCluster(activated_claim_ids=activated, claim_ids=members)
+        for activated, members in claim_graph.conflict_clusters(
+            graph, activated_ids, _conflict_cluster_hops(),
+        )
+    ]
 
-    for trigger in triggers:
-        if trigger.lower() in search_text:
-            return f'Trigger match: "{trigger}" found in scenario context.'
 
-    return None
+def _build_search_text(scenario: _ScenarioLike) -> str:
+    """Combine scenario fields into a single lowercase search surface."""
+    parts = [scenario.scenario_type, scenario.governing_objective, scenario.prompt]
+    return " ".join(p for p in parts if p).lower()
 
 
 def _build_contradiction_alerts(
-    matched: List[Tuple[Dict[str, Any], str]],
+    matched: List[Tuple[ClaimRecord, str]],
     tenant_id: str,
+    index: Optional[ActivationIndex],
 ) -> List[ContradictionAlert]:
     """
-    For each activated claim that carries contradiction_refs, fetch the
-    contradicting claims and build ContradictionAlert objects.
+    For each activated claim that carries contradiction_refs, resolve the
+    contradicting claims and build ContradictionAlert objects. Admitted refs
+    come from the activation index when there is one; the rest are resolved
+    together in one batched corpus fetch (get_claims, LRU-cached).
 
-    Errors fetching individual refs are logged and skipped — a missing ref
-    does not abort the activation.
+    A missing ref is logged and skipped; a failed fetch drops only the
+    alerts it would have produced — neither aborts the activation.
     """
+    ref_pairs = [
+        (row.claim_id, ref_id)
+        for row, _ in matched
+        for ref_id in row.contradiction_refs
+    ]
+    if not ref_pairs:
+        return []
+
+    resolved: Dict[str, ClaimRecord] = {}
+    unresolved: List[str] = []
+    for _, ref_id in ref_pairs:
+        row = index.get(ref_id) if index is not None else None
+        if row is not None:
+            resolved[ref_id] = row
+        else:
+            unresolved.append(ref_id)
+
+    if unresolved:
+        try:
+            resolved.update(get_claims(claim_ids=unresolved, tenant_id=tenant_id))
+        except Exception:
+            logger.exception(
+                "Failed to fetch %d contradiction ref(s) for tenant %s",
+                len(unresolved), tenant_id,
+            )
+
     alerts: List[ContradictionAlert] = []
-    for row, _ in matched:
-        refs: List[str] = row.get("contradiction_refs") or []
-        for ref_id in refs:
-            try:
-                contra_row = get_claim(claim_id=ref_id, tenant_id=tenant_id)
-                if contra_row:
-                    alerts.append(ContradictionAlert(
-                        activated_claim_id=row["claim_id"],
-                        contradicting_claim=_dict_to_claim(contra_row),
-                    ))
-                else:
-                    logger.warning(
-                        "Contradiction ref %r not found in corpus for tenant %s (claim %s)",
-                        ref_id, tenant_id, row["claim_id"],
-                    )
-            except Exception:
-                logger.exception(
-                    "Failed to fetch contradiction ref %r for claim %s tenant %s",
-                    ref_id, row["claim_id"], tenant_id,
-                )
+    for activated_id, ref_id in ref_pairs:
+        contra_row = resolved.get(ref_id)
+        if contra_row is None:
+            logger.warning(
+                "Contradiction ref %r not found in corpus for tenant %s (claim %s)",
+                ref_id, tenant_id, activated_id,
+            )
+            continue
+        alerts.append(ContradictionAlert(
+            activated_claim_id=activated_id,
+            contradicting_claim=contra_row.to_claim(),
+        ))
     return alerts
-
-
-def _parse_dt(value: Optional[str]) -> datetime:
-    if value:
-        return datetime.fromisoformat(value)
-    return datetime.now(UTC)
-
-
-def _dict_to_claim(row: Dict[str, Any]) -> GAQPClaim:
-    """Reconstruct a GAQPClaim from a corpus row dict."""
-    prov_raw: Dict[str, Any] = row.get("provenance") or {}
-    provenance = ClaimProvenance(
-        source_kind=prov_raw.get("source_kind", "unknown"),
-        source_ref=prov_raw.get("source_ref", ""),
-        actor_id=prov_raw.get("actor_id", ""),
-        envelope_id=prov_raw.get("envelope_id"),
-        origin_surface=prov_raw.get("origin_surface"),
-    )
-
-    corr_raw: Dict[str, Any] = row.get("corroboration_profile") or {}
-    lca_raw = corr_raw.get("last_corroborated_at")
-    corroboration_profile = CorroborationProfile(
-        corroboration_count=corr_raw.get("corroboration_count", 0),
-        independent_sources=corr_raw.get("independent_sources", 0),
-        same_tenant_count=corr_raw.get("same_tenant_count", 0),
-        cross_tenant_count=corr_raw.get("cross_tenant_count", 0),
-        contradictions=corr_raw.get("contradictions", 0),
-        last_corroborated_at=datetime.fromisoformat(lca_raw) if lca_raw else None,
-        corroborating_actors=list(corr_raw.get("corroborating_actors") or []),
-    )
-
-    return GAQPClaim(
-        claim_id=row["claim_id"],
-        tenant_id=row["tenant_id"],
-        source_envelope_id=row["source_envelope_id"],
-        claim_type=row["claim_type"],
-        domain=row["domain"],
-        content=row["content"],
-        confidence_level=row["confidence_level"],
-        confidence_score=row["confidence_score"],
-        admission_status=row["admission_status"],
-        corpus_scope=row["corpus_scope"],
-        extraction_method=row["extraction_method"],
-        provenance=provenance,
-        activation_scope=row["activation_scope"],
-        activation_triggers=list(row.get("activation_triggers") or []),
-        corroboration_profile=corroboration_profile,
-        contradiction_refs=list(row.get("contradiction_refs") or []),
-        support_refs=list(row.get("support_refs") or []),
-        fingerprint=row.get("fingerprint", ""),
-        schema_version=row.get("schema_version", "stage9_v1"),
-        standards_package_version=row.get("standards_package_version", "gaqp_v1.0"),
-        inference_flag=bool(row.get("inference_flag", False)),
-        source_location=row.get("source_location"),
-        created_at=_parse_dt(row.get("created_at")),
-        updated_at=_parse_dt(row.get("updated_at")),
-    )
@@ -0,0 +1,285 @@
+"""
+In-process activation index for the Stage 9D activation engine.
+
+One ActivationIndex per tenant holds every admitted corpus claim (as a
+ClaimRecord), the
+universal-scope claim ids, and an Aho-Corasick automaton over all lowercased
+activation_triggers. Activation is a single automaton pass over the scenario
+text — no DB round trip and no per-claim substring scan on the warm path.
+
+The automaton is never rebuilt on the match path. Trigger keys added after
+it was built are scanned from a small delta set, and removed keys stay in
+it as tombstones (they map to no claims). Once _REBUILD_AFTER keys have
+changed, a background thread builds a new automaton and swaps it in.
+
+Freshness (cached by tenant_cache.TenantCache):
+- Cold or expired (EXECALC_ACTIVATION_INDEX_TTL_SECONDS, default 300): the
+  tenant's admitted claims are loaded from the corpus in one query, by one
+  thread per tenant; concurrent callers wait for that load.
+- Writes made by this process are applied incrementally once their
+  transaction commits (corpus.insert_claim(s), update_claim_corroboration,
+  link_contradictions, unlink_contradictions, promote_to_structural).
+  Writes that commit while a load is running are replayed onto the new
+  index before it is published, so the load cannot drop them.
+- Writes made by other processes become visible when the TTL expires.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.service.gaqp.corpus import _UNIVERSAL_RATIONALE, list_admitted_claims
+from src.service.gaqp.models import GAQPClaim
+from src.service.gaqp.records import ClaimRecord
+from src.service.gaqp.tenant_cache import TenantCache
+
+_DEFAULT_TTL_SECONDS = 300.0
+# Added-plus-tombstoned trigger keys tolerated before the automaton is rebuilt.
+_REBUILD_AFTER = 64
+
+
+# ---------------------------------------------------------------------------
+# Aho-Corasick automaton
+# ---------------------------------------------------------------------------
+
+class _Automaton:
+    """Multi-pattern substring matcher: one pass over the text finds every pattern."""
+
+    __slots__ = ("_goto", "_fail", "_out", "_has_empty")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[str, ...]] = [()]
+        self._has_empty = False
+
+        for pattern in set(patterns):
+            if not pattern:
+                self._has_empty = True
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                node = nxt
+            out[node] = out[node] + (pattern,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def find(self, text: str) -> Set[str]:
+        """Return every pattern that occurs in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = {""} if self._has_empty else set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+# ---------------------------------------------------------------------------
+# Per-tenant index
+# ---------------------------------------------------------------------------
+
+class ActivationIndex:
+    def __init__(self, tenant_id: str, rows: Iterable[ClaimRecord] = ()) -> None:
+        self.tenant_id = tenant_id
+        self._lock = threading.Lock()
+        self._rows: Dict[str, ClaimRecord] = {}
+        self._universal: Set[str] = set()
+        self._by_trigger: Dict[str, Set[str]] = {}
+        # Keys the automaton was built over; keys added since are in _added,
+        # and _stale counts built keys no longer in _by_trigger.
+        self._automaton_keys: frozenset = frozenset()
+        self._added: Set[str] = set()
+        self._stale = 0
+        self._rebuilding = True  # no background rebuilds while loading
+        for row in rows:
+            self._upsert(row)
+        self._automaton_keys = frozenset(self._by_trigger)
+        self._automaton = _Automaton(self._automaton_keys)
+        self._added = set()
+        self._rebuilding = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, claim_id: str) -> Optional[ClaimRecord]:
+        return self._rows.get(claim_id)
+
+    # -- incremental maintenance -------------------------------------------
+
+    def upsert(self, row: ClaimRecord) -> None:
+        with self._lock:
+            self._upsert(row)
+
+    def patch(self, claim_id: str, fields: Dict[str, Any]) -> None:
+        """Update non-trigger fields of an indexed claim (confidence, profile, refs)."""
+        with self._lock:
+            row = self._rows.get(claim_id)
+            if row is not None:
+                self._rows[claim_id] = row.replace(**fields)
+
+    def remove(self, claim_id: str) -> None:
+        with self._lock:
+            self._remove(claim_id)
+
+    def rebuild(self) -> None:
+        """Build an automaton over the current trigger keys and swap it in."""
+        with self._lock:
+            keys = frozenset(self._by_trigger)
+        automaton = _Automaton(keys)  # outside the lock: matches keep running
+        with self._lock:
+            self._automaton = automaton
+            self._automaton_keys = keys
+            self._added = {key for key in self._by_trigger if key not in keys}
+            self._stale = sum(1 for key in keys if key not in self._by_trigger)
+            self._rebuilding = False
+            self._maybe_rebuild()
+
+    def _upsert(self, row: ClaimRecord) -> None:
+        claim_id = row.claim_id
+        self._remove(claim_id)
+        if row.admission_status != "admitted":
+            return
+        self._rows[claim_id] = row
+        if row.activation_scope == "universal":
+            self._universal.add(claim_id)
+            return
+        for trigger in row.activation_triggers:
+            key = trigger.lower()
+            ids = self._by_trigger.get(key)
+            if ids is None:
+                self._by_trigger[key] = {claim_id}
+                if key in self._automaton_keys:
+                    self._stale -= 1
+                else:
+                    self._added.add(key)
+                self._maybe_rebuild()
+            else:
+                ids.add(claim_id)
+
+    def _remove(self, claim_id: str) -> None:
+        row = self._rows.pop(claim_id, None)
+        if row is None:
+            return
+        self._universal.discard(claim_id)
+        for trigger in row.activation_triggers:
+            key = trigger.lower()
+            ids = self._by_trigger.get(key)
+            if ids is not None:
+                ids.discard(claim_id)
+                if not ids:
+                    del self._by_trigger[key]
+                    if key in self._automaton_keys:
+                        self._stale += 1
+                    else:
+                        self._added.discard(key)
+                    self._maybe_rebuild()
+
+    def _maybe_rebuild(self) -> None:
+        if self._rebuilding or len(self._added) + self._stale < _REBUILD_AFTER:
+            return
+        self._rebuilding = True
+        threading.Thread(target=self.rebuild, name="gaqp-activation-rebuild", daemon=True).start()
+
+    # -- matching ----------------------------------------------------------
+
+    def match(
+        self,
+        search_text: str,
+        confidence_floor: float,
+    ) -> List[Tuple[ClaimRecord, str]]:
+        """
+        Return (row, rationale) for every claim that activates on search_text
+        at or above confidence_floor, unordered.
+
+        Universal scope always fires. Other scopes fire on their first
+        trigger (in the claim's own order) that occurs in search_text.
+        """
+        with self._lock:
+            found = self._automaton.find(search_text)
+            found.update(key for key in self._added if key in search_text)
+
+            matched: List[Tuple[ClaimRecord, str]] = []
+            for claim_id in self._universal:
+                row = self._rows[claim_id]
+                if row.confidence_score >= confidence_floor:
+                    matched.append((row, _UNIVERSAL_RATIONALE))
+
+            hit_ids: Set[str] = set()
+            for key in found:
+                hit_ids.update(self._by_trigger.get(key, ()))
+            for claim_id in hit_ids:
+                row = self._rows[claim_id]
+                if row.confidence_score < confidence_floor:
+                    continue
+                for trigger in row.activation_triggers:
+                    if trigger.lower() in found:
+                        matched.append((row, f'Trigger match: "{trigger}" found in scenario context.'))
+                        break
+        return matched
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+def _ttl_seconds() -> float:
+    return float(os.getenv("EXECALC_ACTIVATION_INDEX_TTL_SECONDS", str(_DEFAULT_TTL_SECONDS)))
+
+
+def _load(tenant_id: str) -> ActivationIndex:
+    return ActivationIndex(tenant_id, list_admitted_claims(tenant_id=tenant_id))
+
+
+_cache: TenantCache[ActivationIndex] = TenantCache(_load, _ttl_seconds)
+
+
+def get_index(tenant_id: str) -> ActivationIndex:
+    """Return the tenant's index, loading it from the corpus when cold or expired."""
+    return _cache.get(tenant_id)
+
+
+def invalidate(tenant_id: Optional[str] = None) -> None:
+    """Drop one tenant's index (or all of them); the next activation reloads."""
+    _cache.invalidate(tenant_id)
+
+
+def _apply(tenant_id: str, update: Callable[[ActivationIndex], None]) -> None:
+    _cache.apply(tenant_id, update)
+
+
+def note_claims_inserted(claims: Iterable[GAQPClaim]) -> None:
+    """Add newly committed claims to any loaded index for their tenant."""
+    for claim in claims:
+        _apply(claim.tenant_id, lambda index, claim=claim: index.upsert(ClaimRecord.from_claim(claim)))
+
+
+def note_claim_updated(*, tenant_id: str, claim_id: str, **fields: Any) -> None:
+    """Apply a committed field update to the tenant's loaded index, if any."""
+    _apply(tenant_id, lambda index: index.patch(claim_id, fields))
@@ -3,17 +3,24 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+import time
+from datetime import UTC, datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from src.service.db.postgres import get_conn
+from src.service.db.postgres import connection, unit_of_work
 from src.service.decision_loop.models import DecisionReport, SensitivityVariable
 from src.service.gaqp.corpus import insert_claims
 from src.service.gaqp.extraction import extract_claims
+from src.service.gaqp.models import GAQPClaim
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_BATCH_SIZE = 50
+_DEFAULT_STREAM_ITERSIZE = 500
+_STREAM_CURSOR_NAME = "gaqp_backfill_stream"
+_RANGES_PER_WORKER = 4
 
 
 # ---------------------------------------------------------------------------
@@ -29,6 +36,25 @@ class BackfillSummary:
     claims_skipped: int = 0      # duplicate fingerprint — idempotent
     claims_failed: int = 0
     errors: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def records_per_sec(self) -> float:
+        return self.records_read / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def claims_per_sec(self) -> float:
+        return self.claims_inserted / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def merge(self, other: "BackfillSummary") -> None:
+        """Add another summary's counters into this one (elapsed time is not summed)."""
+        self.records_read += other.records_read
+        self.records_skipped += other.records_skipped
+        self.claims_extracted += other.claims_extracted
+        self.claims_inserted += other.claims_inserted
+        self.claims_skipped += other.claims_skipped
+        self.claims_failed += other.claims_failed
+        self.errors.extend(other.errors)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -39,6 +65,9 @@ class BackfillSummary:
             "claims_skipped": self.claims_skipped,
             "claims_failed": self.claims_failed,
             "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "records_per_sec": round(self.records_per_sec, 2),
+            "claims_per_sec": round(self.claims_per_sec, 2),
         }
 
 
@@ -94,32 +123,32 @@ def _fetch_page(
     after_record_id: int,
     tenant_id: Optional[str],
     batch_size: int,
+    until_record_id: Optional[int] = None,
 ) -> List[Tuple[int, str, str, Dict[str, Any]]]:
     """
     Fetch one page of execution_records with full result payload.
 
     Uses record_id as a forward cursor — stable and index-friendly.
+    until_record_id bounds the page to one range of a parallel run (inclusive).
     Only ok=true records are included (failed runs produce no useful reports).
     Returns list of (record_id, tenant_id, envelope_id, result).
     """
+    conditions = ["ok = true", "record_id > %s"]
+    params: List[Any] = [after_record_id]
+    if until_record_id is not None:
+        conditions.append("record_id <= %s")
+        params.append(until_record_id)
     if tenant_id:
-        sql = """
-            SELECT record_id, tenant_id, envelope_id, result
-            FROM execution_records
-            WHERE ok = true AND record_id > %s AND tenant_id = %s
-            ORDER BY record_id ASC
-            LIMIT %s
-        """
-        params: tuple = (after_record_id, tenant_id, batch_size)
-    else:
-        sql = """
-            SELECT record_id, tenant_id, envelope_id, result
-            FROM execution_records
-            WHERE ok = true AND record_id > %s
-            ORDER BY record_id ASC
-            LIMIT %s
-        """
-        params = (after_record_id, batch_size)
+        conditions.append("tenant_id = %s")
+        params.append(tenant_id)
+    params.append(batch_size)
+
+    sql = (
+        "SELECT record_id, tenant_id, envelope_id, result "
+        "FROM execution_records "
+        "WHERE " + " AND ".join(conditions) +
+        " ORDER BY record_id ASC LIMIT %s"
+    )
 
     with conn.cursor() as cur:
         cur.execute(sql, params)
@@ -127,6 +156,106 @@ def _fetch_page(
     return [(int(r[0]), str(r[1]), str(r[2]), r[3]) for r in rows]
 
 
+def _stream_records(
+    *,
+    conn: Any,
+    after_record_id: int,
+    tenant_id: Optional[str],
+    itersize: int,
+) -> Iterator[Tuple[int, str, str, Dict[str, Any]]]:
+    """
+    Yield ok=true execution_records one at a time from a server-side cursor.
+
+    A named (server-side) cursor runs the scan as a single query and ships
+    rows to the client itersize at a time, so only one network batch of
+    parsed result payloads is held in memory however large the table is.
+    The cursor lives inside conn's open transaction; claim writes go
+    through their own pooled connections and do not end it.
+    """
+    conditions = ["ok = true", "record_id > %s"]
+    params: List[Any] = [after_record_id]
+    if tenant_id:
+        conditions.append("tenant_id = %s")
+        params.append(tenant_id)
+
+    sql = (
+        "SELECT record_id, tenant_id, envelope_id, result "
+        "FROM execution_records "
+        "WHERE " + " AND ".join(conditions) +
+        " ORDER BY record_id ASC"
+    )
+
+    with conn.cursor(name=_STREAM_CURSOR_NAME) as cur:
+        cur.itersize = itersize
+        cur.execute(sql, params)
+        for r in cur:
+            yield (int(r[0]), str(r[1]), str(r[2]), r[3])
+
+
+def _paged_records(
+    *,
+    conn: Any,
+    after_record_id: int,
+    tenant_id: Optional[str],
+    batch_size: int,
+) -> Iterator[Tuple[int, str, str, Dict[str, Any]]]:
+    """Yield records page by page via _fetch_page (one LIMIT query per page)."""
+    cursor = after_record_id
+    while True:
+        page = _fetch_page(
+            conn=conn,
+            after_record_id=cursor,
+            tenant_id=tenant_id,
+            batch_size=batch_size,
+        )
+        if not page:
+            return
+        yield from page
+        cursor = page[-1][0]
+
+
+def _extract_record(
+    *,
+    t_id: str,
+    envelope_id: str,
+    result: Optional[Dict[str, Any]],
+    summary: BackfillSummary,
+) -> Optional[List[GAQPClaim]]:
+    """
+    Reconstruct and extract one record. Returns None (and counts the skip)
+    when the record has no report or fails reconstruction/extraction.
+    """
+    if not result or "report" not in result:
+        summary.records_skipped += 1
+        return None
+
+    try:
+        report = _report_from_dict(result)
+    except Exception as exc:
+        summary.records_skipped += 1
+        msg = f"{envelope_id}: reconstruction failed — {exc}"
+        summary.errors.append(msg)
+        logger.warning(msg)
+        return None
+
+    try:
+        claims = extract_claims(
+            report=report,
+            tenant_id=t_id,
+            source_envelope_id=envelope_id,
+            actor_id="backfill",
+        )
+    except Exception as exc:
+        summary.records_skipped += 1
+        msg = f"{envelope_id}: extraction failed — {exc}"
+        summary.errors.append(msg)
+        logger.warning(msg)
+        return None
+
+    summary.claims_extracted += len(claims)
+    return claims
+
+
 # ---------------------------------------------------------------------------
 # Main backfill
 # ---------------------------------------------------------------------------
@@ -137,6 +266,8 @@ def run_backfill(
     batch_size: int = _DEFAULT_BATCH_SIZE,
     dry_run: bool = False,
     limit: Optional[int] = None,
+    stream: bool = False,
+    itersize: int = _DEFAULT_STREAM_ITERSIZE,
 ) -> BackfillSummary:
     """
     Backfill GAQP corpus from existing execution_records.
@@ -145,82 +276,332 @@ def run_backfill(
     DecisionReport, runs Stage 9B extraction, and persists admitted claims
     via Stage 9C corpus persistence.
 
+    By default records are fetched in LIMIT pages of batch_size. With
+    stream=True a single server-side cursor feeds extraction instead,
+    itersize rows per network round trip.
+
     Fingerprint idempotency makes this safe to run multiple times.
     Per-record errors are isolated — a bad record is skipped, not fatal.
     """
     summary = BackfillSummary()
-    conn = get_conn()
-    cursor = 0
+    started = time.monotonic()
 
-    try:
-        while True:
-            page = _fetch_page(
-                conn=conn,
-                after_record_id=cursor,
-                tenant_id=tenant_id,
-                batch_size=batch_size,
+    with connection() as conn:
+        if stream:
+            records = _stream_records(
+                conn=conn, after_record_id=0, tenant_id=tenant_id, itersize=itersize,
+            )
+        else:
+            records = _paged_records(
+                conn=conn, after_record_id=0, tenant_id=tenant_id, batch_size=batch_size,
             )
-            if not page:
+
+        for _record_id, t_id, envelope_id, result in records:
+            if limit is not None and summary.records_read >= limit:
                 break
 
-            for record_id, t_id, envelope_id, result in page:
-                if limit is not None and summary.records_read >= limit:
-                    break
-
-                summary.records_read += 1
-                cursor = record_id
-
-                if not result or "report" not in result:
-                    summary.records_skipped += 1
-                    continue
-
-                try:
-                    report = _report_from_dict(result)
-                except Exception as exc:
-                    summary.records_skipped += 1
-                    msg = f"{envelope_id}: reconstruction failed — {exc}"
-                    summary.errors.append(msg)
-                    logger.warning(msg)
-                    continue
-
-                try:
-                    claims = extract_claims(
-                        report=report,
-                        tenant_id=t_id,
-                        source_envelope_id=envelope_id,
-                        actor_id="backfill",
+            summary.records_read += 1
+
+            claims = _extract_record(
+                t_id=t_id, envelope_id=envelope_id, result=result, summary=summary,
+            )
+            if claims is None:
+                continue
+
+            if dry_run:
+                admitted = [c for c in claims if c.admission_status == "admitted"]
+                summary.claims_inserted += len(admitted)
+                continue
+
+            try:
+                insert_summary = insert_claims(claims)
+                summary.claims_inserted += insert_summary.inserted
+                summary.claims_skipped += insert_summary.skipped
+                summary.claims_failed += insert_summary.failed
+            except Exception as exc:
+                msg = f"{envelope_id}: persistence failed — {exc}"
+                summary.errors.append(msg)
+                logger.warning(msg)
+
+    summary.elapsed_seconds = time.monotonic() - started
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Parallel, resumable backfill
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RangeCheckpoint:
+    range_start: int            # exclusive
+    range_end: int              # inclusive
+    cursor: int                 # last record_id processed
+    status: str = "pending"     # pending | running | complete
+
+
+_SELECT_CHECKPOINTS_SQL = """
+    SELECT range_start, range_end, cursor, status
+    FROM gaqp_backfill_checkpoints
+    WHERE run_id = %s
+    ORDER BY range_start ASC
+"""
+
+_INSERT_CHECKPOINT_SQL = """
+    INSERT INTO gaqp_backfill_checkpoints (run_id, range_start, range_end, cursor, tenant_id)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (run_id, range_start) DO NOTHING
+"""
+
+_ADVANCE_CHECKPOINT_SQL = """
+    UPDATE gaqp_backfill_checkpoints
+    SET cursor = %s,
+        status = %s,
+        records_read = records_read + %s,
+        records_skipped = records_skipped + %s,
+        claims_extracted = claims_extracted + %s,
+        claims_inserted = claims_inserted + %s,
+        claims_skipped = claims_skipped + %s,
+        claims_failed = claims_failed + %s,
+        updated_at = NOW()
+    WHERE run_id = %s AND range_start = %s
+"""
+
+
+def _plan_ranges(
+    *,
+    conn: Any,
+    tenant_id: Optional[str],
+    n_ranges: int,
+) -> List[Tuple[int, int]]:
+    """
+    Split the ok=true record_id keyspace into up to n_ranges contiguous
+    (exclusive_start, inclusive_end] ranges of equal width.
+    """
+    sql = "SELECT MIN(record_id), MAX(record_id) FROM execution_records WHERE ok = true"
+    params: List[Any] = []
+    if tenant_id:
+        sql += " AND tenant_id = %s"
+        params.append(tenant_id)
+
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        row = cur.fetchone()
+    if not row or row[0] is None:
+        return []
+
+    lo, hi = int(row[0]) - 1, int(row[1])
+    n_ranges = max(1, min(n_ranges, hi - lo))
+    width = -(-(hi - lo) // n_ranges)  # ceil division
+    ranges = []
+    start = lo
+    while start < hi:
+        end = min(start + width, hi)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _load_or_create_checkpoints(
+    *,
+    run_id: str,
+    tenant_id: Optional[str],
+    n_ranges: int,
+) -> List[RangeCheckpoint]:
+    """Resume an existing run's ranges, or plan and persist new ones."""
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_SELECT_CHECKPOINTS_SQL, (run_id,))
+            rows = cur.fetchall() or []
+        if not rows:
+            ranges = _plan_ranges(conn=conn, tenant_id=tenant_id, n_ranges=n_ranges)
+            with conn.cursor() as cur:
+                for start, end in ranges:
+                    cur.execute(_INSERT_CHECKPOINT_SQL, (run_id, start, end, start, tenant_id))
+                cur.execute(_SELECT_CHECKPOINTS_SQL, (run_id,))
+                rows = cur.fetchall() or []
+    return [RangeCheckpoint(int(r[0]), int(r[1]), int(r[2]), str(r[3])) for r in rows]
+
+
+def _advance_checkpoint(
+    *,
+    run_id: str,
+    range_start: int,
+    cursor: int,
+    status: str,
+    delta: BackfillSummary,
+) -> None:
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_ADVANCE_CHECKPOINT_SQL, (
+            cursor, status,
+            delta.records_read, delta.records_skipped, delta.claims_extracted,
+            delta.claims_inserted, delta.claims_skipped, delta.claims_failed,
+            run_id, range_start,
+        ))
+
+
+def _backfill_range(
+    *,
+    run_id: Optional[str],
+    checkpoint: RangeCheckpoint,
+    tenant_id: Optional[str],
+    batch_size: int,
+    dry_run: bool,
+) -> BackfillSummary:
+    """
+    Process one record_id range page by page (runs in a worker process).
+
+    Each page's claim writes and checkpoint advance share one unit of work,
+    so the checkpoint never runs ahead of what was committed. A page whose
+    writes fail stops the range with its checkpoint at the last good page;
+    rerunning the same run_id retries from there. run_id=None disables
+    checkpointing (dry runs).
+    """
+    summary = BackfillSummary()
+    started = time.monotonic()
+    cursor = checkpoint.cursor
+    pages = 0
+
+    while True:
+        page_summary = BackfillSummary()
+        try:
+            with unit_of_work() as uow:
+                with connection() as conn:
+                    page = _fetch_page(
+                        conn=conn,
+                        after_record_id=cursor,
+                        until_record_id=checkpoint.range_end,
+                        tenant_id=tenant_id,
+                        batch_size=batch_size,
                     )
-                except Exception as exc:
-                    summary.records_skipped += 1
-                    msg = f"{envelope_id}: extraction failed — {exc}"
-                    summary.errors.append(msg)
-                    logger.warning(msg)
-                    continue
 
-                summary.claims_extracted += len(claims)
+                claims: List[GAQPClaim] = []
+                for _record_id, t_id, envelope_id, result in page:
+                    page_summary.records_read += 1
+                    extracted = _extract_record(
+                        t_id=t_id, envelope_id=envelope_id, result=result, summary=page_summary,
+                    )
+                    if extracted:
+                        claims.extend(extracted)
 
                 if dry_run:
-                    admitted = [c for c in claims if c.admission_status == "admitted"]
-                    summary.claims_inserted += len(admitted)
-                    continue
-
-                try:
-                    insert_summary = insert_claims(claims)
-                    summary.claims_inserted += insert_summary.inserted
-                    summary.claims_skipped += insert_summary.skipped
-                    summary.claims_failed += insert_summary.failed
-                except Exception as exc:
-                    msg = f"{envelope_id}: persistence failed — {exc}"
-                    summary.errors.append(msg)
-                    logger.warning(msg)
+                    page_summary.claims_inserted += sum(1 for c in claims if c.admission_status == "admitted")
+                else:
+                    uow.begin_writes()
+                    if claims:
+                        insert_summary = insert_claims(claims)
+                        page_summary.claims_inserted += insert_summary.inserted
+                        page_summary.claims_skipped += insert_summary.skipped
+                        page_summary.claims_failed += insert_summary.failed
+
+                new_cursor = page[-1][0] if page else checkpoint.range_end
+                status = "running" if page else "complete"
+                if run_id is not None:
+                    _advance_checkpoint(
+                        run_id=run_id,
+                        range_start=checkpoint.range_start,
+                        cursor=new_cursor,
+                        status=status,
+                        delta=page_summary,
+                    )
+        except Exception as exc:
+            msg = f"range ({checkpoint.range_start}, {checkpoint.range_end}] after record {cursor}: page failed — {exc}"
+            summary.errors.append(msg)
+            logger.warning(msg)
+            break
+
+        summary.merge(page_summary)
+        cursor = new_cursor
+        pages += 1
+        if not page:
+            break
+        if pages % 20 == 0:
+            elapsed = time.monotonic() - started
+            logger.info(
+                "backfill range (%d, %d]: cursor=%d records=%d (%.1f rec/s)",
+                checkpoint.range_start, checkpoint.range_end, cursor,
+                summary.records_read, summary.records_read / elapsed if elapsed else 0.0,
+            )
 
-            if limit is not None and summary.records_read >= limit:
-                break
+    summary.elapsed_seconds = time.monotonic() - started
+    return summary
 
-    finally:
-        conn.close()
 
-    return summary
+def run_parallel_backfill(
+    *,
+    run_id: str,
+    tenant_id: Optional[str] = None,
+    workers: int = 4,
+    n_ranges: Optional[int] = None,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+) -> BackfillSummary:
+    """
+    Backfill the GAQP corpus with a pool of worker processes.
+
+    The ok=true record_id keyspace is split into ranges (default
+    workers × 4) recorded in gaqp_backfill_checkpoints under run_id. Each
+    range is processed in a worker process and advances its checkpoint after
+    every committed page, so rerunning an interrupted run with the same
+    run_id skips completed ranges and resumes the rest from their cursors.
+
+    Throughput (records/sec, claims/sec) is logged as ranges complete and
+    returned on the summary. Dry runs plan ranges but write nothing,
+    checkpoints included.
+    """
+    started = time.monotonic()
+    n_ranges = n_ranges or workers * _RANGES_PER_WORKER
+
+    if dry_run:
+        with connection() as conn:
+            ranges = _plan_ranges(conn=conn, tenant_id=tenant_id, n_ranges=n_ranges)
+        checkpoints = [RangeCheckpoint(start, end, start) for start, end in ranges]
+    else:
+        checkpoints = _load_or_create_checkpoints(
+            run_id=run_id, tenant_id=tenant_id, n_ranges=n_ranges,
+        )
+
+    pending = [cp for cp in checkpoints if cp.status != "complete"]
+    logger.info(
+        "backfill %s: %d ranges (%d already complete), %d workers",
+        run_id, len(checkpoints), len(checkpoints) - len(pending), workers,
+    )
+
+    total = BackfillSummary()
+    if not pending:
+        total.elapsed_seconds = time.monotonic() - started
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _backfill_range,
+                run_id=None if dry_run else run_id,
+                checkpoint=cp,
+                tenant_id=tenant_id,
+                batch_size=batch_size,
+                dry_run=dry_run,
+            ): cp
+            for cp in pending
+        }
+        done = 0
+        for future in as_completed(futures):
+            cp = futures[future]
+            done += 1
+            try:
+                total.merge(future.result())
+            except Exception as exc:
+                msg = f"range ({cp.range_start}, {cp.range_end}]: worker failed — {exc}"
+                total.errors.append(msg)
+                logger.warning(msg)
+            total.elapsed_seconds = time.monotonic() - started
+            logger.info(
+                "backfill %s: %d/%d ranges — %d records (%.1f rec/s), %d claims inserted (%.1f claims/s)",
+                run_id, done, len(pending), total.records_read, total.records_per_sec,
+                total.claims_inserted, total.claims_per_sec,
+            )
+
+    total.elapsed_seconds = time.monotonic() - started
+    return total
 
 
 # ---------------------------------------------------------------------------
@@ -254,6 +635,37 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Extract and count claims but do not write to corpus.",
     )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="Serial runs: read through one server-side cursor instead of LIMIT pages.",
+    )
+    p.add_argument(
+        "--itersize",
+        type=int,
+        default=None,
+        help=f"Rows per round trip with --stream. Default: {_DEFAULT_STREAM_ITERSIZE}.",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes. Above 1, runs the parallel resumable engine. Default: 1 (serial).",
+    )
+    p.add_argument(
+        "--run-id",
+        default=None,
+        help=(
+            "Checkpoint key for parallel runs; reuse it to resume. "
+            "Default: a new key per run, backfill:<tenant|all>:<UTC timestamp>."
+        ),
+    )
+    p.add_argument(
+        "--ranges",
+        type=int,
+        default=None,
+        help=f"record_id ranges for parallel runs. Default: workers x {_RANGES_PER_WORKER}.",
+    )
     p.add_argument(
         "--log-level",
         default="INFO",
@@ -262,19 +674,55 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     return p
 
 
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = _build_arg_parser()
+    args = p.parse_args(argv)
+    if args.workers > 1:
+        serial_only = [
+            flag for flag, given in (
+                ("--limit", args.limit is not None),
+                ("--stream", args.stream),
+                ("--itersize", args.itersize is not None),
+            ) if given
+        ]
+        if serial_only:
+            p.error(f"{', '.join(serial_only)} only apply to serial runs (--workers 1)")
+        # A fixed default key would make every later run skip the ranges a
+        # finished run marked complete; insert_claims is idempotent, so a
+        # fresh key per run costs nothing.
+        if args.run_id is None:
+            args.run_id = f"backfill:{args.tenant_id or 'all'}:{datetime.now(UTC):%Y%m%dT%H%M%SZ}"
+    if args.itersize is None:
+        args.itersize = _DEFAULT_STREAM_ITERSIZE
+    return args
+
+
 if __name__ == "__main__":
-    args = _build_arg_parser().parse_args()
+    args = _parse_args()
     logging.basicConfig(
         level=getattr(logging, args.log_level),
         format="%(asctime)s %(levelname)s %(name)s — %(message)s",
     )
 
-    summary = run_backfill(
-        tenant_id=args.tenant_id,
-        batch_size=args.batch_size,
-        dry_run=args.dry_run,
-        limit=args.limit,
-    )
+    if args.workers > 1:
+        print(f"run_id:            {args.run_id}")
+        summary = run_parallel_backfill(
+            run_id=args.run_id,
+            tenant_id=args.tenant_id,
+            workers=args.workers,
+            n_ranges=args.ranges,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    else:
+        summary = run_backfill(
+            tenant_id=args.tenant_id,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            limit=args.limit,
+            stream=args.stream,
+            itersize=args.itersize,
+        )
 
     print(f"records_read:      {summary.records_read}")
     print(f"records_skipped:   {summary.records_skipped}")
@@ -282,6 +730,9 @@ if __name__ == "__main__":
     print(f"claims_inserted:   {summary.claims_inserted}")
     print(f"claims_skipped:    {summary.claims_skipped}")
     print(f"claims_failed:     {summary.claims_failed}")
+    print(f"elapsed_seconds:   {summary.elapsed_seconds:.1f}")
+    print(f"records_per_sec:   {summary.records_per_sec:.1f}")
+    print(f"claims_per_sec:    {summary.claims_per_sec:.1f}")
     if summary.errors:
         print(f"errors ({len(summary.errors)}):")
         for e in summary.errors:
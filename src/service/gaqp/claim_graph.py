@@ -0,0 +1,286 @@
+"""
+In-process contradiction and support graph over a tenant's claims.
+
+One ClaimGraph per tenant holds every contradiction and support link among
+its GAQP claims (contradiction_refs, support_refs) and QCR nuggets
+(counterclaim_links, supporting_claim_links). Claim and nugget ids are
+interned to dense integer node ids with per-node adjacency lists, so
+transitive queries are plain BFS over ints with no DB round trip:
+
+- contradiction_cluster(): every claim within k contradiction hops;
+- support_chain(): the claims supporting a claim, layer by layer;
+- component() / components(): connected components over both link kinds.
+
+Contradiction links are undirected. Support links are directed: a claim's
+support_refs are the claims that support it.
+
+Freshness, as for the activation index (both are cached by tenant_cache.TenantCache):
+- Cold or expired (EXECALC_CLAIM_GRAPH_TTL_SECONDS, default 300): links are
+  loaded in two queries (corpus.list_claim_links, repository.list_nugget_links),
+  by one thread per tenant; concurrent callers wait for that load.
+- Writes made by this process are applied incrementally once committed:
+  claim and nugget inserts, and contradiction links and resolutions. Writes
+  that commit while a load is running are replayed onto the new graph
+  before it is published.
+  Corroboration never changes links, so it leaves the graph as is.
+- Writes made by other processes become visible when the TTL expires.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.service.gaqp.corpus import list_claim_links
+from src.service.gaqp.models import GAQPClaim
+from src.service.gaqp.tenant_cache import TenantCache
+
+if TYPE_CHECKING:
+    from src.service.qualitative_capture.models import AtomicNugget
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL_SECONDS = 300.0
+
+
+# ---------------------------------------------------------------------------
+# Per-tenant graph
+# ---------------------------------------------------------------------------
+
+class ClaimGraph:
+    def __init__(self, tenant_id: str) -> None:
+        self.tenant_id = tenant_id
+        self._lock = threading.Lock()
+        self._node_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._contradicts: List[List[int]] = []
+        self._supported_by: List[List[int]] = []
+        self._supports: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, claim_id: object) -> bool:
+        return claim_id in self._node_ids
+
+    # -- incremental maintenance -------------------------------------------
+
+    def add_links(
+        self,
+        claim_id: str,
+        contradiction_refs: Iterable[str] = (),
+        support_refs: Iterable[str] = (),
+    ) -> None:
+        """Add one claim's contradiction and supporting refs."""
+        with self._lock:
+            node = self._node(claim_id)
+            for ref in contradiction_refs:
+                if ref != claim_id:
+                    self._link(self._contradicts, node, self._node(ref))
+                    self._link(self._contradicts, self._node(ref), node)
+            for ref in support_refs:
+                if ref != claim_id:
+                    other = self._node(ref)
+                    self._link(self._supported_by, node, other)
+                    self._link(self._supports, other, node)
+
+    def remove_contradiction(self, claim_id: str, other_id: str) -> None:
+        with self._lock:
+            a = self._node_ids.get(claim_id)
+            b = self._node_ids.get(other_id)
+            if a is None or b is None:
+                return
+            for x, y in ((a, b), (b, a)):
+                adjacent = self._contradicts[x]
+                if y in adjacent:
+                    adjacent.remove(y)
+
+    def _node(self, claim_id: str) -> int:
+        node = self._node_ids.get(claim_id)
+        if node is None:
+            node = len(self._names)
+            self._node_ids[claim_id] = node
+            self._names.append(claim_id)
+            self._contradicts.append([])
+            self._supported_by.append([])
+            self._supports.append([])
+        return node
+
+    @staticmethod
+    def _link(adjacency: List[List[int]], src: int, dst: int) -> None:
+        if dst not in adjacency[src]:
+            adjacency[src].append(dst)
+
+    # -- queries -------------------------------------------------------------
+
+    def contradiction_cluster(self, claim_id: str, max_hops: int = 2) -> List[str]:
+        """
+        The claim and every claim within max_hops contradiction links of it,
+        nearest first. A claim with no contradictions is a cluster of one.
+        """
+        return [name for layer in self._layers(claim_id, (self._contradicts,), max_hops) for name in layer]
+
+    def support_chain(self, claim_id: str, max_hops: int = 3) -> List[List[str]]:
+        """
+        The claims supporting claim_id, by distance: layer 0 supports it
+        directly, layer 1 supports layer 0, and so on up to max_hops layers.
+        """
+        return self._layers(claim_id, (self._supported_by,), max_hops)[1:]
+
+    def component(self, claim_id: str) -> List[str]:
+        """Every claim connected to claim_id by any mix of contradiction and support links."""
+        adjacency = (self._contradicts, self._supported_by, self._supports)
+        return sorted(name for layer in self._layers(claim_id, adjacency, None) for name in layer)
+
+    def components(self, min_size: int = 2) -> List[List[str]]:
+        """All connected components of at least min_size claims, largest first."""
+        with self._lock:
+            seen: Set[int] = set()
+            found: List[List[str]] = []
+            for start in range(len(self._names)):
+                if start in seen:
+                    continue
+                members = self._bfs(start, (self._contradicts, self._supported_by, self._supports), None, seen)
+                if sum(len(layer) for layer in members) >= min_size:
+                    found.append(sorted(self._names[n] for layer in members for n in layer))
+        found.sort(key=lambda c: (-len(c), c[0]))
+        return found
+
+    def _layers(
+        self,
+        claim_id: str,
+        adjacency: Sequence[List[List[int]]],
+        max_hops: Optional[int],
+    ) -> List[List[str]]:
+        with self._lock:
+            start = self._node_ids.get(claim_id)
+            if start is None:
+                return [[claim_id]]
+            layers = self._bfs(start, adjacency, max_hops, set())
+            return [sorted(self._names[n] for n in layer) for layer in layers]
+
+    @staticmethod
+    def _bfs(
+        start: int,
+        adjacency: Sequence[List[List[int]]],
+        max_hops: Optional[int],
+        seen: Set[int],
+    ) -> List[List[int]]:
+        seen.add(start)
+        layers = [[start]]
+        frontier = [start]
+        while frontier and (max_hops is None or len(layers) <= max_hops):
+            nxt: List[int] = []
+            for node in frontier:
+                for adj in adjacency:
+                    for other in adj[node]:
+                        if other not in seen:
+                            seen.add(other)
+                            nxt.append(other)
+            if nxt:
+                layers.append(nxt)
+            frontier = nxt
+        return layers
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+def _ttl_seconds() -> float:
+    return float(os.getenv("EXECALC_CLAIM_GRAPH_TTL_SECONDS", str(_DEFAULT_TTL_SECONDS)))
+
+
+def _load(tenant_id: str) -> ClaimGraph:
+    graph = ClaimGraph(tenant_id)
+    for claim_id, contradiction_refs, support_refs in list_claim_links(tenant_id=tenant_id):
+        graph.add_links(claim_id, contradiction_refs, support_refs)
+    try:
+        from src.service.qualitative_capture.repository import list_nugget_links  # local to avoid circular
+        for nugget_id, counterclaim_links, supporting_claim_links in list_nugget_links(tenant_id=tenant_id):
+            graph.add_links(nugget_id, counterclaim_links, supporting_claim_links)
+    except Exception:
+        logger.exception("QCR nugget links unavailable for claim graph of tenant %s", tenant_id)
+    return graph
+
+
+_cache: TenantCache[ClaimGraph] = TenantCache(_load, _ttl_seconds)
+
+
+def get_graph(tenant_id: str) -> ClaimGraph:
+    """Return the tenant's graph, loading it when cold or expired."""
+    return _cache.get(tenant_id)
+
+
+def invalidate(tenant_id: Optional[str] = None) -> None:
+    """Drop one tenant's graph (or all of them); the next query reloads."""
+    _cache.invalidate(tenant_id)
+
+
+def _apply(tenant_id: str, update: Callable[[ClaimGraph], None]) -> None:
+    _cache.apply(tenant_id, update)
+
+
+def note_claims_inserted(claims: Iterable[GAQPClaim]) -> None:
+    """Add newly committed claims' refs to any loaded graph for their tenant."""
+    for claim in claims:
+        if claim.contradiction_refs or claim.support_refs:
+            _apply(claim.tenant_id, lambda graph, c=claim: graph.add_links(
+                c.claim_id, c.contradiction_refs, c.support_refs))
+
+
+def note_nuggets_inserted(nuggets: Iterable["AtomicNugget"]) -> None:
+    """Add newly committed QCR nuggets' links to any loaded graph for their tenant."""
+    for nugget in nuggets:
+        if nugget.counterclaim_links or nugget.supporting_claim_links:
+            _apply(nugget.tenant_id, lambda graph, n=nugget: graph.add_links(
+                n.nugget_id, n.counterclaim_links, n.supporting_claim_links))
+
+
+def note_contradictions_changed(
+    *,
+    tenant_id: str,
+    linked: Iterable[Tuple[str, str]] = (),
+    resolved: Iterable[Tuple[str, str]] = (),
+) -> None:
+    """Apply committed contradiction links and resolutions to the tenant's loaded graph, if any."""
+    linked, resolved = list(linked), list(resolved)
+    if not linked and not resolved:
+        return
+
+    def update(graph: ClaimGraph) -> None:
+        for claim_id, other_id in linked:
+            graph.add_links(claim_id, contradiction_refs=(other_id,))
+        for claim_id, other_id in resolved:
+            graph.remove_contradiction(claim_id, other_id)
+
+    _apply(tenant_id, update)
+
+
+def conflict_clusters(
+    graph: ClaimGraph,
+    activated_ids: Sequence[str],
+    max_hops: int,
+) -> List[Tuple[List[str], List[str]]]:
+    """
+    Group activated claims into contradiction clusters.
+
+    Walks activated_ids in order; each claim not already in an earlier
+    cluster seeds one (max_hops contradiction hops). Returns
+    (activated ids in the cluster, all cluster ids) per cluster of two or
+    more claims.
+    """
+    clustered: Set[str] = set()
+    clusters: List[Tuple[List[str], List[str]]] = []
+    for claim_id in activated_ids:
+        if claim_id in clustered or claim_id not in graph:
+            continue
+        members = graph.contradiction_cluster(claim_id, max_hops)
+        if len(members) < 2:
+            continue
+        member_set = set(members)
+        clustered.update(member_set)
+        clusters.append(([a for a in activated_ids if a in member_set], members))
+    return clusters
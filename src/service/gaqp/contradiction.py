@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
-
-from src.service.gaqp.corpus import get_claim, update_claim_contradictions
+from typing import Iterable, List, Tuple
+
+from src.service.db.postgres import in_unit_of_work, unit_of_work
+from src.service.gaqp.corpus import (
+    EdgeWriteSummary,
+    contradiction_edge,
+    link_contradictions,
+    unlink_contradictions,
+)
 from src.service.gaqp.exceptions import ClaimNotFoundError, SelfContradictionError
-from src.service.gaqp.models import CorroborationProfile
 
 logger = logging.getLogger(__name__)
 
@@ -27,38 +31,80 @@ class ContradictionResult:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _profile_from_row(row: Dict[str, Any]) -> CorroborationProfile:
-    corr = row.get("corroboration_profile") or {}
-    lca_raw = corr.get("last_corroborated_at")
-    return CorroborationProfile(
-        corroboration_count=corr.get("corroboration_count", 0),
-        independent_sources=corr.get("independent_sources", 0),
-        same_tenant_count=corr.get("same_tenant_count", 0),
-        cross_tenant_count=corr.get("cross_tenant_count", 0),
-        contradictions=corr.get("contradictions", 0),
-        last_corroborated_at=datetime.fromisoformat(lca_raw) if lca_raw else None,
-        corroborating_actors=list(corr.get("corroborating_actors") or []),
-    )
-
-
-def _with_contradictions_delta(profile: CorroborationProfile, delta: int) -> CorroborationProfile:
-    """Return a new profile with contradictions count adjusted by delta (clamped to 0)."""
-    new_count = max(0, profile.contradictions + delta)
-    return CorroborationProfile(
-        corroboration_count=profile.corroboration_count,
-        independent_sources=profile.independent_sources,
-        same_tenant_count=profile.same_tenant_count,
-        cross_tenant_count=profile.cross_tenant_count,
-        contradictions=new_count,
-        last_corroborated_at=profile.last_corroborated_at,
-        corroborating_actors=list(profile.corroborating_actors),
-    )
+def _raise_if_missing(summary: EdgeWriteSummary, tenant_id: str) -> None:
+    if summary.missing:
+        raise ClaimNotFoundError(
+            f"Claim(s) {', '.join(repr(m) for m in summary.missing)} not found for tenant {tenant_id!r}"
+        )
+
+
+def _results(
+    pairs: List[Tuple[str, str]], summary: EdgeWriteSummary,
+) -> List[ContradictionResult]:
+    # A pair listed twice in one batch changes the edge once; only its
+    # first occurrence reports the change.
+    pending = set(summary.changed)
+    results = []
+    for claim_id, other_id in pairs:
+        edge = contradiction_edge(claim_id, other_id)
+        results.append(ContradictionResult(
+            claim_id=claim_id,
+            contradicting_claim_id=other_id,
+            was_new_link=edge in pending,
+        ))
+        pending.discard(edge)
+    return results
 
 
 # ---------------------------------------------------------------------------
 # Engine entry points
 # ---------------------------------------------------------------------------
 
+def contradict_many(
+    *,
+    tenant_id: str,
+    pairs: Iterable[Tuple[str, str]],
+) -> List[ContradictionResult]:
+    """
+    Register bidirectional contradictions between many pairs of corpus
+    claims, returning one result per pair, in order.
+
+    Every edge and both of its endpoints are written together by
+    corpus.link_contradictions — one statement per chunk of pairs, all in
+    one transaction — so a failure never leaves a one-sided link. Linking
+    is idempotent: pairs already linked, in either order, report
+    was_new_link=False.
+
+    Inside a caller's unit_of_work() the batch joins it without calling
+    begin_writes(): whether a failure here aborts the caller's whole
+    transaction is the caller's choice.
+
+    Raises SelfContradictionError if any pair links a claim to itself.
+    Raises ClaimNotFoundError, writing nothing, if any claim is absent from
+    the corpus.
+    """
+    pairs = list(pairs)
+    for claim_id, other_id in pairs:
+        if claim_id == other_id:
+            raise SelfContradictionError(f"Claim {claim_id!r} cannot contradict itself.")
+    if not pairs:
+        return []
+
+    owns_unit = not in_unit_of_work()
+    with unit_of_work() as uow:
+        if owns_unit:
+            uow.begin_writes()
+        summary = link_contradictions(tenant_id=tenant_id, pairs=pairs)
+        _raise_if_missing(summary, tenant_id)
+
+    for claim_a, claim_b in summary.changed:
+        logger.info(
+            "Contradiction linked: tenant=%s claim_a=%s claim_b=%s",
+            tenant_id, claim_a, claim_b,
+        )
+    return _results(pairs, summary)
+
+
 def contradict(
     *,
     claim_id: str,
@@ -75,58 +121,10 @@ def contradict(
     Raises SelfContradictionError if claim_id == contradicting_claim_id.
     Raises ClaimNotFoundError if either claim is absent from the corpus.
     """
-    if claim_id == contradicting_claim_id:
-        raise SelfContradictionError(
-            f"Claim {claim_id!r} cannot contradict itself."
-        )
-
-    row_a = get_claim(claim_id=claim_id, tenant_id=tenant_id)
-    if row_a is None:
-        raise ClaimNotFoundError(f"Claim {claim_id!r} not found for tenant {tenant_id!r}")
-
-    row_b = get_claim(claim_id=contradicting_claim_id, tenant_id=tenant_id)
-    if row_b is None:
-        raise ClaimNotFoundError(
-            f"Claim {contradicting_claim_id!r} not found for tenant {tenant_id!r}"
-        )
-
-    refs_a: List[str] = list(row_a.get("contradiction_refs") or [])
-    refs_b: List[str] = list(row_b.get("contradiction_refs") or [])
-
-    if contradicting_claim_id in refs_a:
-        # Already linked — idempotent, no update needed.
-        return ContradictionResult(
-            claim_id=claim_id,
-            contradicting_claim_id=contradicting_claim_id,
-            was_new_link=False,
-        )
-
-    profile_a = _with_contradictions_delta(_profile_from_row(row_a), +1)
-    profile_b = _with_contradictions_delta(_profile_from_row(row_b), +1)
-
-    update_claim_contradictions(
-        claim_id=claim_id,
+    return contradict_many(
         tenant_id=tenant_id,
-        new_contradiction_refs=refs_a + [contradicting_claim_id],
-        new_corroboration_profile=profile_a,
-    )
-    update_claim_contradictions(
-        claim_id=contradicting_claim_id,
-        tenant_id=tenant_id,
-        new_contradiction_refs=refs_b + [claim_id],
-        new_corroboration_profile=profile_b,
-    )
-
-    logger.info(
-        "Contradiction linked: tenant=%s claim_a=%s claim_b=%s",
-        tenant_id, claim_id, contradicting_claim_id,
-    )
-
-    return ContradictionResult(
-        claim_id=claim_id,
-        contradicting_claim_id=contradicting_claim_id,
-        was_new_link=True,
-    )
+        pairs=[(claim_id, contradicting_claim_id)],
+    )[0]
 
 
 def resolve_contradiction(
@@ -139,54 +137,23 @@ def resolve_contradiction(
     Remove a previously established contradiction link between two claims.
 
     Idempotent: resolving a link that doesn't exist returns was_new_link=False
-    without error. Both claims must still exist in the corpus.
+    without error. Both claims must still exist in the corpus. The edge and
+    both endpoints are updated in a single statement, in one unit of work
+    joined and committed exactly as contradict_many()'s.
 
     Raises ClaimNotFoundError if either claim is absent from the corpus.
     """
-    row_a = get_claim(claim_id=claim_id, tenant_id=tenant_id)
-    if row_a is None:
-        raise ClaimNotFoundError(f"Claim {claim_id!r} not found for tenant {tenant_id!r}")
-
-    row_b = get_claim(claim_id=contradicting_claim_id, tenant_id=tenant_id)
-    if row_b is None:
-        raise ClaimNotFoundError(
-            f"Claim {contradicting_claim_id!r} not found for tenant {tenant_id!r}"
-        )
-
-    refs_a: List[str] = list(row_a.get("contradiction_refs") or [])
-    refs_b: List[str] = list(row_b.get("contradiction_refs") or [])
-
-    if contradicting_claim_id not in refs_a:
-        # Link doesn't exist — idempotent, nothing to remove.
-        return ContradictionResult(
-            claim_id=claim_id,
-            contradicting_claim_id=contradicting_claim_id,
-            was_new_link=False,
+    pairs = [(claim_id, contradicting_claim_id)]
+    owns_unit = not in_unit_of_work()
+    with unit_of_work() as uow:
+        if owns_unit:
+            uow.begin_writes()
+        summary = unlink_contradictions(tenant_id=tenant_id, pairs=pairs)
+        _raise_if_missing(summary, tenant_id)
+
+    if summary.changed:
+        logger.info(
+            "Contradiction resolved: tenant=%s claim_a=%s claim_b=%s",
+            tenant_id, claim_id, contradicting_claim_id,
         )
-
-    profile_a = _with_contradictions_delta(_profile_from_row(row_a), -1)
-    profile_b = _with_contradictions_delta(_profile_from_row(row_b), -1)
-
-    update_claim_contradictions(
-        claim_id=claim_id,
-        tenant_id=tenant_id,
-        new_contradiction_refs=[r for r in refs_a if r != contradicting_claim_id],
-        new_corroboration_profile=profile_a,
-    )
-    update_claim_contradictions(
-        claim_id=contradicting_claim_id,
-        tenant_id=tenant_id,
-        new_contradiction_refs=[r for r in refs_b if r != claim_id],
-        new_corroboration_profile=profile_b,
-    )
-
-    logger.info(
-        "Contradiction resolved: tenant=%s claim_a=%s claim_b=%s",
-        tenant_id, claim_id, contradicting_claim_id,
-    )
-
-    return ContradictionResult(
-        claim_id=claim_id,
-        contradicting_claim_id=contradicting_claim_id,
-        was_new_link=True,
-    )
+    return _results(pairs, summary)[0]
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-from src.service.db.postgres import get_conn
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.service.db.postgres import after_commit, connection, unit_of_work
 from src.service.gaqp.models import GAQPClaim
+from src.service.gaqp.records import ClaimRecord
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,16 @@ def _load_psycopg2_json():
         ) from e
 
 
+def _load_execute_values():
+    try:
+        from psycopg2.extras import execute_values  # type: ignore
+        return execute_values
+    except ImportError as e:
+        raise RuntimeError(
+            "psycopg2 is not available. Install the Postgres dependency before using corpus persistence."
+        ) from e
+
+
 def _claim_to_row(claim: GAQPClaim, Json: Any) -> tuple:
     return (
         claim.claim_id,
@@ -82,17 +97,58 @@ _INSERT_SQL = """
     ON CONFLICT (fingerprint) DO NOTHING
 """
 
+# Multi-row form of _INSERT_SQL for execute_values; RETURNING yields one row
+# per claim actually inserted, so duplicates are counted exactly.
+_BULK_INSERT_SQL = """
+    INSERT INTO gaqp_claims (
+        claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
+        confidence_level, confidence_score, admission_status, corpus_scope,
+        extraction_method, provenance, activation_scope, activation_triggers,
+        corroboration_profile, contradiction_refs, support_refs,
+        fingerprint, schema_version, inference_flag, source_location,
+        standards_package_version
+    ) VALUES %s
+    ON CONFLICT (fingerprint) DO NOTHING
+    RETURNING claim_id
+"""
+
+_BULK_CHUNK_SIZE = 500
+
+# Record reads (ClaimRecord.from_row) select the JSON sub-objects as text;
+# ClaimRecord decodes them only if a caller touches them.
 _SELECT_BY_ID_SQL = """
     SELECT claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
            confidence_level, confidence_score, admission_status, corpus_scope,
-           extraction_method, provenance, activation_scope, activation_triggers,
-           corroboration_profile, contradiction_refs, support_refs,
+           extraction_method, provenance::text, activation_scope, activation_triggers,
+           corroboration_profile::text, contradiction_refs, support_refs,
            fingerprint, schema_version, inference_flag, source_location,
            standards_package_version, created_at, updated_at
     FROM gaqp_claims
     WHERE claim_id = %s AND tenant_id = %s
 """
 
+_SELECT_BY_IDS_SQL = """
+    SELECT claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
+           confidence_level, confidence_score, admission_status, corpus_scope,
+           extraction_method, provenance::text, activation_scope, activation_triggers,
+           corroboration_profile::text, contradiction_refs, support_refs,
+           fingerprint, schema_version, inference_flag, source_location,
+           standards_package_version, created_at, updated_at
+    FROM gaqp_claims
+    WHERE claim_id = ANY(%s) AND tenant_id = %s
+"""
+
+_SELECT_ADMITTED_SQL = """
+    SELECT claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
+           confidence_level, confidence_score, admission_status, corpus_scope,
+           extraction_method, provenance::text, activation_scope, activation_triggers,
+           corroboration_profile::text, contradiction_refs, support_refs,
+           fingerprint, schema_version, inference_flag, source_location,
+           standards_package_version, created_at, updated_at
+    FROM gaqp_claims
+    WHERE tenant_id = %s AND admission_status = 'admitted'
+"""
+
 _SELECT_BY_ENVELOPE_SQL = """
     SELECT claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
            confidence_level, confidence_score, admission_status, corpus_scope,
@@ -143,6 +199,87 @@ def _row_to_dict(row: tuple) -> Dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Claim cache
+# ---------------------------------------------------------------------------
+
+class _ClaimCache:
+    """
+    Bounded LRU of ClaimRecords keyed by (tenant_id, claim_id).
+
+    Backs get_claims() only — the corroboration engine reads under row
+    locks (lock_claims) and the contradiction engine updates claims in SQL,
+    so neither ever sees a cached row.
+    Entries older than ttl seconds are treated as misses, bounding staleness
+    from writes made by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, ClaimRecord]]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str]) -> Optional[ClaimRecord]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, row = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return row
+
+    def put(self, key: Tuple[str, str], row: ClaimRecord) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), row)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_claim_cache = _ClaimCache(
+    max_size=int(os.getenv("EXECALC_CLAIM_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("EXECALC_CLAIM_CACHE_TTL_SECONDS", "60")),
+)
+
+
+def _invalidate_cached(*, tenant_id: str, claim_id: str) -> None:
+    # Drop now so this transaction's readers refetch, and again after commit
+    # so a concurrent reader cannot re-cache the pre-update row.
+    key = (tenant_id, claim_id)
+    _claim_cache.invalidate(key)
+    after_commit(lambda: _claim_cache.invalidate(key))
+
+
+def _notify_inserted(claims: List[GAQPClaim]) -> None:
+    if not claims:
+        return
+    from src.service.gaqp import activation_index, claim_graph  # local to avoid circular
+    after_commit(lambda: activation_index.note_claims_inserted(claims))
+    after_commit(lambda: claim_graph.note_claims_inserted(claims))
+
+
+def _notify_updated(*, tenant_id: str, claim_id: str, **fields: Any) -> None:
+    from src.service.gaqp import activation_index  # local to avoid circular
+    after_commit(lambda: activation_index.note_claim_updated(
+        tenant_id=tenant_id, claim_id=claim_id, **fields,
+    ))
+
+
 # ---------------------------------------------------------------------------
 # Public interface
 # ---------------------------------------------------------------------------
@@ -158,14 +295,12 @@ def insert_claim(claim: GAQPClaim) -> bool:
         return False
 
     Json = _load_psycopg2_json()
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_INSERT_SQL, _claim_to_row(claim, Json))
-            inserted = cur.rowcount > 0
-        return inserted
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_INSERT_SQL, _claim_to_row(claim, Json))
+        inserted = cur.rowcount > 0
+    if inserted:
+        _notify_inserted([claim])
+    return inserted
 
 
 def insert_claims(claims: List[GAQPClaim]) -> InsertSummary:
@@ -174,42 +309,244 @@ def insert_claims(claims: List[GAQPClaim]) -> InsertSummary:
 
     Skips non-admitted claims. Duplicate fingerprints are silently skipped
     (idempotent — safe to run the same extraction twice).
+
+    Each chunk of up to _BULK_CHUNK_SIZE claims is sent as one multi-row
+    INSERT ... ON CONFLICT (fingerprint) DO NOTHING RETURNING claim_id, so
+    counts stay exact: returned rows were inserted, the rest were duplicates.
+    A chunk that fails is rolled back to its savepoint and retried row by
+    row, each under its own savepoint, so one bad row is isolated and
+    counted as failed without poisoning the rest of the transaction.
     """
     admitted = [c for c in claims if c.admission_status == "admitted"]
     if not admitted:
         return InsertSummary()
 
     Json = _load_psycopg2_json()
+    execute_values = _load_execute_values()
     summary = InsertSummary()
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            for claim in admitted:
-                try:
-                    cur.execute(_INSERT_SQL, _claim_to_row(claim, Json))
-                    if cur.rowcount > 0:
-                        summary.inserted += 1
-                    else:
-                        summary.skipped += 1
-                except Exception:
-                    logger.exception("Failed to insert claim %s", claim.claim_id)
-                    summary.failed += 1
-    finally:
-        conn.close()
-
+    inserted_claims: List[GAQPClaim] = []
+    with connection() as conn, conn.cursor() as cur:
+        for start in range(0, len(admitted), _BULK_CHUNK_SIZE):
+            chunk = admitted[start:start + _BULK_CHUNK_SIZE]
+            rows = [_claim_to_row(c, Json) for c in chunk]
+            try:
+                cur.execute("SAVEPOINT gaqp_insert_chunk")
+                returned = execute_values(
+                    cur, _BULK_INSERT_SQL, rows, page_size=len(rows), fetch=True,
+                )
+                cur.execute("RELEASE SAVEPOINT gaqp_insert_chunk")
+            except Exception:
+                logger.warning(
+                    "Bulk insert of %d claims failed; retrying row by row", len(chunk),
+                    exc_info=True,
+                )
+                _rollback_to(cur, "gaqp_insert_chunk")
+                inserted_claims.extend(_insert_row_by_row(cur, chunk, rows, summary))
+                continue
+            returned_ids = {r[0] for r in returned or []}
+            inserted_claims.extend(c for c in chunk if c.claim_id in returned_ids)
+            summary.inserted += len(returned_ids)
+            summary.skipped += len(chunk) - len(returned_ids)
+
+    _notify_inserted(inserted_claims)
     return summary
 
 
-def get_claim(*, claim_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch a single corpus claim by (claim_id, tenant_id)."""
-    conn = get_conn()
+def _insert_row_by_row(
+    cur: Any,
+    chunk: List[GAQPClaim],
+    rows: List[tuple],
+    summary: InsertSummary,
+) -> List[GAQPClaim]:
+    inserted: List[GAQPClaim] = []
+    for claim, row in zip(chunk, rows):
+        try:
+            cur.execute("SAVEPOINT gaqp_insert_row")
+            cur.execute(_INSERT_SQL, row)
+            if cur.rowcount > 0:
+                summary.inserted += 1
+                inserted.append(claim)
+            else:
+                summary.skipped += 1
+            cur.execute("RELEASE SAVEPOINT gaqp_insert_row")
+        except Exception:
+            logger.exception("Failed to insert claim %s", claim.claim_id)
+            summary.failed += 1
+            _rollback_to(cur, "gaqp_insert_row")
+    return inserted
+
+
+def _rollback_to(cur: Any, savepoint: str) -> None:
     try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_SELECT_BY_ID_SQL, (claim_id, tenant_id))
-            row = cur.fetchone()
-            return _row_to_dict(row) if row else None
-    finally:
-        conn.close()
+        cur.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+    except Exception:
+        logger.warning("Could not roll back to savepoint %s", savepoint, exc_info=True)
+
+
+def get_claim(*, claim_id: str, tenant_id: str) -> Optional[ClaimRecord]:
+    """Fetch a single corpus claim by (claim_id, tenant_id)."""
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_BY_ID_SQL, (claim_id, tenant_id))
+        row = cur.fetchone()
+        return ClaimRecord.from_row(row) if row else None
+
+
+def get_claims(*, claim_ids: Iterable[str], tenant_id: str) -> Dict[str, ClaimRecord]:
+    """
+    Fetch many corpus claims for one tenant, keyed by claim_id.
+
+    Served from the process-wide LRU claim cache where possible; every miss
+    is resolved in a single claim_id = ANY(%s) query. Ids absent from the
+    corpus are simply missing from the result.
+    """
+    found: Dict[str, ClaimRecord] = {}
+    misses: List[str] = []
+    for claim_id in dict.fromkeys(claim_ids):
+        row = _claim_cache.get((tenant_id, claim_id))
+        if row is not None:
+            found[claim_id] = row
+        else:
+            misses.append(claim_id)
+
+    if misses:
+        with connection() as conn, conn.cursor() as cur:
+            cur.execute(_SELECT_BY_IDS_SQL, (misses, tenant_id))
+            rows = cur.fetchall() or []
+        for r in rows:
+            record = ClaimRecord.from_row(r)
+            found[record.claim_id] = record
+            _claim_cache.put((tenant_id, record.claim_id), record)
+
+    return found
+
+
+def list_admitted_claims(*, tenant_id: str) -> List[ClaimRecord]:
+    """
+    Every admitted claim for a tenant, unordered and unpaginated.
+
+    Feeds the in-process activation index, which holds the full admitted set.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_ADMITTED_SQL, (tenant_id,))
+        rows = cur.fetchall() or []
+        return [ClaimRecord.from_row(r) for r in rows]
+
+
+_SELECT_LINKS_SQL = """
+    SELECT claim_id, contradiction_refs, support_refs
+    FROM gaqp_claims
+    WHERE tenant_id = %s
+      AND (contradiction_refs <> '[]'::jsonb OR support_refs <> '[]'::jsonb)
+"""
+
+
+def list_claim_links(*, tenant_id: str) -> List[Tuple[str, Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    (claim_id, contradiction_refs, support_refs) for every claim of the
+    tenant that has at least one ref. Feeds the in-process claim graph,
+    which needs the links only, not the claims.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_LINKS_SQL, (tenant_id,))
+        rows = cur.fetchall() or []
+    return [
+        (claim_id, tuple(contradiction_refs or ()), tuple(support_refs or ()))
+        for claim_id, contradiction_refs, support_refs in rows
+    ]
+
+
+# Scenario tokens are the lowercased text split on non-alphanumerics — the
+# same rule that derives gaqp_claim_triggers.lead_token (migration 012) — so
+# candidate triggers come from the (tenant_id, lead_token) index and are
+# then verified as substrings of the whole scenario. A trigger therefore
+# matches only if its first [a-z0-9]+ word equals a whole scenario token:
+# "cap rate" fires on "cap rates" but "cap" does not fire on "caps" or
+# "capital", and a trigger with no [a-z0-9] at all never fires. That is a
+# recall gap against ActivationIndex.match, which accepts any substring.
+# DISTINCT ON keeps each claim's first matching trigger in its own order,
+# as ActivationIndex does.
+_MATCH_BY_SCENARIO_SQL = """
+    WITH scenario AS (
+        SELECT lower(%s) AS text
+    ),
+    tokens AS (
+        SELECT DISTINCT tok
+        FROM scenario, regexp_split_to_table(scenario.text, '[^a-z0-9]+') AS tok
+        WHERE tok <> ''
+    ),
+    hits AS (
+        SELECT DISTINCT ON (t.claim_id) t.claim_id, t.ordinal
+        FROM gaqp_claim_triggers t
+        JOIN tokens k ON t.lead_token = k.tok
+        CROSS JOIN scenario s
+        WHERE t.tenant_id = %s AND strpos(s.text, t.trigger) > 0
+        ORDER BY t.claim_id, t.ordinal
+    )
+    SELECT c.claim_id, c.tenant_id, c.source_envelope_id, c.claim_type, c.domain, c.content,
+           c.confidence_level, c.confidence_score, c.admission_status, c.corpus_scope,
+           c.extraction_method, c.provenance::text, c.activation_scope, c.activation_triggers,
+           c.corroboration_profile::text, c.contradiction_refs, c.support_refs,
+           c.fingerprint, c.schema_version, c.inference_flag, c.source_location,
+           c.standards_package_version, c.created_at, c.updated_at,
+           c.activation_triggers ->> (h.ordinal - 1) AS matched_trigger
+    FROM hits h
+    JOIN gaqp_claims c ON c.claim_id = h.claim_id
+    WHERE c.tenant_id = %s AND c.admission_status = 'admitted' AND c.confidence_score >= %s
+    UNION ALL
+    SELECT claim_id, tenant_id, source_envelope_id, claim_type, domain, content,
+           confidence_level, confidence_score, admission_status, corpus_scope,
+           extraction_method, provenance::text, activation_scope, activation_triggers,
+           corroboration_profile::text, contradiction_refs, support_refs,
+           fingerprint, schema_version, inference_flag, source_location,
+           standards_package_version, created_at, updated_at,
+           NULL AS matched_trigger
+    FROM gaqp_claims
+    WHERE tenant_id = %s AND activation_scope = 'universal'
+      AND admission_status = 'admitted' AND confidence_score >= %s
+    ORDER BY confidence_score DESC, created_at DESC
+    LIMIT %s
+"""
+
+_UNIVERSAL_RATIONALE = "Universal activation: claim fires on all scenarios."
+
+
+def match_claims_by_scenario(
+    *,
+    tenant_id: str,
+    search_text: str,
+    confidence_floor: float,
+    limit: int,
+) -> List[Tuple[ClaimRecord, str]]:
+    """
+    Activation matching in SQL: (row, rationale) for the top `limit` admitted
+    claims that activate on search_text, by confidence_score then recency.
+
+    Universal scope always fires. Other scopes fire on a trigger that occurs
+    in search_text and whose first word is a whole word of search_text —
+    so "cap" misses "caps" and "capital", which ActivationIndex.match (any
+    substring) would catch.
+    Cost follows the scenario's tokens and the triggers that share them, not
+    the size of the tenant's corpus.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_MATCH_BY_SCENARIO_SQL, (
+            search_text,
+            tenant_id,
+            tenant_id, confidence_floor,
+            tenant_id, confidence_floor,
+            limit,
+        ))
+        rows = cur.fetchall() or []
+
+    matched: List[Tuple[ClaimRecord, str]] = []
+    for r in rows:
+        trigger = r[24]
+        rationale = (
+            f'Trigger match: "{trigger}" found in scenario context.'
+            if trigger is not None else _UNIVERSAL_RATIONALE
+        )
+        matched.append((ClaimRecord.from_row(r[:24]), rationale))
+    return matched
 
 
 def list_claims(
@@ -251,14 +588,10 @@ def list_claims(
         " ORDER BY confidence_score DESC, created_at DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            return [_row_to_dict(r) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [_row_to_dict(r) for r in rows]
 
 
 _UPDATE_CORROBORATION_SQL = """
@@ -287,56 +620,292 @@ def update_claim_corroboration(
     """
     from src.service.gaqp.models import CorroborationProfile  # local to avoid circular
     Json = _load_psycopg2_json()
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_UPDATE_CORROBORATION_SQL, (
-                Json(new_profile.to_dict()),
-                new_confidence_level,
-                new_confidence_score,
-                claim_id,
-                tenant_id,
-            ))
-            return cur.rowcount > 0
-    finally:
-        conn.close()
-
-
-_UPDATE_CONTRADICTIONS_SQL = """
-    UPDATE gaqp_claims
-    SET contradiction_refs = %s,
-        corroboration_profile = %s,
+    _invalidate_cached(tenant_id=tenant_id, claim_id=claim_id)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_UPDATE_CORROBORATION_SQL, (
+            Json(new_profile.to_dict()),
+            new_confidence_level,
+            new_confidence_score,
+            claim_id,
+            tenant_id,
+        ))
+        updated = cur.rowcount > 0
+    if updated:
+        _notify_updated(
+            tenant_id=tenant_id,
+            claim_id=claim_id,
+            corroboration_profile=new_profile,
+            confidence_level=new_confidence_level,
+            confidence_score=new_confidence_score,
+        )
+    return updated
+
+
+_LOCK_BY_IDS_SQL = _SELECT_BY_IDS_SQL + """
+    ORDER BY claim_id
+    FOR UPDATE
+"""
+
+_BULK_UPDATE_CORROBORATION_SQL = """
+    UPDATE gaqp_claims AS c
+    SET corroboration_profile = v.corroboration_profile::jsonb,
+        confidence_level = v.confidence_level,
+        confidence_score = v.confidence_score::float,
         updated_at = NOW()
-    WHERE claim_id = %s AND tenant_id = %s
+    FROM (VALUES %s) AS v(claim_id, tenant_id, corroboration_profile, confidence_level, confidence_score)
+    WHERE c.claim_id = v.claim_id AND c.tenant_id = v.tenant_id
+    RETURNING c.claim_id
 """
 
 
-def update_claim_contradictions(
+def lock_claims(*, claim_ids: Iterable[str], tenant_id: str) -> Dict[str, ClaimRecord]:
+    """
+    Read claims with SELECT ... FOR UPDATE, keyed by claim_id.
+
+    Call inside a unit_of_work(): the row locks are held until it commits,
+    so a read-modify-write on these claims cannot lose a concurrent update.
+    Rows are locked in claim_id order, so two batches over overlapping
+    claims wait on each other instead of deadlocking. Never served from
+    the claim cache.
+    """
+    ids = sorted(set(claim_ids))
+    if not ids:
+        return {}
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_LOCK_BY_IDS_SQL, (ids, tenant_id))
+        rows = cur.fetchall() or []
+    records = [ClaimRecord.from_row(r) for r in rows]
+    return {r.claim_id: r for r in records}
+
+
+def update_claims_corroboration(
     *,
-    claim_id: str,
     tenant_id: str,
-    new_contradiction_refs: List[str],
-    new_corroboration_profile: "CorroborationProfile",
-) -> bool:
+    updates: List[Tuple[str, "CorroborationProfile", str, float]],
+) -> int:
     """
-    Persist updated contradiction_refs and corroboration_profile for a claim.
+    Persist many (claim_id, new_profile, new_confidence_level,
+    new_confidence_score) updates in one UPDATE ... FROM (VALUES ...).
 
-    Returns True if the claim was found and updated, False if not found.
-    Called exclusively by the contradiction engine after linking or resolving.
+    Returns the number of claims updated. Bulk form of
+    update_claim_corroboration, used by corroboration.corroborate_many.
     """
+    if not updates:
+        return 0
     Json = _load_psycopg2_json()
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_UPDATE_CONTRADICTIONS_SQL, (
-                Json(new_contradiction_refs),
-                Json(new_corroboration_profile.to_dict()),
-                claim_id,
-                tenant_id,
-            ))
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    execute_values = _load_execute_values()
+    for claim_id, _, _, _ in updates:
+        _invalidate_cached(tenant_id=tenant_id, claim_id=claim_id)
+    with connection() as conn, conn.cursor() as cur:
+        returned = execute_values(
+            cur,
+            _BULK_UPDATE_CORROBORATION_SQL,
+            [
+                (claim_id, tenant_id, Json(profile.to_dict()), level, score)
+                for claim_id, profile, level, score in updates
+            ],
+            page_size=_BULK_CHUNK_SIZE,
+            fetch=True,
+        )
+    updated_ids = {r[0] for r in returned or []}
+    for claim_id, profile, level, score in updates:
+        if claim_id in updated_ids:
+            _notify_updated(
+                tenant_id=tenant_id,
+                claim_id=claim_id,
+                corroboration_profile=profile,
+                confidence_level=level,
+                confidence_score=score,
+            )
+    return len(updated_ids)
+
+
+# ---------------------------------------------------------------------------
+# Contradiction edges (gaqp_claim_contradictions, migration 013)
+# ---------------------------------------------------------------------------
+
+# Both statements take VALUES rows of (tenant_id, claim_a, claim_b) with
+# claim_a < claim_b, and write the edges, both endpoints' contradiction_refs
+# and both 'contradictions' counts in one statement. If any endpoint is
+# missing, nothing is written and the missing ids are returned instead.
+# Rows come back as (kind, claim_id, other_id, contradiction_refs,
+# corroboration_profile): 'edge' per pair changed, 'claim' per endpoint
+# updated, 'missing' per absent claim id.
+
+_EDGE_STATEMENT_HEAD = """
+    WITH v(tenant_id, claim_a, claim_b) AS (VALUES %s),
+    missing AS (
+        SELECT DISTINCT v.tenant_id, e.claim_id
+        FROM v CROSS JOIN LATERAL (VALUES (v.claim_a), (v.claim_b)) AS e(claim_id)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM gaqp_claims c
+            WHERE c.claim_id = e.claim_id AND c.tenant_id = v.tenant_id
+        )
+    ),
+"""
+
+_EDGE_STATEMENT_TAIL = """
+    ends AS (
+        SELECT tenant_id, claim_a AS claim_id, claim_b AS other_id FROM changed
+        UNION ALL
+        SELECT tenant_id, claim_b, claim_a FROM changed
+    ),
+    delta AS (
+        SELECT tenant_id, claim_id, array_agg(other_id) AS others, count(*)::int AS n
+        FROM ends
+        GROUP BY tenant_id, claim_id
+    ),
+    updated AS (
+        UPDATE gaqp_claims AS c
+        SET contradiction_refs = {refs},
+            corroboration_profile = jsonb_set(
+                COALESCE(c.corroboration_profile, '{{}}'::jsonb), '{{contradictions}}',
+                to_jsonb(GREATEST(0, COALESCE((c.corroboration_profile->>'contradictions')::int, 0) {sign} d.n))
+            ),
+            updated_at = NOW()
+        FROM delta d
+        WHERE c.tenant_id = d.tenant_id AND c.claim_id = d.claim_id
+        RETURNING c.claim_id, c.contradiction_refs::text, c.corroboration_profile::text
+    )
+    SELECT 'edge', claim_a, claim_b, NULL, NULL FROM changed
+    UNION ALL
+    SELECT 'claim', claim_id, NULL, contradiction_refs, corroboration_profile FROM updated
+    UNION ALL
+    SELECT 'missing', claim_id, NULL, NULL, NULL FROM missing
+"""
+
+_LINK_CONTRADICTIONS_SQL = _EDGE_STATEMENT_HEAD + """
+    changed AS (
+        INSERT INTO gaqp_claim_contradictions (tenant_id, claim_a, claim_b)
+        SELECT DISTINCT tenant_id, claim_a, claim_b FROM v
+        WHERE NOT EXISTS (SELECT 1 FROM missing)
+        ON CONFLICT DO NOTHING
+        RETURNING tenant_id, claim_a, claim_b
+    ),
+""" + _EDGE_STATEMENT_TAIL.format(
+    refs="COALESCE(c.contradiction_refs, '[]'::jsonb) || to_jsonb(d.others)",
+    sign="+",
+)
+
+_UNLINK_CONTRADICTIONS_SQL = _EDGE_STATEMENT_HEAD + """
+    changed AS (
+        DELETE FROM gaqp_claim_contradictions AS x
+        USING v
+        WHERE x.tenant_id = v.tenant_id AND x.claim_a = v.claim_a AND x.claim_b = v.claim_b
+          AND NOT EXISTS (SELECT 1 FROM missing)
+        RETURNING x.tenant_id, x.claim_a, x.claim_b
+    ),
+""" + _EDGE_STATEMENT_TAIL.format(
+    refs="COALESCE(c.contradiction_refs, '[]'::jsonb) - d.others",
+    sign="-",
+)
+
+
+_LOCK_EDGE_ENDPOINTS_SQL = """
+    SELECT claim_id FROM gaqp_claims
+    WHERE tenant_id = %s AND claim_id = ANY(%s)
+    ORDER BY claim_id
+    FOR UPDATE
+"""
+
+
+@dataclass
+class EdgeWriteSummary:
+    changed: List[Tuple[str, str]] = field(default_factory=list)  # (claim_a, claim_b), claim_a < claim_b
+    missing: List[str] = field(default_factory=list)              # claim ids absent for the tenant
+
+
+def contradiction_edge(claim_id: str, other_id: str) -> Tuple[str, str]:
+    """
+    The stored (claim_a, claim_b) form of a pair: ids in codepoint order,
+    which is the order the table's COLLATE "C" columns check (migration 013).
+    """
+    return (claim_id, other_id) if claim_id < other_id else (other_id, claim_id)
+
+
+def _write_contradiction_edges(
+    sql: str, *, tenant_id: str, pairs: Iterable[Tuple[str, str]], linking: bool,
+) -> EdgeWriteSummary:
+    edges = sorted({contradiction_edge(a, b) for a, b in pairs})
+    summary = EdgeWriteSummary()
+    if not edges:
+        return summary
+    execute_values = _load_execute_values()
+    with unit_of_work(), connection() as conn, conn.cursor() as cur:
+        if len(edges) > _BULK_CHUNK_SIZE:
+            # Each page only guards its own endpoints, so check them all
+            # first; the row locks keep them from vanishing before the
+            # later pages run.
+            ids = sorted({claim_id for edge in edges for claim_id in edge})
+            cur.execute(_LOCK_EDGE_ENDPOINTS_SQL, (tenant_id, ids))
+            absent = set(ids) - {row[0] for row in cur.fetchall() or []}
+            if absent:
+                summary.missing = sorted(absent)
+                return summary
+        returned = execute_values(
+            cur,
+            sql,
+            [(tenant_id, a, b) for a, b in edges],
+            page_size=_BULK_CHUNK_SIZE,
+            fetch=True,
+        )
+    missing = set()
+    for kind, claim_id, other_id, refs, profile in returned or []:
+        if kind == "edge":
+            summary.changed.append((claim_id, other_id))
+        elif kind == "missing":
+            missing.add(claim_id)
+        else:
+            # Row-form values: the index decodes the profile text lazily.
+            _invalidate_cached(tenant_id=tenant_id, claim_id=claim_id)
+            _notify_updated(
+                tenant_id=tenant_id,
+                claim_id=claim_id,
+                contradiction_refs=json.loads(refs or "[]"),
+                corroboration_profile=profile,
+            )
+    summary.changed.sort()
+    summary.missing = sorted(missing)
+    if summary.changed:
+        from src.service.gaqp import claim_graph  # local to avoid circular
+        changed = list(summary.changed)
+        after_commit(lambda: claim_graph.note_contradictions_changed(
+            tenant_id=tenant_id,
+            **({"linked": changed} if linking else {"resolved": changed}),
+        ))
+    return summary
+
+
+def link_contradictions(*, tenant_id: str, pairs: Iterable[Tuple[str, str]]) -> EdgeWriteSummary:
+    """
+    Record contradiction edges between pairs of the tenant's claims.
+
+    Each new edge is inserted and both endpoints' contradiction_refs and
+    contradictions counts are updated in the same statement — one round
+    trip per _BULK_CHUNK_SIZE pairs, all in one transaction (joining the
+    caller's unit_of_work() if one is open). Pairs already linked are left
+    alone and are absent from summary.changed. If any claim is missing,
+    nothing is written and summary.missing lists the absent ids; past one
+    chunk the endpoints are locked and checked before the first write.
+
+    Self-pairs are not rejected here; the contradiction engine does that.
+    """
+    return _write_contradiction_edges(
+        _LINK_CONTRADICTIONS_SQL, tenant_id=tenant_id, pairs=pairs, linking=True,
+    )
+
+
+def unlink_contradictions(*, tenant_id: str, pairs: Iterable[Tuple[str, str]]) -> EdgeWriteSummary:
+    """
+    Remove contradiction edges between pairs of the tenant's claims.
+
+    The inverse of link_contradictions(), with the same atomicity and
+    missing-claim behaviour. Pairs that were not linked are absent from
+    summary.changed.
+    """
+    return _write_contradiction_edges(
+        _UNLINK_CONTRADICTIONS_SQL, tenant_id=tenant_id, pairs=pairs, linking=False,
+    )
 
 
 _PROMOTE_STRUCTURAL_SQL = """
@@ -363,16 +932,19 @@ def promote_to_structural(
 
     Returns True if the claim was found and promoted, False if not found.
     """
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_PROMOTE_STRUCTURAL_SQL, (claim_id, tenant_id))
-            row = cur.fetchone()
-        if row is None:
-            return False
-        ret_claim_id, ret_tenant_id, claim_type, domain, content, confidence_score = row
-    finally:
-        conn.close()
+    _invalidate_cached(tenant_id=tenant_id, claim_id=claim_id)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_PROMOTE_STRUCTURAL_SQL, (claim_id, tenant_id))
+        row = cur.fetchone()
+    if row is None:
+        return False
+    ret_claim_id, ret_tenant_id, claim_type, domain, content, confidence_score = row
+    _notify_updated(
+        tenant_id=ret_tenant_id,
+        claim_id=ret_claim_id,
+        confidence_level="structural",
+        confidence_score=float(confidence_score),
+    )
 
     try:
         from src.service.memory.qcr_bridge import admit_structural_claim
@@ -402,11 +974,7 @@ def list_claims_by_envelope(
     List all claims extracted from a specific decision artifact.
     Used for backfill verification and per-decision corpus inspection.
     """
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_SELECT_BY_ENVELOPE_SQL, (tenant_id, source_envelope_id))
-            rows = cur.fetchall() or []
-            return [_row_to_dict(r) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_BY_ENVELOPE_SQL, (tenant_id, source_envelope_id))
+        rows = cur.fetchall() or []
+        return [_row_to_dict(r) for r in rows]
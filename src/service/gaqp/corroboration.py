@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
-from src.service.gaqp.corpus import get_claim, update_claim_corroboration
+from src.service.db.postgres import in_unit_of_work, unit_of_work
+from src.service.gaqp.corpus import lock_claims, update_claims_corroboration
 from src.service.gaqp.exceptions import ClaimNotFoundError
 from src.service.gaqp.models import (
     CONFIDENCE_SCORE,
@@ -17,15 +18,22 @@ logger = logging.getLogger(__name__)
 
 # Re-export: callers that import ClaimNotFoundError from this module still work.
 __all__ = [
-    "CorroborationResult", "ClaimNotFoundError",
-    "corroborate", "_compute_confidence", "_actor_key",
+    "CorroborationEvent", "CorroborationResult", "ClaimNotFoundError",
+    "corroborate", "corroborate_many", "_compute_confidence", "_actor_key",
 ]
 
 
 # ---------------------------------------------------------------------------
-# Result type
+# Event and result types
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True)
+class CorroborationEvent:
+    claim_id: str
+    corroborating_tenant_id: str
+    corroborating_actor_id: str
+
+
 @dataclass
 class CorroborationResult:
     claim_id: str
@@ -68,20 +76,16 @@ def _compute_confidence(independent_sources: int) -> Tuple[str, float]:
     return ("seed", CONFIDENCE_SCORE["seed"])
 
 
-# ---------------------------------------------------------------------------
-# Engine entry point
-# ---------------------------------------------------------------------------
-
-def corroborate(
-    *,
-    claim_id: str,
+def _apply(
+    profile: CorroborationProfile,
+    level: str,
+    score: float,
+    event: CorroborationEvent,
     tenant_id: str,
-    corroborating_tenant_id: str,
-    corroborating_actor_id: str,
-) -> CorroborationResult:
+    now: datetime,
+) -> Tuple[CorroborationProfile, str, float, CorroborationResult]:
     """
-    Record a corroboration event against an existing corpus claim and
-    promote its confidence level if the source is independent.
+    Apply one corroboration event to a claim's current state.
 
     Independence criterion: (corroborating_tenant_id, corroborating_actor_id)
     must not have been seen in a prior corroboration for this claim.
@@ -89,82 +93,144 @@ def corroborate(
 
     Structural claims are never auto-promoted further — structural is
     an operator-only elevation. Confidence is never lowered.
-
-    Raises ClaimNotFoundError if the claim does not exist for the tenant.
     """
-    row = get_claim(claim_id=claim_id, tenant_id=tenant_id)
-    if row is None:
-        raise ClaimNotFoundError(
-            f"Claim {claim_id!r} not found for tenant {tenant_id!r}"
-        )
-
-    corr_raw = row.get("corroboration_profile") or {}
-    existing_actors: List[str] = list(corr_raw.get("corroborating_actors") or [])
-
-    key = _actor_key(corroborating_tenant_id, corroborating_actor_id)
-    was_independent = key not in existing_actors
+    key = _actor_key(event.corroborating_tenant_id, event.corroborating_actor_id)
+    was_independent = key not in profile.corroborating_actors
 
     # Counts always update
-    new_count = corr_raw.get("corroboration_count", 0) + 1
-    is_cross_tenant = corroborating_tenant_id != tenant_id
-    new_same_tenant = corr_raw.get("same_tenant_count", 0) + (0 if is_cross_tenant else 1)
-    new_cross_tenant = corr_raw.get("cross_tenant_count", 0) + (1 if is_cross_tenant else 0)
+    is_cross_tenant = event.corroborating_tenant_id != tenant_id
 
     # Independent sources and actor list update only on new actors
-    new_independent = corr_raw.get("independent_sources", 0)
-    updated_actors = list(existing_actors)
+    new_independent = profile.independent_sources
+    updated_actors = list(profile.corroborating_actors)
     if was_independent:
         new_independent += 1
         updated_actors.append(key)
 
     new_profile = CorroborationProfile(
-        corroboration_count=new_count,
+        corroboration_count=profile.corroboration_count + 1,
         independent_sources=new_independent,
-        same_tenant_count=new_same_tenant,
-        cross_tenant_count=new_cross_tenant,
-        contradictions=corr_raw.get("contradictions", 0),
-        last_corroborated_at=datetime.now(UTC),
+        same_tenant_count=profile.same_tenant_count + (0 if is_cross_tenant else 1),
+        cross_tenant_count=profile.cross_tenant_count + (1 if is_cross_tenant else 0),
+        contradictions=profile.contradictions,
+        last_corroborated_at=now,
         corroborating_actors=updated_actors,
     )
 
-    previous_level: str = row["confidence_level"]
-    previous_score: float = row["confidence_score"]
-
     # Structural is an operator ceiling — never auto-promote into it,
     # never demote from it.
-    if previous_level == "structural":
+    if level == "structural":
         new_level, new_score = "structural", CONFIDENCE_SCORE["structural"]
     else:
         computed_level, computed_score = _compute_confidence(new_independent)
-        if computed_score >= previous_score:
+        if computed_score >= score:
             new_level, new_score = computed_level, computed_score
         else:
-            new_level, new_score = previous_level, previous_score
-
-    promoted = new_level != previous_level
+            new_level, new_score = level, score
 
-    update_claim_corroboration(
-        claim_id=claim_id,
-        tenant_id=tenant_id,
-        new_profile=new_profile,
-        new_confidence_level=new_level,
-        new_confidence_score=new_score,
-    )
-
-    logger.info(
-        "Corroboration recorded: claim=%s tenant=%s actor=%s:%s "
-        "independent=%s promoted=%s %s→%s",
-        claim_id, tenant_id, corroborating_tenant_id, corroborating_actor_id,
-        was_independent, promoted, previous_level, new_level,
-    )
-
-    return CorroborationResult(
-        claim_id=claim_id,
+    result = CorroborationResult(
+        claim_id=event.claim_id,
         was_independent=was_independent,
-        promoted=promoted,
-        previous_level=previous_level,
+        promoted=new_level != level,
+        previous_level=level,
         new_level=new_level,
-        previous_score=previous_score,
+        previous_score=score,
         new_score=new_score,
         independent_sources=new_independent,
     )
+    return new_profile, new_level, new_score, result
+
+
+# ---------------------------------------------------------------------------
+# Engine entry points
+# ---------------------------------------------------------------------------
+
+def corroborate_many(
+    *,
+    tenant_id: str,
+    events: Sequence[CorroborationEvent],
+) -> List[CorroborationResult]:
+    """
+    Record a batch of corroboration events against the tenant's corpus
+    claims in one transaction, returning one result per event, in order.
+
+    The claims are read with row locks (corpus.lock_claims), every event is
+    applied in a single pass — several events on one claim compound in
+    order, exactly as sequential corroborate() calls would — and all changed
+    profiles are written in one bulk UPDATE. Two round trips per batch, and
+    concurrent corroborations of the same claim serialize on its row lock
+    instead of overwriting each other.
+
+    Inside a caller's unit_of_work() the batch joins it without calling
+    begin_writes(): whether a failure here aborts the caller's whole
+    transaction is the caller's choice. The profiles are written by one
+    statement, so the batch lands or rolls back as a whole either way.
+
+    Raises ClaimNotFoundError, writing nothing, if any claim does not exist
+    for the tenant.
+    """
+    if not events:
+        return []
+
+    results: List[CorroborationResult] = []
+    state: Dict[str, Tuple[CorroborationProfile, str, float]] = {}
+    now = datetime.now(UTC)
+    owns_unit = not in_unit_of_work()
+    with unit_of_work() as uow:
+        if owns_unit:
+            uow.begin_writes()
+        records = lock_claims(claim_ids=[e.claim_id for e in events], tenant_id=tenant_id)
+        missing = sorted({e.claim_id for e in events} - set(records))
+        if missing:
+            raise ClaimNotFoundError(
+                f"Claim(s) {', '.join(repr(m) for m in missing)} not found for tenant {tenant_id!r}"
+            )
+
+        for event in events:
+            current = state.get(event.claim_id)
+            if current is None:
+                record = records[event.claim_id]
+                current = (record.corroboration_profile, record.confidence_level, record.confidence_score)
+            profile, level, score, result = _apply(*current, event, tenant_id, now)
+            state[event.claim_id] = (profile, level, score)
+            results.append(result)
+
+        update_claims_corroboration(
+            tenant_id=tenant_id,
+            updates=[(claim_id, *values) for claim_id, values in state.items()],
+        )
+
+    for event, result in zip(events, results):
+        logger.info(
+            "Corroboration recorded: claim=%s tenant=%s actor=%s:%s "
+            "independent=%s promoted=%s %s→%s",
+            event.claim_id, tenant_id, event.corroborating_tenant_id, event.corroborating_actor_id,
+            result.was_independent, result.promoted, result.previous_level, result.new_level,
+        )
+    return results
+
+
+def corroborate(
+    *,
+    claim_id: str,
+    tenant_id: str,
+    corroborating_tenant_id: str,
+    corroborating_actor_id: str,
+) -> CorroborationResult:
+    """
+    Record a corroboration event against an existing corpus claim and
+    promote its confidence level if the source is independent.
+
+    A batch of one for corroborate_many(): the claim's row is locked for the
+    read-modify-write, so concurrent corroborations are never lost.
+
+    Raises ClaimNotFoundError if the claim does not exist for the tenant.
+    """
+    return corroborate_many(
+        tenant_id=tenant_id,
+        events=[CorroborationEvent(
+            claim_id=claim_id,
+            corroborating_tenant_id=corroborating_tenant_id,
+            corroborating_actor_id=corroborating_actor_id,
+        )],
+    )[0]
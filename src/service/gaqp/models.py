@@ -267,6 +267,23 @@ class ContradictionAlert:
         }
 
 
+@dataclass(frozen=True)
+class ConflictCluster:
+    """
+    A group of claims tied to activated claims by chains of contradictions
+    (within a bounded number of hops), surfaced whole so the operator sees
+    the full dispute rather than one link at a time.
+    """
+    activated_claim_ids: List[str]   # activated claims inside the cluster
+    claim_ids: List[str]             # every claim in the cluster, nearest first
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "activated_claim_ids": self.activated_claim_ids,
+            "claim_ids": self.claim_ids,
+        }
+
+
 # ---------------------------------------------------------------------------
 # ActivationBundle — activated corpus intelligence surfaced beside a decision
 # ---------------------------------------------------------------------------
@@ -284,6 +301,7 @@ class ActivationBundle:
     corpus_scope: CorpusScope
     confidence_floor: float           # minimum score threshold used for retrieval
     contradiction_alerts: List[ContradictionAlert] = field(default_factory=list)
+    conflict_clusters: List[ConflictCluster] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -292,6 +310,7 @@ class ActivationBundle:
             "corpus_scope": self.corpus_scope,
             "confidence_floor": self.confidence_floor,
             "contradiction_alerts": [a.to_dict() for a in self.contradiction_alerts],
+            "conflict_clusters": [c.to_dict() for c in self.conflict_clusters],
         }
 
     @property
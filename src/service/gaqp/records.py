@@ -0,0 +1,319 @@
+"""
+Read model for gaqp_claims rows.
+
+ClaimRecord is what the corpus read paths return (get_claim, get_claims,
+list_admitted_claims, match_claims_by_scenario) and what the activation
+indexes hold. It is decoded straight from a psycopg2 row:
+
+- timestamps stay datetimes — no isoformat()/fromisoformat() round trip;
+- activation_triggers, contradiction_refs and support_refs are tuples,
+  shared rather than copied;
+- provenance and corroboration_profile are kept as fetched (the corpus
+  selects them as text) and decoded into ClaimProvenance /
+  CorroborationProfile on first access only;
+- to_claim() builds the GAQPClaim once and caches it, so a claim that
+  activates on many scenarios is materialized once per record.
+
+Records are immutable; replace() returns an updated copy. to_dict() gives
+the row-dict shape used by the corpus listing endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.service.gaqp.models import ClaimProvenance, CorroborationProfile, GAQPClaim
+
+# gaqp_claims column order, as selected by the corpus read queries.
+CLAIM_COLUMNS: Tuple[str, ...] = (
+    "claim_id", "tenant_id", "source_envelope_id", "claim_type", "domain", "content",
+    "confidence_level", "confidence_score", "admission_status", "corpus_scope",
+    "extraction_method", "provenance", "activation_scope", "activation_triggers",
+    "corroboration_profile", "contradiction_refs", "support_refs",
+    "fingerprint", "schema_version", "inference_flag", "source_location",
+    "standards_package_version", "created_at", "updated_at",
+)
+
+_JSON_COLUMNS = ("provenance", "corroboration_profile")
+_LAZY_SLOTS = ("_provenance", "_corroboration_profile", "_claim")
+
+
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+def _strings(value: Any) -> Tuple[str, ...]:
+    value = _json(value)
+    if not value:
+        return ()
+    return value if isinstance(value, tuple) else tuple(value)
+
+
+def _dt(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _provenance_from(raw: Any) -> ClaimProvenance:
+    if isinstance(raw, ClaimProvenance):
+        return raw
+    prov: Dict[str, Any] = _json(raw) or {}
+    return ClaimProvenance(
+        source_kind=prov.get("source_kind", "unknown"),
+        source_ref=prov.get("source_ref", ""),
+        actor_id=prov.get("actor_id", ""),
+        envelope_id=prov.get("envelope_id"),
+        origin_surface=prov.get("origin_surface"),
+    )
+
+
+def _profile_from(raw: Any) -> CorroborationProfile:
+    if isinstance(raw, CorroborationProfile):
+        return raw
+    corr: Dict[str, Any] = _json(raw) or {}
+    return CorroborationProfile(
+        corroboration_count=corr.get("corroboration_count", 0),
+        independent_sources=corr.get("independent_sources", 0),
+        same_tenant_count=corr.get("same_tenant_count", 0),
+        cross_tenant_count=corr.get("cross_tenant_count", 0),
+        contradictions=corr.get("contradictions", 0),
+        last_corroborated_at=_dt(corr.get("last_corroborated_at")),
+        corroborating_actors=list(corr.get("corroborating_actors") or []),
+    )
+
+
+class ClaimRecord:
+    """Immutable corpus claim with lazily decoded JSON sub-objects."""
+
+    __slots__ = (
+        tuple(c for c in CLAIM_COLUMNS if c not in _JSON_COLUMNS)
+        + ("_provenance_raw", "_profile_raw")
+        + _LAZY_SLOTS
+    )
+
+    claim_id: str
+    tenant_id: str
+    source_envelope_id: str
+    claim_type: str
+    domain: str
+    content: str
+    confidence_level: str
+    confidence_score: float
+    admission_status: str
+    corpus_scope: str
+    extraction_method: str
+    activation_scope: str
+    activation_triggers: Tuple[str, ...]
+    contradiction_refs: Tuple[str, ...]
+    support_refs: Tuple[str, ...]
+    fingerprint: str
+    schema_version: str
+    inference_flag: bool
+    source_location: Optional[str]
+    standards_package_version: str
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    def __init__(
+        self,
+        claim_id: str,
+        tenant_id: str,
+        source_envelope_id: str,
+        claim_type: str,
+        domain: str,
+        content: str,
+        confidence_level: str,
+        confidence_score: float,
+        admission_status: str,
+        corpus_scope: str,
+        extraction_method: str,
+        provenance: Any,
+        activation_scope: str,
+        activation_triggers: Any,
+        corroboration_profile: Any,
+        contradiction_refs: Any,
+        support_refs: Any,
+        fingerprint: str = "",
+        schema_version: str = "stage9_v1",
+        inference_flag: bool = False,
+        source_location: Optional[str] = None,
+        standards_package_version: str = "gaqp_v1.0",
+        created_at: Any = None,
+        updated_at: Any = None,
+    ) -> None:
+        s = object.__setattr__
+        s(self, "claim_id", claim_id)
+        s(self, "tenant_id", tenant_id)
+        s(self, "source_envelope_id", source_envelope_id)
+        s(self, "claim_type", claim_type)
+        s(self, "domain", domain)
+        s(self, "content", content)
+        s(self, "confidence_level", confidence_level)
+        s(self, "confidence_score", float(confidence_score))
+        s(self, "admission_status", admission_status)
+        s(self, "corpus_scope", corpus_scope)
+        s(self, "extraction_method", extraction_method)
+        s(self, "_provenance_raw", provenance)
+        s(self, "activation_scope", activation_scope)
+        s(self, "activation_triggers", _strings(activation_triggers))
+        s(self, "_profile_raw", corroboration_profile)
+        s(self, "contradiction_refs", _strings(contradiction_refs))
+        s(self, "support_refs", _strings(support_refs))
+        s(self, "fingerprint", fingerprint or "")
+        s(self, "schema_version", schema_version or "stage9_v1")
+        s(self, "inference_flag", bool(inference_flag))
+        s(self, "source_location", source_location)
+        s(self, "standards_package_version", standards_package_version or "gaqp_v1.0")
+        s(self, "created_at", _dt(created_at))
+        s(self, "updated_at", _dt(updated_at))
+        for name in _LAZY_SLOTS:
+            s(self, name, None)
+
+    # -- construction --------------------------------------------------------
+
+    @classmethod
+    def from_row(cls, row: Iterable[Any]) -> "ClaimRecord":
+        """Decode a row selected in CLAIM_COLUMNS order."""
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "ClaimRecord":
+        """Build from the row-dict shape (ISO-string or datetime timestamps)."""
+        return cls(**{name: row.get(name) for name in CLAIM_COLUMNS})
+
+    @classmethod
+    def from_claim(cls, claim: GAQPClaim) -> "ClaimRecord":
+        record = cls(
+            claim.claim_id, claim.tenant_id, claim.source_envelope_id,
+            claim.claim_type, claim.domain, claim.content,
+            claim.confidence_level, claim.confidence_score,
+            claim.admission_status, claim.corpus_scope, claim.extraction_method,
+            claim.provenance, claim.activation_scope, claim.activation_triggers,
+            claim.corroboration_profile, claim.contradiction_refs, claim.support_refs,
+            claim.fingerprint, claim.schema_version, claim.inference_flag,
+            claim.source_location, claim.standards_package_version,
+            claim.created_at, claim.updated_at,
+        )
+        object.__setattr__(record, "_claim", claim)
+        return record
+
+    def replace(self, **fields: Any) -> "ClaimRecord":
+        """A copy with fields changed (values in row form; cached decodes are dropped)."""
+        values = {
+            name: getattr(self, name)
+            for name in CLAIM_COLUMNS
+            if name not in _JSON_COLUMNS
+        }
+        values["provenance"] = self._provenance_raw
+        values["corroboration_profile"] = self._profile_raw
+        unknown = set(fields) - set(CLAIM_COLUMNS)
+        if unknown:
+            raise TypeError(f"Unknown ClaimRecord field(s): {sorted(unknown)}")
+        values.update(fields)
+        return ClaimRecord(**values)
+
+    # -- lazy sub-objects ----------------------------------------------------
+
+    @property
+    def provenance(self) -> ClaimProvenance:
+        prov = self._provenance
+        if prov is None:
+            prov = _provenance_from(self._provenance_raw)
+            object.__setattr__(self, "_provenance", prov)
+        return prov
+
+    @property
+    def corroboration_profile(self) -> CorroborationProfile:
+        profile = self._corroboration_profile
+        if profile is None:
+            profile = _profile_from(self._profile_raw)
+            object.__setattr__(self, "_corroboration_profile", profile)
+        return profile
+
+    def to_claim(self) -> GAQPClaim:
+        """The equivalent GAQPClaim, built on first call and reused after."""
+        claim = self._claim
+        if claim is None:
+            claim = GAQPClaim(
+                claim_id=self.claim_id,
+                tenant_id=self.tenant_id,
+                source_envelope_id=self.source_envelope_id,
+                claim_type=self.claim_type,
+                domain=self.domain,
+                content=self.content,
+                confidence_level=self.confidence_level,
+                confidence_score=self.confidence_score,
+                admission_status=self.admission_status,
+                corpus_scope=self.corpus_scope,
+                extraction_method=self.extraction_method,
+                provenance=self.provenance,
+                activation_scope=self.activation_scope,
+                activation_triggers=list(self.activation_triggers),
+                corroboration_profile=self.corroboration_profile,
+                contradiction_refs=list(self.contradiction_refs),
+                support_refs=list(self.support_refs),
+                fingerprint=self.fingerprint,
+                schema_version=self.schema_version,
+                standards_package_version=self.standards_package_version,
+                inference_flag=self.inference_flag,
+                source_location=self.source_location,
+                created_at=self.created_at or datetime.now(UTC),
+                updated_at=self.updated_at or datetime.now(UTC),
+            )
+            object.__setattr__(self, "_claim", claim)
+        return claim
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Row-dict shape: JSON sub-objects as dicts, timestamps as ISO strings."""
+        prov = self._provenance_raw
+        corr = self._profile_raw
+        return {
+            "claim_id": self.claim_id,
+            "tenant_id": self.tenant_id,
+            "source_envelope_id": self.source_envelope_id,
+            "claim_type": self.claim_type,
+            "domain": self.domain,
+            "content": self.content,
+            "confidence_level": self.confidence_level,
+            "confidence_score": self.confidence_score,
+            "admission_status": self.admission_status,
+            "corpus_scope": self.corpus_scope,
+            "extraction_method": self.extraction_method,
+            "provenance": prov.to_dict() if isinstance(prov, ClaimProvenance) else _json(prov),
+            "activation_scope": self.activation_scope,
+            "activation_triggers": list(self.activation_triggers),
+            "corroboration_profile": (
+                corr.to_dict() if isinstance(corr, CorroborationProfile) else _json(corr)
+            ),
+            "contradiction_refs": list(self.contradiction_refs),
+            "support_refs": list(self.support_refs),
+            "fingerprint": self.fingerprint,
+            "schema_version": self.schema_version,
+            "inference_flag": self.inference_flag,
+            "source_location": self.source_location,
+            "standards_package_version": self.standards_package_version,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    # -- immutability ----------------------------------------------------------
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClaimRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ClaimRecord(claim_id={self.claim_id!r}, tenant_id={self.tenant_id!r})"
@@ -0,0 +1,185 @@
+"""
+Cross-tenant structural corpus read path for the Stage 9D activation engine.
+
+Structural-scope claims are shared across tenants through the de-identified
+gaqp_structural_corpus table (infra/migrations/006), which a trigger on
+gaqp_claims keeps current and stamps with a monotonically increasing
+version. This module holds one in-memory snapshot per process:
+
+- Cold: every non-withdrawn row is loaded into an ActivationIndex.
+- Warm: at most once per refresh interval, only rows with version > the
+  snapshot's version are read and applied (upsert, or remove if withdrawn).
+- Between refreshes activation reads the snapshot without touching the DB.
+
+Versions come from a sequence, so a slow writer can commit a lower version
+after a faster one has been read. A full reload every
+EXECALC_STRUCTURAL_CORPUS_FULL_RELOAD_SECONDS (default 900) picks up any
+such straggler.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src.service.db.postgres import connection
+from src.service.gaqp.activation_index import ActivationIndex
+from src.service.gaqp.records import ClaimRecord
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_REFRESH_SECONDS = 60.0
+_DEFAULT_FULL_RELOAD_SECONDS = 900.0
+
+_SELECT_CHANGES_SQL = """
+    SELECT claim_id, claim_type, domain, content,
+           confidence_level, confidence_score, extraction_method,
+           activation_scope, activation_triggers, corroboration_profile,
+           fingerprint, schema_version, standards_package_version, inference_flag,
+           created_at, updated_at, withdrawn, version
+    FROM gaqp_structural_corpus
+    WHERE version > %s
+    ORDER BY version ASC
+"""
+
+
+def _row_to_record(row: tuple) -> Tuple[ClaimRecord, bool, int]:
+    """
+    Shape a structural corpus row as a gaqp_claims ClaimRecord.
+
+    Identifying fields are blank: the claim belongs to no tenant, envelope
+    or actor as far as the reader is concerned.
+    """
+    (
+        claim_id, claim_type, domain, content,
+        confidence_level, confidence_score, extraction_method,
+        activation_scope, activation_triggers, corroboration_profile,
+        fingerprint, schema_version, standards_package_version, inference_flag,
+        created_at, updated_at, withdrawn, version,
+    ) = row
+    claim = ClaimRecord(
+        claim_id=claim_id,
+        tenant_id="",
+        source_envelope_id="",
+        claim_type=claim_type,
+        domain=domain,
+        content=content,
+        confidence_level=confidence_level,
+        confidence_score=confidence_score,
+        admission_status="admitted",
+        corpus_scope="structural",
+        extraction_method=extraction_method,
+        provenance=None,
+        activation_scope=activation_scope,
+        activation_triggers=activation_triggers,
+        corroboration_profile=corroboration_profile,
+        contradiction_refs=(),
+        support_refs=(),
+        fingerprint=fingerprint,
+        schema_version=schema_version,
+        inference_flag=inference_flag,
+        source_location=None,
+        standards_package_version=standards_package_version,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+    return claim, bool(withdrawn), int(version)
+
+
+def _fetch_changes(since_version: int) -> List[tuple]:
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_CHANGES_SQL, (since_version,))
+        return cur.fetchall() or []
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+class StructuralCorpus:
+    def __init__(self) -> None:
+        self.version = 0
+        self.index = ActivationIndex("structural")
+        now = time.monotonic()
+        self.loaded_at = now
+        self.refreshed_at = now
+
+    def apply(self, rows: List[tuple]) -> int:
+        """Apply changed rows in version order; returns the number applied."""
+        for r in rows:
+            claim, withdrawn, version = _row_to_record(r)
+            if withdrawn:
+                self.index.remove(claim.claim_id)
+            else:
+                self.index.upsert(claim)
+            self.version = max(self.version, version)
+        self.refreshed_at = time.monotonic()
+        return len(rows)
+
+
+_snapshot: Optional[StructuralCorpus] = None
+_last_attempt: Optional[float] = None
+_refresh_lock = threading.Lock()
+
+
+def _refresh_seconds() -> float:
+    return float(os.getenv("EXECALC_STRUCTURAL_CORPUS_REFRESH_SECONDS", str(_DEFAULT_REFRESH_SECONDS)))
+
+
+def _full_reload_seconds() -> float:
+    return float(os.getenv("EXECALC_STRUCTURAL_CORPUS_FULL_RELOAD_SECONDS", str(_DEFAULT_FULL_RELOAD_SECONDS)))
+
+
+def get_structural_corpus() -> Optional[StructuralCorpus]:
+    """
+    Return the current structural corpus snapshot, refreshing it first if
+    the refresh interval has passed.
+
+    A failed refresh keeps serving the previous snapshot and is not retried
+    until the next interval. Returns None only if no snapshot has ever loaded.
+    """
+    global _snapshot, _last_attempt
+
+    if _last_attempt is not None and time.monotonic() - _last_attempt < _refresh_seconds():
+        return _snapshot
+    if not _refresh_lock.acquire(blocking=_snapshot is None):
+        return _snapshot  # another thread is refreshing; serve what we have
+    try:
+        if _last_attempt is not None and time.monotonic() - _last_attempt < _refresh_seconds():
+            return _snapshot
+        _last_attempt = time.monotonic()
+
+        current = _snapshot
+        full = current is None or time.monotonic() - current.loaded_at >= _full_reload_seconds()
+        try:
+            if full:
+                fresh = StructuralCorpus()
+                fresh.apply(_fetch_changes(0))
+                _snapshot = fresh
+                logger.info(
+                    "Structural corpus loaded: %d claims at version %d",
+                    len(fresh.index), fresh.version,
+                )
+            else:
+                applied = current.apply(_fetch_changes(current.version))
+                if applied:
+                    logger.info(
+                        "Structural corpus refreshed: %d change(s), now version %d",
+                        applied, current.version,
+                    )
+        except Exception:
+            logger.exception("Structural corpus refresh failed; serving previous snapshot")
+        return _snapshot
+    finally:
+        _refresh_lock.release()
+
+
+def reset() -> None:
+    """Drop the snapshot; the next read reloads (tests, config reload)."""
+    global _snapshot, _last_attempt
+    with _refresh_lock:
+        _snapshot = None
+        _last_attempt = None
@@ -0,0 +1,112 @@
+"""
+Process-wide per-tenant cache for in-memory corpus views (the activation
+index and the claim graph).
+
+- A value lives for ttl() seconds after its load started.
+- A cold or expired tenant is loaded by one thread; concurrent callers for
+  that tenant wait for that load instead of running their own.
+- apply() hands a committed update to the tenant's loaded value and queues
+  it for any load in flight. The load replays the queue before the value is
+  published, so a load whose snapshot predates the commit cannot drop it.
+- invalidate() during a load: the loaded value is served to the callers of
+  that load but not cached.
+
+Load locks exist only while a tenant has a load running or waiting, so the
+lock table does not grow with every tenant ever seen.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TenantCache(Generic[T]):
+    def __init__(self, loader: Callable[[str], T], ttl: Callable[[], float]) -> None:
+        self._loader = loader
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[T, float]] = {}
+        # Updates noted while a tenant's load is running.
+        self._pending: Dict[str, List[Callable[[T], None]]] = {}
+        # tenant_id -> [load lock, threads holding or waiting on it]
+        self._load_locks: Dict[str, list] = {}
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self._entries
+
+    def get(self, tenant_id: str) -> T:
+        """Return the tenant's value, loading it when cold or expired."""
+        value = self._fresh(tenant_id)
+        if value is not None:
+            return value
+
+        load_lock = self._hold_load_lock(tenant_id)
+        try:
+            with load_lock:
+                value = self._fresh(tenant_id)
+                if value is not None:
+                    return value  # loaded by the thread we waited for
+                started = time.monotonic()
+                with self._lock:
+                    self._pending[tenant_id] = []
+                try:
+                    value = self._loader(tenant_id)
+                except BaseException:
+                    with self._lock:
+                        self._pending.pop(tenant_id, None)
+                    raise
+                with self._lock:
+                    pending = self._pending.pop(tenant_id, None)
+                    if pending is None:
+                        return value  # invalidated mid-load: serve it, don't cache it
+                    for update in pending:
+                        update(value)
+                    self._entries[tenant_id] = (value, started)
+                return value
+        finally:
+            self._drop_load_lock(tenant_id)
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        """Drop one tenant's value (or all of them); the next get() reloads."""
+        with self._lock:
+            if tenant_id is None:
+                self._entries.clear()
+                self._pending.clear()
+            else:
+                self._entries.pop(tenant_id, None)
+                self._pending.pop(tenant_id, None)
+
+    def apply(self, tenant_id: str, update: Callable[[T], None]) -> None:
+        """Apply a committed update to the tenant's loaded value and to any load in flight."""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            pending = self._pending.get(tenant_id)
+            if pending is not None:
+                pending.append(update)
+        if entry is not None:
+            update(entry[0])
+
+    def _fresh(self, tenant_id: str) -> Optional[T]:
+        entry = self._entries.get(tenant_id)
+        if entry is None or time.monotonic() - entry[1] >= self._ttl():
+            return None
+        return entry[0]
+
+    def _hold_load_lock(self, tenant_id: str) -> threading.Lock:
+        with self._lock:
+            holder = self._load_locks.get(tenant_id)
+            if holder is None:
+                holder = self._load_locks[tenant_id] = [threading.Lock(), 0]
+            holder[1] += 1
+            return holder[0]
+
+    def _drop_load_lock(self, tenant_id: str) -> None:
+        with self._lock:
+            holder = self._load_locks[tenant_id]
+            holder[1] -= 1
+            if holder[1] == 0:
+                del self._load_locks[tenant_id]
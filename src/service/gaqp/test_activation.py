@@ -6,12 +6,12 @@ from unittest.mock import patch
 
 import pytest
 
+from src.service.gaqp import activation_index, claim_graph, structural_corpus
 from src.service.gaqp.activation import (
     _build_search_text,
-    _dict_to_claim,
-    _match_rationale,
     activate,
 )
+from src.service.gaqp.records import ClaimRecord
 from src.service.orchestration.models import ScenarioEnvelope
 
 
@@ -19,6 +19,30 @@ from src.service.orchestration.models import ScenarioEnvelope
 # Fixtures
 # ---------------------------------------------------------------------------
 
+_LOADER = "src.service.gaqp.activation_index.list_admitted_claims"
+
+
+_GRAPH_LOADER = "src.service.gaqp.claim_graph.list_claim_links"
+
+
+@pytest.fixture(autouse=True)
+def _cold_index():
+    activation_index.invalidate()
+    claim_graph.invalidate()
+    with patch("src.service.gaqp.activation.get_structural_corpus", return_value=None), \
+         patch("src.service.qualitative_capture.repository.list_nugget_links", return_value=[]):
+        yield
+    activation_index.invalidate()
+    claim_graph.invalidate()
+
+
+def _structural(rows: List[Dict[str, Any]]) -> structural_corpus.StructuralCorpus:
+    corpus = structural_corpus.StructuralCorpus()
+    for row in rows:
+        corpus.index.upsert(row)
+    return corpus
+
+
 def _scenario(
     scenario_type: str = "acquisition",
     governing_objective: str = "evaluate target",
@@ -41,8 +65,8 @@ def _row(
     activation_triggers: List[str] = None,
     corpus_scope: str = "tenant",
     tenant_id: str = "t-001",
-) -> Dict[str, Any]:
-    return {
+) -> ClaimRecord:
+    return ClaimRecord.from_dict({
         "claim_id": claim_id,
         "tenant_id": tenant_id,
         "source_envelope_id": "env-001",
@@ -75,7 +99,7 @@ def _row(
         "schema_version": "stage9_v1",
         "created_at": datetime.now(UTC).isoformat(),
         "updated_at": datetime.now(UTC).isoformat(),
-    }
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -102,43 +126,12 @@ def test_build_search_text_skips_empty_fields():
 
 
 # ---------------------------------------------------------------------------
-# _match_rationale
-# ---------------------------------------------------------------------------
-
-def test_match_rationale_universal_always_fires():
-    row = _row(activation_scope="universal", activation_triggers=[])
-    assert _match_rationale(row, "anything at all") is not None
-
-
-def test_match_rationale_trigger_match_fires():
-    row = _row(activation_scope="domain_specific", activation_triggers=["acquisition"])
-    rationale = _match_rationale(row, "considering an acquisition target")
-    assert rationale is not None
-    assert "acquisition" in rationale
-
-
-def test_match_rationale_no_match_returns_none():
-    row = _row(activation_scope="domain_specific", activation_triggers=["salary cap"])
-    assert _match_rationale(row, "quarterly revenue review") is None
-
-
-def test_match_rationale_case_insensitive():
-    row = _row(activation_scope="situational", activation_triggers=["Acquisition"])
-    assert _match_rationale(row, "acquisition target") is not None
-
-
-def test_match_rationale_empty_triggers_no_match():
-    row = _row(activation_scope="tenant_specific", activation_triggers=[])
-    assert _match_rationale(row, "anything") is None
-
-
-# ---------------------------------------------------------------------------
-# _dict_to_claim
+# ClaimRecord.to_claim
 # ---------------------------------------------------------------------------
 
 def test_dict_to_claim_roundtrip():
     row = _row()
-    claim = _dict_to_claim(row)
+    claim = row.to_claim()
     assert claim.claim_id == "cid-001"
     assert claim.claim_type == "tradeoff"
     assert claim.confidence_score == 0.72
@@ -148,28 +141,25 @@ def test_dict_to_claim_roundtrip():
 
 
 def test_dict_to_claim_missing_provenance_fields():
-    row = _row()
-    row["provenance"] = {}
-    claim = _dict_to_claim(row)
+    row = _row().replace(provenance={})
+    claim = row.to_claim()
     assert claim.provenance.source_kind == "unknown"
     assert claim.provenance.source_ref == ""
 
 
 def test_dict_to_claim_null_timestamps_use_defaults():
-    row = _row()
-    row["created_at"] = None
-    row["updated_at"] = None
-    claim = _dict_to_claim(row)
+    row = _row().replace(created_at=None, updated_at=None)
+    claim = row.to_claim()
     assert isinstance(claim.created_at, datetime)
     assert isinstance(claim.updated_at, datetime)
 
 
 # ---------------------------------------------------------------------------
-# activate — integration via mocked list_claims
+# activate — integration via mocked corpus load
 # ---------------------------------------------------------------------------
 
 def test_activate_empty_corpus_returns_empty_bundle():
-    with patch("src.service.gaqp.activation.list_claims", return_value=[]):
+    with patch(_LOADER, return_value=[]):
         bundle = activate(scenario=_scenario(), tenant_id="t-001")
     assert bundle.is_empty
     assert bundle.activation_rationale == []
@@ -177,7 +167,7 @@ def test_activate_empty_corpus_returns_empty_bundle():
 
 def test_activate_universal_claim_always_fires():
     row = _row(activation_scope="universal", activation_triggers=[])
-    with patch("src.service.gaqp.activation.list_claims", return_value=[row]):
+    with patch(_LOADER, return_value=[row]):
         bundle = activate(scenario=_scenario(prompt="completely unrelated topic"), tenant_id="t-001")
     assert len(bundle.activated_claims) == 1
     assert "Universal" in bundle.activation_rationale[0]
@@ -185,14 +175,14 @@ def test_activate_universal_claim_always_fires():
 
 def test_activate_trigger_match_fires():
     row = _row(activation_scope="domain_specific", activation_triggers=["acquire"])
-    with patch("src.service.gaqp.activation.list_claims", return_value=[row]):
+    with patch(_LOADER, return_value=[row]):
         bundle = activate(scenario=_scenario(prompt="Should we acquire this company?"), tenant_id="t-001")
     assert len(bundle.activated_claims) == 1
 
 
 def test_activate_no_trigger_match_excluded():
     row = _row(activation_scope="situational", activation_triggers=["salary cap"])
-    with patch("src.service.gaqp.activation.list_claims", return_value=[row]):
+    with patch(_LOADER, return_value=[row]):
         bundle = activate(scenario=_scenario(prompt="revenue forecast review"), tenant_id="t-001")
     assert bundle.is_empty
 
@@ -203,7 +193,7 @@ def test_activate_sorted_by_confidence_desc():
         _row(claim_id="high", confidence_score=0.91, activation_scope="universal"),
         _row(claim_id="mid", confidence_score=0.72, activation_scope="universal"),
     ]
-    with patch("src.service.gaqp.activation.list_claims", return_value=rows):
+    with patch(_LOADER, return_value=rows):
         bundle = activate(scenario=_scenario(), tenant_id="t-001")
     scores = [c.confidence_score for c in bundle.activated_claims]
     assert scores == sorted(scores, reverse=True)
@@ -211,29 +201,182 @@ def test_activate_sorted_by_confidence_desc():
 
 def test_activate_max_claims_cap():
     rows = [_row(claim_id=f"cid-{i}", activation_scope="universal") for i in range(30)]
-    with patch("src.service.gaqp.activation.list_claims", return_value=rows):
+    with patch(_LOADER, return_value=rows):
         bundle = activate(scenario=_scenario(), tenant_id="t-001", max_claims=5)
     assert len(bundle.activated_claims) == 5
     assert len(bundle.activation_rationale) == 5
 
 
-def test_activate_deduplicates_across_scopes():
+def test_activate_deduplicates_repeated_rows():
     row = _row(claim_id="cid-dup", activation_scope="universal")
-    # list_claims is called 3 times (private, tenant, structural); each returns the same row
-    with patch("src.service.gaqp.activation.list_claims", return_value=[row]):
+    with patch(_LOADER, return_value=[row, row.replace()]):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert len(bundle.activated_claims) == 1
+
+
+def test_activate_applies_confidence_floor():
+    rows = [
+        _row(claim_id="low", confidence_score=0.50, activation_scope="universal"),
+        _row(claim_id="high", confidence_score=0.91, activation_scope="universal"),
+    ]
+    with patch(_LOADER, return_value=rows):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001", confidence_floor=0.72)
+    assert [c.claim_id for c in bundle.activated_claims] == ["high"]
+
+
+def test_activate_warm_path_skips_corpus():
+    row = _row(activation_scope="universal")
+    with patch(_LOADER, return_value=[row]) as loader:
+        activate(scenario=_scenario(), tenant_id="t-001")
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert loader.call_count == 1
+    assert len(bundle.activated_claims) == 1
+
+
+def test_activate_contradiction_ref_resolved_from_index():
+    a = _row(claim_id="a", activation_scope="universal")
+    a = a.replace(contradiction_refs=["b"])
+    b = _row(claim_id="b", activation_triggers=["unrelated"])
+    with patch(_LOADER, return_value=[a, b]), \
+         patch("src.service.gaqp.activation.get_claims") as get_claims:
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    get_claims.assert_not_called()
+    assert [al.contradicting_claim.claim_id for al in bundle.contradiction_alerts] == ["b"]
+
+
+def test_activate_surfaces_conflict_clusters_from_the_claim_graph():
+    a = _row(claim_id="a", activation_scope="universal").replace(contradiction_refs=["b"])
+    b = _row(claim_id="b", activation_triggers=["unrelated"])
+    links = [("a", ("b",), ()), ("b", ("a", "c"), ()), ("c", ("b", "d"), ()), ("d", ("c",), ())]
+    with patch(_LOADER, return_value=[a, b]), patch(_GRAPH_LOADER, return_value=links):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert len(bundle.conflict_clusters) == 1
+    cluster = bundle.conflict_clusters[0]
+    assert cluster.activated_claim_ids == ["a"]
+    assert cluster.claim_ids == ["a", "b", "c"]
+    assert bundle.to_dict()["conflict_clusters"][0]["claim_ids"] == ["a", "b", "c"]
+
+
+def test_activate_without_contradictions_skips_the_claim_graph():
+    with patch(_LOADER, return_value=[_row(activation_scope="universal")]), \
+         patch(_GRAPH_LOADER) as graph_loader:
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    graph_loader.assert_not_called()
+    assert bundle.conflict_clusters == []
+
+
+def test_activate_claim_graph_failure_keeps_alerts():
+    a = _row(claim_id="a", activation_scope="universal").replace(contradiction_refs=["b"])
+    b = _row(claim_id="b", activation_triggers=["unrelated"])
+    with patch(_LOADER, return_value=[a, b]), patch(_GRAPH_LOADER, side_effect=RuntimeError("db down")):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert len(bundle.contradiction_alerts) == 1
+    assert bundle.conflict_clusters == []
+
+
+def test_activate_unindexed_refs_fetched_in_one_batch():
+    rows = []
+    for i in range(3):
+        r = _row(claim_id=f"a{i}", activation_scope="universal")
+        r = r.replace(contradiction_refs=[f"x{i}", "shared"])
+        rows.append(r)
+    fetched = {cid: _row(claim_id=cid) for cid in ("x0", "x1", "x2", "shared")}
+    with patch(_LOADER, return_value=rows), \
+         patch("src.service.gaqp.activation.get_claims", return_value=fetched) as get_claims:
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    get_claims.assert_called_once()
+    assert len(bundle.contradiction_alerts) == 6
+
+
+def test_activate_ref_fetch_failure_keeps_claims():
+    row = _row(activation_scope="universal")
+    row = row.replace(contradiction_refs=["x"])
+    with patch(_LOADER, return_value=[row]), \
+         patch("src.service.gaqp.activation.get_claims", side_effect=RuntimeError("db down")):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert len(bundle.activated_claims) == 1
+    assert bundle.contradiction_alerts == []
+
+
+def test_activate_includes_cross_tenant_structural_claims():
+    own = _row(claim_id="own", activation_triggers=["acquire"])
+    shared = _row(claim_id="shared", tenant_id="", corpus_scope="structural",
+                  confidence_score=1.0, activation_triggers=["acquire"])
+    with patch(_LOADER, return_value=[own]), \
+         patch("src.service.gaqp.activation.get_structural_corpus", return_value=_structural([shared])):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert [c.claim_id for c in bundle.activated_claims] == ["shared", "own"]
+
+
+def test_activate_structural_claim_not_duplicated_for_owning_tenant():
+    row = _row(claim_id="s", corpus_scope="structural", activation_scope="universal")
+    with patch(_LOADER, return_value=[row]), \
+         patch("src.service.gaqp.activation.get_structural_corpus", return_value=_structural([row.replace(tenant_id="")])):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert len(bundle.activated_claims) == 1
+    assert bundle.activated_claims[0].tenant_id == "t-001"
+
+
+def test_activate_structural_failure_keeps_tenant_claims():
+    row = _row(activation_scope="universal")
+    with patch(_LOADER, return_value=[row]), \
+         patch("src.service.gaqp.activation.get_structural_corpus", side_effect=RuntimeError("down")):
         bundle = activate(scenario=_scenario(), tenant_id="t-001")
     assert len(bundle.activated_claims) == 1
 
 
 def test_activate_corpus_error_returns_empty_bundle():
-    with patch("src.service.gaqp.activation.list_claims", side_effect=RuntimeError("db down")):
+    with patch(_LOADER, side_effect=RuntimeError("db down")):
         bundle = activate(scenario=_scenario(), tenant_id="t-001")
     assert bundle.is_empty
     assert bundle.confidence_floor == 0.50
 
 
 def test_activate_bundle_metadata():
-    with patch("src.service.gaqp.activation.list_claims", return_value=[]):
+    with patch(_LOADER, return_value=[]):
         bundle = activate(scenario=_scenario(), tenant_id="t-001", confidence_floor=0.72)
     assert bundle.corpus_scope == "structural"
     assert bundle.confidence_floor == 0.72
+
+
+# ---------------------------------------------------------------------------
+# EXECALC_ACTIVATION_MODE=sql
+# ---------------------------------------------------------------------------
+
+_SQL_MATCH = "src.service.gaqp.activation.match_claims_by_scenario"
+
+
+def test_sql_mode_matches_in_the_database(monkeypatch):
+    monkeypatch.setenv("EXECALC_ACTIVATION_MODE", "sql")
+    row = _row()
+    pairs = [(row, 'Trigger match: "acquire" found in scenario context.')]
+    with patch(_SQL_MATCH, return_value=pairs) as match, patch(_LOADER) as loader:
+        bundle = activate(scenario=_scenario(), tenant_id="t-001", max_claims=5)
+    loader.assert_not_called()
+    assert match.call_args.kwargs == {
+        "tenant_id": "t-001",
+        "search_text": _build_search_text(_scenario()),
+        "confidence_floor": 0.50,
+        "limit": 5,
+    }
+    assert [c.claim_id for c in bundle.activated_claims] == ["cid-001"]
+    assert bundle.activation_rationale == [pairs[0][1]]
+
+
+def test_sql_mode_resolves_contradictions_through_get_claims(monkeypatch):
+    monkeypatch.setenv("EXECALC_ACTIVATION_MODE", "sql")
+    row = _row()
+    row = row.replace(contradiction_refs=["cid-002"])
+    other = _row(claim_id="cid-002")
+    with patch(_SQL_MATCH, return_value=[(row, "r")]), \
+         patch("src.service.gaqp.activation.get_claims", return_value={"cid-002": other}) as get_claims:
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    get_claims.assert_called_once_with(claim_ids=["cid-002"], tenant_id="t-001")
+    assert bundle.contradiction_alerts[0].contradicting_claim.claim_id == "cid-002"
+
+
+def test_sql_mode_failure_returns_empty_bundle(monkeypatch):
+    monkeypatch.setenv("EXECALC_ACTIVATION_MODE", "sql")
+    with patch(_SQL_MATCH, side_effect=RuntimeError("db down")):
+        bundle = activate(scenario=_scenario(), tenant_id="t-001")
+    assert bundle.activated_claims == []
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import threading
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.gaqp import activation_index
+from src.service.gaqp.activation_index import ActivationIndex, _Automaton, get_index
+from src.service.gaqp.corpus import insert_claims, update_claim_corroboration
+from src.service.gaqp.models import ClaimProvenance, CorroborationProfile, GAQPClaim
+from src.service.gaqp.records import ClaimRecord
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_LOADER = "src.service.gaqp.activation_index.list_admitted_claims"
+
+
+@pytest.fixture(autouse=True)
+def _cold_index():
+    activation_index.invalidate()
+    yield
+    activation_index.invalidate()
+
+
+def _row(
+    claim_id: str,
+    *,
+    triggers: List[str] = None,
+    scope: str = "domain_specific",
+    score: float = 0.72,
+) -> ClaimRecord:
+    return ClaimRecord.from_dict({
+        "claim_id": claim_id,
+        "tenant_id": "t-001",
+        "admission_status": "admitted",
+        "activation_scope": scope,
+        "activation_triggers": triggers or [],
+        "confidence_score": score,
+        "contradiction_refs": [],
+    })
+
+
+def _claim(claim_id: str, triggers: List[str]) -> GAQPClaim:
+    return GAQPClaim(
+        claim_id=claim_id,
+        tenant_id="t-001",
+        source_envelope_id="env-1",
+        claim_type="tradeoff",
+        domain="strategy",
+        content="Scale compresses margin before it expands it.",
+        confidence_level="developing",
+        confidence_score=0.72,
+        admission_status="admitted",
+        corpus_scope="tenant",
+        extraction_method="direct_field",
+        provenance=ClaimProvenance(source_kind="decision_artifact", source_ref="env-1", actor_id="u"),
+        activation_scope="domain_specific",
+        activation_triggers=triggers,
+        fingerprint=f"fp-{claim_id}",
+    )
+
+
+def _mock_conn() -> MagicMock:
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# _Automaton
+# ---------------------------------------------------------------------------
+
+def test_automaton_finds_overlapping_patterns():
+    ac = _Automaton(["he", "she", "his", "hers"])
+    assert ac.find("ushers") == {"he", "she", "hers"}
+
+
+def test_automaton_matches_substrings_like_in_operator():
+    patterns = ["acquire", "acquisition", "cap", "salary cap", "q"]
+    text = "should we acquire under the salary cap?"
+    assert _Automaton(patterns).find(text) == {p for p in patterns if p in text}
+
+
+def test_automaton_empty_pattern_always_matches():
+    assert _Automaton([""]).find("anything") == {""}
+
+
+# ---------------------------------------------------------------------------
+# ActivationIndex
+# ---------------------------------------------------------------------------
+
+def test_match_universal_and_first_trigger_rationale():
+    index = ActivationIndex("t-001", [
+        _row("u", scope="universal"),
+        _row("t", triggers=["Merger", "acquire"]),
+        _row("miss", triggers=["salary cap"]),
+    ])
+    matched = {row.claim_id: why for row, why in index.match("acquire or merger?", 0.5)}
+    assert set(matched) == {"u", "t"}
+    assert "Universal" in matched["u"]
+    assert '"Merger"' in matched["t"]
+
+
+def test_match_respects_confidence_floor():
+    index = ActivationIndex("t-001", [_row("u", scope="universal", score=0.5)])
+    assert index.match("x", 0.72) == []
+
+
+def test_upsert_adds_new_trigger_and_remove_drops_it():
+    index = ActivationIndex("t-001")
+    assert index.match("pricing power", 0.5) == []
+    index.upsert(_row("p", triggers=["pricing"]))
+    assert [r.claim_id for r, _ in index.match("pricing power", 0.5)] == ["p"]
+    index.remove("p")
+    assert index.match("pricing power", 0.5) == []
+
+
+def test_new_triggers_match_without_rebuilding_the_automaton():
+    index = ActivationIndex("t-001", [_row("a", triggers=["merger"])])
+    automaton = index._automaton
+    index.upsert(_row("p", triggers=["Pricing"]))
+    matched = {r.claim_id for r, _ in index.match("pricing after the merger", 0.5)}
+    assert matched == {"a", "p"}
+    assert index._automaton is automaton
+    assert index._added == {"pricing"}
+
+
+def test_removed_trigger_is_a_tombstone_until_readded():
+    index = ActivationIndex("t-001", [_row("a", triggers=["merger"])])
+    index.remove("a")
+    assert index.match("merger", 0.5) == []
+    assert index._stale == 1
+    index.upsert(_row("b", triggers=["merger"]))
+    assert [r.claim_id for r, _ in index.match("merger", 0.5)] == ["b"]
+    assert (index._stale, index._added) == (0, set())
+
+
+class _DeferredThread:
+    started: List["_DeferredThread"] = []
+
+    def __init__(self, target, **_):
+        self.target = target
+
+    def start(self):
+        _DeferredThread.started.append(self)
+
+
+def test_enough_changes_rebuild_the_automaton_in_the_background(monkeypatch):
+    monkeypatch.setattr(activation_index, "_REBUILD_AFTER", 3)
+    monkeypatch.setattr(activation_index.threading, "Thread", _DeferredThread)
+    monkeypatch.setattr(_DeferredThread, "started", [])
+    index = ActivationIndex("t-001", [_row("a", triggers=["merger"])])
+    index.remove("a")
+    index.upsert(_row("p", triggers=["pricing"]))
+    assert _DeferredThread.started == []
+    index.upsert(_row("q", triggers=["quota"]))
+    index.upsert(_row("r", triggers=["runway"]))
+    assert len(_DeferredThread.started) == 1  # one rebuild at a time
+    before = index._automaton
+    assert {r.claim_id for r, _ in index.match("pricing and quota", 0.5)} == {"p", "q"}
+    assert index._automaton is before  # matches never rebuild
+
+    _DeferredThread.started[0].target()
+    assert index._automaton is not before
+    assert index._automaton_keys == {"pricing", "quota", "runway"}
+    assert (index._added, index._stale) == (set(), 0)
+    assert {r.claim_id for r, _ in index.match("pricing and quota", 0.5)} == {"p", "q"}
+
+
+def test_upsert_non_admitted_removes_claim():
+    index = ActivationIndex("t-001", [_row("p", triggers=["pricing"])])
+    index.upsert(_row("p", triggers=["pricing"]).replace(admission_status="rejected"))
+    assert len(index) == 0
+
+
+def test_patch_updates_fields_in_place():
+    index = ActivationIndex("t-001", [_row("u", scope="universal", score=0.5)])
+    index.patch("u", {"confidence_score": 0.91})
+    assert index.get("u").confidence_score == 0.91
+    index.patch("missing", {"confidence_score": 1.0})
+    assert index.get("missing") is None
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def test_get_index_loads_once_within_ttl():
+    with patch(_LOADER, return_value=[_row("u", scope="universal")]) as loader:
+        first = get_index("t-001")
+        second = get_index("t-001")
+    assert first is second
+    loader.assert_called_once_with(tenant_id="t-001")
+
+
+def test_get_index_reloads_after_ttl(monkeypatch):
+    monkeypatch.setenv("EXECALC_ACTIVATION_INDEX_TTL_SECONDS", "0")
+    with patch(_LOADER, return_value=[]) as loader:
+        get_index("t-001")
+        get_index("t-001")
+    assert loader.call_count == 2
+
+
+def test_concurrent_cold_loads_are_single_flight():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_load(*, tenant_id):
+        started.set()
+        release.wait(2)
+        return [_row("u", scope="universal")]
+
+    with patch(_LOADER, side_effect=slow_load) as loader:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_index("t-001"))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        assert started.wait(2)
+        release.set()
+        for t in threads:
+            t.join(2)
+    loader.assert_called_once()
+    assert len(results) == 4 and all(i is results[0] for i in results)
+
+
+def test_updates_committed_during_a_load_reach_the_new_index():
+    def load_then_commit_elsewhere(*, tenant_id):
+        # The load's snapshot predates these commits.
+        activation_index.note_claims_inserted([_claim("new", ["pricing"])])
+        activation_index.note_claim_updated(tenant_id="t-001", claim_id="old", confidence_score=0.95)
+        return [_row("old", triggers=["margin"], score=0.72)]
+
+    with patch(_LOADER, side_effect=load_then_commit_elsewhere):
+        index = get_index("t-001")
+    assert index.get("new") is not None
+    assert index.get("old").confidence_score == 0.95
+    assert activation_index._cache._pending == {}
+
+
+def test_invalidate_during_load_does_not_cache_stale_index():
+    def load_then_invalidate(*, tenant_id):
+        activation_index.invalidate("t-001")
+        return []
+
+    with patch(_LOADER, side_effect=load_then_invalidate):
+        get_index("t-001")
+    assert "t-001" not in activation_index._cache
+
+
+def test_insert_claims_updates_loaded_index():
+    with patch(_LOADER, return_value=[]):
+        index = get_index("t-001")
+
+    claim = _claim("new", ["pricing"])
+    execute_values = MagicMock(return_value=[("new",)])
+    with patch("src.service.gaqp.corpus.connection", return_value=_mock_conn()), \
+         patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+         patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+        insert_claims([claim])
+
+    assert [r.claim_id for r, _ in index.match("pricing review", 0.5)] == ["new"]
+
+
+def test_duplicate_insert_not_added_to_index():
+    with patch(_LOADER, return_value=[]):
+        index = get_index("t-001")
+
+    execute_values = MagicMock(return_value=[])
+    with patch("src.service.gaqp.corpus.connection", return_value=_mock_conn()), \
+         patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+         patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+        insert_claims([_claim("dup", ["pricing"])])
+
+    assert len(index) == 0
+
+
+def test_corroboration_update_patches_loaded_index():
+    with patch(_LOADER, return_value=[_row("c", scope="universal", score=0.72)]):
+        index = get_index("t-001")
+
+    conn = _mock_conn()
+    conn.cursor.return_value.__enter__.return_value.rowcount = 1
+    with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+         patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
+        update_claim_corroboration(
+            claim_id="c",
+            tenant_id="t-001",
+            new_profile=CorroborationProfile(independent_sources=3),
+            new_confidence_level="established",
+            new_confidence_score=0.91,
+        )
+
+    assert index.get("c").confidence_score == 0.91
+    assert index.get("c").confidence_level == "established"
+    assert index.get("c").corroboration_profile.independent_sources == 3
@@ -5,7 +5,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.service.gaqp.backfill import BackfillSummary, _report_from_dict, run_backfill
+from concurrent.futures import ThreadPoolExecutor
+
+from src.service.gaqp.backfill import (
+    _parse_args,
+    BackfillSummary,
+    RangeCheckpoint,
+    _backfill_range,
+    _plan_ranges,
+    _report_from_dict,
+    _stream_records,
+    run_backfill,
+    run_parallel_backfill,
+)
 from src.service.gaqp.corpus import InsertSummary
 from src.service.decision_loop.models import DecisionReport, SensitivityVariable
 
@@ -50,9 +62,7 @@ def _make_result(suffix: str = "") -> Dict[str, Any]:
 
 
 def _mock_conn() -> MagicMock:
-    conn = MagicMock()
-    conn.close = MagicMock()
-    return conn
+    return MagicMock()
 
 
 # ---------------------------------------------------------------------------
@@ -134,7 +144,7 @@ def test_report_from_dict_none_report_uses_defaults():
 # ---------------------------------------------------------------------------
 
 def test_run_backfill_empty_records():
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", return_value=[]):
         summary = run_backfill()
     assert summary.records_read == 0
@@ -150,7 +160,7 @@ def test_run_backfill_single_record_inserted():
     page = [(1, "tenant_a", "env_001", _make_result("a"))]
     insert_sum = InsertSummary(inserted=5, skipped=0, failed=0)
     fetch_pages = [page, []]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=fetch_pages), \
          patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum) as mock_insert:
         summary = run_backfill()
@@ -167,7 +177,7 @@ def test_run_backfill_single_record_inserted():
 
 def test_run_backfill_skips_record_without_report_key():
     page = [(1, "tenant_a", "env_001", {"ok": True})]  # no "report" key
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]):
         summary = run_backfill()
     assert summary.records_read == 1
@@ -177,7 +187,7 @@ def test_run_backfill_skips_record_without_report_key():
 
 def test_run_backfill_skips_null_result():
     page = [(1, "tenant_a", "env_001", None)]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]):
         summary = run_backfill()
     assert summary.records_read == 1
@@ -186,7 +196,7 @@ def test_run_backfill_skips_null_result():
 
 def test_run_backfill_isolation_on_reconstruction_error():
     page = [(1, "tenant_a", "env_bad", _make_result())]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill._report_from_dict", side_effect=ValueError("boom")):
         summary = run_backfill()
@@ -199,7 +209,7 @@ def test_run_backfill_isolation_on_reconstruction_error():
 
 def test_run_backfill_isolation_on_extraction_error():
     page = [(1, "tenant_a", "env_001", _make_result())]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill.extract_claims", side_effect=RuntimeError("extraction exploded")):
         summary = run_backfill()
@@ -211,7 +221,7 @@ def test_run_backfill_isolation_on_extraction_error():
 
 def test_run_backfill_persistence_error_isolated():
     page = [(1, "tenant_a", "env_001", _make_result())]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill.insert_claims", side_effect=RuntimeError("db down")):
         summary = run_backfill()
@@ -229,7 +239,7 @@ def test_run_backfill_persistence_error_isolated():
 
 def test_run_backfill_dry_run_does_not_call_insert():
     page = [(1, "tenant_a", "env_001", _make_result())]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill.insert_claims") as mock_insert:
         summary = run_backfill(dry_run=True)
@@ -239,7 +249,7 @@ def test_run_backfill_dry_run_does_not_call_insert():
 
 def test_run_backfill_dry_run_counts_admitted_claims():
     page = [(1, "tenant_a", "env_001", _make_result())]
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]):
         summary = run_backfill(dry_run=True)
     # claims_inserted reflects admitted count even in dry run
@@ -258,7 +268,7 @@ def test_run_backfill_pagination_across_two_pages():
     ]
     page2 = [(3, "t", "e3", _make_result("3"))]
     insert_sum = InsertSummary(inserted=2, skipped=0, failed=0)
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page1, page2, []]), \
          patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum):
         summary = run_backfill(batch_size=2)
@@ -272,7 +282,7 @@ def test_run_backfill_limit_stops_early():
         (3, "t", "e3", _make_result("3")),
     ]
     insert_sum = InsertSummary(inserted=2, skipped=0, failed=0)
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum):
         summary = run_backfill(limit=2)
@@ -289,7 +299,7 @@ def test_run_backfill_accumulates_insert_summary():
         (2, "t", "e2", _make_result("2")),
     ]
     insert_sum = InsertSummary(inserted=3, skipped=2, failed=0)
-    with patch("src.service.gaqp.backfill.get_conn", return_value=_mock_conn()), \
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
          patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
          patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum):
         summary = run_backfill()
@@ -297,6 +307,55 @@ def test_run_backfill_accumulates_insert_summary():
     assert summary.claims_skipped == 4    # 2 per record × 2 records
 
 
+# ---------------------------------------------------------------------------
+# Streaming mode
+# ---------------------------------------------------------------------------
+
+def _streaming_conn(rows: List[Tuple[Any, ...]]) -> Tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cur = MagicMock()
+    cur.__iter__.return_value = iter(rows)
+    conn.cursor.return_value.__enter__.return_value = cur
+    return conn, cur
+
+
+def test_stream_records_uses_named_cursor_with_itersize():
+    conn, cur = _streaming_conn([(1, "t", "e1", {"ok": True})])
+    out = list(_stream_records(conn=conn, after_record_id=0, tenant_id="t", itersize=123))
+
+    assert out == [(1, "t", "e1", {"ok": True})]
+    assert conn.cursor.call_args.kwargs["name"]
+    assert cur.itersize == 123
+    sql, params = cur.execute.call_args[0]
+    assert "LIMIT" not in sql
+    assert params == [0, "t"]
+    cur.fetchall.assert_not_called()
+
+
+def test_run_backfill_stream_runs_single_query():
+    rows = [(1, "t", "e1", _make_result("1")), (2, "t", "e2", _make_result("2"))]
+    conn, cur = _streaming_conn(rows)
+    insert_sum = InsertSummary(inserted=1, skipped=0, failed=0)
+    with patch("src.service.gaqp.backfill.connection", return_value=conn), \
+         patch("src.service.gaqp.backfill._fetch_page") as mock_fetch, \
+         patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum):
+        summary = run_backfill(stream=True, itersize=10)
+
+    mock_fetch.assert_not_called()
+    assert cur.execute.call_count == 1
+    assert summary.records_read == 2
+    assert summary.claims_inserted == 2
+
+
+def test_run_backfill_stream_respects_limit():
+    rows = [(i, "t", f"e{i}", _make_result(str(i))) for i in range(1, 6)]
+    conn, _ = _streaming_conn(rows)
+    with patch("src.service.gaqp.backfill.connection", return_value=conn):
+        summary = run_backfill(stream=True, dry_run=True, limit=2)
+    assert summary.records_read == 2
+
+
 # ---------------------------------------------------------------------------
 # BackfillSummary
 # ---------------------------------------------------------------------------
@@ -325,3 +384,166 @@ def test_backfill_summary_default_state():
     s = BackfillSummary()
     assert s.records_read == 0
     assert s.errors == []
+    assert s.records_per_sec == 0.0
+
+
+def test_backfill_summary_merge_and_rates():
+    a = BackfillSummary(records_read=10, claims_inserted=20, errors=["a"], elapsed_seconds=2.0)
+    b = BackfillSummary(records_read=30, claims_inserted=60, errors=["b"])
+    a.merge(b)
+    assert a.records_read == 40
+    assert a.claims_inserted == 80
+    assert a.errors == ["a", "b"]
+    d = a.to_dict()
+    assert d["records_per_sec"] == 20.0
+    assert d["claims_per_sec"] == 40.0
+
+
+# ---------------------------------------------------------------------------
+# Parallel, resumable backfill
+# ---------------------------------------------------------------------------
+
+def _conn_with_rows(*, fetchone=None, fetchall=None) -> MagicMock:
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.return_value = fetchone
+    if fetchall is not None:
+        cur.fetchall.side_effect = fetchall
+    return conn
+
+
+def test_plan_ranges_splits_keyspace_evenly():
+    conn = _conn_with_rows(fetchone=(1, 100))
+    assert _plan_ranges(conn=conn, tenant_id=None, n_ranges=4) == [
+        (0, 25), (25, 50), (50, 75), (75, 100),
+    ]
+
+
+def test_plan_ranges_never_exceeds_record_count():
+    conn = _conn_with_rows(fetchone=(5, 6))
+    assert _plan_ranges(conn=conn, tenant_id="t", n_ranges=8) == [(4, 5), (5, 6)]
+
+
+def test_plan_ranges_empty_table():
+    conn = _conn_with_rows(fetchone=(None, None))
+    assert _plan_ranges(conn=conn, tenant_id=None, n_ranges=4) == []
+
+
+def test_backfill_range_inserts_once_per_page_and_advances_checkpoint():
+    page = [(11, "t", "e1", _make_result("1")), (12, "t", "e2", _make_result("2"))]
+    insert_sum = InsertSummary(inserted=3, skipped=0, failed=0)
+    cp = RangeCheckpoint(range_start=10, range_end=20, cursor=10)
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
+         patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]) as mock_fetch, \
+         patch("src.service.gaqp.backfill.insert_claims", return_value=insert_sum) as mock_insert, \
+         patch("src.service.gaqp.backfill._advance_checkpoint") as mock_advance:
+        summary = _backfill_range(run_id="r", checkpoint=cp, tenant_id=None, batch_size=50, dry_run=False)
+
+    assert mock_insert.call_count == 1
+    assert mock_fetch.call_args_list[0].kwargs["until_record_id"] == 20
+    assert mock_fetch.call_args_list[1].kwargs["after_record_id"] == 12
+    advances = [c.kwargs for c in mock_advance.call_args_list]
+    assert [(a["cursor"], a["status"]) for a in advances] == [(12, "running"), (20, "complete")]
+    assert summary.records_read == 2
+    assert summary.claims_inserted == 3
+
+
+def test_backfill_range_stops_on_page_failure_without_advancing():
+    page = [(11, "t", "e1", _make_result("1"))]
+    cp = RangeCheckpoint(range_start=10, range_end=20, cursor=10)
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
+         patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
+         patch("src.service.gaqp.backfill.insert_claims", side_effect=RuntimeError("db down")), \
+         patch("src.service.gaqp.backfill._advance_checkpoint") as mock_advance:
+        summary = _backfill_range(run_id="r", checkpoint=cp, tenant_id=None, batch_size=50, dry_run=False)
+
+    mock_advance.assert_not_called()
+    assert summary.records_read == 0
+    assert len(summary.errors) == 1
+    assert "after record 10" in summary.errors[0]
+
+
+def test_backfill_range_dry_run_writes_nothing():
+    page = [(11, "t", "e1", _make_result("1"))]
+    cp = RangeCheckpoint(range_start=10, range_end=20, cursor=10)
+    with patch("src.service.gaqp.backfill.connection", return_value=_mock_conn()), \
+         patch("src.service.gaqp.backfill._fetch_page", side_effect=[page, []]), \
+         patch("src.service.gaqp.backfill.insert_claims") as mock_insert, \
+         patch("src.service.gaqp.backfill._advance_checkpoint") as mock_advance:
+        summary = _backfill_range(run_id=None, checkpoint=cp, tenant_id=None, batch_size=50, dry_run=True)
+
+    mock_insert.assert_not_called()
+    mock_advance.assert_not_called()
+    assert summary.claims_inserted > 0
+
+
+def test_run_parallel_backfill_resumes_only_incomplete_ranges():
+    checkpoints = [
+        RangeCheckpoint(0, 50, 50, "complete"),
+        RangeCheckpoint(50, 100, 70, "running"),
+        RangeCheckpoint(100, 150, 100, "pending"),
+    ]
+    seen = []
+
+    def fake_range(**kwargs):
+        seen.append(kwargs["checkpoint"])
+        return BackfillSummary(records_read=5, claims_inserted=7)
+
+    with patch("src.service.gaqp.backfill._load_or_create_checkpoints", return_value=checkpoints), \
+         patch("src.service.gaqp.backfill._backfill_range", side_effect=fake_range), \
+         patch("src.service.gaqp.backfill.ProcessPoolExecutor", ThreadPoolExecutor):
+        summary = run_parallel_backfill(run_id="r", workers=2)
+
+    assert sorted(cp.range_start for cp in seen) == [50, 100]
+    assert next(cp for cp in seen if cp.range_start == 50).cursor == 70
+    assert summary.records_read == 10
+    assert summary.claims_inserted == 14
+
+
+def test_run_parallel_backfill_records_worker_failure():
+    checkpoints = [RangeCheckpoint(0, 50, 0), RangeCheckpoint(50, 100, 50)]
+
+    def fake_range(**kwargs):
+        if kwargs["checkpoint"].range_start == 50:
+            raise RuntimeError("worker crashed")
+        return BackfillSummary(records_read=5)
+
+    with patch("src.service.gaqp.backfill._load_or_create_checkpoints", return_value=checkpoints), \
+         patch("src.service.gaqp.backfill._backfill_range", side_effect=fake_range), \
+         patch("src.service.gaqp.backfill.ProcessPoolExecutor", ThreadPoolExecutor):
+        summary = run_parallel_backfill(run_id="r", workers=2)
+
+    assert summary.records_read == 5
+    assert len(summary.errors) == 1
+    assert "worker crashed" in summary.errors[0]
+
+
+def test_run_parallel_backfill_all_complete_is_noop():
+    checkpoints = [RangeCheckpoint(0, 50, 50, "complete")]
+    with patch("src.service.gaqp.backfill._load_or_create_checkpoints", return_value=checkpoints), \
+         patch("src.service.gaqp.backfill._backfill_range") as mock_range:
+        summary = run_parallel_backfill(run_id="r", workers=2)
+    mock_range.assert_not_called()
+    assert summary.records_read == 0
+
+
+# ---------------------------------------------------------------------------
+# CLI arguments
+# ---------------------------------------------------------------------------
+
+def test_parallel_cli_defaults_to_a_fresh_run_id():
+    args = _parse_args(["--workers", "2", "--tenant-id", "t1"])
+    assert args.run_id.startswith("backfill:t1:")
+    assert _parse_args(["--workers", "2", "--run-id", "resume-me"]).run_id == "resume-me"
+
+
+@pytest.mark.parametrize("flags", [["--limit", "10"], ["--stream"], ["--itersize", "100"]])
+def test_parallel_cli_rejects_serial_only_flags(flags):
+    with pytest.raises(SystemExit):
+        _parse_args(["--workers", "2", *flags])
+
+
+def test_serial_cli_accepts_serial_flags():
+    args = _parse_args(["--stream", "--limit", "10"])
+    assert args.itersize > 0
+    assert args.run_id is None
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.gaqp import claim_graph
+from src.service.gaqp.claim_graph import ClaimGraph, conflict_clusters, get_graph
+from src.service.gaqp.corpus import link_contradictions, unlink_contradictions
+from src.service.gaqp.models import ClaimProvenance, GAQPClaim
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_CLAIM_LINKS = "src.service.gaqp.claim_graph.list_claim_links"
+_NUGGET_LINKS = "src.service.qualitative_capture.repository.list_nugget_links"
+
+
+@pytest.fixture(autouse=True)
+def _cold_graphs():
+    claim_graph.invalidate()
+    yield
+    claim_graph.invalidate()
+
+
+def _graph() -> ClaimGraph:
+    """
+    a — b — c — d   contradictions (undirected)
+    s1 → a, s2 → s1 supports (s1 supports a, s2 supports s1)
+    x — y           a separate contradiction pair
+    """
+    graph = ClaimGraph("t-001")
+    graph.add_links("a", contradiction_refs=["b"], support_refs=["s1"])
+    graph.add_links("b", contradiction_refs=["a", "c"])
+    graph.add_links("c", contradiction_refs=["d"])
+    graph.add_links("s1", support_refs=["s2"])
+    graph.add_links("x", contradiction_refs=["y"])
+    return graph
+
+
+def _claim(claim_id: str, *, contradiction_refs=(), support_refs=()) -> GAQPClaim:
+    return GAQPClaim(
+        claim_id=claim_id,
+        tenant_id="t-001",
+        source_envelope_id="env-1",
+        claim_type="tradeoff",
+        domain="strategy",
+        content="Scale compresses margin before it expands it.",
+        confidence_level="seed",
+        confidence_score=0.5,
+        admission_status="admitted",
+        corpus_scope="tenant",
+        extraction_method="direct_field",
+        provenance=ClaimProvenance(source_kind="decision_artifact", source_ref="env-1", actor_id="u"),
+        activation_scope="situational",
+        contradiction_refs=list(contradiction_refs),
+        support_refs=list(support_refs),
+    )
+
+
+# ---------------------------------------------------------------------------
+# ClaimGraph queries
+# ---------------------------------------------------------------------------
+
+def test_nodes_are_interned_once():
+    graph = _graph()
+    assert len(graph) == 8
+    assert graph._contradicts[graph._node_ids["a"]] == [graph._node_ids["b"]]
+
+
+def test_contradiction_cluster_is_bounded_by_hops():
+    graph = _graph()
+    assert graph.contradiction_cluster("a", max_hops=1) == ["a", "b"]
+    assert graph.contradiction_cluster("a", max_hops=2) == ["a", "b", "c"]
+    assert graph.contradiction_cluster("a", max_hops=5) == ["a", "b", "c", "d"]
+
+
+def test_contradiction_cluster_of_unknown_claim_is_itself():
+    assert _graph().contradiction_cluster("nope") == ["nope"]
+
+
+def test_support_chain_follows_supporters_by_layer():
+    graph = _graph()
+    assert graph.support_chain("a") == [["s1"], ["s2"]]
+    assert graph.support_chain("a", max_hops=1) == [["s1"]]
+    assert graph.support_chain("s2") == []
+
+
+def test_components_span_both_link_kinds():
+    graph = _graph()
+    assert graph.component("s2") == ["a", "b", "c", "d", "s1", "s2"]
+    assert graph.components() == [["a", "b", "c", "d", "s1", "s2"], ["x", "y"]]
+
+
+def test_remove_contradiction_unlinks_both_ends():
+    graph = _graph()
+    graph.remove_contradiction("c", "b")
+    assert graph.contradiction_cluster("a", max_hops=5) == ["a", "b"]
+    assert graph.contradiction_cluster("d", max_hops=5) == ["d", "c"]
+
+
+def test_conflict_clusters_group_activated_claims():
+    graph = _graph()
+    clusters = conflict_clusters(graph, ["b", "a", "lonely", "x"], max_hops=1)
+    assert clusters == [(["b", "a"], ["b", "a", "c"]), (["x"], ["x", "y"])]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+def test_get_graph_loads_claims_and_nuggets_once():
+    claim_links = [("a", ("b",), ()), ("b", ("a",), ())]
+    nugget_links = [("n1", ["a"], ["b"])]
+    with patch(_CLAIM_LINKS, return_value=claim_links) as claims, \
+         patch(_NUGGET_LINKS, return_value=nugget_links) as nuggets:
+        graph = get_graph("t-001")
+        assert get_graph("t-001") is graph
+    claims.assert_called_once_with(tenant_id="t-001")
+    nuggets.assert_called_once_with(tenant_id="t-001")
+    assert graph.contradiction_cluster("b", max_hops=1) == ["b", "a"]
+    assert graph.contradiction_cluster("n1", max_hops=1) == ["n1", "a"]
+    assert graph.support_chain("n1") == [["b"]]
+
+
+def test_nugget_load_failure_keeps_claim_links():
+    with patch(_CLAIM_LINKS, return_value=[("a", ("b",), ())]), \
+         patch(_NUGGET_LINKS, side_effect=RuntimeError("qcr down")):
+        graph = get_graph("t-001")
+    assert graph.contradiction_cluster("a") == ["a", "b"]
+
+
+def test_expired_graph_reloads(monkeypatch):
+    monkeypatch.setenv("EXECALC_CLAIM_GRAPH_TTL_SECONDS", "0")
+    with patch(_CLAIM_LINKS, return_value=[]) as claims, patch(_NUGGET_LINKS, return_value=[]):
+        get_graph("t-001")
+        get_graph("t-001")
+    assert claims.call_count == 2
+
+
+def test_inserted_claims_are_added_to_loaded_graph():
+    with patch(_CLAIM_LINKS, return_value=[]), patch(_NUGGET_LINKS, return_value=[]):
+        graph = get_graph("t-001")
+    claim_graph.note_claims_inserted([
+        _claim("a", contradiction_refs=["b"], support_refs=["s"]),
+        _claim("plain"),
+    ])
+    assert graph.contradiction_cluster("b") == ["b", "a"]
+    assert graph.support_chain("a") == [["s"]]
+    assert "plain" not in graph
+
+
+def test_concurrent_cold_loads_are_single_flight():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_links(*, tenant_id):
+        started.set()
+        release.wait(2)
+        return [("a", ("b",), ())]
+
+    with patch(_CLAIM_LINKS, side_effect=slow_links) as claims, patch(_NUGGET_LINKS, return_value=[]):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_graph("t-001"))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        assert started.wait(2)
+        release.set()
+        for t in threads:
+            t.join(2)
+    claims.assert_called_once()
+    assert len(results) == 4 and all(g is results[0] for g in results)
+
+
+def test_links_committed_during_a_load_reach_the_new_graph():
+    def links_then_commit_elsewhere(*, tenant_id):
+        # The load's snapshot predates this commit.
+        claim_graph.note_contradictions_changed(tenant_id="t-001", linked=[("a", "c")])
+        return [("a", ("b",), ())]
+
+    with patch(_CLAIM_LINKS, side_effect=links_then_commit_elsewhere), patch(_NUGGET_LINKS, return_value=[]):
+        graph = get_graph("t-001")
+    assert graph.contradiction_cluster("a", max_hops=1) == ["a", "b", "c"]
+    assert claim_graph._cache._pending == {}
+
+
+def test_notes_for_unloaded_tenant_are_ignored():
+    claim_graph.note_contradictions_changed(tenant_id="t-001", linked=[("a", "b")])
+    assert "t-001" not in claim_graph._cache
+
+
+# ---------------------------------------------------------------------------
+# Kept current by the contradiction store
+# ---------------------------------------------------------------------------
+
+def _run_edge_write(fn, returned):
+    conn = MagicMock()
+    conn.__enter__ = lambda s: s
+    conn.__exit__ = MagicMock(return_value=False)
+    with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+         patch("src.service.gaqp.corpus._load_execute_values", return_value=MagicMock(return_value=returned)):
+        fn(tenant_id="t-001", pairs=[("a", "b")])
+
+
+def test_committed_links_and_resolutions_update_loaded_graph():
+    with patch(_CLAIM_LINKS, return_value=[]), patch(_NUGGET_LINKS, return_value=[]):
+        graph = get_graph("t-001")
+
+    _run_edge_write(link_contradictions, [("edge", "a", "b", None, None)])
+    assert graph.contradiction_cluster("a") == ["a", "b"]
+
+    _run_edge_write(unlink_contradictions, [("edge", "a", "b", None, None)])
+    assert graph.contradiction_cluster("a") == ["a"]
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from contextlib import contextmanager
 from typing import Any, Dict
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.service.gaqp.contradiction import (
-    ContradictionResult,
-    _profile_from_row,
-    _with_contradictions_delta,
     contradict,
+    contradict_many,
     resolve_contradiction,
 )
+from src.service.gaqp.corpus import EdgeWriteSummary
 from src.service.gaqp.exceptions import ClaimNotFoundError, SelfContradictionError
-from src.service.gaqp.models import CorroborationProfile
+from src.service.gaqp.records import ClaimRecord
 
 
 # ---------------------------------------------------------------------------
@@ -26,6 +26,20 @@ def _row(
     tenant_id: str = "tenant_001",
     contradiction_refs: list | None = None,
     contradictions: int = 0,
+) -> ClaimRecord:
+    return ClaimRecord.from_dict(_row_dict(
+        claim_id=claim_id,
+        tenant_id=tenant_id,
+        contradiction_refs=contradiction_refs,
+        contradictions=contradictions,
+    ))
+
+
+def _row_dict(
+    claim_id: str = "claim_a",
+    tenant_id: str = "tenant_001",
+    contradiction_refs: list | None = None,
+    contradictions: int = 0,
 ) -> Dict[str, Any]:
     return {
         "claim_id": claim_id,
@@ -65,68 +79,49 @@ def _row(
 
 
 # ---------------------------------------------------------------------------
-# _profile_from_row
+# ClaimRecord.corroboration_profile
 # ---------------------------------------------------------------------------
 
 class TestProfileFromRow:
     def test_reconstructs_contradictions_count(self):
         row = _row(contradictions=3)
-        profile = _profile_from_row(row)
+        profile = row.corroboration_profile
         assert profile.contradictions == 3
 
     def test_defaults_when_profile_missing(self):
-        row = _row()
+        row = _row_dict()
         row["corroboration_profile"] = None
-        profile = _profile_from_row(row)
+        profile = ClaimRecord.from_dict(row).corroboration_profile
         assert profile.contradictions == 0
         assert profile.corroboration_count == 0
 
 
 # ---------------------------------------------------------------------------
-# _with_contradictions_delta
+# contradict() / contradict_many()
 # ---------------------------------------------------------------------------
 
-class TestWithContradictionsDelta:
-    def test_increment(self):
-        profile = CorroborationProfile(contradictions=2)
-        updated = _with_contradictions_delta(profile, +1)
-        assert updated.contradictions == 3
-
-    def test_decrement(self):
-        profile = CorroborationProfile(contradictions=2)
-        updated = _with_contradictions_delta(profile, -1)
-        assert updated.contradictions == 1
-
-    def test_clamps_to_zero(self):
-        profile = CorroborationProfile(contradictions=0)
-        updated = _with_contradictions_delta(profile, -1)
-        assert updated.contradictions == 0
-
-    def test_other_fields_preserved(self):
-        profile = CorroborationProfile(
-            corroboration_count=5,
-            independent_sources=2,
-            contradictions=1,
-        )
-        updated = _with_contradictions_delta(profile, +1)
-        assert updated.corroboration_count == 5
-        assert updated.independent_sources == 2
+_LINK = "src.service.gaqp.contradiction.link_contradictions"
+_UNLINK = "src.service.gaqp.contradiction.unlink_contradictions"
 
 
-# ---------------------------------------------------------------------------
-# contradict()
-# ---------------------------------------------------------------------------
+@contextmanager
+def _fake_uow():
+    yield MagicMock()
 
-class TestContradict:
-    def test_creates_bidirectional_link(self):
-        row_a = _row(claim_id="claim_a")
-        row_b = _row(claim_id="claim_b")
 
-        def fake_get_claim(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
+@pytest.fixture(autouse=True)
+def _no_db_transaction():
+    with patch("src.service.gaqp.contradiction.unit_of_work", _fake_uow):
+        yield
+
+
+def _summary(changed=(), missing=()) -> EdgeWriteSummary:
+    return EdgeWriteSummary(changed=list(changed), missing=list(missing))
+
 
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get_claim), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
+class TestContradict:
+    def test_creates_link_in_one_store_call(self):
+        with patch(_LINK, return_value=_summary(changed=[("claim_a", "claim_b")])) as link:
             result = contradict(
                 claim_id="claim_a",
                 contradicting_claim_id="claim_b",
@@ -134,80 +129,84 @@ class TestContradict:
             )
 
         assert result.was_new_link is True
-        assert mock_update.call_count == 2
-
-        # First update call is for claim_a
-        _, kwargs_a = mock_update.call_args_list[0]
-        assert kwargs_a["claim_id"] == "claim_a"
-        assert "claim_b" in kwargs_a["new_contradiction_refs"]
-
-        # Second update call is for claim_b
-        _, kwargs_b = mock_update.call_args_list[1]
-        assert kwargs_b["claim_id"] == "claim_b"
-        assert "claim_a" in kwargs_b["new_contradiction_refs"]
-
-    def test_increments_contradictions_on_both_profiles(self):
-        row_a = _row(claim_id="claim_a", contradictions=0)
-        row_b = _row(claim_id="claim_b", contradictions=1)
-
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
-
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
-            contradict(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="tenant_001")
-
-        _, kwargs_a = mock_update.call_args_list[0]
-        _, kwargs_b = mock_update.call_args_list[1]
-        assert kwargs_a["new_corroboration_profile"].contradictions == 1
-        assert kwargs_b["new_corroboration_profile"].contradictions == 2
+        link.assert_called_once_with(tenant_id="tenant_001", pairs=[("claim_a", "claim_b")])
 
     def test_idempotent_when_already_linked(self):
-        row_a = _row(claim_id="claim_a", contradiction_refs=["claim_b"])
-        row_b = _row(claim_id="claim_b")
-
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
-
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
+        with patch(_LINK, return_value=_summary()):
             result = contradict(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="tenant_001")
-
         assert result.was_new_link is False
-        mock_update.assert_not_called()
-
-    def test_self_contradiction_raises(self):
-        with pytest.raises(SelfContradictionError):
-            contradict(claim_id="claim_a", contradicting_claim_id="claim_a", tenant_id="tenant_001")
-
-    def test_missing_claim_a_raises(self):
-        with patch("src.service.gaqp.contradiction.get_claim", return_value=None):
-            with pytest.raises(ClaimNotFoundError):
-                contradict(claim_id="missing", contradicting_claim_id="claim_b", tenant_id="t1")
 
-    def test_missing_claim_b_raises(self):
-        row_a = _row(claim_id="claim_a")
+    def test_reversed_pair_matches_stored_edge(self):
+        with patch(_LINK, return_value=_summary(changed=[("aaa", "bbb")])):
+            result = contradict(claim_id="bbb", contradicting_claim_id="aaa", tenant_id="t1")
+        assert result.claim_id == "bbb"
+        assert result.contradicting_claim_id == "aaa"
+        assert result.was_new_link is True
 
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else None
+    def test_self_contradiction_raises(self):
+        with patch(_LINK) as link:
+            with pytest.raises(SelfContradictionError):
+                contradict(claim_id="claim_a", contradicting_claim_id="claim_a", tenant_id="tenant_001")
+        link.assert_not_called()
 
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get):
-            with pytest.raises(ClaimNotFoundError):
+    def test_missing_claim_raises(self):
+        with patch(_LINK, return_value=_summary(missing=["missing"])):
+            with pytest.raises(ClaimNotFoundError, match="missing"):
                 contradict(claim_id="claim_a", contradicting_claim_id="missing", tenant_id="t1")
 
-    def test_returns_correct_claim_ids(self):
-        row_a = _row(claim_id="aaa")
-        row_b = _row(claim_id="bbb")
-
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "aaa" else row_b
+    def test_missing_claim_rolls_back_the_unit_of_work(self):
+        from src.service.gaqp import contradiction
+        entered = []
 
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions"):
-            result = contradict(claim_id="aaa", contradicting_claim_id="bbb", tenant_id="t1")
+        @contextmanager
+        def tracking_uow():
+            try:
+                yield MagicMock()
+            except BaseException as exc:
+                entered.append(exc)
+                raise
 
-        assert result.claim_id == "aaa"
-        assert result.contradicting_claim_id == "bbb"
+        with patch.object(contradiction, "unit_of_work", tracking_uow), \
+             patch(_LINK, return_value=_summary(missing=["ghost"])):
+            with pytest.raises(ClaimNotFoundError):
+                contradict(claim_id="claim_a", contradicting_claim_id="ghost", tenant_id="t1")
+        assert isinstance(entered[0], ClaimNotFoundError)
+
+
+class TestContradictMany:
+    def test_bulk_pairs_share_one_store_call(self):
+        pairs = [("a", "b"), ("c", "b"), ("a", "d")]
+        with patch(_LINK, return_value=_summary(changed=[("a", "b"), ("b", "c")])) as link:
+            results = contradict_many(tenant_id="t1", pairs=pairs)
+        link.assert_called_once()
+        assert [(r.claim_id, r.contradicting_claim_id) for r in results] == pairs
+        assert [r.was_new_link for r in results] == [True, True, False]
+
+    def test_duplicate_pair_reports_change_once(self):
+        with patch(_LINK, return_value=_summary(changed=[("a", "b")])):
+            results = contradict_many(tenant_id="t1", pairs=[("a", "b"), ("b", "a")])
+        assert [r.was_new_link for r in results] == [True, False]
+
+    def test_empty_batch_touches_nothing(self):
+        with patch(_LINK) as link:
+            assert contradict_many(tenant_id="t1", pairs=[]) == []
+        link.assert_not_called()
+
+    def test_begins_writes_only_in_a_unit_it_opened(self):
+        from src.service.db import postgres
+        seen = []
+
+        def link(**kwargs):
+            seen.append(postgres._current_uow.get().writing)
+            return _summary()
+
+        with patch("src.service.gaqp.contradiction.unit_of_work", postgres.unit_of_work), \
+             patch(_LINK, side_effect=link):
+            contradict_many(tenant_id="t1", pairs=[("a", "b")])
+            with postgres.unit_of_work() as outer:
+                contradict_many(tenant_id="t1", pairs=[("a", "b")])
+                assert outer.writing is False
+        assert seen == [True, False]
 
 
 # ---------------------------------------------------------------------------
@@ -215,64 +214,61 @@ class TestContradict:
 # ---------------------------------------------------------------------------
 
 class TestResolveContradiction:
-    def test_removes_bidirectional_link(self):
-        row_a = _row(claim_id="claim_a", contradiction_refs=["claim_b"], contradictions=1)
-        row_b = _row(claim_id="claim_b", contradiction_refs=["claim_a"], contradictions=1)
-
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
-
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
+    def test_removes_link_in_one_store_call(self):
+        with patch(_UNLINK, return_value=_summary(changed=[("claim_a", "claim_b")])) as unlink:
             result = resolve_contradiction(
-                claim_id="claim_a",
-                contradicting_claim_id="claim_b",
+                claim_id="claim_b",
+                contradicting_claim_id="claim_a",
                 tenant_id="tenant_001",
             )
 
         assert result.was_new_link is True
-        assert mock_update.call_count == 2
+        unlink.assert_called_once_with(tenant_id="tenant_001", pairs=[("claim_b", "claim_a")])
 
-        _, kwargs_a = mock_update.call_args_list[0]
-        assert "claim_b" not in kwargs_a["new_contradiction_refs"]
+    def test_idempotent_when_link_absent(self):
+        with patch(_UNLINK, return_value=_summary()):
+            result = resolve_contradiction(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="t1")
+        assert result.was_new_link is False
 
-        _, kwargs_b = mock_update.call_args_list[1]
-        assert "claim_a" not in kwargs_b["new_contradiction_refs"]
+    def test_missing_claim_raises(self):
+        with patch(_UNLINK, return_value=_summary(missing=["missing"])):
+            with pytest.raises(ClaimNotFoundError):
+                resolve_contradiction(claim_id="missing", contradicting_claim_id="b", tenant_id="t1")
 
-    def test_decrements_contradictions_on_both(self):
-        row_a = _row(claim_id="claim_a", contradiction_refs=["claim_b"], contradictions=2)
-        row_b = _row(claim_id="claim_b", contradiction_refs=["claim_a"], contradictions=3)
+    def test_runs_in_one_unit_of_work_with_after_commit_updates(self):
+        from src.service.db import postgres
+        events = []
 
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
+        def unlink(**kwargs):
+            events.append(("writing", postgres._current_uow.get().writing))
+            postgres.after_commit(lambda: events.append("graph updated"))
+            return _summary(changed=[("claim_a", "claim_b")])
 
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
+        with patch("src.service.gaqp.contradiction.unit_of_work", postgres.unit_of_work), \
+             patch(_UNLINK, side_effect=unlink):
             resolve_contradiction(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="t1")
+            assert events == [("writing", True), "graph updated"]
 
-        _, kwargs_a = mock_update.call_args_list[0]
-        _, kwargs_b = mock_update.call_args_list[1]
-        assert kwargs_a["new_corroboration_profile"].contradictions == 1
-        assert kwargs_b["new_corroboration_profile"].contradictions == 2
+            events.clear()
+            with postgres.unit_of_work() as outer:
+                resolve_contradiction(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="t1")
+                assert events == [("writing", False)]  # joined: deferred to the caller's commit
+                assert outer.writing is False
+            assert events == [("writing", False), "graph updated"]
 
-    def test_idempotent_when_link_absent(self):
-        row_a = _row(claim_id="claim_a", contradiction_refs=[])
-        row_b = _row(claim_id="claim_b")
-
-        def fake_get(*, claim_id, tenant_id):
-            return row_a if claim_id == "claim_a" else row_b
+    def test_missing_claim_drops_after_commit_updates(self):
+        from src.service.db import postgres
+        fired = []
 
-        with patch("src.service.gaqp.contradiction.get_claim", side_effect=fake_get), \
-             patch("src.service.gaqp.contradiction.update_claim_contradictions") as mock_update:
-            result = resolve_contradiction(claim_id="claim_a", contradicting_claim_id="claim_b", tenant_id="t1")
+        def unlink(**kwargs):
+            postgres.after_commit(lambda: fired.append(True))
+            return _summary(missing=["ghost"])
 
-        assert result.was_new_link is False
-        mock_update.assert_not_called()
-
-    def test_missing_claim_raises(self):
-        with patch("src.service.gaqp.contradiction.get_claim", return_value=None):
+        with patch("src.service.gaqp.contradiction.unit_of_work", postgres.unit_of_work), \
+             patch(_UNLINK, side_effect=unlink):
             with pytest.raises(ClaimNotFoundError):
-                resolve_contradiction(claim_id="missing", contradicting_claim_id="b", tenant_id="t1")
+                resolve_contradiction(claim_id="claim_a", contradicting_claim_id="ghost", tenant_id="t1")
+        assert fired == []
 
 
 # ---------------------------------------------------------------------------
@@ -282,8 +278,16 @@ class TestResolveContradiction:
 class TestActivationSurfacesContradictions:
     """Verify the activation engine surfaces contradiction alerts in the bundle."""
 
-    def _activated_row(self, claim_id: str, contradiction_refs: list) -> Dict[str, Any]:
-        return {
+    def setup_method(self):
+        from src.service.gaqp import activation_index
+        activation_index.invalidate()
+
+    def teardown_method(self):
+        from src.service.gaqp import activation_index
+        activation_index.invalidate()
+
+    def _activated_row(self, claim_id: str, contradiction_refs: list) -> ClaimRecord:
+        return ClaimRecord.from_dict({
             "claim_id": claim_id,
             "tenant_id": "t-001",
             "source_envelope_id": "env-001",
@@ -310,7 +314,7 @@ class TestActivationSurfacesContradictions:
             "schema_version": "stage9_v1",
             "created_at": datetime.now(UTC).isoformat(),
             "updated_at": datetime.now(UTC).isoformat(),
-        }
+        })
 
     def test_no_contradictions_empty_alerts(self):
         from src.service.gaqp.activation import activate
@@ -323,7 +327,7 @@ class TestActivationSurfacesContradictions:
             prompt="acquire?",
         )
 
-        with patch("src.service.gaqp.activation.list_claims", return_value=[row]):
+        with patch("src.service.gaqp.activation_index.list_admitted_claims", return_value=[row]):
             bundle = activate(scenario=scenario, tenant_id="t-001")
 
         assert bundle.contradiction_alerts == []
@@ -340,8 +344,8 @@ class TestActivationSurfacesContradictions:
             prompt="acquire?",
         )
 
-        with patch("src.service.gaqp.activation.list_claims", return_value=[active_row]), \
-             patch("src.service.gaqp.activation.get_claim", return_value=contra_row):
+        with patch("src.service.gaqp.activation_index.list_admitted_claims", return_value=[active_row]), \
+             patch("src.service.gaqp.activation.get_claims", return_value={"claim_b": contra_row}):
             bundle = activate(scenario=scenario, tenant_id="t-001")
 
         assert len(bundle.contradiction_alerts) == 1
@@ -360,8 +364,8 @@ class TestActivationSurfacesContradictions:
             prompt="acquire?",
         )
 
-        with patch("src.service.gaqp.activation.list_claims", return_value=[active_row]), \
-             patch("src.service.gaqp.activation.get_claim", return_value=None):
+        with patch("src.service.gaqp.activation_index.list_admitted_claims", return_value=[active_row]), \
+             patch("src.service.gaqp.activation.get_claims", return_value={}):
             bundle = activate(scenario=scenario, tenant_id="t-001")
 
         # Ghost ref produces no alert — no crash
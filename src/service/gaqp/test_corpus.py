@@ -7,13 +7,22 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from src.service.gaqp import corpus
 from src.service.gaqp.corpus import (
     InsertSummary,
+    _ClaimCache,
     get_claim,
+    get_claims,
     insert_claim,
     insert_claims,
     list_claims,
+    link_contradictions,
     list_claims_by_envelope,
+    lock_claims,
+    match_claims_by_scenario,
+    update_claim_corroboration,
+    unlink_contradictions,
+    update_claims_corroboration,
 )
 from src.service.gaqp.models import (
     CONFIDENCE_SCORE,
@@ -93,7 +102,7 @@ class TestInsertClaim:
     def test_admitted_claim_inserted(self):
         claim = _make_claim()
         conn, cur = _mock_conn(rowcount=1)
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
             result = insert_claim(claim)
         assert result is True
@@ -102,7 +111,7 @@ class TestInsertClaim:
     def test_returns_false_when_duplicate(self):
         claim = _make_claim()
         conn, cur = _mock_conn(rowcount=0)
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
             result = insert_claim(claim)
         assert result is False
@@ -110,7 +119,7 @@ class TestInsertClaim:
     def test_non_admitted_not_inserted(self):
         claim = _make_claim(admission_status="rejected")
         conn, cur = _mock_conn()
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
             result = insert_claim(claim)
         assert result is False
@@ -119,19 +128,19 @@ class TestInsertClaim:
     def test_needs_review_not_inserted(self):
         claim = _make_claim(admission_status="needs_review")
         conn, cur = _mock_conn()
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
             result = insert_claim(claim)
         assert result is False
         cur.execute.assert_not_called()
 
-    def test_connection_closed_after_insert(self):
+    def test_connection_released_after_insert(self):
         claim = _make_claim()
         conn, _ = _mock_conn()
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
             insert_claim(claim)
-        conn.close.assert_called_once()
+        conn.__exit__.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -141,7 +150,7 @@ class TestInsertClaim:
 class TestInsertClaims:
     def test_empty_list_returns_zero_summary(self):
         summary = InsertSummary()
-        with patch("src.service.gaqp.corpus.get_conn"):
+        with patch("src.service.gaqp.corpus.connection"):
             result = insert_claims([])
         assert result.inserted == 0
         assert result.skipped == 0
@@ -152,7 +161,7 @@ class TestInsertClaims:
             _make_claim(admission_status="rejected"),
             _make_claim(admission_status="needs_review"),
         ]
-        with patch("src.service.gaqp.corpus.get_conn") as mock_conn:
+        with patch("src.service.gaqp.corpus.connection") as mock_conn:
             result = insert_claims(claims)
         mock_conn.assert_not_called()
         assert result.inserted == 0
@@ -164,37 +173,100 @@ class TestInsertClaims:
             content="A different claim about capital allocation and constraint management.",
         )
 
-        conn, cur = _mock_conn(rowcount=1)
-        call_count = [0]
-
-        def side_effect(*args, **kwargs):
-            call_count[0] += 1
-            cur.rowcount = 1 if call_count[0] == 1 else 0
-
-        cur.execute.side_effect = side_effect
+        conn, cur = _mock_conn()
+        execute_values = MagicMock(return_value=[(admitted.claim_id,)])
 
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
-             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
             summary = insert_claims([admitted, duplicate])
 
         assert summary.inserted == 1
         assert summary.skipped == 1
         assert summary.failed == 0
 
-    def test_connection_closed_after_batch(self):
+    def test_batch_sent_in_one_statement(self):
+        claims = [
+            _make_claim(content=f"Claim number {i} about disciplined capital allocation.")
+            for i in range(5)
+        ]
+        conn, cur = _mock_conn()
+        execute_values = MagicMock(return_value=[(c.claim_id,) for c in claims])
+
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+            summary = insert_claims(claims)
+
+        execute_values.assert_called_once()
+        _, sql, rows = execute_values.call_args.args
+        assert "RETURNING claim_id" in sql
+        assert len(rows) == 5
+        assert execute_values.call_args.kwargs["fetch"] is True
+        assert summary.inserted == 5
+
+    def test_large_batch_split_into_chunks(self):
+        claims = [
+            _make_claim(content=f"Claim number {i} about disciplined capital allocation.")
+            for i in range(3)
+        ]
+        conn, cur = _mock_conn()
+        execute_values = MagicMock(side_effect=lambda cur, sql, rows, **kw: [(r[0],) for r in rows])
+
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values), \
+             patch("src.service.gaqp.corpus._BULK_CHUNK_SIZE", 2):
+            summary = insert_claims(claims)
+
+        assert execute_values.call_count == 2
+        assert summary.inserted == 3
+
+    def test_failed_batch_falls_back_to_row_by_row(self):
+        good = _make_claim()
+        bad = _make_claim(content="A claim whose row violates a constraint in the corpus table.")
+        dup = _make_claim(content="A claim already present in the corpus under the same fingerprint.")
+
+        conn, cur = _mock_conn()
+        executed = []
+
+        def execute(sql, params=None):
+            executed.append(sql)
+            if params is not None:
+                if params[0] == bad.claim_id:
+                    raise Exception("check constraint violated")
+                cur.rowcount = 0 if params[0] == dup.claim_id else 1
+
+        cur.execute.side_effect = execute
+        execute_values = MagicMock(side_effect=Exception("batch failed"))
+
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+            summary = insert_claims([good, bad, dup])
+
+        assert summary.inserted == 1
+        assert summary.skipped == 1
+        assert summary.failed == 1
+        assert "ROLLBACK TO SAVEPOINT gaqp_insert_chunk" in executed
+        assert "ROLLBACK TO SAVEPOINT gaqp_insert_row" in executed
+
+    def test_connection_released_after_batch(self):
         claims = [_make_claim()]
         conn, _ = _mock_conn()
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
-             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=MagicMock(return_value=[])):
             insert_claims(claims)
-        conn.close.assert_called_once()
+        conn.__exit__.assert_called_once()
 
     def test_failed_count_on_exception(self):
         claim = _make_claim()
         conn, cur = _mock_conn()
         cur.execute.side_effect = Exception("DB error")
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
-             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=MagicMock()):
             summary = insert_claims([claim])
         assert summary.failed == 1
         assert summary.inserted == 0
@@ -221,29 +293,119 @@ class TestGetClaim:
             datetime.now(UTC), datetime.now(UTC),
         )
 
-    def test_returns_dict_when_found(self):
+    def test_returns_record_when_found(self):
         claim = _make_claim()
         conn, cur = _mock_conn()
         cur.fetchone.return_value = self._make_db_row(claim)
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             result = get_claim(claim_id=claim.claim_id, tenant_id=claim.tenant_id)
         assert result is not None
-        assert result["claim_id"] == claim.claim_id
-        assert result["tenant_id"] == claim.tenant_id
+        assert result.claim_id == claim.claim_id
+        assert result.tenant_id == claim.tenant_id
+        assert result.to_claim().created_at.tzinfo is not None
 
     def test_returns_none_when_not_found(self):
         conn, cur = _mock_conn()
         cur.fetchone.return_value = None
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             result = get_claim(claim_id="nonexistent", tenant_id="tenant_001")
         assert result is None
 
-    def test_connection_closed_after_fetch(self):
+    def test_connection_released_after_fetch(self):
         conn, cur = _mock_conn()
         cur.fetchone.return_value = None
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             get_claim(claim_id="x", tenant_id="t")
-        conn.close.assert_called_once()
+        conn.__exit__.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_claims — batched fetch + LRU claim cache
+# ---------------------------------------------------------------------------
+
+class TestGetClaims:
+    def setup_method(self):
+        corpus._claim_cache.clear()
+
+    def teardown_method(self):
+        corpus._claim_cache.clear()
+
+    def _db_row(self, claim: GAQPClaim):
+        return TestGetClaim()._make_db_row(claim)
+
+    def test_single_any_query_for_all_misses(self):
+        a, b = _make_claim(content="Claim A content."), _make_claim(content="Claim B content.")
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [self._db_row(a), self._db_row(b)]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
+            result = get_claims(claim_ids=[a.claim_id, b.claim_id, "ghost", a.claim_id], tenant_id="tenant_001")
+        assert set(result) == {a.claim_id, b.claim_id}
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        assert "ANY(%s)" in sql
+        assert params == ([a.claim_id, b.claim_id, "ghost"], "tenant_001")
+
+    def test_cached_rows_skip_the_db(self):
+        claim = _make_claim()
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [self._db_row(claim)]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn) as connection:
+            get_claims(claim_ids=[claim.claim_id], tenant_id="tenant_001")
+            again = get_claims(claim_ids=[claim.claim_id], tenant_id="tenant_001")
+        assert connection.call_count == 1
+        assert again[claim.claim_id].claim_id == claim.claim_id
+
+    def test_cache_is_keyed_by_tenant(self):
+        claim = _make_claim()
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [self._db_row(claim)]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
+            get_claims(claim_ids=[claim.claim_id], tenant_id="tenant_001")
+            cur.fetchall.return_value = []
+            other = get_claims(claim_ids=[claim.claim_id], tenant_id="tenant_002")
+        assert other == {}
+
+    def test_contradiction_link_invalidates(self):
+        claim = _make_claim()
+        corpus._claim_cache.put(("tenant_001", claim.claim_id), {"claim_id": claim.claim_id})
+        conn, _ = _mock_conn()
+        returned = [("claim", claim.claim_id, None, '["other"]', '{"contradictions": 1}')]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=MagicMock(return_value=returned)):
+            link_contradictions(tenant_id="tenant_001", pairs=[(claim.claim_id, "other")])
+        assert corpus._claim_cache.get(("tenant_001", claim.claim_id)) is None
+
+    def test_update_corroboration_invalidates(self):
+        claim = _make_claim()
+        corpus._claim_cache.put(("tenant_001", claim.claim_id), {"claim_id": claim.claim_id})
+        conn, _ = _mock_conn(rowcount=1)
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x):
+            update_claim_corroboration(
+                claim_id=claim.claim_id,
+                tenant_id="tenant_001",
+                new_profile=CorroborationProfile(),
+                new_confidence_level="developing",
+                new_confidence_score=0.72,
+            )
+        assert corpus._claim_cache.get(("tenant_001", claim.claim_id)) is None
+
+
+class TestClaimCache:
+    def test_evicts_least_recently_used(self):
+        cache = _ClaimCache(max_size=2, ttl=60.0)
+        cache.put(("t", "a"), {"claim_id": "a"})
+        cache.put(("t", "b"), {"claim_id": "b"})
+        cache.get(("t", "a"))
+        cache.put(("t", "c"), {"claim_id": "c"})
+        assert cache.get(("t", "b")) is None
+        assert cache.get(("t", "a")) is not None
+        assert len(cache) == 2
+
+    def test_expired_entry_is_a_miss(self):
+        cache = _ClaimCache(max_size=2, ttl=0.0)
+        cache.put(("t", "a"), {"claim_id": "a"})
+        assert cache.get(("t", "a")) is None
 
 
 # ---------------------------------------------------------------------------
@@ -254,14 +416,14 @@ class TestListClaims:
     def test_empty_result(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             result = list_claims(tenant_id="tenant_001")
         assert result == []
 
     def test_limit_clamped_to_200(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims(tenant_id="t1", limit=999)
         sql_call = cur.execute.call_args[0][0]
         params = cur.execute.call_args[0][1]
@@ -270,7 +432,7 @@ class TestListClaims:
     def test_limit_minimum_1(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims(tenant_id="t1", limit=0)
         params = cur.execute.call_args[0][1]
         assert params[-1] == 1
@@ -278,17 +440,189 @@ class TestListClaims:
     def test_claim_type_filter_added(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims(tenant_id="t1", claim_type="tradeoff")
         sql = cur.execute.call_args[0][0]
         assert "claim_type" in sql
 
-    def test_connection_closed(self):
+    def test_connection_released(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims(tenant_id="t1")
-        conn.close.assert_called_once()
+        conn.__exit__.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# match_claims_by_scenario — SQL activation over gaqp_claim_triggers
+# ---------------------------------------------------------------------------
+
+class TestMatchClaimsByScenario:
+    def _db_row(self, claim: GAQPClaim, trigger):
+        return TestGetClaim()._make_db_row(claim) + (trigger,)
+
+    def test_single_query_with_tenant_floor_and_limit(self):
+        conn, cur = _mock_conn()
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
+            result = match_claims_by_scenario(
+                tenant_id="t1", search_text="should we acquire", confidence_floor=0.6, limit=20,
+            )
+        assert result == []
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        assert "gaqp_claim_triggers" in sql
+        assert "regexp_split_to_table" in sql
+        assert params == ("should we acquire", "t1", "t1", 0.6, "t1", 0.6, 20)
+
+    def test_rationale_names_trigger_or_universal(self):
+        hit = _make_claim(content="Trigger hit.")
+        universal = _make_claim(content="Universal claim.")
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [self._db_row(hit, "Tradeoff_Analysis"), self._db_row(universal, None)]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
+            result = match_claims_by_scenario(
+                tenant_id="tenant_001", search_text="tradeoff_analysis", confidence_floor=0.5, limit=20,
+            )
+        assert [row.claim_id for row, _ in result] == [hit.claim_id, universal.claim_id]
+        assert result[0][1] == 'Trigger match: "Tradeoff_Analysis" found in scenario context.'
+        assert result[1][1] == "Universal activation: claim fires on all scenarios."
+        assert isinstance(result[0][0].created_at, datetime)
+
+
+# ---------------------------------------------------------------------------
+# lock_claims / update_claims_corroboration — batched corroboration writes
+# ---------------------------------------------------------------------------
+
+class TestBatchCorroborationWrites:
+    def setup_method(self):
+        corpus._claim_cache.clear()
+
+    def test_lock_claims_selects_for_update_in_id_order(self):
+        claim = _make_claim()
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [TestGetClaim()._make_db_row(claim)]
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
+            result = lock_claims(claim_ids=["z", claim.claim_id, "z"], tenant_id="tenant_001")
+        sql, params = cur.execute.call_args.args
+        assert "FOR UPDATE" in sql
+        assert params == (sorted({"z", claim.claim_id}), "tenant_001")
+        assert list(result) == [claim.claim_id]
+
+    def test_lock_claims_empty_skips_db(self):
+        with patch("src.service.gaqp.corpus.connection") as connection:
+            assert lock_claims(claim_ids=[], tenant_id="t") == {}
+        connection.assert_not_called()
+
+    def test_update_claims_corroboration_is_one_statement(self):
+        conn, cur = _mock_conn()
+        execute_values = MagicMock(return_value=[("a",)])
+        profile = CorroborationProfile(independent_sources=1)
+        corpus._claim_cache.put(("t1", "a"), object())
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_psycopg2_json", return_value=lambda x: x), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+            updated = update_claims_corroboration(tenant_id="t1", updates=[
+                ("a", profile, "single_source", 0.65),
+                ("gone", profile, "single_source", 0.65),
+            ])
+        assert updated == 1
+        execute_values.assert_called_once()
+        rows = execute_values.call_args.args[2]
+        assert rows[0] == ("a", "t1", profile.to_dict(), "single_source", 0.65)
+        assert corpus._claim_cache.get(("t1", "a")) is None
+
+
+# ---------------------------------------------------------------------------
+# link_contradictions / unlink_contradictions — contradiction edges
+# ---------------------------------------------------------------------------
+
+class TestContradictionEdges:
+    def _run(self, fn, pairs, returned):
+        conn, _ = _mock_conn()
+        execute_values = MagicMock(return_value=returned)
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+            summary = fn(tenant_id="t1", pairs=pairs)
+        return summary, execute_values
+
+    def test_pairs_are_ordered_deduped_and_sent_in_one_statement(self):
+        _, execute_values = self._run(link_contradictions, [("b", "a"), ("a", "b"), ("c", "a")], [])
+        execute_values.assert_called_once()
+        sql, rows = execute_values.call_args.args[1:3]
+        assert "INSERT INTO gaqp_claim_contradictions" in sql
+        assert "UPDATE gaqp_claims" in sql
+        assert rows == [("t1", "a", "b"), ("t1", "a", "c")]
+
+    def test_pairs_use_codepoint_order_like_the_collate_c_columns(self):
+        _, execute_values = self._run(link_contradictions, [("b", "B"), ("é", "z")], [])
+        rows = execute_values.call_args.args[2]
+        assert rows == [("t1", "B", "b"), ("t1", "z", "é")]
+
+    def test_summary_and_index_notification(self):
+        returned = [
+            ("edge", "a", "b", None, None),
+            ("claim", "a", None, '["x", "b"]', '{"contradictions": 2}'),
+            ("claim", "b", None, '["a"]', '{"contradictions": 1}'),
+        ]
+        with patch("src.service.gaqp.corpus._notify_updated") as notify:
+            summary, _ = self._run(link_contradictions, [("a", "b")], returned)
+        assert summary.changed == [("a", "b")]
+        assert summary.missing == []
+        assert notify.call_count == 2
+        first = notify.call_args_list[0].kwargs
+        assert first["claim_id"] == "a"
+        assert first["contradiction_refs"] == ["x", "b"]
+
+    def test_missing_claims_are_reported(self):
+        summary, _ = self._run(link_contradictions, [("a", "ghost")], [("missing", "ghost", None, None, None)])
+        assert summary.changed == []
+        assert summary.missing == ["ghost"]
+
+    def _run_chunked(self, absent=()):
+        pairs = [(f"c{i:04d}", f"c{i + 1:04d}") for i in range(corpus._BULK_CHUNK_SIZE + 1)]
+        ids = sorted({claim_id for pair in pairs for claim_id in pair})
+        conn, cur = _mock_conn()
+        cur.fetchall.return_value = [(claim_id,) for claim_id in ids if claim_id not in absent]
+        execute_values = MagicMock(return_value=[])
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=execute_values):
+            summary = link_contradictions(tenant_id="t1", pairs=pairs)
+        return summary, cur, execute_values, ids
+
+    def test_multi_chunk_missing_claim_writes_nothing(self):
+        summary, cur, execute_values, ids = self._run_chunked(absent={"c0300"})
+        sql, params = cur.execute.call_args.args
+        assert "FOR UPDATE" in sql
+        assert params == ("t1", ids)
+        execute_values.assert_not_called()
+        assert summary.changed == []
+        assert summary.missing == ["c0300"]
+
+    def test_multi_chunk_writes_after_endpoints_are_locked(self):
+        summary, cur, execute_values, _ = self._run_chunked()
+        cur.execute.assert_called_once()
+        execute_values.assert_called_once()
+        assert execute_values.call_args.kwargs["page_size"] == corpus._BULK_CHUNK_SIZE
+        assert summary.missing == []
+
+    def test_single_chunk_skips_the_endpoint_check(self):
+        conn, cur = _mock_conn()
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
+             patch("src.service.gaqp.corpus._load_execute_values", return_value=MagicMock(return_value=[])):
+            link_contradictions(tenant_id="t1", pairs=[("a", "b")])
+        cur.execute.assert_not_called()
+
+    def test_unlink_deletes_edges(self):
+        summary, execute_values = self._run(unlink_contradictions, [("b", "a")], [("edge", "a", "b", None, None)])
+        sql = execute_values.call_args.args[1]
+        assert "DELETE FROM gaqp_claim_contradictions" in sql
+        assert summary.changed == [("a", "b")]
+
+    def test_empty_pairs_skip_db(self):
+        with patch("src.service.gaqp.corpus.connection") as connection:
+            summary = link_contradictions(tenant_id="t1", pairs=[])
+        assert summary.changed == [] and summary.missing == []
+        connection.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -299,25 +633,25 @@ class TestListClaimsByEnvelope:
     def test_empty_result(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             result = list_claims_by_envelope(tenant_id="t1", source_envelope_id="env_001")
         assert result == []
 
     def test_passes_correct_params(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims_by_envelope(tenant_id="tenant_abc", source_envelope_id="env_xyz")
         params = cur.execute.call_args[0][1]
         assert "tenant_abc" in params
         assert "env_xyz" in params
 
-    def test_connection_closed(self):
+    def test_connection_released(self):
         conn, cur = _mock_conn()
         cur.fetchall.return_value = []
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             list_claims_by_envelope(tenant_id="t1", source_envelope_id="e1")
-        conn.close.assert_called_once()
+        conn.__exit__.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -329,7 +663,7 @@ class TestPromoteToStructural:
         from src.service.gaqp.corpus import promote_to_structural
         conn, cur = _mock_conn(rowcount=1)
         cur.fetchone.return_value = ("claim1", "t1", "doctrine", "strategy", "Content text.", 1.00)
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.memory.qcr_bridge.admit_structural_claim", return_value=True):
             result = promote_to_structural(claim_id="claim1", tenant_id="t1", actor_id="u1")
         assert result is True
@@ -338,7 +672,7 @@ class TestPromoteToStructural:
         from src.service.gaqp.corpus import promote_to_structural
         conn, cur = _mock_conn(rowcount=0)
         cur.fetchone.return_value = None
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn):
+        with patch("src.service.gaqp.corpus.connection", return_value=conn):
             result = promote_to_structural(claim_id="missing", tenant_id="t1")
         assert result is False
 
@@ -346,7 +680,7 @@ class TestPromoteToStructural:
         from src.service.gaqp.corpus import promote_to_structural
         conn, cur = _mock_conn(rowcount=1)
         cur.fetchone.return_value = ("claim1", "t1", "doctrine", "strategy", "Content.", 1.00)
-        with patch("src.service.gaqp.corpus.get_conn", return_value=conn), \
+        with patch("src.service.gaqp.corpus.connection", return_value=conn), \
              patch("src.service.memory.qcr_bridge.admit_structural_claim", side_effect=Exception("pem down")):
             result = promote_to_structural(claim_id="claim1", tenant_id="t1")
         assert result is True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, call, patch
 
@@ -8,10 +9,12 @@ import pytest
 
 from src.service.gaqp.corroboration import (
     ClaimNotFoundError,
+    CorroborationEvent,
     CorroborationResult,
     _actor_key,
     _compute_confidence,
     corroborate,
+    corroborate_many,
 )
 from src.service.gaqp.models import (
     CONFIDENCE_SCORE,
@@ -20,6 +23,7 @@ from src.service.gaqp.models import (
     GAQPClaim,
     compute_fingerprint,
 )
+from src.service.gaqp.records import ClaimRecord
 
 
 # ---------------------------------------------------------------------------
@@ -33,9 +37,9 @@ def _make_corpus_row(
     confidence_level: str = "seed",
     confidence_score: float = CONFIDENCE_SCORE["seed"],
     corroboration_profile: dict | None = None,
-) -> dict:
-    """Minimal corpus row dict as returned by get_claim()."""
-    return {
+) -> ClaimRecord:
+    """Minimal corpus record as returned by lock_claims()."""
+    return ClaimRecord.from_dict({
         "claim_id": claim_id,
         "tenant_id": tenant_id,
         "source_envelope_id": "env_001",
@@ -71,6 +75,39 @@ def _make_corpus_row(
         "schema_version": "stage9_v1",
         "created_at": datetime.now(UTC).isoformat(),
         "updated_at": datetime.now(UTC).isoformat(),
+    })
+
+
+_LOCK = "src.service.gaqp.corroboration.lock_claims"
+_UPDATE = "src.service.gaqp.corroboration.update_claims_corroboration"
+
+
+@contextmanager
+def _fake_uow():
+    yield MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def _no_db_transaction():
+    with patch("src.service.gaqp.corroboration.unit_of_work", _fake_uow):
+        yield
+
+
+def _locked(row):
+    """Patch lock_claims to return row (or nothing, for None)."""
+    return patch(_LOCK, return_value={row.claim_id: row} if row is not None else {})
+
+
+def _single_update(mock_update) -> dict:
+    """The one (claim, profile, level, score) write of a single-event batch."""
+    kwargs = mock_update.call_args.kwargs
+    (claim_id, profile, level, score), = kwargs["updates"]
+    return {
+        "claim_id": claim_id,
+        "tenant_id": kwargs["tenant_id"],
+        "new_profile": profile,
+        "new_confidence_level": level,
+        "new_confidence_score": score,
     }
 
 
@@ -134,19 +171,16 @@ class TestActorKey:
 
 class TestCorroborate:
     def _patch(self, row, update_returns=True):
-        """Return context managers patching get_claim and update_claim_corroboration."""
+        """Return context managers patching lock_claims and update_claims_corroboration."""
         return (
-            patch("src.service.gaqp.corroboration.get_claim", return_value=row),
-            patch(
-                "src.service.gaqp.corroboration.update_claim_corroboration",
-                return_value=update_returns,
-            ),
+            _locked(row),
+            patch(_UPDATE, return_value=1 if update_returns else 0),
         )
 
     def test_first_corroboration_promotes_seed_to_single_source(self):
         row = _make_corpus_row()
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             result = corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -176,8 +210,8 @@ class TestCorroborate:
                 "corroborating_actors": ["tenant_001:user_002"],
             },
         )
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration"):
+        with _locked(row), \
+             patch(_UPDATE):
             result = corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -192,8 +226,8 @@ class TestCorroborate:
 
     def test_same_actor_repetition_does_not_promote(self):
         row = _make_corpus_row()
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             # First corroboration — records the actor
             result1 = corroborate(
                 claim_id="claim_abc",
@@ -217,8 +251,8 @@ class TestCorroborate:
             },
         )
 
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row2), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration"):
+        with _locked(row2), \
+             patch(_UPDATE):
             # Same actor again — repetition
             result2 = corroborate(
                 claim_id="claim_abc",
@@ -234,8 +268,8 @@ class TestCorroborate:
 
     def test_cross_tenant_corroboration_is_independent(self):
         row = _make_corpus_row()
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             result = corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -248,7 +282,7 @@ class TestCorroborate:
         assert result.new_level == "single_source"
 
         # Verify cross_tenant_count was incremented in the profile passed to update
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         profile = kwargs["new_profile"]
         assert profile.cross_tenant_count == 1
         assert profile.same_tenant_count == 0
@@ -258,8 +292,8 @@ class TestCorroborate:
             confidence_level="structural",
             confidence_score=CONFIDENCE_SCORE["structural"],
         )
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration"):
+        with _locked(row), \
+             patch(_UPDATE):
             result = corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -272,7 +306,7 @@ class TestCorroborate:
         assert result.new_score == CONFIDENCE_SCORE["structural"]
 
     def test_claim_not_found_raises(self):
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=None):
+        with _locked(None):
             with pytest.raises(ClaimNotFoundError):
                 corroborate(
                     claim_id="nonexistent",
@@ -283,8 +317,8 @@ class TestCorroborate:
 
     def test_update_called_with_correct_claim_and_tenant(self):
         row = _make_corpus_row(claim_id="claim_xyz", tenant_id="tenant_abc")
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             corroborate(
                 claim_id="claim_xyz",
                 tenant_id="tenant_abc",
@@ -292,7 +326,7 @@ class TestCorroborate:
                 corroborating_actor_id="user_002",
             )
 
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         assert kwargs["claim_id"] == "claim_xyz"
         assert kwargs["tenant_id"] == "tenant_abc"
 
@@ -309,8 +343,8 @@ class TestCorroborate:
                 "corroborating_actors": ["tenant_001:user_002"],
             },
         )
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -318,13 +352,13 @@ class TestCorroborate:
                 corroborating_actor_id="user_002",  # already seen
             )
 
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         assert kwargs["new_profile"].corroboration_count == 4
 
     def test_actor_key_appended_on_independent_source(self):
         row = _make_corpus_row()
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -332,7 +366,7 @@ class TestCorroborate:
                 corroborating_actor_id="user_007",
             )
 
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         profile = kwargs["new_profile"]
         assert "tenant_001:user_007" in profile.corroborating_actors
 
@@ -348,8 +382,8 @@ class TestCorroborate:
                 "corroborating_actors": ["tenant_001:user_002"],
             },
         )
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -357,14 +391,14 @@ class TestCorroborate:
                 corroborating_actor_id="user_002",
             )
 
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         profile = kwargs["new_profile"]
         assert profile.corroborating_actors.count("tenant_001:user_002") == 1
 
     def test_last_corroborated_at_updated(self):
         row = _make_corpus_row()
-        with patch("src.service.gaqp.corroboration.get_claim", return_value=row), \
-             patch("src.service.gaqp.corroboration.update_claim_corroboration") as mock_update:
+        with _locked(row), \
+             patch(_UPDATE) as mock_update:
             corroborate(
                 claim_id="claim_abc",
                 tenant_id="tenant_001",
@@ -372,7 +406,79 @@ class TestCorroborate:
                 corroborating_actor_id="user_002",
             )
 
-        _, kwargs = mock_update.call_args
+        kwargs = _single_update(mock_update)
         profile = kwargs["new_profile"]
         assert profile.last_corroborated_at is not None
         assert isinstance(profile.last_corroborated_at, __import__("datetime").datetime)
+
+
+# ---------------------------------------------------------------------------
+# corroborate_many() — batched, row-locked
+# ---------------------------------------------------------------------------
+
+class TestCorroborateMany:
+    def test_empty_batch_touches_nothing(self):
+        with patch(_LOCK) as lock, patch(_UPDATE) as update:
+            assert corroborate_many(tenant_id="tenant_001", events=[]) == []
+        lock.assert_not_called()
+        update.assert_not_called()
+
+    def test_one_lock_and_one_write_for_the_batch(self):
+        a = _make_corpus_row(claim_id="a")
+        b = _make_corpus_row(claim_id="b")
+        events = [
+            CorroborationEvent("a", "tenant_001", "u1"),
+            CorroborationEvent("b", "tenant_002", "u1"),
+        ]
+        with patch(_LOCK, return_value={"a": a, "b": b}) as lock, patch(_UPDATE) as update:
+            results = corroborate_many(tenant_id="tenant_001", events=events)
+        lock.assert_called_once_with(claim_ids=["a", "b"], tenant_id="tenant_001")
+        update.assert_called_once()
+        assert [r.claim_id for r in results] == ["a", "b"]
+        assert all(r.new_level == "single_source" for r in results)
+        assert [u[0] for u in update.call_args.kwargs["updates"]] == ["a", "b"]
+
+    def test_events_on_one_claim_compound_in_order(self):
+        row = _make_corpus_row()
+        events = [
+            CorroborationEvent("claim_abc", "tenant_001", "u1"),
+            CorroborationEvent("claim_abc", "tenant_001", "u2"),
+            CorroborationEvent("claim_abc", "tenant_001", "u1"),
+            CorroborationEvent("claim_abc", "tenant_001", "u3"),
+        ]
+        with _locked(row), patch(_UPDATE) as update:
+            results = corroborate_many(tenant_id="tenant_001", events=events)
+
+        assert [r.new_level for r in results] == ["single_source", "developing", "developing", "corroborated"]
+        assert [r.was_independent for r in results] == [True, True, False, True]
+        assert results[1].previous_level == "single_source"
+        kwargs = _single_update(update)
+        assert kwargs["new_profile"].corroboration_count == 4
+        assert kwargs["new_profile"].independent_sources == 3
+        assert kwargs["new_confidence_level"] == "corroborated"
+
+    def test_missing_claim_raises_before_writing(self):
+        row = _make_corpus_row(claim_id="a")
+        events = [CorroborationEvent("a", "tenant_001", "u1"), CorroborationEvent("ghost", "tenant_001", "u1")]
+        with patch(_LOCK, return_value={"a": row}), patch(_UPDATE) as update:
+            with pytest.raises(ClaimNotFoundError, match="ghost"):
+                corroborate_many(tenant_id="tenant_001", events=events)
+        update.assert_not_called()
+
+    def test_begins_writes_only_in_a_unit_it_opened(self):
+        from src.service.db import postgres
+        seen = []
+        row = _make_corpus_row()
+
+        def record_mode(**kwargs):
+            seen.append(postgres._current_uow.get().writing)
+
+        with patch("src.service.gaqp.corroboration.unit_of_work", postgres.unit_of_work), \
+             _locked(row), patch(_UPDATE, side_effect=record_mode):
+            corroborate(claim_id="claim_abc", tenant_id="tenant_001",
+                        corroborating_tenant_id="tenant_002", corroborating_actor_id="u1")
+            with postgres.unit_of_work() as outer:
+                corroborate(claim_id="claim_abc", tenant_id="tenant_001",
+                            corroborating_tenant_id="tenant_002", corroborating_actor_id="u1")
+                assert outer.writing is False
+        assert seen == [True, False]
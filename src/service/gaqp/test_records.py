@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime
+
+import pytest
+
+from src.service.gaqp.models import ClaimProvenance, CorroborationProfile, GAQPClaim
+from src.service.gaqp.records import CLAIM_COLUMNS, ClaimRecord
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_NOW = datetime(2026, 1, 5, 12, 0, tzinfo=UTC)
+
+
+def _db_row(**overrides) -> tuple:
+    """A gaqp_claims row as psycopg2 returns it (JSON sub-objects selected as text)."""
+    values = {
+        "claim_id": "cid-1",
+        "tenant_id": "t-1",
+        "source_envelope_id": "env-1",
+        "claim_type": "tradeoff",
+        "domain": "strategy",
+        "content": "Speed and certainty trade off.",
+        "confidence_level": "developing",
+        "confidence_score": 0.72,
+        "admission_status": "admitted",
+        "corpus_scope": "tenant",
+        "extraction_method": "direct_field",
+        "provenance": json.dumps({"source_kind": "decision_artifact", "source_ref": "env-1", "actor_id": "u-1"}),
+        "activation_scope": "domain_specific",
+        "activation_triggers": ["acquire"],
+        "corroboration_profile": json.dumps({
+            "independent_sources": 2,
+            "contradictions": 1,
+            "last_corroborated_at": _NOW.isoformat(),
+            "corroborating_actors": ["t-1:u-2"],
+        }),
+        "contradiction_refs": ["cid-2"],
+        "support_refs": [],
+        "fingerprint": "fp-1",
+        "schema_version": "stage9_v1",
+        "inference_flag": False,
+        "source_location": None,
+        "standards_package_version": "gaqp_v1.0",
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+    values.update(overrides)
+    return tuple(values[c] for c in CLAIM_COLUMNS)
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+def test_from_row_keeps_datetimes_and_tuples():
+    record = ClaimRecord.from_row(_db_row())
+    assert record.created_at is _NOW
+    assert record.activation_triggers == ("acquire",)
+    assert record.contradiction_refs == ("cid-2",)
+
+
+def test_json_sub_objects_decode_lazily_once():
+    record = ClaimRecord.from_row(_db_row())
+    assert record._corroboration_profile is None
+    profile = record.corroboration_profile
+    assert profile.independent_sources == 2
+    assert profile.last_corroborated_at == _NOW
+    assert record.corroboration_profile is profile
+    assert record.provenance.actor_id == "u-1"
+
+
+def test_missing_json_uses_defaults():
+    record = ClaimRecord.from_row(_db_row(provenance=None, corroboration_profile=None))
+    assert record.provenance.source_kind == "unknown"
+    assert record.corroboration_profile == CorroborationProfile()
+
+
+# ---------------------------------------------------------------------------
+# GAQPClaim / dict views
+# ---------------------------------------------------------------------------
+
+def test_to_claim_is_built_once():
+    record = ClaimRecord.from_row(_db_row())
+    claim = record.to_claim()
+    assert isinstance(claim, GAQPClaim)
+    assert claim.contradiction_refs == ["cid-2"]
+    assert claim.created_at == _NOW
+    assert record.to_claim() is claim
+
+
+def test_from_claim_reuses_the_claim():
+    claim = GAQPClaim(
+        claim_id="c", tenant_id="t", source_envelope_id="e",
+        claim_type="tradeoff", domain="strategy", content="x",
+        confidence_level="seed", confidence_score=0.5,
+        admission_status="admitted", corpus_scope="tenant",
+        extraction_method="direct_field",
+        provenance=ClaimProvenance(source_kind="k", source_ref="r", actor_id="a"),
+        activation_scope="situational", activation_triggers=["pricing"],
+    )
+    record = ClaimRecord.from_claim(claim)
+    assert record.to_claim() is claim
+    assert record.provenance is claim.provenance
+    assert record.to_dict() == claim.to_dict()
+
+
+def test_to_dict_matches_row_dict_shape():
+    row = ClaimRecord.from_row(_db_row()).to_dict()
+    assert row["created_at"] == _NOW.isoformat()
+    assert row["provenance"]["actor_id"] == "u-1"
+    assert row["corroboration_profile"]["contradictions"] == 1
+    assert row["contradiction_refs"] == ["cid-2"]
+
+
+# ---------------------------------------------------------------------------
+# Immutability
+# ---------------------------------------------------------------------------
+
+def test_record_is_frozen():
+    record = ClaimRecord.from_row(_db_row())
+    with pytest.raises(FrozenInstanceError):
+        record.confidence_score = 1.0
+
+
+def test_replace_returns_updated_copy_and_drops_cached_decodes():
+    record = ClaimRecord.from_row(_db_row())
+    record.to_claim()
+    updated = record.replace(confidence_score=0.91, corroboration_profile={"independent_sources": 3})
+    assert record.confidence_score == 0.72
+    assert updated.confidence_score == 0.91
+    assert updated.corroboration_profile.independent_sources == 3
+    assert updated.to_claim().confidence_score == 0.91
+
+
+def test_replace_rejects_unknown_fields():
+    with pytest.raises(TypeError):
+        ClaimRecord.from_row(_db_row()).replace(nope=1)
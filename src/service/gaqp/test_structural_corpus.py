@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.service.gaqp import structural_corpus
+from src.service.gaqp.structural_corpus import get_structural_corpus
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_FETCH = "src.service.gaqp.structural_corpus._fetch_changes"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot(monkeypatch):
+    monkeypatch.setenv("EXECALC_STRUCTURAL_CORPUS_REFRESH_SECONDS", "0")
+    structural_corpus.reset()
+    yield
+    structural_corpus.reset()
+
+
+def _db_row(claim_id: str, version: int, *, triggers=None, withdrawn: bool = False) -> tuple:
+    now = datetime.now(UTC)
+    return (
+        claim_id, "doctrine", "strategy", "Liquidity buys optionality in a downturn.",
+        "structural", 1.0, "direct_field",
+        "domain_specific", triggers or ["liquidity"], {"corroboration_count": 4},
+        f"fp-{claim_id}", "stage9_v1", "gaqp_v1.0", False,
+        now, now, withdrawn, version,
+    )
+
+
+def _hits(corpus, text: str):
+    return [row.claim_id for row, _ in corpus.index.match(text, 0.5)]
+
+
+# ---------------------------------------------------------------------------
+# Load and refresh
+# ---------------------------------------------------------------------------
+
+def test_cold_load_reads_from_version_zero():
+    with patch(_FETCH, return_value=[_db_row("s1", 3), _db_row("s2", 5)]) as fetch:
+        corpus = get_structural_corpus()
+    fetch.assert_called_once_with(0)
+    assert corpus.version == 5
+    assert set(_hits(corpus, "liquidity squeeze")) == {"s1", "s2"}
+
+
+def test_rows_are_de_identified():
+    with patch(_FETCH, return_value=[_db_row("s1", 1)]):
+        corpus = get_structural_corpus()
+    row = corpus.index.get("s1")
+    assert row.tenant_id == ""
+    assert row.source_envelope_id == ""
+    assert row.provenance.actor_id == ""
+    assert row.corpus_scope == "structural"
+
+
+def test_refresh_applies_only_newer_versions():
+    with patch(_FETCH, side_effect=[
+        [_db_row("s1", 3), _db_row("s2", 5)],
+        [_db_row("s2", 6, withdrawn=True), _db_row("s3", 7, triggers=["pricing"])],
+    ]) as fetch:
+        first = get_structural_corpus()
+        second = get_structural_corpus()
+    assert first is second
+    assert fetch.call_args_list[1].args == (5,)
+    assert second.version == 7
+    assert _hits(second, "liquidity") == ["s1"]
+    assert _hits(second, "pricing") == ["s3"]
+
+
+def test_snapshot_served_without_db_inside_refresh_interval(monkeypatch):
+    monkeypatch.setenv("EXECALC_STRUCTURAL_CORPUS_REFRESH_SECONDS", "3600")
+    with patch(_FETCH, return_value=[_db_row("s1", 1)]) as fetch:
+        get_structural_corpus()
+        get_structural_corpus()
+        get_structural_corpus()
+    fetch.assert_called_once()
+
+
+def test_failed_refresh_keeps_previous_snapshot():
+    with patch(_FETCH, side_effect=[[_db_row("s1", 1)], RuntimeError("db down")]):
+        first = get_structural_corpus()
+        second = get_structural_corpus()
+    assert second is first
+    assert _hits(second, "liquidity") == ["s1"]
+
+
+def test_failed_cold_load_returns_none():
+    with patch(_FETCH, side_effect=RuntimeError("db down")):
+        assert get_structural_corpus() is None
+
+
+def test_full_reload_replaces_snapshot(monkeypatch):
+    monkeypatch.setenv("EXECALC_STRUCTURAL_CORPUS_FULL_RELOAD_SECONDS", "0")
+    with patch(_FETCH, side_effect=[[_db_row("s1", 1)], [_db_row("s2", 2)]]) as fetch:
+        first = get_structural_corpus()
+        second = get_structural_corpus()
+    assert second is not first
+    assert fetch.call_args_list[1].args == (0,)
+    assert _hits(second, "liquidity") == ["s2"]
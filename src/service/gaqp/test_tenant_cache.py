@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from typing import List
+
+from src.service.gaqp.tenant_cache import TenantCache
+
+
+def _cache(loader, ttl: float = 300.0) -> TenantCache:
+    return TenantCache(loader, lambda: ttl)
+
+
+def test_loads_once_within_ttl():
+    calls: List[str] = []
+    cache = _cache(lambda tenant_id: calls.append(tenant_id) or [tenant_id])
+    assert cache.get("t1") is cache.get("t1")
+    assert calls == ["t1"]
+    assert "t1" in cache
+
+
+def test_reloads_after_ttl():
+    calls: List[str] = []
+    cache = _cache(lambda tenant_id: calls.append(tenant_id) or [], ttl=0)
+    cache.get("t1")
+    cache.get("t1")
+    assert len(calls) == 2
+
+
+def test_concurrent_cold_loads_are_single_flight_and_drop_their_lock():
+    started, release = threading.Event(), threading.Event()
+    calls: List[str] = []
+
+    def slow_load(tenant_id):
+        calls.append(tenant_id)
+        started.set()
+        release.wait(2)
+        return [tenant_id]
+
+    cache = _cache(slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("t1"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    assert started.wait(2)
+    assert "t1" in cache._load_locks
+    release.set()
+    for t in threads:
+        t.join(2)
+    assert calls == ["t1"]
+    assert len(results) == 4 and all(r is results[0] for r in results)
+    assert cache._load_locks == {}
+
+
+def test_updates_applied_during_a_load_are_replayed():
+    cache: TenantCache = None
+
+    def load_then_commit_elsewhere(tenant_id):
+        cache.apply(tenant_id, lambda value: value.append("committed"))
+        return ["loaded"]
+
+    cache = _cache(load_then_commit_elsewhere)
+    assert cache.get("t1") == ["loaded", "committed"]
+    assert cache._pending == {}
+
+
+def test_invalidate_during_load_serves_but_does_not_cache():
+    cache: TenantCache = None
+
+    def load_then_invalidate(tenant_id):
+        cache.invalidate(tenant_id)
+        return ["stale"]
+
+    cache = _cache(load_then_invalidate)
+    assert cache.get("t1") == ["stale"]
+    assert "t1" not in cache
+
+
+def test_failed_load_caches_nothing_and_drops_its_lock():
+    def failing_load(tenant_id):
+        raise RuntimeError("db down")
+
+    cache = _cache(failing_load)
+    try:
+        cache.get("t1")
+    except RuntimeError:
+        pass
+    assert "t1" not in cache
+    assert cache._pending == {} and cache._load_locks == {}
+
+
+def test_apply_for_unloaded_tenant_is_ignored():
+    cache = _cache(lambda tenant_id: [])
+    cache.apply("t1", lambda value: value.append("x"))
+    assert "t1" not in cache
+    assert cache.get("t1") == []
@@ -4,7 +4,7 @@ import logging
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
-from src.service.db.postgres import get_conn
+from src.service.db.postgres import connection
 from src.service.memory.models import MemoryObject
 
 logger = logging.getLogger(__name__)
@@ -136,30 +136,22 @@ def _dict_to_object(d: Dict[str, Any]) -> MemoryObject:
 
 def db_insert(obj: MemoryObject) -> bool:
     Json = _load_json()
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_INSERT_SQL, (
-                obj.memory_id, obj.tenant_id, obj.memory_class, obj.activation_state,
-                obj.content, obj.summary, obj.source_kind, obj.source_ref, obj.origin_surface,
-                obj.claim_type, obj.domain, obj.memory_family,
-                obj.actor_id, obj.admission_reason, obj.confidence,
-                Json(list(obj.related_memory_ids)), obj.supersedes,
-            ))
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_INSERT_SQL, (
+            obj.memory_id, obj.tenant_id, obj.memory_class, obj.activation_state,
+            obj.content, obj.summary, obj.source_kind, obj.source_ref, obj.origin_surface,
+            obj.claim_type, obj.domain, obj.memory_family,
+            obj.actor_id, obj.admission_reason, obj.confidence,
+            Json(list(obj.related_memory_ids)), obj.supersedes,
+        ))
+        return cur.rowcount > 0
 
 
 def db_get(*, tenant_id: str, memory_id: str) -> Optional[MemoryObject]:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_SELECT_BY_ID_SQL, (memory_id, tenant_id))
-            row = cur.fetchone()
-            return _dict_to_object(_row_to_dict(row)) if row else None
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_SELECT_BY_ID_SQL, (memory_id, tenant_id))
+        row = cur.fetchone()
+        return _dict_to_object(_row_to_dict(row)) if row else None
 
 
 def db_list(
@@ -202,14 +194,10 @@ def db_list(
         " ORDER BY confidence DESC NULLS LAST, created_at DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            return [_dict_to_object(_row_to_dict(r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [_dict_to_object(_row_to_dict(r)) for r in rows]
 
 
 def db_update_state(
@@ -218,10 +206,6 @@ def db_update_state(
     memory_id: str,
     new_state: str,
 ) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(_UPDATE_STATE_SQL, (new_state, new_state, new_state, memory_id, tenant_id))
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_UPDATE_STATE_SQL, (new_state, new_state, new_state, memory_id, tenant_id))
+        return cur.rowcount > 0
@@ -59,7 +59,7 @@ class TestOrchestration9E(unittest.TestCase):
         self.assertEqual(out["rail_state"]["corpus_claims_count"], 0)
 
     def test_rail_state_corpus_claims_count_reflects_bundle(self):
-        from src.service.gaqp.activation import _dict_to_claim
+        from src.service.gaqp.records import ClaimRecord
         from datetime import UTC, datetime
 
         row = {
@@ -75,7 +75,7 @@ class TestOrchestration9E(unittest.TestCase):
             "created_at": datetime.now(UTC).isoformat(),
             "updated_at": datetime.now(UTC).isoformat(),
         }
-        claim = _dict_to_claim(row)
+        claim = ClaimRecord.from_dict(row).to_claim()
         bundle_with_claim = ActivationBundle(
             activated_claims=[claim],
             activation_rationale=["Universal activation: claim fires on all scenarios."],
@@ -104,7 +104,7 @@ class TestOrchestration9E(unittest.TestCase):
         self.assertNotIn("planned Stage 9", out["assistant_message"])
 
     def test_evidence_seeking_nonempty_corpus_message(self):
-        from src.service.gaqp.activation import _dict_to_claim
+        from src.service.gaqp.records import ClaimRecord
         from datetime import UTC, datetime
 
         row = {
@@ -120,7 +120,7 @@ class TestOrchestration9E(unittest.TestCase):
             "created_at": datetime.now(UTC).isoformat(),
             "updated_at": datetime.now(UTC).isoformat(),
         }
-        claim = _dict_to_claim(row)
+        claim = ClaimRecord.from_dict(row).to_claim()
         bundle = ActivationBundle(
             activated_claims=[claim],
             activation_rationale=["Universal activation: claim fires on all scenarios."],
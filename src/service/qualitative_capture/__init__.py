@@ -1,4 +1,4 @@
-from src.service.qualitative_capture.events import ingest_event
+from src.service.qualitative_capture.events import EventIngestResult, ingest_event, ingest_events
 from src.service.qualitative_capture.preserved_ideas import memorialize
 from src.service.qualitative_capture.promotion import (
     approve_candidate,
@@ -12,6 +12,10 @@ from src.service.qualitative_capture.rail import (
     publish_conclusions_to_rail,
 )
 from src.service.qualitative_capture.retrieval import (
+    export_claims_ndjson,
+    list_claims_page,
+    NuggetPage,
+    retrieve_categories,
     retrieve_decisions,
     retrieve_doctrine,
     retrieve_open_questions,
@@ -22,6 +26,7 @@ from src.service.qualitative_capture.retrieval import (
     retrieve_risks,
     retrieve_session_conclusions,
     search_claims,
+    search_claims_page,
 )
 from src.service.qualitative_capture.second_order import process_pending_artifacts
 from src.service.qualitative_capture.session_packet import (
@@ -32,6 +37,8 @@ from src.service.qualitative_capture.session_packet import (
 __all__ = [
     # Ingestion
     "ingest_event",
+    "ingest_events",
+    "EventIngestResult",
     # Human memorialize
     "memorialize",
     # Promotion
@@ -44,6 +51,7 @@ __all__ = [
     "persist_card_as_artifact",
     "publish_conclusions_to_rail",
     # Retrieval
+    "retrieve_categories",
     "retrieve_doctrine",
     "retrieve_risks",
     "retrieve_opportunities",
@@ -54,6 +62,10 @@ __all__ = [
     "retrieve_pending_promotions",
     "retrieve_session_conclusions",
     "search_claims",
+    "search_claims_page",
+    "list_claims_page",
+    "NuggetPage",
+    "export_claims_ndjson",
     # Second-order deconstruction
     "process_pending_artifacts",
     # Session Intelligence Packet
@@ -0,0 +1,334 @@
+"""
+Buffered writer for qcr_audit_events.
+
+record_audit() / record_audits() append to an in-memory buffer and return.
+A flusher thread writes the buffer with repository.insert_audit_events
+(multi-row INSERTs) when it reaches EXECALC_QCR_AUDIT_FLUSH_SIZE events,
+every EXECALC_QCR_AUDIT_FLUSH_SECONDS, or as soon as a transaction that
+recorded audit events commits. Concurrent writers' events share flushes,
+so audit cost no longer grows one round trip per event.
+
+Inside a unit_of_work() events are held until the unit commits and dropped
+if it rolls back, so the trail never describes writes that did not land.
+
+The buffer is bounded by EXECALC_QCR_AUDIT_MAX_BUFFER: a record that finds
+it full flushes inline in the caller instead of dropping. When a flush's
+multi-row INSERT fails, the batch is bisected so the rows that can be
+written still are. A row that fails on its own goes back to the head of
+the buffer and is spilled after _MAX_ROW_ATTEMPTS flushes; if two rows fail
+alone before anything lands, the database is taken to be unavailable and
+the untried rest is put back as is. Spilled rows, rows that no longer fit,
+and whatever the final drain cannot write go as NDJSON to
+EXECALC_QCR_AUDIT_SPILL_PATH (logged at ERROR when unset).
+
+shutdown() stops the flusher and drains the buffer; it is registered with
+atexit when the process's writer is created. With EXECALC_QCR_AUDIT_SYNC=1
+(or AuditWriter(sync=True)) there is no thread and every committed record
+is written before record_audit() returns — for tests and one-shot scripts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.service.db.postgres import after_commit, in_unit_of_work
+from src.service.qualitative_capture.repository import insert_audit_events
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BUFFER = 10_000
+_DEFAULT_FLUSH_SIZE = 500
+_DEFAULT_FLUSH_SECONDS = 1.0
+_MAX_ROW_ATTEMPTS = 3
+
+
+@dataclass
+class AuditWriterStats:
+    recorded: int = 0
+    written: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    spilled: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "spilled": self.spilled,
+        }
+
+
+class AuditWriter:
+    """
+    Bounded audit buffer with one flusher thread (none in sync mode).
+    Flushes are serialized, so events are written in the order their
+    transactions committed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buffer: int = _DEFAULT_MAX_BUFFER,
+        flush_size: int = _DEFAULT_FLUSH_SIZE,
+        flush_seconds: float = _DEFAULT_FLUSH_SECONDS,
+        sync: bool = False,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        if flush_size < 1:
+            raise ValueError("flush_size must be >= 1")
+        if max_buffer < flush_size:
+            raise ValueError("max_buffer must be >= flush_size")
+        self.max_buffer = max_buffer
+        self.flush_size = flush_size
+        self.flush_seconds = flush_seconds
+        self.sync = sync
+        self.spill_path = spill_path
+        self.stats = AuditWriterStats()
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.sync or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="qcr-audit-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, events: Sequence[Dict[str, Any]]) -> None:
+        """Buffer events (insert_audit_event's keyword arguments, audit_id included)."""
+        if not events:
+            return
+        batch = list(events)
+        if in_unit_of_work():
+            after_commit(lambda: self._enqueue(batch, committed=True))
+        else:
+            self._enqueue(batch, committed=False)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write everything buffered now. Returns the number of events written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            if not batch:
+                return 0
+            try:
+                insert_audit_events(batch)
+            except Exception:
+                logger.exception("audit: flush of %d events failed; retrying in smaller batches", len(batch))
+                written, failed, untried = self._write_isolated(batch)
+                bulk_failed = True
+            else:
+                written, failed, untried = batch, [], []
+                bulk_failed = False
+            retry: List[Dict[str, Any]] = []
+            poisoned: List[Dict[str, Any]] = []
+            with self._lock:
+                for e in written:
+                    self._attempts.pop(e["audit_id"], None)
+                for e in failed:
+                    attempts = self._attempts.get(e["audit_id"], 0) + 1
+                    if attempts >= _MAX_ROW_ATTEMPTS:
+                        self._attempts.pop(e["audit_id"], None)
+                        poisoned.append(e)
+                    else:
+                        self._attempts[e["audit_id"]] = attempts
+                        retry.append(e)
+                if written:
+                    self.stats.flushes += 1
+                    self.stats.written += len(written)
+                if bulk_failed:
+                    self.stats.failed_flushes += 1
+            # failed rows all precede the untried ones, so this keeps commit order.
+            retry.extend(untried)
+            if retry:
+                self._requeue(retry)
+            if poisoned:
+                logger.error("audit: %d events failed %d flushes on their own; spilling them",
+                             len(poisoned), _MAX_ROW_ATTEMPTS)
+                self._spill(poisoned)
+            return len(written)
+
+    def _write_isolated(
+        self, batch: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Bisect a batch whose multi-row INSERT failed. Returns (written, rows
+        that failed on their own, rows left untried), each in batch order.
+        """
+        written: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        if len(batch) == 1:
+            return written, list(batch), []
+        mid = len(batch) // 2
+        stack = [batch[mid:], batch[:mid]]
+        while stack:
+            chunk = stack.pop()
+            try:
+                insert_audit_events(chunk)
+            except Exception:
+                if len(chunk) > 1:
+                    mid = len(chunk) // 2
+                    stack.append(chunk[mid:])
+                    stack.append(chunk[:mid])
+                    continue
+                failed.append(chunk[0])
+                if not written and len(failed) >= 2:
+                    # Nothing lands, even one row at a time: the database is
+                    # unavailable, not the rows. Stop instead of trying each one.
+                    return written, failed, [e for c in reversed(stack) for e in c]
+            else:
+                written.extend(chunk)
+        return written, failed, []
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the flusher, drain the buffer, and spill whatever could not be written."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        with self._lock:
+            leftover = list(self._buffer)
+            self._buffer.clear()
+            self._attempts.clear()
+        if leftover:
+            self._spill(leftover)
+
+    def _enqueue(self, events: List[Dict[str, Any]], *, committed: bool) -> None:
+        with self._lock:
+            self._buffer.extend(events)
+            self.stats.recorded += len(events)
+            size = len(self._buffer)
+        if self.sync or size >= self.max_buffer:
+            self.flush()
+        elif committed or size >= self.flush_size:
+            self._wake.set()
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._buffer.extendleft(reversed(batch))
+            overflow = len(self._buffer) - self.max_buffer
+            dropped = [self._buffer.popleft() for _ in range(overflow)] if overflow > 0 else []
+            for e in dropped:
+                self._attempts.pop(e["audit_id"], None)
+        if dropped:
+            self._spill(dropped)
+
+    def _spill(self, events: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.stats.spilled += len(events)
+        lines = "".join(json.dumps(e, default=str) + "\n" for e in events)
+        if self.spill_path:
+            try:
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                logger.error("audit: spilled %d unwritten events to %s", len(events), self.spill_path)
+                return
+            except OSError:
+                logger.exception("audit: could not write spill file %s", self.spill_path)
+        logger.error("audit: %d unwritten events:\n%s", len(events), lines)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide writer
+# ---------------------------------------------------------------------------
+
+_writer: Optional[AuditWriter] = None
+_writer_pid: Optional[int] = None
+_writer_lock = threading.Lock()
+_atexit_registered = False
+
+
+def _writer_from_env() -> AuditWriter:
+    return AuditWriter(
+        max_buffer=int(os.getenv("EXECALC_QCR_AUDIT_MAX_BUFFER", str(_DEFAULT_MAX_BUFFER))),
+        flush_size=int(os.getenv("EXECALC_QCR_AUDIT_FLUSH_SIZE", str(_DEFAULT_FLUSH_SIZE))),
+        flush_seconds=float(os.getenv("EXECALC_QCR_AUDIT_FLUSH_SECONDS", str(_DEFAULT_FLUSH_SECONDS))),
+        sync=os.getenv("EXECALC_QCR_AUDIT_SYNC", "0") == "1",
+        spill_path=os.getenv("EXECALC_QCR_AUDIT_SPILL_PATH") or None,
+    )
+
+
+def get_writer() -> AuditWriter:
+    """This process's writer, created from EXECALC_QCR_AUDIT_* on first use (and after fork)."""
+    global _writer, _writer_pid, _atexit_registered
+    if _writer is None or _writer_pid != os.getpid():
+        with _writer_lock:
+            if _writer is None or _writer_pid != os.getpid():
+                _writer = _writer_from_env()
+                _writer_pid = os.getpid()
+                _writer.start()
+                if not _atexit_registered:
+                    atexit.register(shutdown)
+                    _atexit_registered = True
+    return _writer
+
+
+def record_audits(events: Sequence[Dict[str, Any]]) -> None:
+    """Buffer prepared audit rows (see repository.insert_audit_events)."""
+    get_writer().record(events)
+
+
+def record_audit(
+    *,
+    tenant_id: str,
+    event_kind: str,
+    actor_id: Optional[str] = None,
+    source_object_type: Optional[str] = None,
+    source_object_id: Optional[str] = None,
+    payload: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Buffer one audit event. Returns its audit_id."""
+    audit_id = uuid.uuid4().hex
+    record_audits([{
+        "audit_id": audit_id,
+        "tenant_id": tenant_id,
+        "event_kind": event_kind,
+        "actor_id": actor_id,
+        "source_object_type": source_object_type,
+        "source_object_id": source_object_id,
+        "payload": payload or {},
+    }])
+    return audit_id
+
+
+def flush_audits() -> int:
+    """Write this process's buffered events now (no-op if no writer was created)."""
+    writer = _writer if _writer_pid == os.getpid() else None
+    return writer.flush() if writer is not None else 0
+
+
+def shutdown(timeout: Optional[float] = None) -> None:
+    """Drain and stop this process's writer, if one was created (atexit, tests)."""
+    global _writer, _writer_pid
+    with _writer_lock:
+        writer, owner = _writer, _writer_pid
+        _writer, _writer_pid = None, None
+    if writer is not None and owner == os.getpid():
+        writer.shutdown(timeout)
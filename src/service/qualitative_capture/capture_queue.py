@@ -0,0 +1,316 @@
+"""
+Durable capture queue for /qcr/events deconstruction.
+
+qcr_conversation_events is the queue (infra/migrations/007). ingest_event
+stamps capture_queued_at on insert; capture workers lease pending events in
+batches with FOR UPDATE SKIP LOCKED, deconstruct them, and write each
+event's nuggets together with its capture_completed_at mark in one
+transaction. The mark is fenced on the attempt the event was claimed at,
+so a worker whose lease expired and was re-claimed rolls back instead of
+writing the nuggets a second time. A failed event is released with its error and retried until
+EXECALC_CAPTURE_MAX_ATTEMPTS; a crashed worker's leases expire after
+EXECALC_CAPTURE_LEASE_SECONDS.
+
+Workers run either in a dedicated process:
+
+    python -m src.service.qualitative_capture.capture_queue --workers 4
+
+or inside the API process: EXECALC_CAPTURE_WORKERS threads per process,
+2 by default. In-process workers start lazily on the first notify() in
+each process (so they survive gunicorn's pre-fork) and are woken by it
+instead of waiting out the poll interval. Set EXECALC_CAPTURE_WORKERS=0
+only where a dedicated worker process drains the queue; with neither,
+queued events never get nuggets.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+
+from src.service.db.postgres import unit_of_work
+from src.service.qualitative_capture.deconstructor import deconstruct_event
+from src.service.qualitative_capture.models import ConversationEvent
+from src.service.qualitative_capture.repository import (
+    claim_capture_batch,
+    insert_nuggets,
+    mark_event_captured,
+    release_event_capture,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 20
+_DEFAULT_LEASE_SECONDS = 300.0
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_POLL_SECONDS = 2.0
+_DEFAULT_IN_PROCESS_WORKERS = 2
+_DEFAULT_DOMAIN = "strategy"
+
+
+def _lease_seconds() -> float:
+    return float(os.getenv("EXECALC_CAPTURE_LEASE_SECONDS", str(_DEFAULT_LEASE_SECONDS)))
+
+
+def _max_attempts() -> int:
+    return int(os.getenv("EXECALC_CAPTURE_MAX_ATTEMPTS", str(_DEFAULT_MAX_ATTEMPTS)))
+
+
+# ---------------------------------------------------------------------------
+# One batch
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CaptureSummary:
+    claimed: int = 0
+    captured: int = 0
+    nuggets_persisted: int = 0
+    failed: int = 0
+
+    def merge(self, other: "CaptureSummary") -> None:
+        self.claimed += other.claimed
+        self.captured += other.captured
+        self.nuggets_persisted += other.nuggets_persisted
+        self.failed += other.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "claimed": self.claimed,
+            "captured": self.captured,
+            "nuggets_persisted": self.nuggets_persisted,
+            "failed": self.failed,
+        }
+
+
+def _row_to_event(row: Dict[str, Any]) -> ConversationEvent:
+    return ConversationEvent(
+        event_id=row["event_id"],
+        tenant_id=row["tenant_id"],
+        session_id=row["session_id"],
+        user_id=row["user_id"],
+        role=row["role"],
+        message_text=row["message_text"],
+        token_count=row.get("token_count"),
+        created_at=row.get("created_at") or datetime.now(UTC),
+        capture_queued_at=row.get("capture_queued_at"),
+    )
+
+
+def capture_batch(*, batch_size: int = _DEFAULT_BATCH_SIZE) -> CaptureSummary:
+    """Lease and capture one batch of pending events. Returns what was done."""
+    summary = CaptureSummary()
+    rows = claim_capture_batch(
+        limit=batch_size,
+        lease_seconds=_lease_seconds(),
+        max_attempts=_max_attempts(),
+    )
+    summary.claimed = len(rows)
+    for row in rows:
+        _capture_one(row, summary)
+    return summary
+
+
+def _capture_one(row: Dict[str, Any], summary: CaptureSummary) -> None:
+    event_id = row["event_id"]
+    attempts = row["capture_attempts"]
+    try:
+        event = _row_to_event(row)
+        nuggets = deconstruct_event(event, domain=row.get("capture_domain") or _DEFAULT_DOMAIN)
+        with unit_of_work() as uow:
+            uow.begin_writes()
+            persisted = insert_nuggets(nuggets)
+            if not mark_event_captured(event_id=event_id, attempts=attempts):
+                # Another worker re-claimed the event after our lease
+                # expired; roll back so its nuggets are not written twice.
+                raise RuntimeError(f"capture lease lost at attempt {attempts}")
+        summary.captured += 1
+        summary.nuggets_persisted += persisted
+    except Exception as e:
+        logger.exception(
+            "capture_queue: capture failed for event %s (attempt %s)",
+            event_id, attempts,
+        )
+        summary.failed += 1
+        try:
+            release_event_capture(
+                event_id=event_id, attempts=attempts, error=f"{e.__class__.__name__}: {e}"[:500],
+            )
+        except Exception:
+            logger.exception("capture_queue: release failed for event %s; lease will expire", event_id)
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+class CaptureWorkerPool:
+    """
+    Threads that drain the queue until stopped. Each worker claims its own
+    batches (SKIP LOCKED keeps them disjoint), goes straight back for more
+    after a full batch, and otherwise sleeps until poll_seconds pass or
+    notify() is called.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        poll_seconds: float = _DEFAULT_POLL_SECONDS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.summary = CaptureSummary()
+        self._summary_lock = threading.Lock()
+        self._wake = threading.Condition()
+        self._pending_wakeups = 0
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"qcr-capture-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        with self._wake:
+            self._wake.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """Wake one idle worker: new work was just queued."""
+        with self._wake:
+            self._pending_wakeups += 1
+            self._wake.notify()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                batch = capture_batch(batch_size=self.batch_size)
+            except Exception:
+                logger.exception("capture_queue: claim failed; backing off")
+                batch = CaptureSummary()
+            with self._summary_lock:
+                self.summary.merge(batch)
+            if batch.claimed >= self.batch_size:
+                continue
+            with self._wake:
+                if self._pending_wakeups == 0 and not self._stopping.is_set():
+                    self._wake.wait(self.poll_seconds)
+                self._pending_wakeups = max(0, self._pending_wakeups - 1)
+
+
+_pool: Optional[CaptureWorkerPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _in_process_workers() -> int:
+    return int(os.getenv("EXECALC_CAPTURE_WORKERS", str(_DEFAULT_IN_PROCESS_WORKERS)))
+
+
+def notify() -> None:
+    """
+    Signal that an event was queued. Starts this process's in-process pool
+    on first use; a no-op when EXECALC_CAPTURE_WORKERS=0 leaves the queue to
+    a dedicated worker process.
+    """
+    global _pool, _pool_pid
+    workers = _in_process_workers()
+    if workers <= 0:
+        return
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = CaptureWorkerPool(
+                    workers=workers,
+                    batch_size=int(os.getenv("EXECALC_CAPTURE_BATCH_SIZE", str(_DEFAULT_BATCH_SIZE))),
+                )
+                _pool_pid = os.getpid()
+                _pool.start()
+    _pool.notify()
+
+
+def stop_workers(timeout: Optional[float] = None) -> None:
+    """Stop the in-process pool, if one was started (tests, shutdown)."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        pool, _pool, _pool_pid = _pool, None, None
+    if pool is not None:
+        pool.stop(timeout)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="capture_queue",
+        description="Drain the QCR capture queue: deconstruct queued conversation events into nuggets.",
+    )
+    p.add_argument("--workers", type=int, default=2, help="Worker threads. Default: 2.")
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=_DEFAULT_BATCH_SIZE,
+        help=f"Events leased per claim. Default: {_DEFAULT_BATCH_SIZE}.",
+    )
+    p.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=_DEFAULT_POLL_SECONDS,
+        help=f"Idle sleep between empty claims. Default: {_DEFAULT_POLL_SECONDS}.",
+    )
+    p.add_argument(
+        "--once",
+        action="store_true",
+        help="Drain until the queue is empty, then exit.",
+    )
+    p.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+    )
+    return p
+
+
+if __name__ == "__main__":
+    args = _build_arg_parser().parse_args()
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s %(levelname)s %(name)s — %(message)s",
+    )
+
+    if args.once:
+        total = CaptureSummary()
+        while True:
+            batch = capture_batch(batch_size=args.batch_size)
+            total.merge(batch)
+            if batch.claimed < args.batch_size:
+                break
+        print(total.to_dict())
+        sys.exit(1 if total.failed else 0)
+
+    pool = CaptureWorkerPool(workers=args.workers, batch_size=args.batch_size, poll_seconds=args.poll_seconds)
+    pool.start()
+    try:
+        while True:
+            time.sleep(60)
+            logger.info("capture_queue: %s", pool.summary.to_dict())
+    except KeyboardInterrupt:
+        pool.stop(timeout=30)
@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 import re
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from src.service.qualitative_capture.models import AtomicNugget, ConversationEvent
 
@@ -70,41 +71,110 @@ _CLAIM_SIGNALS: List[Tuple[str, List[str]]] = [
 
 _MIN_SENTENCE_LENGTH = 30
 _EPHEMERAL_MARKERS = ("today", "yesterday", "this week", "right now", "as of now")
+_MEDIUM_TERM_MARKERS = ("q1", "q2", "q3", "q4", "this year", "next year", "this quarter")
 
+_NEGATIVE_SIGNALS = ("risk", "danger", "threat", "weakness", "cannot", "must not", "fail")
+_POSITIVE_SIGNALS = ("opportunity", "growth", "advantage", "strength", "achieve", "succeed")
+_CAUTIONARY_SIGNALS = ("however", "but ", "caution", "warning", "concern", "careful")
 
-def _detect_claim_type(text: str) -> Optional[str]:
-    lower = text.lower()
-    for claim_type, signals in _CLAIM_SIGNALS:
-        if any(s in lower for s in signals):
-            return claim_type
-    return None
 
+# ---------------------------------------------------------------------------
+# Compiled classifier — one lowercase and one regex scan per sentence
+#
+# Every phrase above is folded into a single trie-shaped regex, wrapped in a
+# lookahead so the scan tries each position once and reports the longest
+# phrase starting there. Any other phrase starting at the same position is
+# a prefix of that one, so the set of phrases present in the sentence is the
+# union of the prefix closures of the matches — the same set the per-phrase
+# `in` checks would find.
+# ---------------------------------------------------------------------------
 
-def _detect_polarity(text: str) -> str:
-    lower = text.lower()
-    negative_signals = ("risk", "danger", "threat", "weakness", "cannot", "must not", "fail")
-    positive_signals = ("opportunity", "growth", "advantage", "strength", "achieve", "succeed")
-    cautionary_signals = ("however", "but ", "caution", "warning", "concern", "careful")
-    n = sum(1 for s in negative_signals if s in lower)
-    p = sum(1 for s in positive_signals if s in lower)
-    c = sum(1 for s in cautionary_signals if s in lower)
+@dataclass(frozen=True)
+class _SentenceClass:
+    claim_type: Optional[str]
+    polarity: str
+    durability: str
+
+
+def _trie_regex(phrases: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+def _build_classifier() -> Tuple["re.Pattern[str]", Dict[str, frozenset], Dict[str, int]]:
+    phrases = {p for _, signals in _CLAIM_SIGNALS for p in signals}
+    phrases.update(_NEGATIVE_SIGNALS, _POSITIVE_SIGNALS, _CAUTIONARY_SIGNALS)
+    phrases.update(_EPHEMERAL_MARKERS, _MEDIUM_TERM_MARKERS)
+
+    first_rank: Dict[str, int] = {}
+    for rank, (_, signals) in enumerate(_CLAIM_SIGNALS):
+        for phrase in signals:
+            first_rank.setdefault(phrase, rank)
+
+    closure = {p: frozenset(q for q in phrases if p.startswith(q)) for p in phrases}
+    # Best (lowest) claim-type rank among a match and its prefixes; len() = none.
+    rank = {
+        p: min((first_rank[q] for q in qs if q in first_rank), default=len(_CLAIM_SIGNALS))
+        for p, qs in closure.items()
+    }
+    return re.compile(f"(?=({_trie_regex(phrases)}))"), closure, rank
+
+
+_SIGNAL_RE, _PREFIX_CLOSURE, _CLAIM_RANK = _build_classifier()
+_NEGATIVE_SET = frozenset(_NEGATIVE_SIGNALS)
+_POSITIVE_SET = frozenset(_POSITIVE_SIGNALS)
+_CAUTIONARY_SET = frozenset(_CAUTIONARY_SIGNALS)
+_EPHEMERAL_SET = frozenset(_EPHEMERAL_MARKERS)
+_MEDIUM_TERM_SET = frozenset(_MEDIUM_TERM_MARKERS)
+_NO_SIGNAL = _SentenceClass(claim_type=None, polarity="neutral", durability="enduring")
+
+
+def _classify(text: str) -> _SentenceClass:
+    """Claim type (first matching category), polarity and durability in one scan."""
+    matches = set(_SIGNAL_RE.findall(text.lower()))
+    if not matches:
+        return _NO_SIGNAL
+
+    rank = min(_CLAIM_RANK[m] for m in matches)
+    claim_type = _CLAIM_SIGNALS[rank][0] if rank < len(_CLAIM_SIGNALS) else None
+
+    found: Set[str] = set()
+    for m in matches:
+        found |= _PREFIX_CLOSURE[m]
+
+    n = len(found & _NEGATIVE_SET)
+    p = len(found & _POSITIVE_SET)
+    c = len(found & _CAUTIONARY_SET)
     if n > p and n > c:
-        return "negative"
-    if p > n and p > c:
-        return "positive"
-    if c > 0:
-        return "cautionary"
-    return "neutral"
+        polarity = "negative"
+    elif p > n and p > c:
+        polarity = "positive"
+    elif c > 0:
+        polarity = "cautionary"
+    else:
+        polarity = "neutral"
 
+    if found & _EPHEMERAL_SET:
+        durability = "ephemeral"
+    elif found & _MEDIUM_TERM_SET:
+        durability = "medium_term"
+    else:
+        durability = "enduring"
 
-def _detect_durability(text: str) -> str:
-    lower = text.lower()
-    if any(m in lower for m in _EPHEMERAL_MARKERS):
-        return "ephemeral"
-    ephemeral_patterns = ("q1", "q2", "q3", "q4", "this year", "next year", "this quarter")
-    if any(p in lower for p in ephemeral_patterns):
-        return "medium_term"
-    return "enduring"
+    return _SentenceClass(claim_type=claim_type, polarity=polarity, durability=durability)
 
 
 def _split_sentences(text: str) -> List[str]:
@@ -143,12 +213,13 @@ def deconstruct_event(
         if not _is_admission_eligible(sentence):
             continue
 
-        claim_type = _detect_claim_type(sentence)
+        signals = _classify(sentence)
+        claim_type = signals.claim_type
         if claim_type is None:
             continue
 
-        polarity = _detect_polarity(sentence)
-        durability = _detect_durability(sentence)
+        polarity = signals.polarity
+        durability = signals.durability
         is_rail_candidate = claim_type in ("doctrine", "principle", "risk", "opportunity", "objective")
 
         nugget = AtomicNugget(
@@ -1,17 +1,41 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
+import multiprocessing
+import os
+import threading
 import uuid
-from datetime import UTC, datetime
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from src.service.qualitative_capture.models import ConversationEvent
-from src.service.qualitative_capture.repository import insert_event
+from src.service import telemetry
+from src.service.db.postgres import unit_of_work
+from src.service.qualitative_capture.deconstructor import deconstruct_event
+from src.service.qualitative_capture.models import AtomicNugget, ConversationEvent
+from src.service.qualitative_capture.repository import (
+    insert_event,
+    insert_events,
+    insert_nuggets,
+    list_foreign_event_ids,
+)
 
 logger = logging.getLogger(__name__)
 
 VALID_ROLES = {"operator", "system", "agent"}
 
+# Client-chosen event_ids are stored as uuid5(namespace, "tenant_id:client_id"),
+# so they are unique per tenant while qcr_conversation_events.event_id stays
+# a global key.
+_CLIENT_EVENT_NAMESPACE = uuid.UUID("6f1d2c3e-8a47-5b0e-9c61-2f4e7a9d0b13")
+
+# Below this many events a batch is deconstructed inline: pickling events
+# to worker processes costs more than the rule pass itself.
+_POOL_MIN_EVENTS = 128
+
 
 def ingest_event(
     *,
@@ -21,12 +45,18 @@ def ingest_event(
     role: str,
     message_text: str,
     token_count: Optional[int] = None,
+    domain: str = "strategy",
 ) -> ConversationEvent:
     """
     Ingest a raw conversation event into the Tier 0 archive.
 
     Non-blocking — callers should fire this and proceed. The return value
     carries the event_id needed for downstream deconstruction.
+
+    The stored event is also queued for capture (capture_queue drains it in
+    the given domain). If the write fails, the returned event has
+    capture_queued_at=None: nothing was queued and the caller must
+    deconstruct it inline or drop it.
     """
     if role not in VALID_ROLES:
         raise ValueError(f"Invalid role {role!r}. Must be one of: {VALID_ROLES}")
@@ -46,7 +76,7 @@ def ingest_event(
     )
 
     try:
-        insert_event(event)
+        insert_event(event, metadata={"capture_domain": domain})
         logger.debug(
             "QCR event ingested: event=%s tenant=%s session=%s role=%s",
             event.event_id, tenant_id, session_id, role,
@@ -56,5 +86,252 @@ def ingest_event(
             "QCR event persistence failed for tenant=%s session=%s; returning event without DB write",
             tenant_id, session_id,
         )
+        return dataclasses.replace(event, capture_queued_at=None)
 
     return event
+
+
+# ---------------------------------------------------------------------------
+# Batch ingestion
+# ---------------------------------------------------------------------------
+
+@dataclass
+class EventIngestResult:
+    index: int                       # position in the submitted batch
+    status: str                      # ingested / duplicate / invalid / failed
+    event_id: Optional[str] = None   # stored id
+    client_event_id: Optional[str] = None
+    nuggets_extracted: int = 0
+    nuggets_persisted: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "status": self.status,
+            "event_id": self.event_id,
+            "client_event_id": self.client_event_id,
+            "nuggets_extracted": self.nuggets_extracted,
+            "nuggets_persisted": self.nuggets_persisted,
+            "error": self.error,
+        }
+
+
+def _deconstruct_workers() -> int:
+    default = min(4, os.cpu_count() or 1)
+    return int(os.getenv("EXECALC_QCR_DECONSTRUCT_WORKERS", str(default)))
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _new_executor(workers: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the API process is multi-threaded, and forking it
+    # can copy a held lock into the child.
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """This process's deconstruction pool, created on first use (survives pre-fork)."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = _new_executor(workers)
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def shutdown_deconstruction_pool() -> None:
+    """Stop this process's deconstruction pool, if one was started (tests, shutdown)."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        executor, _executor, _executor_pid = _executor, None, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _deconstruct_chunk(items: List[Tuple[ConversationEvent, str]]) -> List[List[AtomicNugget]]:
+    return [deconstruct_event(event, domain=domain) for event, domain in items]
+
+
+def _deconstruct_all(items: List[Tuple[ConversationEvent, str]]) -> List[List[AtomicNugget]]:
+    """
+    Deconstruct (event, domain) pairs, in order. Large batches are split
+    into one chunk per worker and run in the process pool; small batches,
+    a pool of one, or a broken pool run inline.
+    """
+    workers = _deconstruct_workers()
+    if workers <= 1 or len(items) < _POOL_MIN_EVENTS:
+        return _deconstruct_chunk(items)
+
+    size = -(-len(items) // workers)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    try:
+        executor = _get_executor(workers)
+        out: List[List[AtomicNugget]] = []
+        for part in executor.map(_deconstruct_chunk, chunks):
+            out.extend(part)
+        return out
+    except BrokenProcessPool:
+        logger.exception("QCR batch: deconstruction pool broke; recreating it and deconstructing inline")
+        shutdown_deconstruction_pool()
+        return _deconstruct_chunk(items)
+
+
+def _stored_event_id(tenant_id: str, client_event_id: str) -> str:
+    return uuid.uuid5(_CLIENT_EVENT_NAMESPACE, f"{tenant_id}:{client_event_id}").hex
+
+
+def _validate_batch_item(
+    item: Mapping[str, Any],
+    *,
+    session_id: Optional[str],
+    domain: str,
+    seen_ids: set,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Normalise one submitted event. Returns (fields, None) or (None, error)."""
+    if not isinstance(item, Mapping):
+        return None, "event must be an object"
+    sid = str(item.get("session_id") or session_id or "")
+    role = str(item.get("role") or "operator")
+    message_text = str(item.get("message_text") or "")
+    client_event_id = str(item.get("event_id") or "") or None
+    token_count = item.get("token_count")
+
+    if not sid:
+        return None, "session_id is required"
+    if role not in VALID_ROLES:
+        return None, f"Invalid role {role!r}. Must be one of: {VALID_ROLES}"
+    if not message_text.strip():
+        return None, "message_text must not be empty"
+    if token_count is not None and (isinstance(token_count, bool) or not isinstance(token_count, int)):
+        return None, "token_count must be an integer"
+    if client_event_id is not None:
+        if client_event_id in seen_ids:
+            return None, f"duplicate event_id {client_event_id!r} in batch"
+        seen_ids.add(client_event_id)
+
+    return {
+        "client_event_id": client_event_id,
+        "session_id": sid,
+        "role": role,
+        "message_text": message_text,
+        "token_count": token_count,
+        "domain": str(item.get("domain") or domain),
+    }, None
+
+
+def ingest_events(
+    *,
+    tenant_id: str,
+    user_id: str,
+    events: Sequence[Mapping[str, Any]],
+    session_id: Optional[str] = None,
+    domain: str = "strategy",
+) -> List[EventIngestResult]:
+    """
+    Ingest a batch of conversation events and capture their nuggets.
+
+    Each item carries role and message_text, and may carry session_id,
+    domain and token_count (defaulting to the batch-level values) and a
+    client-chosen event_id. Client ids are scoped to the tenant (stored as
+    a uuid5 of tenant and client id) and make a replay idempotent: events
+    the tenant already stored come back as "duplicate" and their nuggets
+    are not written again. An id that collides with another tenant's event
+    is reported "invalid".
+
+    Events are timestamped in submission order (one microsecond apart), so
+    the transcript's message order survives.
+
+    Valid events are deconstructed in the worker pool, then written —
+    events and nuggets each as multi-row INSERTs — in one transaction, and
+    stored already captured so the capture queue does not repeat the work.
+    Invalid items are reported without blocking the rest of the batch. If
+    the transaction fails, every valid event is reported "failed" and
+    nothing was stored.
+
+    Returns one result per submitted item, in submission order.
+    """
+    results: List[EventIngestResult] = []
+    accepted: List[Tuple[EventIngestResult, ConversationEvent, str]] = []
+    seen_ids: set = set()
+    now = datetime.now(UTC)
+
+    for index, item in enumerate(events):
+        fields, error = _validate_batch_item(item, session_id=session_id, domain=domain, seen_ids=seen_ids)
+        if error is not None:
+            results.append(EventIngestResult(index=index, status="invalid", error=error))
+            continue
+        client_event_id = fields["client_event_id"]
+        event = ConversationEvent(
+            event_id=(
+                _stored_event_id(tenant_id, client_event_id) if client_event_id else uuid.uuid4().hex
+            ),
+            tenant_id=tenant_id,
+            session_id=fields["session_id"],
+            user_id=user_id,
+            role=fields["role"],
+            message_text=fields["message_text"],
+            token_count=fields["token_count"],
+            created_at=now + timedelta(microseconds=index),
+            capture_queued_at=now,
+            capture_completed_at=now,
+        )
+        result = EventIngestResult(
+            index=index, status="ingested", event_id=event.event_id, client_event_id=client_event_id,
+        )
+        results.append(result)
+        accepted.append((result, event, fields["domain"]))
+
+    if not accepted:
+        return results
+
+    with telemetry.span("qcr_batch_deconstruct"):
+        nugget_lists = _deconstruct_all([(event, dom) for _, event, dom in accepted])
+    for (result, _, _), nuggets in zip(accepted, nugget_lists):
+        result.nuggets_extracted = len(nuggets)
+
+    try:
+        with telemetry.span("qcr_batch_persist"), unit_of_work() as uow:
+            uow.begin_writes()
+            inserted = insert_events(
+                [event for _, event, _ in accepted],
+                metadata=[{"capture_domain": dom} for _, _, dom in accepted],
+            )
+            new_nuggets = [
+                n
+                for (_, event, _), nuggets in zip(accepted, nugget_lists)
+                if event.event_id in inserted
+                for n in nuggets
+            ]
+            insert_nuggets(new_nuggets)
+            foreign = list_foreign_event_ids(
+                event_ids=[e.event_id for _, e, _ in accepted if e.event_id not in inserted],
+                tenant_id=tenant_id,
+            )
+    except Exception as e:
+        logger.exception(
+            "QCR batch persistence failed for tenant=%s (%d events); nothing stored",
+            tenant_id, len(accepted),
+        )
+        for result, _, _ in accepted:
+            result.status = "failed"
+            result.error = f"persistence failed: {e.__class__.__name__}"
+        return results
+
+    for result, event, _ in accepted:
+        if event.event_id in inserted:
+            result.nuggets_persisted = result.nuggets_extracted
+        elif event.event_id in foreign:
+            result.status = "invalid"
+            result.error = "event_id conflicts with an existing event"
+        else:
+            result.status = "duplicate"
+
+    logger.debug(
+        "QCR batch ingested: tenant=%s events=%d inserted=%d nuggets=%d",
+        tenant_id, len(accepted), len(inserted), len(new_nuggets),
+    )
+    return results
@@ -2,99 +2,299 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
-from src.service.db.postgres import get_conn
+from src.service.db.postgres import after_commit, connection
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement in the bulk writers.
+_BULK_PAGE_SIZE = 500
+# Rows per server-side cursor fetch when streaming exports.
+_STREAM_FETCH_SIZE = 2000
+
 
 def _json(v: Any) -> str:
     return json.dumps(v)
 
 
+def _invalidate_session_packets(tenant_id: str, session_id: Optional[str] = None) -> None:
+    # Drop now so this transaction's readers rebuild, and again after commit
+    # so a concurrent reader cannot re-cache the pre-write packet.
+    from src.service.qualitative_capture import session_packet  # local to avoid circular
+    session_packet.invalidate(tenant_id, session_id)
+    after_commit(lambda: session_packet.invalidate(tenant_id, session_id))
+
+
+def _notify_nuggets_inserted(nuggets: Sequence["AtomicNugget"]) -> None:
+    if not nuggets:
+        return
+    from src.service.gaqp import claim_graph  # local to avoid circular
+    after_commit(lambda: claim_graph.note_nuggets_inserted(nuggets))
+
+
+def _load_execute_values():
+    try:
+        from psycopg2.extras import execute_values  # type: ignore
+        return execute_values
+    except ImportError as e:
+        raise RuntimeError(
+            "psycopg2 is not available. Install the Postgres dependency before using QCR persistence."
+        ) from e
+
+
 # ---------------------------------------------------------------------------
 # conversation_events
 # ---------------------------------------------------------------------------
 
-def insert_event(event: "ConversationEvent") -> bool:
+def insert_event(event: "ConversationEvent", *, metadata: Optional[Dict[str, Any]] = None) -> bool:
     from src.service.qualitative_capture.models import ConversationEvent
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_conversation_events
-                    (event_id, tenant_id, session_id, user_id, role,
-                     message_text, token_count, created_at, capture_queued_at)
-                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                ON CONFLICT (event_id) DO NOTHING
-                """,
-                (
-                    event.event_id, event.tenant_id, event.session_id,
-                    event.user_id, event.role, event.message_text,
-                    event.token_count, event.created_at, event.capture_queued_at,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_conversation_events
+                (event_id, tenant_id, session_id, user_id, role,
+                 message_text, token_count, created_at, capture_queued_at, metadata)
+            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            ON CONFLICT (event_id) DO NOTHING
+            """,
+            (
+                event.event_id, event.tenant_id, event.session_id,
+                event.user_id, event.role, event.message_text,
+                event.token_count, event.created_at, event.capture_queued_at,
+                _json(metadata or {}),
+            ),
+        )
+        return cur.rowcount > 0
+
+
+def insert_events(
+    events: Sequence["ConversationEvent"],
+    *,
+    metadata: Sequence[Dict[str, Any]],
+) -> Set[str]:
+    """
+    Insert many events with multi-row INSERTs (one statement per
+    _BULK_PAGE_SIZE rows). metadata is parallel to events.
 
+    Returns the event_ids actually inserted; ids that already existed are
+    skipped, so a replayed batch is idempotent.
+    """
+    if not events:
+        return set()
+    rows = [
+        (
+            e.event_id, e.tenant_id, e.session_id, e.user_id, e.role,
+            e.message_text, e.token_count, e.created_at,
+            e.capture_queued_at, e.capture_completed_at, _json(meta or {}),
+        )
+        for e, meta in zip(events, metadata)
+    ]
+    execute_values = _load_execute_values()
+    with connection() as conn, conn.cursor() as cur:
+        inserted = execute_values(
+            cur,
+            """
+            INSERT INTO qcr_conversation_events
+                (event_id, tenant_id, session_id, user_id, role,
+                 message_text, token_count, created_at,
+                 capture_queued_at, capture_completed_at, metadata)
+            VALUES %s
+            ON CONFLICT (event_id) DO NOTHING
+            RETURNING event_id
+            """,
+            rows,
+            page_size=_BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    return {r[0] for r in inserted}
+
+
+def list_foreign_event_ids(*, event_ids: Sequence[str], tenant_id: str) -> Set[str]:
+    """Of event_ids, those already stored under a tenant other than tenant_id."""
+    if not event_ids:
+        return set()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT event_id FROM qcr_conversation_events WHERE event_id = ANY(%s) AND tenant_id <> %s",
+            (list(event_ids), tenant_id),
+        )
+        rows = cur.fetchall() or []
+    return {r[0] for r in rows}
+
+
+def mark_event_captured(*, event_id: str, attempts: int) -> bool:
+    """
+    Mark a claimed event captured. attempts is the capture_attempts it was
+    claimed at; the row is only updated while that lease is still held, so
+    a worker whose lease expired and was re-claimed cannot finish it too.
+    Returns False when the lease was lost.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE qcr_conversation_events
+            SET capture_completed_at = NOW(), capture_leased_until = NULL, capture_error = NULL
+            WHERE event_id = %s AND capture_attempts = %s AND capture_completed_at IS NULL
+            """,
+            (event_id, attempts),
+        )
+        return cur.rowcount > 0
+
+
+def claim_capture_batch(
+    *,
+    limit: int,
+    lease_seconds: float,
+    max_attempts: int,
+) -> List[Dict[str, Any]]:
+    """
+    Lease up to limit pending events, oldest first, across all tenants.
 
-def mark_event_captured(event_id: str) -> None:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_conversation_events SET capture_completed_at = NOW() WHERE event_id = %s",
-                (event_id,),
-            )
-    finally:
-        conn.close()
+    SKIP LOCKED lets concurrent workers claim disjoint batches without
+    waiting on each other. The lease and attempt count are committed with
+    the claim, so a crashed worker's events become claimable again once
+    the lease expires.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE qcr_conversation_events e
+            SET capture_leased_until = NOW() + make_interval(secs => %s),
+                capture_attempts = e.capture_attempts + 1
+            FROM (
+                SELECT event_id
+                FROM qcr_conversation_events
+                WHERE capture_queued_at IS NOT NULL
+                  AND capture_completed_at IS NULL
+                  AND capture_attempts < %s
+                  AND (capture_leased_until IS NULL OR capture_leased_until < NOW())
+                ORDER BY capture_queued_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            ) picked
+            WHERE e.event_id = picked.event_id
+            RETURNING e.event_id, e.tenant_id, e.session_id, e.user_id, e.role,
+                      e.message_text, e.token_count, e.created_at, e.capture_queued_at,
+                      e.capture_attempts, e.metadata->>'capture_domain'
+            """,
+            (lease_seconds, max_attempts, limit),
+        )
+        rows = cur.fetchall()
+    cols = [
+        "event_id", "tenant_id", "session_id", "user_id", "role",
+        "message_text", "token_count", "created_at", "capture_queued_at",
+        "capture_attempts", "capture_domain",
+    ]
+    return [dict(zip(cols, r)) for r in rows]
+
+
+def release_event_capture(*, event_id: str, attempts: int, error: str) -> bool:
+    """
+    Give a claimed event back to the queue after a failed capture attempt.
+    Fenced like mark_event_captured: a stale worker cannot clear the lease
+    of the worker that re-claimed the event. Returns False when the lease
+    was lost.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE qcr_conversation_events
+            SET capture_leased_until = NULL, capture_error = %s
+            WHERE event_id = %s AND capture_attempts = %s AND capture_completed_at IS NULL
+            """,
+            (error, event_id, attempts),
+        )
+        return cur.rowcount > 0
 
 
 # ---------------------------------------------------------------------------
 # atomic_nuggets
 # ---------------------------------------------------------------------------
 
+_NUGGET_INSERT_COLUMNS = """
+    (nugget_id, tenant_id, session_id, source_event_id,
+     claim_text, claim_type, domain, subdomain,
+     confidence_level, confidence_score,
+     provenance_source, provenance_author,
+     activation_scope, activation_triggers,
+     polarity, durability_class, evidence_status, freshness_class,
+     composability_score, origin,
+     counterclaim_links, supporting_claim_links, scenario_tags,
+     rail_candidate, selection_method, generation_depth,
+     source_rail_artifact_id, created_at, expires_at)
+"""
+
+
+def _nugget_row(nugget: "AtomicNugget") -> tuple:
+    return (
+        nugget.nugget_id, nugget.tenant_id, nugget.session_id, nugget.source_event_id,
+        nugget.claim_text, nugget.claim_type, nugget.domain, nugget.subdomain,
+        nugget.confidence_level, nugget.confidence_score,
+        nugget.provenance_source, nugget.provenance_author,
+        nugget.activation_scope, _json(nugget.activation_triggers),
+        nugget.polarity, nugget.durability_class, nugget.evidence_status, nugget.freshness_class,
+        nugget.composability_score, nugget.origin,
+        _json(nugget.counterclaim_links), _json(nugget.supporting_claim_links), _json(nugget.scenario_tags),
+        nugget.rail_candidate, nugget.selection_method, nugget.generation_depth,
+        nugget.source_rail_artifact_id, nugget.created_at, nugget.expires_at,
+    )
+
+
 def insert_nugget(nugget: "AtomicNugget") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_atomic_nuggets
-                    (nugget_id, tenant_id, session_id, source_event_id,
-                     claim_text, claim_type, domain, subdomain,
-                     confidence_level, confidence_score,
-                     provenance_source, provenance_author,
-                     activation_scope, activation_triggers,
-                     polarity, durability_class, evidence_status, freshness_class,
-                     composability_score, origin,
-                     counterclaim_links, supporting_claim_links, scenario_tags,
-                     rail_candidate, selection_method, generation_depth,
-                     source_rail_artifact_id, created_at, expires_at)
-                VALUES
-                    (%s,%s,%s,%s, %s,%s,%s,%s, %s,%s, %s,%s, %s,%s,
-                     %s,%s,%s,%s, %s,%s, %s,%s,%s, %s,%s,%s, %s,%s,%s)
-                ON CONFLICT (nugget_id) DO NOTHING
-                """,
-                (
-                    nugget.nugget_id, nugget.tenant_id, nugget.session_id, nugget.source_event_id,
-                    nugget.claim_text, nugget.claim_type, nugget.domain, nugget.subdomain,
-                    nugget.confidence_level, nugget.confidence_score,
-                    nugget.provenance_source, nugget.provenance_author,
-                    nugget.activation_scope, _json(nugget.activation_triggers),
-                    nugget.polarity, nugget.durability_class, nugget.evidence_status, nugget.freshness_class,
-                    nugget.composability_score, nugget.origin,
-                    _json(nugget.counterclaim_links), _json(nugget.supporting_claim_links), _json(nugget.scenario_tags),
-                    nugget.rail_candidate, nugget.selection_method, nugget.generation_depth,
-                    nugget.source_rail_artifact_id, nugget.created_at, nugget.expires_at,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO qcr_atomic_nuggets" + _NUGGET_INSERT_COLUMNS + """
+            VALUES
+                (%s,%s,%s,%s, %s,%s,%s,%s, %s,%s, %s,%s, %s,%s,
+                 %s,%s,%s,%s, %s,%s, %s,%s,%s, %s,%s,%s, %s,%s,%s)
+            ON CONFLICT (nugget_id) DO NOTHING
+            """,
+            _nugget_row(nugget),
+        )
+        inserted = cur.rowcount > 0
+    if inserted:
+        _invalidate_session_packets(nugget.tenant_id, nugget.session_id)
+        _notify_nuggets_inserted([nugget])
+    return inserted
+
+
+def insert_nuggets(nuggets: Sequence["AtomicNugget"]) -> int:
+    """Insert many nuggets with multi-row INSERTs. Returns the number inserted."""
+    if not nuggets:
+        return 0
+    execute_values = _load_execute_values()
+    with connection() as conn, conn.cursor() as cur:
+        inserted = execute_values(
+            cur,
+            "INSERT INTO qcr_atomic_nuggets" + _NUGGET_INSERT_COLUMNS + """
+            VALUES %s
+            ON CONFLICT (nugget_id) DO NOTHING
+            RETURNING nugget_id
+            """,
+            [_nugget_row(n) for n in nuggets],
+            page_size=_BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    for tenant_id, session_id in {(n.tenant_id, n.session_id) for n in nuggets}:
+        _invalidate_session_packets(tenant_id, session_id)
+    inserted_ids = {r[0] for r in inserted}
+    _notify_nuggets_inserted([n for n in nuggets if n.nugget_id in inserted_ids])
+    return len(inserted)
+
+
+_NUGGET_LIST_COLUMNS = [
+    "nugget_id", "tenant_id", "session_id", "source_event_id", "claim_text", "claim_type",
+    "domain", "subdomain", "confidence_level", "confidence_score", "provenance_source",
+    "provenance_author", "activation_scope", "activation_triggers", "polarity",
+    "durability_class", "evidence_status", "freshness_class", "composability_score",
+    "origin", "counterclaim_links", "supporting_claim_links", "scenario_tags",
+    "rail_candidate", "selection_method", "generation_depth",
+    "source_rail_artifact_id", "created_at", "expires_at",
+]
 
 
 def list_nuggets(
@@ -104,8 +304,15 @@ def list_nuggets(
     claim_type: Optional[str] = None,
     min_confidence: float = 0.0,
     rail_candidate_only: bool = False,
+    after: Optional[Tuple[float, datetime, str]] = None,
     limit: int = 100,
 ) -> List[Dict[str, Any]]:
+    """
+    Nuggets best first: confidence, then newest, then nugget_id as the
+    tiebreak. after is the previous page's last (confidence_score,
+    created_at, nugget_id); rows strictly after it are returned (keyset
+    pagination, infra/migrations/011).
+    """
     conditions = ["tenant_id = %s", "confidence_score >= %s"]
     params: List[Any] = [tenant_id, min_confidence]
     if session_id:
@@ -116,36 +323,149 @@ def list_nuggets(
         params.append(claim_type)
     if rail_candidate_only:
         conditions.append("rail_candidate = TRUE")
+    if after is not None:
+        conditions.append("(confidence_score, created_at, nugget_id) < (%s, %s, %s)")
+        params.extend(after)
     params.append(limit)
 
     sql = (
-        "SELECT nugget_id, tenant_id, session_id, source_event_id, claim_text, claim_type, "
-        "domain, subdomain, confidence_level, confidence_score, provenance_source, provenance_author, "
-        "activation_scope, activation_triggers, polarity, durability_class, evidence_status, "
-        "freshness_class, composability_score, origin, counterclaim_links, supporting_claim_links, "
-        "scenario_tags, rail_candidate, selection_method, generation_depth, "
-        "source_rail_artifact_id, created_at, expires_at "
+        "SELECT " + ", ".join(_NUGGET_LIST_COLUMNS) + " "
         "FROM qcr_atomic_nuggets WHERE " + " AND ".join(conditions) +
-        " ORDER BY confidence_score DESC, created_at DESC LIMIT %s"
+        " ORDER BY confidence_score DESC, created_at DESC, nugget_id DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            cols = [
-                "nugget_id", "tenant_id", "session_id", "source_event_id", "claim_text", "claim_type",
-                "domain", "subdomain", "confidence_level", "confidence_score", "provenance_source",
-                "provenance_author", "activation_scope", "activation_triggers", "polarity",
-                "durability_class", "evidence_status", "freshness_class", "composability_score",
-                "origin", "counterclaim_links", "supporting_claim_links", "scenario_tags",
-                "rail_candidate", "selection_method", "generation_depth",
-                "source_rail_artifact_id", "created_at", "expires_at",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [dict(zip(_NUGGET_LIST_COLUMNS, r)) for r in rows]
+
+
+def stream_nuggets(
+    *,
+    tenant_id: str,
+    session_id: Optional[str] = None,
+    claim_type: Optional[str] = None,
+    fetch_size: int = _STREAM_FETCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every matching nugget, oldest first, through a server-side
+    (named) cursor that fetches fetch_size rows per round trip, so memory
+    stays flat however many rows match. The connection is held until the
+    generator is exhausted or closed.
+    """
+    conditions = ["tenant_id = %s"]
+    params: List[Any] = [tenant_id]
+    if session_id:
+        conditions.append("session_id = %s")
+        params.append(session_id)
+    if claim_type:
+        conditions.append("claim_type = %s")
+        params.append(claim_type)
+    sql = (
+        "SELECT " + ", ".join(_NUGGET_LIST_COLUMNS) + " "
+        "FROM qcr_atomic_nuggets WHERE " + " AND ".join(conditions) +
+        " ORDER BY created_at, nugget_id"
+    )
+    with connection() as conn, conn.cursor(name=f"qcr_nugget_export_{uuid.uuid4().hex}") as cur:
+        cur.itersize = fetch_size
+        cur.execute(sql, params)
+        for r in cur:
+            yield dict(zip(_NUGGET_LIST_COLUMNS, r))
+
+
+def list_nugget_links(*, tenant_id: str) -> List[Tuple[str, List[str], List[str]]]:
+    """
+    (nugget_id, counterclaim_links, supporting_claim_links) for every nugget
+    of the tenant that links to another claim. Feeds the GAQP claim graph.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT nugget_id, counterclaim_links, supporting_claim_links
+            FROM qcr_atomic_nuggets
+            WHERE tenant_id = %s
+              AND (counterclaim_links <> '[]'::jsonb OR supporting_claim_links <> '[]'::jsonb)
+            """,
+            (tenant_id,),
+        )
+        rows = cur.fetchall() or []
+    return [(r[0], list(r[1] or []), list(r[2] or [])) for r in rows]
+
+
+def list_nuggets_by_category(
+    *,
+    tenant_id: str,
+    categories: Dict[str, Sequence[str]],
+    session_id: Optional[str] = None,
+    open_category: Optional[str] = None,
+    open_max_confidence: float = 0.50,
+    limit: int = 20,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    The top limit nuggets of every category in one statement.
+
+    categories maps a category name to its claim types. Typed categories
+    are read with one claim_type = ANY(%s) scan and ranked per category by
+    confidence then recency with row_number(); a claim type may belong to
+    several categories. open_category, if given, names the category of open
+    loops instead: its claim types OR confidence_score <= open_max_confidence,
+    newest first. Returns every requested category, empty ones included.
+    """
+    typed = {c: list(t) for c, t in categories.items() if c != open_category and t}
+    select_cols = ", ".join("n." + c for c in _NUGGET_LIST_COLUMNS)
+    session_filter = " AND n.session_id = %s" if session_id else ""
+    branches: List[str] = []
+    params: List[Any] = []
+
+    if typed:
+        pairs = [(t, c) for c, types in typed.items() for t in types]
+        branches.append(
+            "SELECT m.category, " + select_cols + ", row_number() OVER ("
+            "PARTITION BY m.category ORDER BY n.confidence_score DESC, n.created_at DESC, n.nugget_id DESC"
+            ") AS category_rank "
+            "FROM qcr_atomic_nuggets n "
+            "JOIN unnest(%s::text[], %s::text[]) AS m(claim_type, category) ON m.claim_type = n.claim_type "
+            "WHERE n.tenant_id = %s AND n.claim_type = ANY(%s)" + session_filter
+        )
+        params += [[t for t, _ in pairs], [c for _, c in pairs], tenant_id,
+                   sorted({t for t, _ in pairs})]
+        if session_id:
+            params.append(session_id)
+    if open_category is not None and open_category in categories:
+        branches.append(
+            "SELECT %s::text, " + select_cols + ", row_number() OVER ("
+            "ORDER BY n.created_at DESC, n.nugget_id DESC"
+            ") AS category_rank "
+            "FROM qcr_atomic_nuggets n "
+            "WHERE n.tenant_id = %s AND (n.claim_type = ANY(%s) OR n.confidence_score <= %s)"
+            + session_filter
+        )
+        params += [open_category, tenant_id, list(categories[open_category]), open_max_confidence]
+        if session_id:
+            params.append(session_id)
+
+    out: Dict[str, List[Dict[str, Any]]] = {c: [] for c in categories}
+    if not branches:
+        return out
+    params.append(limit)
+    sql = (
+        "SELECT * FROM (" + " UNION ALL ".join(branches) + ") ranked "
+        "WHERE category_rank <= %s ORDER BY category, category_rank"
+    )
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+    for r in rows:
+        out[r[0]].append(dict(zip(_NUGGET_LIST_COLUMNS, r[1:-1])))
+    return out
+
+
+# Search relevance blends text rank with claim confidence. ts_rank's
+# normalization 32 maps rank into [0, 1), the same range as
+# confidence_score, so the weights read as shares of the final score.
+_SEARCH_TEXT_WEIGHT = 0.7
+_SEARCH_CONFIDENCE_WEIGHT = 0.3
+_SEARCH_RANK_SCALE = 6
 
 
 def search_nuggets(
@@ -155,24 +475,30 @@ def search_nuggets(
     claim_types: Optional[List[str]] = None,
     domain: Optional[str] = None,
     session_id: Optional[str] = None,
+    after: Optional[Tuple[Decimal, str]] = None,
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
     """
-    Keyword search across claim_text using ILIKE.
-
-    Returns nuggets whose claim_text contains all words in the query (case-insensitive).
-    Ordered by confidence_score DESC so the most authoritative matches surface first.
+    Full-text search across claim_text (infra/migrations/008).
+
+    The query is parsed with websearch_to_tsquery, so words are stemmed and
+    all must match, "quoted phrases" match as phrases, and -word excludes.
+    Matches come from the (tenant_id, claim_tsv) GIN index and are ordered
+    by search_rank — ts_rank blended with confidence_score, rounded to
+    _SEARCH_RANK_SCALE places as an exact numeric (Decimal) — then
+    nugget_id, which every row carries for keyset paging: pass the last
+    row's (search_rank, nugget_id) as after to get the next page. The
+    rounding makes the rank the same on every page, so the keyset
+    comparison cannot skip or repeat a row at a page boundary.
     """
     query = (query or "").strip()
     if not query:
         return []
 
-    conditions = ["tenant_id = %s"]
-    params: List[Any] = [tenant_id]
-
-    for word in query.split():
-        conditions.append("claim_text ILIKE %s")
-        params.append(f"%{word}%")
+    conditions = ["tenant_id = %s", "claim_tsv @@ q"]
+    params: List[Any] = [
+        _SEARCH_TEXT_WEIGHT, _SEARCH_CONFIDENCE_WEIGHT, _SEARCH_RANK_SCALE, query, tenant_id,
+    ]
 
     if session_id:
         conditions.append("session_id = %s")
@@ -185,38 +511,27 @@ def search_nuggets(
         conditions.append(f"claim_type IN ({placeholders})")
         params.extend(claim_types)
 
+    outer = ""
+    if after is not None:
+        outer = "WHERE (search_rank, nugget_id) < (%s::numeric, %s) "
+        params.extend(after)
     params.append(limit)
 
+    select_list = ", ".join(_NUGGET_LIST_COLUMNS)
     sql = (
-        "SELECT nugget_id, tenant_id, session_id, source_event_id, claim_text, claim_type, "
-        "domain, subdomain, confidence_level, confidence_score, provenance_source, "
-        "provenance_author, activation_scope, activation_triggers, polarity, "
-        "durability_class, evidence_status, freshness_class, composability_score, "
-        "origin, counterclaim_links, supporting_claim_links, scenario_tags, "
-        "rail_candidate, selection_method, generation_depth, "
-        "source_rail_artifact_id, created_at, expires_at "
-        "FROM qcr_atomic_nuggets "
+        f"SELECT {select_list}, search_rank FROM ("
+        f"SELECT {select_list}, "
+        "round((ts_rank(claim_tsv, q, 32) * %s + confidence_score * %s)::numeric, %s) AS search_rank "
+        "FROM qcr_atomic_nuggets, websearch_to_tsquery('english', %s) AS q "
         "WHERE " + " AND ".join(conditions) +
-        " ORDER BY confidence_score DESC, created_at DESC LIMIT %s"
+        ") ranked " + outer +
+        "ORDER BY search_rank DESC, nugget_id DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            cols = [
-                "nugget_id", "tenant_id", "session_id", "source_event_id", "claim_text", "claim_type",
-                "domain", "subdomain", "confidence_level", "confidence_score", "provenance_source",
-                "provenance_author", "activation_scope", "activation_triggers", "polarity",
-                "durability_class", "evidence_status", "freshness_class", "composability_score",
-                "origin", "counterclaim_links", "supporting_claim_links", "scenario_tags",
-                "rail_candidate", "selection_method", "generation_depth",
-                "source_rail_artifact_id", "created_at", "expires_at",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        return [dict(zip(_NUGGET_LIST_COLUMNS + ["search_rank"], r)) for r in rows]
 
 
 def list_preserved_ideas_for_session(
@@ -241,19 +556,15 @@ def list_preserved_ideas_for_session(
         " ORDER BY memorialized_at DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            cols = [
-                "idea_id", "tenant_id", "nugget_id", "session_id", "source_event_id",
-                "selected_text", "memorialized_by", "memorialized_at", "corroboration_count",
-                "corroborated_by", "structural_threshold_crossed_at", "rail_card_id",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        cols = [
+            "idea_id", "tenant_id", "nugget_id", "session_id", "source_event_id",
+            "selected_text", "memorialized_by", "memorialized_at", "corroboration_count",
+            "corroborated_by", "structural_threshold_crossed_at", "rail_card_id",
+        ]
+        return [dict(zip(cols, r)) for r in rows]
 
 
 # ---------------------------------------------------------------------------
@@ -261,51 +572,46 @@ def list_preserved_ideas_for_session(
 # ---------------------------------------------------------------------------
 
 def insert_preserved_idea(idea: "PreservedIdea") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_preserved_ideas
-                    (idea_id, tenant_id, nugget_id, session_id, source_event_id,
-                     selected_text, memorialized_by, memorialized_at,
-                     corroboration_count, corroborated_by)
-                VALUES (%s,%s,%s,%s,%s, %s,%s,%s, %s,%s)
-                ON CONFLICT (idea_id) DO NOTHING
-                """,
-                (
-                    idea.idea_id, idea.tenant_id, idea.nugget_id, idea.session_id, idea.source_event_id,
-                    idea.selected_text, idea.memorialized_by, idea.memorialized_at,
-                    idea.corroboration_count, _json(idea.corroborated_by),
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_preserved_ideas
+                (idea_id, tenant_id, nugget_id, session_id, source_event_id,
+                 selected_text, memorialized_by, memorialized_at,
+                 corroboration_count, corroborated_by)
+            VALUES (%s,%s,%s,%s,%s, %s,%s,%s, %s,%s)
+            ON CONFLICT (idea_id) DO NOTHING
+            """,
+            (
+                idea.idea_id, idea.tenant_id, idea.nugget_id, idea.session_id, idea.source_event_id,
+                idea.selected_text, idea.memorialized_by, idea.memorialized_at,
+                idea.corroboration_count, _json(idea.corroborated_by),
+            ),
+        )
+        inserted = cur.rowcount > 0
+    if inserted:
+        _invalidate_session_packets(idea.tenant_id, idea.session_id)
+    return inserted
 
 
 def get_preserved_idea(*, idea_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "SELECT idea_id, tenant_id, nugget_id, session_id, source_event_id, "
-                "selected_text, memorialized_by, memorialized_at, corroboration_count, "
-                "corroborated_by, structural_threshold_crossed_at, rail_card_id "
-                "FROM qcr_preserved_ideas WHERE idea_id = %s AND tenant_id = %s",
-                (idea_id, tenant_id),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            cols = [
-                "idea_id", "tenant_id", "nugget_id", "session_id", "source_event_id",
-                "selected_text", "memorialized_by", "memorialized_at", "corroboration_count",
-                "corroborated_by", "structural_threshold_crossed_at", "rail_card_id",
-            ]
-            return dict(zip(cols, row))
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT idea_id, tenant_id, nugget_id, session_id, source_event_id, "
+            "selected_text, memorialized_by, memorialized_at, corroboration_count, "
+            "corroborated_by, structural_threshold_crossed_at, rail_card_id "
+            "FROM qcr_preserved_ideas WHERE idea_id = %s AND tenant_id = %s",
+            (idea_id, tenant_id),
+        )
+        row = cur.fetchone()
+        if not row:
+            return None
+        cols = [
+            "idea_id", "tenant_id", "nugget_id", "session_id", "source_event_id",
+            "selected_text", "memorialized_by", "memorialized_at", "corroboration_count",
+            "corroborated_by", "structural_threshold_crossed_at", "rail_card_id",
+        ]
+        return dict(zip(cols, row))
 
 
 # ---------------------------------------------------------------------------
@@ -313,29 +619,28 @@ def get_preserved_idea(*, idea_id: str, tenant_id: str) -> Optional[Dict[str, An
 # ---------------------------------------------------------------------------
 
 def insert_conclusion(conclusion: "ExecutiveConclusion") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_executive_conclusions
-                    (conclusion_id, tenant_id, session_id, conclusion_text,
-                     source_nugget_ids, claim_types_present,
-                     reconstruction_confidence, domain, polarity, rail_card_type, generated_at)
-                VALUES (%s,%s,%s,%s, %s,%s, %s,%s,%s,%s,%s)
-                ON CONFLICT (conclusion_id) DO NOTHING
-                """,
-                (
-                    conclusion.conclusion_id, conclusion.tenant_id, conclusion.session_id,
-                    conclusion.conclusion_text,
-                    _json(conclusion.source_nugget_ids), _json(conclusion.claim_types_present),
-                    conclusion.reconstruction_confidence, conclusion.domain,
-                    conclusion.polarity, conclusion.rail_card_type, conclusion.generated_at,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_executive_conclusions
+                (conclusion_id, tenant_id, session_id, conclusion_text,
+                 source_nugget_ids, claim_types_present,
+                 reconstruction_confidence, domain, polarity, rail_card_type, generated_at)
+            VALUES (%s,%s,%s,%s, %s,%s, %s,%s,%s,%s,%s)
+            ON CONFLICT (conclusion_id) DO NOTHING
+            """,
+            (
+                conclusion.conclusion_id, conclusion.tenant_id, conclusion.session_id,
+                conclusion.conclusion_text,
+                _json(conclusion.source_nugget_ids), _json(conclusion.claim_types_present),
+                conclusion.reconstruction_confidence, conclusion.domain,
+                conclusion.polarity, conclusion.rail_card_type, conclusion.generated_at,
+            ),
+        )
+        inserted = cur.rowcount > 0
+    if inserted:
+        _invalidate_session_packets(conclusion.tenant_id, conclusion.session_id)
+    return inserted
 
 
 def list_conclusions(
@@ -359,19 +664,109 @@ def list_conclusions(
         " ORDER BY generated_at DESC LIMIT %s"
     )
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            cols = [
-                "conclusion_id", "tenant_id", "session_id", "conclusion_text", "source_nugget_ids",
-                "claim_types_present", "reconstruction_confidence", "domain", "polarity",
-                "rail_card_type", "generated_at", "promoted_to_artifact_id",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        cols = [
+            "conclusion_id", "tenant_id", "session_id", "conclusion_text", "source_nugget_ids",
+            "claim_types_present", "reconstruction_confidence", "domain", "polarity",
+            "rail_card_type", "generated_at", "promoted_to_artifact_id",
+        ]
+        return [dict(zip(cols, r)) for r in rows]
+
+
+# ---------------------------------------------------------------------------
+# session packet sources
+# ---------------------------------------------------------------------------
+
+_PACKET_SECTIONS = {
+    # section -> (columns, timestamp columns to restore from JSON)
+    "preserved_ideas": (
+        [
+            "idea_id", "tenant_id", "nugget_id", "session_id", "source_event_id",
+            "selected_text", "memorialized_by", "memorialized_at", "corroboration_count",
+            "corroborated_by", "structural_threshold_crossed_at", "rail_card_id",
+        ],
+        ("memorialized_at", "structural_threshold_crossed_at"),
+    ),
+    "pending_promotions": (
+        [
+            "candidate_id", "tenant_id", "source_artifact_id", "source_conclusion_id",
+            "candidate_text", "proposed_claim_type", "nominated_by", "nominated_by_user_id",
+            "nominated_at", "nomination_rationale", "review_status",
+            "reviewed_by", "reviewed_at", "rejection_reason", "canon_nugget_id",
+        ],
+        ("nominated_at", "reviewed_at"),
+    ),
+    "conclusions": (
+        [
+            "conclusion_id", "tenant_id", "session_id", "conclusion_text", "source_nugget_ids",
+            "claim_types_present", "reconstruction_confidence", "domain", "polarity",
+            "rail_card_type", "generated_at", "promoted_to_artifact_id",
+        ],
+        ("generated_at",),
+    ),
+}
+
+
+def _from_json_row(row: Dict[str, Any], timestamp_cols: Sequence[str]) -> Dict[str, Any]:
+    for col in timestamp_cols:
+        if row.get(col) is not None:
+            row[col] = datetime.fromisoformat(row[col])
+    return row
+
+
+def load_session_packet_sources(
+    *,
+    tenant_id: str,
+    session_id: str,
+    section_limit: int,
+) -> Dict[str, Any]:
+    """
+    Everything a session packet reads, in one round trip.
+
+    One statement: the session's qcr_session_summaries row (infra/migrations/009)
+    plus a CTE per list section, each aggregated to a JSON array, so the reads
+    share a snapshot and a single server call. summary is None for a session
+    with no nuggets yet; the list rows have the same keys, order and Python
+    types as list_preserved_ideas_for_session, list_promotion_candidates
+    (pending) and list_conclusions.
+    """
+    cols = {name: ", ".join(spec[0]) for name, spec in _PACKET_SECTIONS.items()}
+    sql = f"""
+        WITH preserved_ideas AS (
+            SELECT {cols["preserved_ideas"]} FROM qcr_preserved_ideas
+            WHERE tenant_id = %(tenant_id)s AND session_id = %(session_id)s
+            ORDER BY memorialized_at DESC LIMIT %(section_limit)s
+        ), pending_promotions AS (
+            SELECT {cols["pending_promotions"]} FROM qcr_promotion_candidates
+            WHERE tenant_id = %(tenant_id)s AND review_status = 'pending'
+            ORDER BY nominated_at DESC LIMIT %(section_limit)s
+        ), conclusions AS (
+            SELECT {cols["conclusions"]} FROM qcr_executive_conclusions
+            WHERE tenant_id = %(tenant_id)s AND session_id = %(session_id)s
+            ORDER BY generated_at DESC LIMIT %(section_limit)s
+        )
+        SELECT
+            (SELECT row_to_json(x) FROM qcr_session_summaries x
+               WHERE x.tenant_id = %(tenant_id)s AND x.session_id = %(session_id)s),
+            (SELECT COALESCE(json_agg(x ORDER BY x.memorialized_at DESC), '[]') FROM preserved_ideas x),
+            (SELECT COALESCE(json_agg(x ORDER BY x.nominated_at DESC), '[]') FROM pending_promotions x),
+            (SELECT COALESCE(json_agg(x ORDER BY x.generated_at DESC), '[]') FROM conclusions x)
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, {
+            "tenant_id": tenant_id,
+            "session_id": session_id,
+            "section_limit": section_limit,
+        })
+        summary, *sections = cur.fetchone()
+    out: Dict[str, Any] = {
+        name: [_from_json_row(r, spec[1]) for r in (section or [])]
+        for (name, spec), section in zip(_PACKET_SECTIONS.items(), sections)
+    }
+    out["summary"] = _from_json_row(summary, ("updated_at",)) if summary else None
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -379,57 +774,45 @@ def list_conclusions(
 # ---------------------------------------------------------------------------
 
 def insert_rail_card(card: "RightRailCard") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_right_rail_cards
-                    (card_id, tenant_id, session_id, card_type, card_text,
-                     source_conclusion_id, source_idea_id,
-                     is_memorialized, is_pinned, is_dismissed,
-                     pin_order, display_rank, created_at)
-                VALUES (%s,%s,%s,%s,%s, %s,%s, %s,%s,%s, %s,%s,%s)
-                ON CONFLICT (card_id) DO NOTHING
-                """,
-                (
-                    card.card_id, card.tenant_id, card.session_id, card.card_type, card.card_text,
-                    card.source_conclusion_id, card.source_idea_id,
-                    card.is_memorialized, card.is_pinned, card.is_dismissed,
-                    card.pin_order, card.display_rank, card.created_at,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_right_rail_cards
+                (card_id, tenant_id, session_id, card_type, card_text,
+                 source_conclusion_id, source_idea_id,
+                 is_memorialized, is_pinned, is_dismissed,
+                 pin_order, display_rank, created_at)
+            VALUES (%s,%s,%s,%s,%s, %s,%s, %s,%s,%s, %s,%s,%s)
+            ON CONFLICT (card_id) DO NOTHING
+            """,
+            (
+                card.card_id, card.tenant_id, card.session_id, card.card_type, card.card_text,
+                card.source_conclusion_id, card.source_idea_id,
+                card.is_memorialized, card.is_pinned, card.is_dismissed,
+                card.pin_order, card.display_rank, card.created_at,
+            ),
+        )
+        return cur.rowcount > 0
 
 
 def dismiss_rail_card(*, card_id: str, tenant_id: str) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_right_rail_cards SET is_dismissed = TRUE, dismissed_at = NOW() "
-                "WHERE card_id = %s AND tenant_id = %s",
-                (card_id, tenant_id),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE qcr_right_rail_cards SET is_dismissed = TRUE, dismissed_at = NOW() "
+            "WHERE card_id = %s AND tenant_id = %s",
+            (card_id, tenant_id),
+        )
+        return cur.rowcount > 0
 
 
 def pin_rail_card(*, card_id: str, tenant_id: str, pin_order: int) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_right_rail_cards SET is_pinned = TRUE, pin_order = %s "
-                "WHERE card_id = %s AND tenant_id = %s",
-                (pin_order, card_id, tenant_id),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE qcr_right_rail_cards SET is_pinned = TRUE, pin_order = %s "
+            "WHERE card_id = %s AND tenant_id = %s",
+            (pin_order, card_id, tenant_id),
+        )
+        return cur.rowcount > 0
 
 
 def list_rail_cards(
@@ -450,19 +833,15 @@ def list_rail_cards(
         sql += " AND is_dismissed = FALSE"
     sql += " ORDER BY is_pinned DESC, pin_order ASC NULLS LAST, display_rank ASC"
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall() or []
-            cols = [
-                "card_id", "tenant_id", "session_id", "card_type", "card_text",
-                "source_conclusion_id", "source_idea_id", "is_memorialized", "is_pinned",
-                "is_dismissed", "pin_order", "display_rank", "created_at", "dismissed_at", "artifact_id",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall() or []
+        cols = [
+            "card_id", "tenant_id", "session_id", "card_type", "card_text",
+            "source_conclusion_id", "source_idea_id", "is_memorialized", "is_pinned",
+            "is_dismissed", "pin_order", "display_rank", "created_at", "dismissed_at", "artifact_id",
+        ]
+        return [dict(zip(cols, r)) for r in rows]
 
 
 # ---------------------------------------------------------------------------
@@ -470,30 +849,26 @@ def list_rail_cards(
 # ---------------------------------------------------------------------------
 
 def insert_rail_artifact(artifact: "RailArtifact") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_rail_artifacts
-                    (artifact_id, tenant_id, session_id, source_card_id,
-                     artifact_text, card_type, is_memorialized,
-                     operator_action, actioned_by, actioned_at,
-                     second_order_deconstruction_status)
-                VALUES (%s,%s,%s,%s, %s,%s,%s, %s,%s,%s, %s)
-                ON CONFLICT (artifact_id) DO NOTHING
-                """,
-                (
-                    artifact.artifact_id, artifact.tenant_id, artifact.session_id,
-                    artifact.source_card_id,
-                    artifact.artifact_text, artifact.card_type, artifact.is_memorialized,
-                    artifact.operator_action, artifact.actioned_by, artifact.actioned_at,
-                    artifact.second_order_deconstruction_status,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_rail_artifacts
+                (artifact_id, tenant_id, session_id, source_card_id,
+                 artifact_text, card_type, is_memorialized,
+                 operator_action, actioned_by, actioned_at,
+                 second_order_deconstruction_status)
+            VALUES (%s,%s,%s,%s, %s,%s,%s, %s,%s,%s, %s)
+            ON CONFLICT (artifact_id) DO NOTHING
+            """,
+            (
+                artifact.artifact_id, artifact.tenant_id, artifact.session_id,
+                artifact.source_card_id,
+                artifact.artifact_text, artifact.card_type, artifact.is_memorialized,
+                artifact.operator_action, artifact.actioned_by, artifact.actioned_at,
+                artifact.second_order_deconstruction_status,
+            ),
+        )
+        return cur.rowcount > 0
 
 
 def list_rail_artifacts_pending_deconstruction(
@@ -501,27 +876,23 @@ def list_rail_artifacts_pending_deconstruction(
     tenant_id: str,
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "SELECT artifact_id, tenant_id, session_id, source_card_id, artifact_text, "
-                "card_type, is_memorialized, operator_action, actioned_by, actioned_at, "
-                "second_order_deconstruction_status, second_order_nugget_ids, deconstructed_at "
-                "FROM qcr_rail_artifacts "
-                "WHERE tenant_id = %s AND second_order_deconstruction_status = 'pending' "
-                "ORDER BY actioned_at ASC LIMIT %s",
-                (tenant_id, limit),
-            )
-            rows = cur.fetchall() or []
-            cols = [
-                "artifact_id", "tenant_id", "session_id", "source_card_id", "artifact_text",
-                "card_type", "is_memorialized", "operator_action", "actioned_by", "actioned_at",
-                "second_order_deconstruction_status", "second_order_nugget_ids", "deconstructed_at",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT artifact_id, tenant_id, session_id, source_card_id, artifact_text, "
+            "card_type, is_memorialized, operator_action, actioned_by, actioned_at, "
+            "second_order_deconstruction_status, second_order_nugget_ids, deconstructed_at "
+            "FROM qcr_rail_artifacts "
+            "WHERE tenant_id = %s AND second_order_deconstruction_status = 'pending' "
+            "ORDER BY actioned_at ASC LIMIT %s",
+            (tenant_id, limit),
+        )
+        rows = cur.fetchall() or []
+        cols = [
+            "artifact_id", "tenant_id", "session_id", "source_card_id", "artifact_text",
+            "card_type", "is_memorialized", "operator_action", "actioned_by", "actioned_at",
+            "second_order_deconstruction_status", "second_order_nugget_ids", "deconstructed_at",
+        ]
+        return [dict(zip(cols, r)) for r in rows]
 
 
 def mark_artifact_deconstructed(
@@ -530,19 +901,15 @@ def mark_artifact_deconstructed(
     tenant_id: str,
     nugget_ids: List[str],
 ) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_rail_artifacts "
-                "SET second_order_deconstruction_status = 'complete', "
-                "    second_order_nugget_ids = %s, deconstructed_at = NOW() "
-                "WHERE artifact_id = %s AND tenant_id = %s",
-                (_json(nugget_ids), artifact_id, tenant_id),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE qcr_rail_artifacts "
+            "SET second_order_deconstruction_status = 'complete', "
+            "    second_order_nugget_ids = %s, deconstructed_at = NOW() "
+            "WHERE artifact_id = %s AND tenant_id = %s",
+            (_json(nugget_ids), artifact_id, tenant_id),
+        )
+        return cur.rowcount > 0
 
 
 def update_artifact_deconstruction_status(
@@ -552,17 +919,161 @@ def update_artifact_deconstruction_status(
     new_status: str,
 ) -> bool:
     """Transition artifact deconstruction status (pending → in_progress → complete/skipped)."""
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_rail_artifacts SET second_order_deconstruction_status = %s "
-                "WHERE artifact_id = %s AND tenant_id = %s",
-                (new_status, artifact_id, tenant_id),
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE qcr_rail_artifacts SET second_order_deconstruction_status = %s "
+            "WHERE artifact_id = %s AND tenant_id = %s",
+            (new_status, artifact_id, tenant_id),
+        )
+        return cur.rowcount > 0
+
+
+def claim_artifact_batch(
+    *,
+    limit: int,
+    lease_seconds: float,
+    max_attempts: int,
+    tenant_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Lease up to limit artifacts awaiting second-order deconstruction, oldest
+    actioned first, across all tenants unless tenant_id is given.
+
+    Claimed rows move to 'in_progress' with a lease; SKIP LOCKED keeps
+    concurrent workers' batches disjoint, and an expired lease makes a dead
+    worker's artifacts claimable again (infra/migrations/010). An expired
+    lease on an artifact with no attempts left is returned to 'pending'
+    with deconstruction_error set, in the same statement, rather than
+    being left 'in_progress' for good.
+    """
+    tenant_filter = "AND tenant_id = %s" if tenant_id else ""
+    params: List[Any] = [max_attempts]
+    if tenant_id:
+        params.append(tenant_id)
+    params += [lease_seconds, max_attempts]
+    if tenant_id:
+        params.append(tenant_id)
+    params.append(limit)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            f"""
+            WITH exhausted AS (
+                UPDATE qcr_rail_artifacts
+                SET second_order_deconstruction_status = 'pending',
+                    deconstruction_leased_until = NULL,
+                    deconstruction_error = COALESCE(deconstruction_error,
+                                                    'lease expired on final attempt')
+                WHERE second_order_deconstruction_status = 'in_progress'
+                  AND deconstruction_leased_until < NOW()
+                  AND deconstruction_attempts >= %s
+                  {tenant_filter}
             )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+            UPDATE qcr_rail_artifacts a
+            SET second_order_deconstruction_status = 'in_progress',
+                deconstruction_leased_until = NOW() + make_interval(secs => %s),
+                deconstruction_attempts = a.deconstruction_attempts + 1
+            FROM (
+                SELECT artifact_id
+                FROM qcr_rail_artifacts
+                WHERE (second_order_deconstruction_status = 'pending'
+                       OR (second_order_deconstruction_status = 'in_progress'
+                           AND deconstruction_leased_until < NOW()))
+                  AND deconstruction_attempts < %s
+                  {tenant_filter}
+                ORDER BY actioned_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            ) picked
+            WHERE a.artifact_id = picked.artifact_id
+            RETURNING a.artifact_id, a.tenant_id, a.session_id, a.source_card_id, a.artifact_text,
+                      a.card_type, a.is_memorialized, a.operator_action, a.actioned_by,
+                      a.actioned_at, a.deconstruction_attempts
+            """,
+            params,
+        )
+        rows = cur.fetchall()
+    cols = [
+        "artifact_id", "tenant_id", "session_id", "source_card_id", "artifact_text",
+        "card_type", "is_memorialized", "operator_action", "actioned_by",
+        "actioned_at", "deconstruction_attempts",
+    ]
+    return [dict(zip(cols, r)) for r in rows]
+
+
+def complete_artifact_batch(
+    outcomes: Sequence[Tuple[str, str, List[str]]],
+    *,
+    leases: Mapping[str, int],
+) -> int:
+    """
+    Record (artifact_id, status, nugget_ids) for many claimed artifacts in
+    one UPDATE ... FROM (VALUES ...). status is 'complete' or 'skipped'.
+
+    leases maps each artifact_id to the deconstruction_attempts it was
+    claimed at; a row is only updated while that lease is still held (still
+    'in_progress' at that attempt), so a worker whose lease expired and was
+    re-claimed cannot overwrite the new holder. Returns the number of rows
+    updated — fewer than len(outcomes) means a lease was lost.
+    """
+    if not outcomes:
+        return 0
+    execute_values = _load_execute_values()
+    with connection() as conn, conn.cursor() as cur:
+        updated = execute_values(
+            cur,
+            """
+            UPDATE qcr_rail_artifacts a
+            SET second_order_deconstruction_status = v.status,
+                second_order_nugget_ids = v.nugget_ids::jsonb,
+                deconstructed_at = CASE WHEN v.status = 'complete' THEN NOW() ELSE a.deconstructed_at END,
+                deconstruction_leased_until = NULL,
+                deconstruction_error = NULL
+            FROM (VALUES %s) AS v(artifact_id, attempts, status, nugget_ids)
+            WHERE a.artifact_id = v.artifact_id
+              AND a.second_order_deconstruction_status = 'in_progress'
+              AND a.deconstruction_attempts = v.attempts
+            RETURNING a.artifact_id
+            """,
+            [
+                (artifact_id, leases[artifact_id], status, _json(nugget_ids))
+                for artifact_id, status, nugget_ids in outcomes
+            ],
+            page_size=_BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    return len(updated)
+
+
+def release_artifact_batch(*, leases: Mapping[str, int], error: str) -> int:
+    """
+    Give claimed artifacts back to the queue after a failed attempt.
+
+    leases maps artifact_id to the deconstruction_attempts it was claimed
+    at; artifacts whose lease has since passed to another worker are left
+    alone. Returns the number of rows released.
+    """
+    if not leases:
+        return 0
+    execute_values = _load_execute_values()
+    with connection() as conn, conn.cursor() as cur:
+        released = execute_values(
+            cur,
+            """
+            UPDATE qcr_rail_artifacts a
+            SET second_order_deconstruction_status = 'pending',
+                deconstruction_leased_until = NULL,
+                deconstruction_error = v.error
+            FROM (VALUES %s) AS v(artifact_id, attempts, error)
+            WHERE a.artifact_id = v.artifact_id
+              AND a.second_order_deconstruction_status = 'in_progress'
+              AND a.deconstruction_attempts = v.attempts
+            RETURNING a.artifact_id
+            """,
+            [(artifact_id, attempts, error) for artifact_id, attempts in leases.items()],
+            page_size=_BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    return len(released)
 
 
 def insert_audit_event(
@@ -575,22 +1086,50 @@ def insert_audit_event(
     source_object_id: Optional[str] = None,
     payload: Optional[Dict[str, Any]] = None,
 ) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "INSERT INTO qcr_audit_events "
-                "(audit_id, tenant_id, event_kind, actor_id, source_object_type, source_object_id, payload) "
-                "VALUES (%s,%s,%s,%s,%s,%s,%s) ON CONFLICT (audit_id) DO NOTHING",
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO qcr_audit_events "
+            "(audit_id, tenant_id, event_kind, actor_id, source_object_type, source_object_id, payload) "
+            "VALUES (%s,%s,%s,%s,%s,%s,%s) ON CONFLICT (audit_id) DO NOTHING",
+            (
+                audit_id, tenant_id, event_kind, actor_id,
+                source_object_type, source_object_id,
+                _json(payload or {}),
+            ),
+        )
+        return cur.rowcount > 0
+
+
+def insert_audit_events(events: Sequence[Dict[str, Any]]) -> int:
+    """
+    Insert many audit events with multi-row INSERTs. Each dict takes
+    insert_audit_event's keyword arguments. Returns the number inserted.
+    """
+    if not events:
+        return 0
+    execute_values = _load_execute_values()
+    with connection() as conn, conn.cursor() as cur:
+        inserted = execute_values(
+            cur,
+            """
+            INSERT INTO qcr_audit_events
+                (audit_id, tenant_id, event_kind, actor_id, source_object_type, source_object_id, payload)
+            VALUES %s
+            ON CONFLICT (audit_id) DO NOTHING
+            RETURNING audit_id
+            """,
+            [
                 (
-                    audit_id, tenant_id, event_kind, actor_id,
-                    source_object_type, source_object_id,
-                    _json(payload or {}),
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+                    e["audit_id"], e["tenant_id"], e["event_kind"], e.get("actor_id"),
+                    e.get("source_object_type"), e.get("source_object_id"),
+                    _json(e.get("payload") or {}),
+                )
+                for e in events
+            ],
+            page_size=_BULK_PAGE_SIZE,
+            fetch=True,
+        )
+    return len(inserted)
 
 
 # ---------------------------------------------------------------------------
@@ -598,31 +1137,31 @@ def insert_audit_event(
 # ---------------------------------------------------------------------------
 
 def insert_promotion_candidate(candidate: "PromotionCandidate") -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO qcr_promotion_candidates
-                    (candidate_id, tenant_id, source_artifact_id, source_conclusion_id,
-                     candidate_text, proposed_claim_type,
-                     nominated_by, nominated_by_user_id, nominated_at, nomination_rationale,
-                     review_status)
-                VALUES (%s,%s,%s,%s, %s,%s, %s,%s,%s,%s, %s)
-                ON CONFLICT (candidate_id) DO NOTHING
-                """,
-                (
-                    candidate.candidate_id, candidate.tenant_id,
-                    candidate.source_artifact_id, candidate.source_conclusion_id,
-                    candidate.candidate_text, candidate.proposed_claim_type,
-                    candidate.nominated_by, candidate.nominated_by_user_id,
-                    candidate.nominated_at, candidate.nomination_rationale,
-                    candidate.review_status,
-                ),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO qcr_promotion_candidates
+                (candidate_id, tenant_id, source_artifact_id, source_conclusion_id,
+                 candidate_text, proposed_claim_type,
+                 nominated_by, nominated_by_user_id, nominated_at, nomination_rationale,
+                 review_status)
+            VALUES (%s,%s,%s,%s, %s,%s, %s,%s,%s,%s, %s)
+            ON CONFLICT (candidate_id) DO NOTHING
+            """,
+            (
+                candidate.candidate_id, candidate.tenant_id,
+                candidate.source_artifact_id, candidate.source_conclusion_id,
+                candidate.candidate_text, candidate.proposed_claim_type,
+                candidate.nominated_by, candidate.nominated_by_user_id,
+                candidate.nominated_at, candidate.nomination_rationale,
+                candidate.review_status,
+            ),
+        )
+        inserted = cur.rowcount > 0
+    if inserted:
+        # Packets list the tenant's pending promotions, whatever the session.
+        _invalidate_session_packets(candidate.tenant_id)
+    return inserted
 
 
 def get_promotion_candidate(
@@ -631,30 +1170,26 @@ def get_promotion_candidate(
     tenant_id: str,
 ) -> Optional[Dict[str, Any]]:
     """Fetch a single promotion candidate by (candidate_id, tenant_id)."""
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "SELECT candidate_id, tenant_id, source_artifact_id, source_conclusion_id, "
-                "candidate_text, proposed_claim_type, nominated_by, nominated_by_user_id, "
-                "nominated_at, nomination_rationale, review_status, "
-                "reviewed_by, reviewed_at, rejection_reason, canon_nugget_id "
-                "FROM qcr_promotion_candidates "
-                "WHERE candidate_id = %s AND tenant_id = %s",
-                (candidate_id, tenant_id),
-            )
-            row = cur.fetchone()
-            if row is None:
-                return None
-            cols = [
-                "candidate_id", "tenant_id", "source_artifact_id", "source_conclusion_id",
-                "candidate_text", "proposed_claim_type", "nominated_by", "nominated_by_user_id",
-                "nominated_at", "nomination_rationale", "review_status",
-                "reviewed_by", "reviewed_at", "rejection_reason", "canon_nugget_id",
-            ]
-            return dict(zip(cols, row))
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT candidate_id, tenant_id, source_artifact_id, source_conclusion_id, "
+            "candidate_text, proposed_claim_type, nominated_by, nominated_by_user_id, "
+            "nominated_at, nomination_rationale, review_status, "
+            "reviewed_by, reviewed_at, rejection_reason, canon_nugget_id "
+            "FROM qcr_promotion_candidates "
+            "WHERE candidate_id = %s AND tenant_id = %s",
+            (candidate_id, tenant_id),
+        )
+        row = cur.fetchone()
+        if row is None:
+            return None
+        cols = [
+            "candidate_id", "tenant_id", "source_artifact_id", "source_conclusion_id",
+            "candidate_text", "proposed_claim_type", "nominated_by", "nominated_by_user_id",
+            "nominated_at", "nomination_rationale", "review_status",
+            "reviewed_by", "reviewed_at", "rejection_reason", "canon_nugget_id",
+        ]
+        return dict(zip(cols, row))
 
 
 def list_promotion_candidates(
@@ -663,29 +1198,25 @@ def list_promotion_candidates(
     review_status: str = "pending",
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "SELECT candidate_id, tenant_id, source_artifact_id, source_conclusion_id, "
-                "candidate_text, proposed_claim_type, nominated_by, nominated_by_user_id, "
-                "nominated_at, nomination_rationale, review_status, "
-                "reviewed_by, reviewed_at, rejection_reason, canon_nugget_id "
-                "FROM qcr_promotion_candidates "
-                "WHERE tenant_id = %s AND review_status = %s "
-                "ORDER BY nominated_at DESC LIMIT %s",
-                (tenant_id, review_status, limit),
-            )
-            rows = cur.fetchall() or []
-            cols = [
-                "candidate_id", "tenant_id", "source_artifact_id", "source_conclusion_id",
-                "candidate_text", "proposed_claim_type", "nominated_by", "nominated_by_user_id",
-                "nominated_at", "nomination_rationale", "review_status",
-                "reviewed_by", "reviewed_at", "rejection_reason", "canon_nugget_id",
-            ]
-            return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT candidate_id, tenant_id, source_artifact_id, source_conclusion_id, "
+            "candidate_text, proposed_claim_type, nominated_by, nominated_by_user_id, "
+            "nominated_at, nomination_rationale, review_status, "
+            "reviewed_by, reviewed_at, rejection_reason, canon_nugget_id "
+            "FROM qcr_promotion_candidates "
+            "WHERE tenant_id = %s AND review_status = %s "
+            "ORDER BY nominated_at DESC LIMIT %s",
+            (tenant_id, review_status, limit),
+        )
+        rows = cur.fetchall() or []
+        cols = [
+            "candidate_id", "tenant_id", "source_artifact_id", "source_conclusion_id",
+            "candidate_text", "proposed_claim_type", "nominated_by", "nominated_by_user_id",
+            "nominated_at", "nomination_rationale", "review_status",
+            "reviewed_by", "reviewed_at", "rejection_reason", "canon_nugget_id",
+        ]
+        return [dict(zip(cols, r)) for r in rows]
 
 
 def update_candidate_review(
@@ -697,17 +1228,16 @@ def update_candidate_review(
     rejection_reason: Optional[str] = None,
     canon_nugget_id: Optional[str] = None,
 ) -> bool:
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE qcr_promotion_candidates "
-                "SET review_status = %s, reviewed_by = %s, reviewed_at = NOW(), "
-                "    rejection_reason = %s, canon_nugget_id = %s "
-                "WHERE candidate_id = %s AND tenant_id = %s",
-                (review_status, reviewed_by, rejection_reason, canon_nugget_id,
-                 candidate_id, tenant_id),
-            )
-            return cur.rowcount > 0
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE qcr_promotion_candidates "
+            "SET review_status = %s, reviewed_by = %s, reviewed_at = NOW(), "
+            "    rejection_reason = %s, canon_nugget_id = %s "
+            "WHERE candidate_id = %s AND tenant_id = %s",
+            (review_status, reviewed_by, rejection_reason, canon_nugget_id,
+             candidate_id, tenant_id),
+        )
+        updated = cur.rowcount > 0
+    if updated:
+        _invalidate_session_packets(tenant_id)
+    return updated
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import logging
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.service.qualitative_capture.repository import (
     list_conclusions,
     list_nuggets,
+    list_nuggets_by_category,
     list_preserved_ideas_for_session,
     list_promotion_candidates,
     search_nuggets,
+    stream_nuggets,
 )
 
 logger = logging.getLogger(__name__)
@@ -22,23 +30,64 @@ _CAUSAL_TYPES = ["causal_claim", "tradeoff", "threshold_condition"]
 _STRUCTURAL_TYPES = ["constraint", "heuristic"]
 
 
-def retrieve_doctrine(
+# Categories answered by retrieve_categories. "open" is the corpus's open
+# loops: its claim types plus anything at or below _OPEN_MAX_CONFIDENCE,
+# newest first, the same rule as the session summary's open_questions
+# (infra/migrations/009). Every other category ranks by confidence.
+CATEGORIES: Dict[str, List[str]] = {
+    "doctrine": _DOCTRINE_TYPES,
+    "risks": _RISK_TYPES,
+    "opportunities": _OPPORTUNITY_TYPES,
+    "decisions": _DECISION_TYPES,
+    "causal": _CAUSAL_TYPES,
+    "structural": _STRUCTURAL_TYPES,
+    "open": ["threshold_condition"],
+}
+_OPEN_CATEGORY = "open"
+_OPEN_MAX_CONFIDENCE = 0.50
+
+
+def retrieve_categories(
     *,
     tenant_id: str,
+    categories: Iterable[str],
     session_id: Optional[str] = None,
     limit: int = 20,
-) -> List[Dict]:
-    """Return all doctrine-class claims (doctrine, principle, declaration_of_value, axiom)."""
+) -> Dict[str, List[Dict]]:
+    """
+    Top claims for several categories (keys of CATEGORIES) in one round trip.
+
+    Returns {category: nuggets} for every requested category. Raises
+    ValueError for an unknown category; a failed query returns empty lists.
+    """
+    wanted = list(dict.fromkeys(categories))
+    unknown = [c for c in wanted if c not in CATEGORIES]
+    if unknown:
+        raise ValueError(f"unknown category: {', '.join(unknown)}")
     try:
-        return list_nuggets(
+        return list_nuggets_by_category(
             tenant_id=tenant_id,
+            categories={c: CATEGORIES[c] for c in wanted},
             session_id=session_id,
-            claim_type=None,
-            limit=limit * len(_DOCTRINE_TYPES),
+            open_category=_OPEN_CATEGORY,
+            open_max_confidence=_OPEN_MAX_CONFIDENCE,
+            limit=limit,
         )
     except Exception:
-        logger.exception("retrieval: retrieve_doctrine failed for tenant %s", tenant_id)
-        return []
+        logger.exception("retrieval: retrieve_categories %s failed for tenant %s", wanted, tenant_id)
+        return {c: [] for c in wanted}
+
+
+def retrieve_doctrine(
+    *,
+    tenant_id: str,
+    session_id: Optional[str] = None,
+    limit: int = 20,
+) -> List[Dict]:
+    """Return doctrine-class claims (doctrine, principle, declaration_of_value, axiom)."""
+    return retrieve_categories(
+        tenant_id=tenant_id, categories=["doctrine"], session_id=session_id, limit=limit,
+    )["doctrine"]
 
 
 def retrieve_risks(
@@ -48,17 +97,9 @@ def retrieve_risks(
     limit: int = 20,
 ) -> List[Dict]:
     """Return risk-class claims (risk, threat, diagnostic_signal)."""
-    results = []
-    for ct in _RISK_TYPES:
-        try:
-            results.extend(list_nuggets(
-                tenant_id=tenant_id, session_id=session_id,
-                claim_type=ct, limit=limit,
-            ))
-        except Exception:
-            logger.exception("retrieval: retrieve_risks failed for claim_type %s", ct)
-    results.sort(key=lambda r: r.get("confidence_score", 0), reverse=True)
-    return results[:limit]
+    return retrieve_categories(
+        tenant_id=tenant_id, categories=["risks"], session_id=session_id, limit=limit,
+    )["risks"]
 
 
 def retrieve_opportunities(
@@ -68,14 +109,9 @@ def retrieve_opportunities(
     limit: int = 20,
 ) -> List[Dict]:
     """Return opportunity claims."""
-    try:
-        return list_nuggets(
-            tenant_id=tenant_id, session_id=session_id,
-            claim_type="opportunity", limit=limit,
-        )
-    except Exception:
-        logger.exception("retrieval: retrieve_opportunities failed for tenant %s", tenant_id)
-        return []
+    return retrieve_categories(
+        tenant_id=tenant_id, categories=["opportunities"], session_id=session_id, limit=limit,
+    )["opportunities"]
 
 
 def retrieve_decisions(
@@ -85,17 +121,9 @@ def retrieve_decisions(
     limit: int = 20,
 ) -> List[Dict]:
     """Return decision-class claims (objective, tactic, best_practice)."""
-    results = []
-    for ct in _DECISION_TYPES:
-        try:
-            results.extend(list_nuggets(
-                tenant_id=tenant_id, session_id=session_id,
-                claim_type=ct, limit=limit,
-            ))
-        except Exception:
-            logger.exception("retrieval: retrieve_decisions failed for claim_type %s", ct)
-    results.sort(key=lambda r: r.get("confidence_score", 0), reverse=True)
-    return results[:limit]
+    return retrieve_categories(
+        tenant_id=tenant_id, categories=["decisions"], session_id=session_id, limit=limit,
+    )["decisions"]
 
 
 def retrieve_open_questions(
@@ -110,23 +138,9 @@ def retrieve_open_questions(
     These are signals that have been captured but not yet corroborated or resolved.
     Seed-confidence items are the most likely candidates for follow-up.
     """
-    try:
-        results = list_nuggets(
-            tenant_id=tenant_id, session_id=session_id,
-            claim_type="threshold_condition", limit=limit,
-        )
-        seed_items = list_nuggets(
-            tenant_id=tenant_id, session_id=session_id,
-            min_confidence=0.0, limit=limit * 2,
-        )
-        seed_only = [r for r in seed_items if r.get("confidence_score", 1) <= 0.50]
-        combined = {r["nugget_id"]: r for r in results + seed_only}
-        out = list(combined.values())
-        out.sort(key=lambda r: r.get("created_at", ""), reverse=True)
-        return out[:limit]
-    except Exception:
-        logger.exception("retrieval: retrieve_open_questions failed for tenant %s", tenant_id)
-        return []
+    return retrieve_categories(
+        tenant_id=tenant_id, categories=["open"], session_id=session_id, limit=limit,
+    )["open"]
 
 
 def retrieve_rail_candidates(
@@ -158,7 +172,6 @@ def retrieve_by_domain(
 ) -> List[Dict]:
     """Return all claims for a given domain, ordered by confidence."""
     try:
-        conn = __import__("src.service.db.postgres", fromlist=["get_conn"]).get_conn()
         conditions = ["tenant_id = %s", "domain = %s", "confidence_score >= %s"]
         params = [tenant_id, domain, min_confidence]
         if session_id:
@@ -172,52 +185,206 @@ def retrieve_by_domain(
             "FROM qcr_atomic_nuggets WHERE " + " AND ".join(conditions) +
             " ORDER BY confidence_score DESC, created_at DESC LIMIT %s"
         )
-        try:
-            with conn, conn.cursor() as cur:
-                cur.execute(sql, params)
-                rows = cur.fetchall() or []
-                cols = [
-                    "nugget_id", "tenant_id", "session_id", "source_event_id", "claim_text",
-                    "claim_type", "domain", "confidence_level", "confidence_score", "polarity",
-                    "durability_class", "selection_method", "rail_candidate", "created_at",
-                ]
-                return [dict(zip(cols, r)) for r in rows]
-        finally:
-            conn.close()
+        connection = __import__("src.service.db.postgres", fromlist=["connection"]).connection
+        with connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall() or []
+            cols = [
+                "nugget_id", "tenant_id", "session_id", "source_event_id", "claim_text",
+                "claim_type", "domain", "confidence_level", "confidence_score", "polarity",
+                "durability_class", "selection_method", "rail_candidate", "created_at",
+            ]
+            return [dict(zip(cols, r)) for r in rows]
     except Exception:
         logger.exception("retrieval: retrieve_by_domain failed for domain %s", domain)
         return []
 
 
-def search_claims(
+@dataclass
+class NuggetPage:
+    """One page of search or listing results."""
+    nuggets: List[Dict] = field(default_factory=list)
+    next_cursor: Optional[str] = None    # None on the last page
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"nuggets": self.nuggets, "next_cursor": self.next_cursor}
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("invalid cursor")
+    return values
+
+
+def _encode_search_cursor(row: Dict) -> str:
+    # The rank is a rounded numeric; as text it round-trips exactly.
+    return _encode_cursor([str(row["search_rank"]), row["nugget_id"]])
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[Decimal, str]:
+    try:
+        rank, nugget_id = _decode_cursor(cursor, 2)
+        if not isinstance(rank, str):
+            raise ValueError("search rank must be text")
+        rank = Decimal(rank)
+        if not rank.is_finite():
+            raise ValueError("search rank must be finite")
+        return rank, str(nugget_id)
+    except (ValueError, TypeError, InvalidOperation) as e:
+        raise ValueError("invalid search cursor") from e
+
+
+def _encode_list_cursor(row: Dict) -> str:
+    created_at = row["created_at"]
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    return _encode_cursor([row["confidence_score"], created_at, row["nugget_id"]])
+
+
+def _decode_list_cursor(cursor: str) -> Tuple[float, datetime, str]:
+    try:
+        confidence, created_at, nugget_id = _decode_cursor(cursor, 3)
+        return float(confidence), datetime.fromisoformat(created_at), str(nugget_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid list cursor") from e
+
+
+def search_claims_page(
     *,
     tenant_id: str,
     query: str,
     claim_types: Optional[List[str]] = None,
     domain: Optional[str] = None,
     session_id: Optional[str] = None,
+    cursor: Optional[str] = None,
     limit: int = 20,
-) -> List[Dict]:
+) -> NuggetPage:
     """
-    Keyword search across the claim corpus.
+    One page of full-text search results, best match first.
 
-    Matches all words in the query against claim_text (case-insensitive).
-    Optional filters by claim_type list, domain, and session.
+    Pass the previous page's next_cursor to continue. The rows carry the
+    same columns as list_claims_page; the rank they were ordered by lives
+    only in the cursor. Raises ValueError for a malformed cursor; a failed
+    query returns an empty page.
     """
     if not query or not query.strip():
-        return []
+        return NuggetPage()
+    after = _decode_search_cursor(cursor) if cursor else None
     try:
-        return search_nuggets(
+        # One extra row tells us whether another page exists.
+        rows = search_nuggets(
             tenant_id=tenant_id,
             query=query,
             claim_types=claim_types,
             domain=domain,
             session_id=session_id,
-            limit=limit,
+            after=after,
+            limit=limit + 1,
         )
     except Exception:
         logger.exception("retrieval: search_claims failed for tenant %s query %r", tenant_id, query)
-        return []
+        return NuggetPage()
+    page = rows[:limit]
+    next_cursor = _encode_search_cursor(page[-1]) if len(rows) > limit else None
+    for row in page:
+        row.pop("search_rank", None)
+    return NuggetPage(nuggets=page, next_cursor=next_cursor)
+
+
+def search_claims(
+    *,
+    tenant_id: str,
+    query: str,
+    claim_types: Optional[List[str]] = None,
+    domain: Optional[str] = None,
+    session_id: Optional[str] = None,
+    limit: int = 20,
+) -> List[Dict]:
+    """
+    Full-text search across the claim corpus: the first page of
+    search_claims_page.
+
+    All query words must match (stemmed, case-insensitive), ranked by text
+    relevance blended with confidence. Optional filters by claim_type list,
+    domain, and session.
+    """
+    return search_claims_page(
+        tenant_id=tenant_id,
+        query=query,
+        claim_types=claim_types,
+        domain=domain,
+        session_id=session_id,
+        limit=limit,
+    ).nuggets
+
+
+def list_claims_page(
+    *,
+    tenant_id: str,
+    session_id: Optional[str] = None,
+    claim_type: Optional[str] = None,
+    min_confidence: float = 0.0,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> NuggetPage:
+    """
+    One page of a tenant's claims, best first (confidence, newest, nugget_id).
+
+    Pass the previous page's next_cursor to continue; every page costs the
+    same however deep it is. Raises ValueError for a malformed cursor; a
+    failed query returns an empty page.
+    """
+    after = _decode_list_cursor(cursor) if cursor else None
+    try:
+        rows = list_nuggets(
+            tenant_id=tenant_id,
+            session_id=session_id,
+            claim_type=claim_type,
+            min_confidence=min_confidence,
+            after=after,
+            limit=limit + 1,
+        )
+    except Exception:
+        logger.exception("retrieval: list_claims_page failed for tenant %s", tenant_id)
+        return NuggetPage()
+    if len(rows) <= limit:
+        return NuggetPage(nuggets=rows)
+    page = rows[:limit]
+    return NuggetPage(nuggets=page, next_cursor=_encode_list_cursor(page[-1]))
+
+
+def _json_default(v: Any) -> Any:
+    if isinstance(v, datetime):
+        return v.isoformat()
+    return str(v)
+
+
+def export_claims_ndjson(
+    *,
+    tenant_id: str,
+    session_id: Optional[str] = None,
+    claim_type: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Every claim for the tenant as NDJSON lines, oldest first, streamed from
+    a server-side cursor. If the export fails part-way, a final
+    {"error": "export_failed"} line marks it as truncated.
+    """
+    try:
+        for row in stream_nuggets(tenant_id=tenant_id, session_id=session_id, claim_type=claim_type):
+            yield json.dumps(row, default=_json_default) + "\n"
+    except Exception:
+        logger.exception("retrieval: export failed for tenant %s", tenant_id)
+        yield json.dumps({"error": "export_failed"}) + "\n"
 
 
 def retrieve_preserved_ideas(
@@ -1,19 +1,50 @@
+"""
+Second-order deconstruction: rail artifacts -> generation_depth=2 nuggets.
+
+qcr_rail_artifacts is the queue (infra/migrations/010). Workers lease
+pending artifacts in batches with FOR UPDATE SKIP LOCKED, deconstruct them
+in memory, and write the whole batch's nuggets and status marks with two
+multi-row statements in one transaction; its audit events go to the
+buffered audit writer (qualitative_capture.audit) when that commits. A batch that
+fails to persist is released back to pending with its error and retried
+until EXECALC_SECOND_ORDER_MAX_ATTEMPTS; a crashed worker's leases expire
+after EXECALC_SECOND_ORDER_LEASE_SECONDS. Status writes check the lease, so
+a batch that outlived one is rolled back rather than written twice.
+
+Workers run in a dedicated process, across all tenants:
+
+    python -m src.service.qualitative_capture.second_order --workers 4
+
+and log their throughput (artifacts/sec) every --report-seconds.
+POST /qcr/second-order/run drains one batch for a single tenant through
+process_pending_artifacts.
+"""
+
 from __future__ import annotations
 
+import argparse
 import dataclasses
 import logging
+import os
+import signal
+import sys
+import threading
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.service import telemetry
+from src.service.db.postgres import unit_of_work
+from src.service.qualitative_capture.audit import record_audits
 from src.service.qualitative_capture.deconstructor import deconstruct_event
 from src.service.qualitative_capture.models import AtomicNugget, ConversationEvent
 from src.service.qualitative_capture.repository import (
-    insert_audit_event,
-    insert_nugget,
-    list_rail_artifacts_pending_deconstruction,
-    mark_artifact_deconstructed,
-    update_artifact_deconstruction_status,
+    claim_artifact_batch,
+    complete_artifact_batch,
+    insert_nuggets,
+    release_artifact_batch,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,6 +58,193 @@ _MACHINE_CONFIDENCE_LEVEL = "developing"
 _SYNTHETIC_USER_ID = "system:second_order"
 _SYNTHETIC_ROLE = "system"
 
+_DEFAULT_BATCH_SIZE = 50
+_DEFAULT_LEASE_SECONDS = 300.0
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_POLL_SECONDS = 5.0
+_DEFAULT_REPORT_SECONDS = 60.0
+
+
+def _lease_seconds() -> float:
+    return float(os.getenv("EXECALC_SECOND_ORDER_LEASE_SECONDS", str(_DEFAULT_LEASE_SECONDS)))
+
+
+def _max_attempts() -> int:
+    return int(os.getenv("EXECALC_SECOND_ORDER_MAX_ATTEMPTS", str(_DEFAULT_MAX_ATTEMPTS)))
+
+
+# ---------------------------------------------------------------------------
+# One batch
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SecondOrderSummary:
+    # elapsed_seconds sums batch time, so for a merged pool summary
+    # artifacts_per_second is per worker; SecondOrderWorkerPool.report()
+    # gives the wall-clock rate.
+    claimed: int = 0
+    processed: int = 0
+    nuggets_created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def artifacts_per_second(self) -> float:
+        done = self.processed + self.skipped
+        return done / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def merge(self, other: "SecondOrderSummary") -> None:
+        self.claimed += other.claimed
+        self.processed += other.processed
+        self.nuggets_created += other.nuggets_created
+        self.skipped += other.skipped
+        self.failed += other.failed
+        self.elapsed_seconds += other.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "claimed": self.claimed,
+            "processed": self.processed,
+            "nuggets_created": self.nuggets_created,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "artifacts_per_second": round(self.artifacts_per_second, 1),
+        }
+
+
+def deconstruct_artifact_batch(
+    *,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    tenant_id: Optional[str] = None,
+) -> SecondOrderSummary:
+    """
+    Lease and deconstruct one batch of pending artifacts, across all
+    tenants unless tenant_id is given. Returns what was done; elapsed_seconds
+    covers the claim and the write.
+    """
+    started = time.perf_counter()
+    summary = SecondOrderSummary()
+    rows = claim_artifact_batch(
+        limit=batch_size,
+        lease_seconds=_lease_seconds(),
+        max_attempts=_max_attempts(),
+        tenant_id=tenant_id,
+    )
+    summary.claimed = len(rows)
+    if rows:
+        _deconstruct_and_persist(rows, summary)
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
+
+
+def _deconstruct_and_persist(rows: List[Dict[str, Any]], summary: SecondOrderSummary) -> None:
+    leases = {artifact["artifact_id"]: artifact["deconstruction_attempts"] for artifact in rows}
+    nuggets: List[AtomicNugget] = []
+    audits: List[Dict[str, Any]] = []
+    outcomes: List[Tuple[str, str, List[str]]] = []
+
+    with telemetry.span("second_order_deconstruct"):
+        for artifact in rows:
+            artifact_id = artifact["artifact_id"]
+            try:
+                produced = _deconstruct_one_artifact(artifact)
+            except Exception as e:
+                logger.exception("second_order: deconstruction failed for artifact %s", artifact_id)
+                summary.failed += 1
+                _release({artifact_id: leases[artifact_id]}, e)
+                continue
+            _collect(artifact, produced, nuggets, audits, outcomes)
+
+    if not outcomes:
+        return
+    held = {artifact_id: leases[artifact_id] for artifact_id, _, _ in outcomes}
+    try:
+        with telemetry.span("second_order_persist"), unit_of_work() as uow:
+            uow.begin_writes()
+            created = insert_nuggets(nuggets)
+            completed = complete_artifact_batch(outcomes, leases=held)
+            if completed < len(outcomes):
+                # Another worker re-claimed an artifact after our lease
+                # expired; roll the whole batch back so its nuggets are
+                # not written twice.
+                raise RuntimeError(
+                    f"lease lost on {len(outcomes) - completed} of {len(outcomes)} artifacts"
+                )
+            record_audits(audits)
+    except Exception as e:
+        logger.exception("second_order: batch write failed for %d artifacts", len(outcomes))
+        summary.failed += len(outcomes)
+        _release(held, e)
+        return
+
+    summary.nuggets_created += created
+    for _, status, _ in outcomes:
+        if status == "skipped":
+            summary.skipped += 1
+        else:
+            summary.processed += 1
+
+
+def _collect(
+    artifact: Dict[str, Any],
+    nuggets: List[AtomicNugget],
+    batch_nuggets: List[AtomicNugget],
+    audits: List[Dict[str, Any]],
+    outcomes: List[Tuple[str, str, List[str]]],
+) -> None:
+    """Append one artifact's nuggets, audit events, and final status to the batch."""
+    artifact_id = artifact["artifact_id"]
+    tenant_id = artifact["tenant_id"]
+    audits.append(_audit_row(tenant_id, "artifact.deconstruction_started", artifact_id))
+
+    if not nuggets:
+        audits.append(_audit_row(
+            tenant_id, "artifact.deconstruction_skipped", artifact_id,
+            payload={"reason": "no_claims_detected"},
+        ))
+        outcomes.append((artifact_id, "skipped", []))
+        return
+
+    batch_nuggets.extend(nuggets)
+    for nugget in nuggets:
+        audits.append(_audit_row(
+            tenant_id, "nugget.created", artifact_id,
+            payload={"nugget_id": nugget.nugget_id, "claim_type": nugget.claim_type},
+        ))
+    audits.append(_audit_row(
+        tenant_id, "artifact.deconstruction_complete", artifact_id,
+        payload={"nugget_count": len(nuggets)},
+    ))
+    outcomes.append((artifact_id, "complete", [n.nugget_id for n in nuggets]))
+
+
+def _release(leases: Dict[str, int], error: Exception) -> None:
+    try:
+        release_artifact_batch(
+            leases=leases,
+            error=f"{error.__class__.__name__}: {error}"[:500],
+        )
+    except Exception:
+        logger.exception("second_order: release failed for %d artifacts; leases will expire", len(leases))
+
+
+def _audit_row(
+    tenant_id: str,
+    event_kind: str,
+    artifact_id: str,
+    *,
+    payload: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return {
+        "audit_id": uuid.uuid4().hex,
+        "tenant_id": tenant_id,
+        "event_kind": event_kind,
+        "source_object_type": "rail_artifact",
+        "source_object_id": artifact_id,
+        "payload": payload or {},
+    }
+
 
 def process_pending_artifacts(
     *,
@@ -36,111 +254,25 @@ def process_pending_artifacts(
     """
     Run one batch of second-order deconstruction for a tenant.
 
-    Picks up to batch_size artifacts in 'pending' status, ordered by actioned_at
+    Claims up to batch_size pending artifacts, ordered by actioned_at
     (oldest first).  Each artifact is converted into a synthetic ConversationEvent
     and run through the standard deconstructor.  Resulting nuggets receive
     generation_depth=2 and a confidence floor derived from is_memorialized.
 
-    Returns a summary dict: {processed, nuggets_created, skipped, failed}.
+    Returns SecondOrderSummary.to_dict(): {claimed, processed, nuggets_created,
+    skipped, failed, artifacts_per_second}.
     Depth limit is enforced at artifact creation time — this worker never writes
     generation_depth > 2 and rail artifacts derived from depth-2 nuggets should
     not be queued for second-order deconstruction.
     """
-    summary: Dict[str, int] = {
-        "processed": 0,
-        "nuggets_created": 0,
-        "skipped": 0,
-        "failed": 0,
-    }
-
     try:
-        artifacts = list_rail_artifacts_pending_deconstruction(
-            tenant_id=tenant_id, limit=batch_size
-        )
+        summary = deconstruct_artifact_batch(batch_size=batch_size, tenant_id=tenant_id)
     except Exception:
         logger.exception(
-            "second_order: failed to load pending artifacts for tenant %s", tenant_id
+            "second_order: failed to claim pending artifacts for tenant %s", tenant_id
         )
-        return summary
-
-    for artifact in artifacts:
-        artifact_id = artifact["artifact_id"]
-        try:
-            _process_artifact(artifact, tenant_id, summary)
-        except Exception:
-            logger.exception(
-                "second_order: unhandled error for artifact %s tenant %s",
-                artifact_id, tenant_id,
-            )
-            try:
-                update_artifact_deconstruction_status(
-                    artifact_id=artifact_id, tenant_id=tenant_id, new_status="pending"
-                )
-            except Exception:
-                pass
-            summary["failed"] += 1
-
-    return summary
-
-
-def _process_artifact(artifact: Dict, tenant_id: str, summary: Dict) -> None:
-    artifact_id = artifact["artifact_id"]
-
-    update_artifact_deconstruction_status(
-        artifact_id=artifact_id, tenant_id=tenant_id, new_status="in_progress"
-    )
-    _audit(
-        tenant_id=tenant_id,
-        event_kind="artifact.deconstruction_started",
-        source_object_type="rail_artifact",
-        source_object_id=artifact_id,
-    )
-
-    nuggets = _deconstruct_one_artifact(artifact)
-
-    if not nuggets:
-        update_artifact_deconstruction_status(
-            artifact_id=artifact_id, tenant_id=tenant_id, new_status="skipped"
-        )
-        _audit(
-            tenant_id=tenant_id,
-            event_kind="artifact.deconstruction_skipped",
-            source_object_type="rail_artifact",
-            source_object_id=artifact_id,
-            payload={"reason": "no_claims_detected"},
-        )
-        summary["skipped"] += 1
-        return
-
-    nugget_ids: List[str] = []
-    for nugget in nuggets:
-        try:
-            insert_nugget(nugget)
-            nugget_ids.append(nugget.nugget_id)
-            _audit(
-                tenant_id=tenant_id,
-                event_kind="nugget.created",
-                source_object_type="rail_artifact",
-                source_object_id=artifact_id,
-                payload={"nugget_id": nugget.nugget_id, "claim_type": nugget.claim_type},
-            )
-            summary["nuggets_created"] += 1
-        except Exception:
-            logger.exception(
-                "second_order: insert_nugget failed for artifact %s", artifact_id
-            )
-
-    mark_artifact_deconstructed(
-        artifact_id=artifact_id, tenant_id=tenant_id, nugget_ids=nugget_ids
-    )
-    _audit(
-        tenant_id=tenant_id,
-        event_kind="artifact.deconstruction_complete",
-        source_object_type="rail_artifact",
-        source_object_id=artifact_id,
-        payload={"nugget_count": len(nugget_ids)},
-    )
-    summary["processed"] += 1
+        summary = SecondOrderSummary()
+    return summary.to_dict()
 
 
 def _deconstruct_one_artifact(artifact: Dict) -> List[AtomicNugget]:
@@ -180,24 +312,154 @@ def _deconstruct_one_artifact(artifact: Dict) -> List[AtomicNugget]:
     ]
 
 
-def _audit(
-    *,
-    tenant_id: str,
-    event_kind: str,
-    source_object_type: Optional[str] = None,
-    source_object_id: Optional[str] = None,
-    payload: Optional[Dict] = None,
-) -> None:
-    try:
-        insert_audit_event(
-            audit_id=uuid.uuid4().hex,
-            tenant_id=tenant_id,
-            event_kind=event_kind,
-            source_object_type=source_object_type,
-            source_object_id=source_object_id,
-            payload=payload or {},
-        )
-    except Exception:
-        logger.warning(
-            "second_order: audit write failed for event_kind %s", event_kind
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+class SecondOrderWorkerPool:
+    """
+    Threads that drain the artifact queue across all tenants until stopped.
+    Each worker claims its own batches (SKIP LOCKED keeps them disjoint),
+    goes straight back for more after a full batch, and otherwise sleeps
+    poll_seconds. summary accumulates every batch; report() gives the
+    throughput since the previous report.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        poll_seconds: float = _DEFAULT_POLL_SECONDS,
+        tenant_id: Optional[str] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.tenant_id = tenant_id
+        self.summary = SecondOrderSummary()
+        self._summary_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._reported_done = 0
+        self._reported_at = time.monotonic()
+
+    def start(self) -> None:
+        self._reported_at = time.monotonic()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"qcr-second-order-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def report(self) -> Dict[str, Any]:
+        """Cumulative summary plus artifacts/sec over the interval since the last report."""
+        now = time.monotonic()
+        with self._summary_lock:
+            out = self.summary.to_dict()
+            done = self.summary.processed + self.summary.skipped
+        interval = now - self._reported_at
+        out["interval_artifacts_per_second"] = round(
+            (done - self._reported_done) / interval if interval > 0 else 0.0, 1
         )
+        self._reported_done, self._reported_at = done, now
+        return out
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                batch = deconstruct_artifact_batch(batch_size=self.batch_size, tenant_id=self.tenant_id)
+            except Exception:
+                logger.exception("second_order: claim failed; backing off")
+                batch = SecondOrderSummary()
+            with self._summary_lock:
+                self.summary.merge(batch)
+            if batch.claimed >= self.batch_size:
+                continue
+            self._stopping.wait(self.poll_seconds)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="second_order",
+        description="Drain the QCR second-order queue: deconstruct rail artifacts into depth-2 nuggets.",
+    )
+    p.add_argument("--workers", type=int, default=2, help="Worker threads. Default: 2.")
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=_DEFAULT_BATCH_SIZE,
+        help=f"Artifacts leased per claim. Default: {_DEFAULT_BATCH_SIZE}.",
+    )
+    p.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=_DEFAULT_POLL_SECONDS,
+        help=f"Idle sleep between empty claims. Default: {_DEFAULT_POLL_SECONDS}.",
+    )
+    p.add_argument(
+        "--report-seconds",
+        type=float,
+        default=_DEFAULT_REPORT_SECONDS,
+        help=f"Interval between throughput log lines. Default: {_DEFAULT_REPORT_SECONDS}.",
+    )
+    p.add_argument("--tenant-id", help="Only claim this tenant's artifacts. Default: all tenants.")
+    p.add_argument(
+        "--once",
+        action="store_true",
+        help="Drain until the queue is empty, then exit.",
+    )
+    p.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+    )
+    return p
+
+
+if __name__ == "__main__":
+    args = _build_arg_parser().parse_args()
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s %(levelname)s %(name)s — %(message)s",
+    )
+
+    if args.once:
+        total = SecondOrderSummary()
+        while True:
+            batch = deconstruct_artifact_batch(batch_size=args.batch_size, tenant_id=args.tenant_id)
+            total.merge(batch)
+            if batch.claimed < args.batch_size:
+                break
+        print(total.to_dict())
+        sys.exit(1 if total.failed else 0)
+
+    pool = SecondOrderWorkerPool(
+        workers=args.workers,
+        batch_size=args.batch_size,
+        poll_seconds=args.poll_seconds,
+        tenant_id=args.tenant_id,
+    )
+    # SIGTERM exits through the finally below, then atexit drains the
+    # buffered audit writer.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    pool.start()
+    try:
+        while True:
+            time.sleep(args.report_seconds)
+            logger.info("second_order: %s", pool.report())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop(timeout=30)
@@ -1,30 +1,21 @@
 from __future__ import annotations
 
 import logging
-from collections import Counter
+import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.service.qualitative_capture.repository import (
-    list_conclusions,
-    list_nuggets,
-    list_preserved_ideas_for_session,
-    list_promotion_candidates,
-)
+from src.service.qualitative_capture.repository import load_session_packet_sources
 
 logger = logging.getLogger(__name__)
 
-# Minimum confidence for a nugget to appear in the packet
-_PACKET_CONFIDENCE_FLOOR = 0.50
-
-# Claim types considered doctrine candidates
-_DOCTRINE_TYPES = {"doctrine", "principle", "declaration_of_value", "axiom"}
-
-# Claim types considered decisions
-_DECISION_TYPES = {"objective", "tactic", "best_practice"}
-
-# Maximum items per section in the packet
+# Maximum items per list section (ideas, promotions, conclusions). The nugget
+# sections, their confidence floor and claim-type groups are maintained by the
+# qcr_session_summaries trigger — see infra/migrations/009.
 _SECTION_LIMIT = 10
 
 
@@ -70,43 +61,131 @@ class SessionIntelligencePacket:
         return self.nugget_count == 0 and not self.preserved_ideas
 
 
-def _infer_session_title(nuggets: List[Dict], domain: Optional[str]) -> str:
+def _infer_session_title(claim_type_counts: Dict[str, int], domain: Optional[str]) -> str:
     """
     Infer a session title from the dominant claim types and domain.
 
-    Reads the top-3 claim types by frequency and combines them with the domain.
-    Falls back to a generic label if no nuggets exist.
+    Reads the top-3 claim types by frequency (ties by name) and combines them
+    with the domain. Falls back to a generic label if no nuggets exist.
     """
-    if not nuggets:
+    if not claim_type_counts:
         return "Empty session — no claims captured"
 
-    counts = Counter(n.get("claim_type", "unknown") for n in nuggets)
-    top_types = [ct for ct, _ in counts.most_common(3)]
-    type_label = " · ".join(t.replace("_", " ") for t in top_types)
+    ranked = sorted(claim_type_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    type_label = " · ".join(ct.replace("_", " ") for ct, _ in ranked[:3])
     domain_label = f" [{domain}]" if domain else ""
     return f"{type_label}{domain_label}"
 
 
-def _find_core_breakthrough(nuggets: List[Dict]) -> Optional[str]:
-    """
-    Identify the single most important output of the session.
+# ---------------------------------------------------------------------------
+# Packet cache
+# ---------------------------------------------------------------------------
+
+_CacheKey = Tuple[str, str, Optional[str]]   # (tenant_id, session_id, domain)
 
-    Priority: rail_candidate=True → highest confidence → doctrine/principle first.
-    Returns the claim_text of the top candidate, or None if no nuggets.
+
+class _PacketCache:
+    """
+    Bounded LRU of built packets keyed by (tenant_id, session_id, domain).
+
+    The packet endpoint is polled, so a session's packet is rebuilt only
+    after something it shows changes. Repository writes made by this
+    process invalidate the session (or, for promotion candidates, the whole
+    tenant) when their transaction commits; writes made by other processes
+    become visible when an entry's ttl expires. Generation counters keep a
+    build that raced with an invalidation from caching its pre-write result.
     """
-    candidates = [n for n in nuggets if n.get("rail_candidate")]
-    if not candidates:
-        candidates = list(nuggets)
-    if not candidates:
-        return None
 
-    def _score(n: Dict) -> tuple:
-        is_doctrine = n.get("claim_type") in _DOCTRINE_TYPES
-        return (is_doctrine, n.get("confidence_score", 0))
+    # Generation counters are dropped wholesale past this many sessions.
+    _MAX_GENERATIONS = 65536
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, SessionIntelligencePacket]]" = OrderedDict()
+        self._epoch = 0
+        self._tenant_gen: Dict[str, int] = {}
+        self._session_gen: Dict[Tuple[str, str], int] = {}
+
+    def get(self, key: _CacheKey) -> Optional["SessionIntelligencePacket"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, packet = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return packet
+
+    def generation(self, tenant_id: str, session_id: str) -> Tuple[int, int, int]:
+        """Snapshot to pass to put(); take it before reading the packet's sources."""
+        with self._lock:
+            return self._generation(tenant_id, session_id)
+
+    def _generation(self, tenant_id: str, session_id: str) -> Tuple[int, int, int]:
+        return (
+            self._epoch,
+            self._tenant_gen.get(tenant_id, 0),
+            self._session_gen.get((tenant_id, session_id), 0),
+        )
+
+    def put(self, key: _CacheKey, packet: "SessionIntelligencePacket", generation: Tuple[int, int, int]) -> None:
+        with self._lock:
+            if self._generation(key[0], key[1]) != generation:
+                return
+            self._entries[key] = (time.monotonic(), packet)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tenant_id: str, session_id: Optional[str] = None) -> None:
+        with self._lock:
+            if session_id is None:
+                self._tenant_gen[tenant_id] = self._tenant_gen.get(tenant_id, 0) + 1
+                stale = [k for k in self._entries if k[0] == tenant_id]
+            else:
+                sk = (tenant_id, session_id)
+                self._session_gen[sk] = self._session_gen.get(sk, 0) + 1
+                stale = [k for k in self._entries if k[0] == tenant_id and k[1] == session_id]
+            for k in stale:
+                del self._entries[k]
+            if len(self._session_gen) + len(self._tenant_gen) > self._MAX_GENERATIONS:
+                self._tenant_gen.clear()
+                self._session_gen.clear()
+                self._epoch += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tenant_gen.clear()
+            self._session_gen.clear()
+            self._epoch += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache = _PacketCache(
+    max_size=int(os.getenv("EXECALC_SESSION_PACKET_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("EXECALC_SESSION_PACKET_CACHE_TTL_SECONDS", "10")),
+)
+
+
+def invalidate(tenant_id: str, session_id: Optional[str] = None) -> None:
+    """Drop cached packets for one session, or for every session of the tenant."""
+    _cache.invalidate(tenant_id, session_id)
+
+
+def clear_cache() -> None:
+    _cache.clear()
 
-    best = max(candidates, key=_score)
-    return best.get("claim_text")
 
+# ---------------------------------------------------------------------------
+# Packet generation
+# ---------------------------------------------------------------------------
 
 def generate_session_packet(
     *,
@@ -118,101 +197,72 @@ def generate_session_packet(
     Generate a Session Intelligence Packet for a completed session.
 
     This is the anti-overload mechanism: long conversation in, operational packet out.
-    The packet is assembled from the live corpus state — it is not cached.
+    The packet is assembled in one round trip from the session's incrementally
+    maintained summary (no re-scan of its nuggets) and the list sections, cached per
+    (tenant_id, session_id, domain) until a write touches the session (see
+    _PacketCache); generated_at is when the served packet was built.
 
     Returns a packet with is_empty=True if no intelligence has been captured yet.
     This is a valid outcome for short or low-signal sessions.
     """
-    now = datetime.now(UTC)
+    key = (tenant_id, session_id, domain)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
 
+    generation = _cache.generation(tenant_id, session_id)
     try:
-        all_nuggets = list_nuggets(
+        sources = load_session_packet_sources(
             tenant_id=tenant_id,
             session_id=session_id,
-            min_confidence=_PACKET_CONFIDENCE_FLOOR,
-            limit=500,
+            section_limit=_SECTION_LIMIT,
         )
     except Exception:
-        logger.exception("session_packet: failed to load nuggets for session %s", session_id)
-        all_nuggets = []
-
-    # Claim type breakdown
-    breakdown = dict(Counter(n.get("claim_type", "unknown") for n in all_nuggets))
-
-    # Top nuggets — rail candidates first, then by confidence
-    top_nuggets = sorted(
-        all_nuggets,
-        key=lambda n: (n.get("rail_candidate", False), n.get("confidence_score", 0)),
-        reverse=True,
-    )[:_SECTION_LIMIT]
-
-    # Doctrine candidates
-    doctrine_candidates = [
-        n for n in all_nuggets if n.get("claim_type") in _DOCTRINE_TYPES
-    ][:_SECTION_LIMIT]
-
-    # Decisions made
-    decisions_made = [
-        n for n in all_nuggets if n.get("claim_type") in _DECISION_TYPES
-    ][:_SECTION_LIMIT]
-
-    # Open questions: seed-confidence items + threshold conditions
-    open_questions = [
-        n for n in all_nuggets
-        if n.get("confidence_score", 1) <= 0.50 or n.get("claim_type") == "threshold_condition"
-    ][:_SECTION_LIMIT]
-
-    # Preserved ideas
-    try:
-        preserved = list_preserved_ideas_for_session(
-            tenant_id=tenant_id, session_id=session_id, limit=_SECTION_LIMIT,
-        )
-    except Exception:
-        logger.exception("session_packet: failed to load preserved ideas for session %s", session_id)
-        preserved = []
+        logger.exception("session_packet: failed to load sources for session %s", session_id)
+        # Not cached: the next poll retries.
+        return _build_packet(tenant_id=tenant_id, session_id=session_id, domain=domain, sources={})
 
-    # Pending promotions (session-scoped would need artifact linkage — use tenant-wide for V1)
-    try:
-        pending = list_promotion_candidates(
-            tenant_id=tenant_id, review_status="pending", limit=_SECTION_LIMIT,
-        )
-    except Exception:
-        logger.exception("session_packet: failed to load promotions for tenant %s", tenant_id)
-        pending = []
+    packet = _build_packet(tenant_id=tenant_id, session_id=session_id, domain=domain, sources=sources)
+    _cache.put(key, packet, generation)
+    return packet
 
-    # Executive conclusions
-    try:
-        conclusions = list_conclusions(
-            tenant_id=tenant_id, session_id=session_id, limit=_SECTION_LIMIT,
-        )
-    except Exception:
-        logger.exception("session_packet: failed to load conclusions for session %s", session_id)
-        conclusions = []
 
-    title = _infer_session_title(all_nuggets, domain)
-    breakthrough = _find_core_breakthrough(all_nuggets)
+def _build_packet(
+    *,
+    tenant_id: str,
+    session_id: str,
+    domain: Optional[str],
+    sources: Dict[str, Any],
+) -> SessionIntelligencePacket:
+    # The summary row carries counters and pre-ranked, bounded sections, so
+    # building a packet never touches the session's individual nuggets.
+    summary = sources.get("summary") or {}
+    breakdown = dict(summary.get("claim_type_counts") or {})
+    nugget_count = int(summary.get("nugget_count") or 0)
+    breakthrough = summary.get("core_breakthrough") or []
 
     packet = SessionIntelligencePacket(
         session_id=session_id,
         tenant_id=tenant_id,
-        generated_at=now,
-        session_title=title,
-        core_breakthrough=breakthrough,
-        nugget_count=len(all_nuggets),
+        generated_at=datetime.now(UTC),
+        session_title=_infer_session_title(breakdown, domain),
+        core_breakthrough=breakthrough[0].get("claim_text") if breakthrough else None,
+        nugget_count=nugget_count,
         claim_type_breakdown=breakdown,
-        top_nuggets=[_slim(n) for n in top_nuggets],
-        doctrine_candidates=[_slim(n) for n in doctrine_candidates],
-        decisions_made=[_slim(n) for n in decisions_made],
-        open_questions=[_slim(n) for n in open_questions],
-        preserved_ideas=preserved,
-        pending_promotions=pending,
-        executive_conclusions=conclusions,
+        top_nuggets=[_slim(n) for n in summary.get("top_nuggets") or []],
+        doctrine_candidates=[_slim(n) for n in summary.get("doctrine_candidates") or []],
+        decisions_made=[_slim(n) for n in summary.get("decisions_made") or []],
+        open_questions=[_slim(n) for n in summary.get("open_questions") or []],
+        preserved_ideas=sources.get("preserved_ideas", []),
+        # Pending promotions are tenant-wide (session scoping would need artifact linkage)
+        pending_promotions=sources.get("pending_promotions", []),
+        executive_conclusions=sources.get("conclusions", []),
         domain=domain,
     )
 
     logger.info(
         "Session packet generated: session=%s tenant=%s nuggets=%d is_empty=%s",
-        session_id, tenant_id, len(all_nuggets), packet.is_empty,
+        session_id, tenant_id, nugget_count, packet.is_empty,
     )
     return packet
 
@@ -0,0 +1,195 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.service.db import postgres
+from src.service.qualitative_capture import audit
+from src.service.qualitative_capture.audit import AuditWriter
+
+_MOD = "src.service.qualitative_capture.audit"
+
+
+def _event(i: int = 0) -> dict:
+    return {
+        "audit_id": f"a{i}",
+        "tenant_id": "t1",
+        "event_kind": "nugget.created",
+        "source_object_type": "rail_artifact",
+        "source_object_id": "art1",
+        "payload": {"n": i},
+    }
+
+
+class TestAuditWriter(unittest.TestCase):
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_sync_mode_writes_before_returning(self, mock_insert):
+        writer = AuditWriter(sync=True)
+        writer.record([_event(1), _event(2)])
+        mock_insert.assert_called_once_with([_event(1), _event(2)])
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(writer.stats.written, 2)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_buffers_until_flush_size(self, mock_insert):
+        writer = AuditWriter(flush_size=3, max_buffer=10, flush_seconds=60)
+        writer.record([_event(1), _event(2)])
+        self.assertEqual(writer.pending(), 2)
+        self.assertFalse(writer._wake.is_set())
+        writer.record([_event(3)])
+        self.assertTrue(writer._wake.is_set())
+        mock_insert.assert_not_called()
+        self.assertEqual(writer.flush(), 3)
+        mock_insert.assert_called_once()
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_full_buffer_flushes_inline(self, mock_insert):
+        writer = AuditWriter(flush_size=2, max_buffer=2, flush_seconds=60)
+        writer.record([_event(1), _event(2)])
+        mock_insert.assert_called_once()
+        self.assertEqual(writer.pending(), 0)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_flusher_thread_writes_on_interval(self, mock_insert):
+        written = threading.Event()
+        mock_insert.side_effect = lambda events: written.set() or len(events)
+        writer = AuditWriter(flush_seconds=0.01)
+        writer.start()
+        try:
+            writer.record([_event(1)])
+            self.assertTrue(written.wait(2))
+        finally:
+            writer.shutdown(timeout=2)
+        self.assertEqual(writer.stats.written, 1)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=RuntimeError("db down"))
+    def test_failed_flush_keeps_events_in_order(self, _):
+        writer = AuditWriter(flush_size=5, max_buffer=10, flush_seconds=60)
+        writer.record([_event(1), _event(2)])
+        self.assertEqual(writer.flush(), 0)
+        writer.record([_event(3)])
+        self.assertEqual([e["audit_id"] for e in writer._buffer], ["a1", "a2", "a3"])
+        self.assertEqual(writer.stats.failed_flushes, 1)
+
+    def test_poison_event_does_not_block_good_ones(self):
+        def insert(events):
+            if any(e["audit_id"] == "a3" for e in events):
+                raise ValueError("violates check constraint")
+            return len(events)
+
+        with tempfile.TemporaryDirectory() as d, \
+                patch(f"{_MOD}.insert_audit_events", side_effect=insert) as mock_insert:
+            path = os.path.join(d, "audit.ndjson")
+            writer = AuditWriter(flush_size=10, max_buffer=10, flush_seconds=60, spill_path=path)
+            writer.record([_event(i) for i in range(1, 7)])
+            self.assertEqual(writer.flush(), 5)
+            self.assertEqual([e["audit_id"] for e in writer._buffer], ["a3"])
+            for _ in range(audit._MAX_ROW_ATTEMPTS - 1):
+                writer.record([_event(7)])
+                self.assertEqual(writer.flush(), 1)
+            self.assertEqual(writer.pending(), 0)
+            with open(path, encoding="utf-8") as f:
+                spilled = [json.loads(line) for line in f]
+        written = [e["audit_id"] for (events,), _ in mock_insert.call_args_list
+                   if not any(x["audit_id"] == "a3" for x in events) for e in events]
+        self.assertEqual(sorted(set(written)), ["a1", "a2", "a4", "a5", "a6", "a7"])
+        self.assertEqual([e["audit_id"] for e in spilled], ["a3"])
+        self.assertEqual(writer.stats.written, 7)
+        self.assertEqual(writer.stats.spilled, 1)
+        self.assertEqual(writer.stats.failed_flushes, audit._MAX_ROW_ATTEMPTS)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=RuntimeError("db down"))
+    def test_unavailable_database_stops_bisecting(self, mock_insert):
+        writer = AuditWriter(flush_size=100, max_buffer=100, flush_seconds=60)
+        writer.record([_event(i) for i in range(64)])
+        self.assertEqual(writer.flush(), 0)
+        self.assertLess(mock_insert.call_count, 16)
+        self.assertEqual([e["audit_id"] for e in writer._buffer], [f"a{i}" for i in range(64)])
+        self.assertEqual(writer.stats.spilled, 0)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=RuntimeError("db down"))
+    def test_shutdown_spills_unwritten_events(self, _):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "audit.ndjson")
+            writer = AuditWriter(flush_size=5, max_buffer=10, flush_seconds=60, spill_path=path)
+            writer.record([_event(1), _event(2)])
+            writer.shutdown()
+            with open(path, encoding="utf-8") as f:
+                spilled = [json.loads(line) for line in f]
+        self.assertEqual([e["audit_id"] for e in spilled], ["a1", "a2"])
+        self.assertEqual(writer.stats.spilled, 2)
+        self.assertEqual(writer.pending(), 0)
+
+
+@contextlib.contextmanager
+def _unit_of_work():
+    conn = MagicMock()
+    conn.closed = 0
+    postgres.reset_pool()
+    try:
+        with patch("src.service.db.postgres.get_conn", return_value=conn):
+            yield
+    finally:
+        postgres.reset_pool()
+
+
+class TestTransactionalRecording(unittest.TestCase):
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_held_until_commit(self, mock_insert):
+        writer = AuditWriter(sync=True)
+        with _unit_of_work():
+            with postgres.unit_of_work():
+                with postgres.connection():
+                    writer.record([_event(1)])
+                mock_insert.assert_not_called()
+        mock_insert.assert_called_once_with([_event(1)])
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_dropped_on_rollback(self, mock_insert):
+        writer = AuditWriter(sync=True)
+        with _unit_of_work(), self.assertRaises(RuntimeError):
+            with postgres.unit_of_work():
+                with postgres.connection():
+                    writer.record([_event(1)])
+                raise RuntimeError("boom")
+        mock_insert.assert_not_called()
+        self.assertEqual(writer.stats.recorded, 0)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_commit_wakes_flusher(self, _):
+        writer = AuditWriter(flush_size=100, max_buffer=1000, flush_seconds=60)
+        with _unit_of_work():
+            with postgres.unit_of_work():
+                with postgres.connection():
+                    writer.record([_event(1)])
+                self.assertFalse(writer._wake.is_set())
+        self.assertTrue(writer._wake.is_set())
+
+
+class TestProcessWriter(unittest.TestCase):
+    def tearDown(self):
+        audit.shutdown(timeout=2)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_record_audit_uses_env_sync_writer(self, mock_insert):
+        with patch.dict("os.environ", {"EXECALC_QCR_AUDIT_SYNC": "1"}):
+            audit_id = audit.record_audit(tenant_id="t1", event_kind="artifact.deconstruction_started")
+        (events,), _ = mock_insert.call_args
+        self.assertEqual(events[0]["audit_id"], audit_id)
+        self.assertEqual(events[0]["payload"], {})
+        self.assertIs(audit.get_writer(), audit._writer)
+
+    @patch(f"{_MOD}.insert_audit_events", side_effect=len)
+    def test_shutdown_drains(self, mock_insert):
+        with patch.dict("os.environ", {"EXECALC_QCR_AUDIT_SYNC": "0", "EXECALC_QCR_AUDIT_FLUSH_SECONDS": "60"}):
+            audit.record_audits([_event(1)])
+        audit.shutdown(timeout=2)
+        mock_insert.assert_called_once_with([_event(1)])
+        self.assertIsNone(audit._writer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import contextlib
+import os
+import threading
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from src.service.qualitative_capture import capture_queue
+from src.service.qualitative_capture.capture_queue import (
+    CaptureSummary,
+    CaptureWorkerPool,
+    capture_batch,
+)
+from src.service.qualitative_capture.repository import (
+    claim_capture_batch,
+    mark_event_captured,
+    release_event_capture,
+)
+
+_MOD = "src.service.qualitative_capture.capture_queue"
+
+
+def _row(event_id: str = "e1", text: str = "We will never compromise on data quality under any circumstances.") -> dict:
+    return {
+        "event_id": event_id,
+        "tenant_id": "t1",
+        "session_id": "s1",
+        "user_id": "u1",
+        "role": "operator",
+        "message_text": text,
+        "token_count": None,
+        "created_at": datetime(2026, 5, 20, tzinfo=UTC),
+        "capture_queued_at": datetime(2026, 5, 20, tzinfo=UTC),
+        "capture_attempts": 1,
+        "capture_domain": "finance",
+    }
+
+
+@contextlib.contextmanager
+def _fake_uow():
+    yield MagicMock()
+
+
+class TestCaptureBatch(unittest.TestCase):
+    @patch(f"{_MOD}.unit_of_work", _fake_uow)
+    @patch(f"{_MOD}.release_event_capture")
+    @patch(f"{_MOD}.mark_event_captured", return_value=True)
+    @patch(f"{_MOD}.insert_nuggets", side_effect=len)
+    @patch(f"{_MOD}.claim_capture_batch")
+    def test_captures_nuggets_and_marks_event(self, mock_claim, mock_insert, mock_mark, mock_release):
+        mock_claim.return_value = [_row()]
+        summary = capture_batch(batch_size=5)
+        self.assertEqual(summary.claimed, 1)
+        self.assertEqual(summary.captured, 1)
+        self.assertGreaterEqual(summary.nuggets_persisted, 1)
+        mock_insert.assert_called_once()
+        nuggets = mock_insert.call_args.args[0]
+        self.assertEqual(len(nuggets), summary.nuggets_persisted)
+        self.assertEqual({n.domain for n in nuggets}, {"finance"})
+        mock_mark.assert_called_once_with(event_id="e1", attempts=1)
+        mock_release.assert_not_called()
+
+    @patch(f"{_MOD}.unit_of_work", _fake_uow)
+    @patch(f"{_MOD}.release_event_capture")
+    @patch(f"{_MOD}.mark_event_captured")
+    @patch(f"{_MOD}.insert_nuggets", side_effect=RuntimeError("fk violation"))
+    @patch(f"{_MOD}.claim_capture_batch")
+    def test_failed_event_is_released_with_error(self, mock_claim, _insert, mock_mark, mock_release):
+        mock_claim.return_value = [_row("bad"), _row("also-bad")]
+        summary = capture_batch(batch_size=5)
+        self.assertEqual(summary.failed, 2)
+        self.assertEqual(summary.captured, 0)
+        mock_mark.assert_not_called()
+        first = mock_release.call_args_list[0].kwargs
+        self.assertEqual((first["event_id"], first["attempts"]), ("bad", 1))
+        self.assertIn("fk violation", first["error"])
+
+    @patch(f"{_MOD}.release_event_capture", return_value=False)
+    @patch(f"{_MOD}.mark_event_captured", return_value=False)
+    @patch(f"{_MOD}.insert_nuggets", side_effect=len)
+    @patch(f"{_MOD}.claim_capture_batch")
+    def test_lost_lease_rolls_back_the_nuggets(self, mock_claim, _insert, _mark, mock_release):
+        mock_claim.return_value = [_row()]
+        uow = MagicMock()
+
+        @contextlib.contextmanager
+        def tracking_uow():
+            try:
+                yield uow
+            except BaseException:
+                uow.rolled_back = True
+                raise
+
+        with patch(f"{_MOD}.unit_of_work", tracking_uow):
+            summary = capture_batch(batch_size=5)
+        self.assertTrue(uow.rolled_back)
+        self.assertEqual((summary.captured, summary.failed, summary.nuggets_persisted), (0, 1, 0))
+        self.assertIn("lease lost", mock_release.call_args.kwargs["error"])
+
+    @patch(f"{_MOD}.unit_of_work", _fake_uow)
+    @patch(f"{_MOD}.mark_event_captured", return_value=True)
+    @patch(f"{_MOD}.insert_nuggets", side_effect=len)
+    @patch(f"{_MOD}.claim_capture_batch")
+    def test_event_without_claims_is_still_marked(self, mock_claim, mock_insert, mock_mark):
+        mock_claim.return_value = [_row(text="Short.")]
+        summary = capture_batch()
+        self.assertEqual(summary.captured, 1)
+        self.assertEqual(summary.nuggets_persisted, 0)
+        mock_mark.assert_called_once_with(event_id="e1", attempts=1)
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_workers_drain_until_stopped(self):
+        drained = threading.Event()
+        batches = [CaptureSummary(claimed=2, captured=2), CaptureSummary(claimed=1, captured=1)]
+
+        def fake_batch(*, batch_size):
+            if batches:
+                return batches.pop(0)
+            drained.set()
+            return CaptureSummary()
+
+        with patch(f"{_MOD}.capture_batch", side_effect=fake_batch):
+            pool = CaptureWorkerPool(workers=1, batch_size=2, poll_seconds=0.01)
+            pool.start()
+            self.assertTrue(drained.wait(2))
+            pool.stop(timeout=2)
+        self.assertEqual(pool.summary.captured, 3)
+
+    def test_notify_is_noop_without_in_process_workers(self):
+        with patch.dict("os.environ", {"EXECALC_CAPTURE_WORKERS": "0"}):
+            capture_queue.notify()
+        self.assertIsNone(capture_queue._pool)
+
+    def test_in_process_workers_are_on_by_default(self):
+        with patch.dict("os.environ"):
+            os.environ.pop("EXECALC_CAPTURE_WORKERS", None)
+            self.assertEqual(capture_queue._in_process_workers(), 2)
+
+    def test_notify_starts_in_process_pool_once(self):
+        with patch.dict("os.environ", {"EXECALC_CAPTURE_WORKERS": "1"}), \
+             patch(f"{_MOD}.capture_batch", return_value=CaptureSummary()):
+            try:
+                capture_queue.notify()
+                first = capture_queue._pool
+                capture_queue.notify()
+                self.assertIs(capture_queue._pool, first)
+                self.assertEqual(len(first._threads), 1)
+            finally:
+                capture_queue.stop_workers(timeout=2)
+        self.assertIsNone(capture_queue._pool)
+
+
+class TestClaimCaptureBatch(unittest.TestCase):
+    def test_claims_with_skip_locked_and_maps_rows(self):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        row = _row()
+        cur.fetchall.return_value = [tuple(row.values())]
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            rows = claim_capture_batch(limit=10, lease_seconds=60, max_attempts=3)
+        sql, params = cur.execute.call_args.args
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertEqual(params, (60, 3, 10))
+        self.assertEqual(rows, [row])
+
+
+class TestLeaseFencedUpdates(unittest.TestCase):
+    def _run(self, fn, rowcount, **kwargs):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.rowcount = rowcount
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            held = fn(**kwargs)
+        return held, cur.execute.call_args.args
+
+    def test_mark_captured_is_fenced_on_the_claimed_attempt(self):
+        held, (sql, params) = self._run(mark_event_captured, 1, event_id="e1", attempts=2)
+        self.assertTrue(held)
+        self.assertIn("capture_attempts = %s AND capture_completed_at IS NULL", sql)
+        self.assertEqual(params, ("e1", 2))
+
+    def test_release_reports_a_lost_lease(self):
+        held, (sql, params) = self._run(release_event_capture, 0, event_id="e1", attempts=2, error="x")
+        self.assertFalse(held)
+        self.assertIn("capture_attempts = %s AND capture_completed_at IS NULL", sql)
+        self.assertEqual(params, ("x", "e1", 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
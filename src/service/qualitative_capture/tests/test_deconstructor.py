@@ -1,7 +1,7 @@
 import unittest
 from datetime import UTC, datetime
 
-from src.service.qualitative_capture.deconstructor import deconstruct_event
+from src.service.qualitative_capture.deconstructor import _classify, deconstruct_event
 from src.service.qualitative_capture.models import AtomicNugget, ConversationEvent
 
 
@@ -89,5 +89,34 @@ class TestDeconstructEvent(unittest.TestCase):
             self.assertEqual(n.confidence_score, 0.50)
 
 
+class TestClassify(unittest.TestCase):
+    def test_first_category_in_signal_order_wins(self):
+        # "we will" (doctrine) and "because " (causal_claim) both match.
+        self.assertEqual(_classify("Because margins matter, we will hold price.").claim_type, "doctrine")
+
+    def test_phrase_sharing_a_start_with_a_longer_phrase_is_found(self):
+        # "risk that" and "risk " start at the same position; "risk" is a polarity signal.
+        result = _classify("The risk that rates rise is real.")
+        self.assertEqual(result.claim_type, "risk")
+        self.assertEqual(result.polarity, "negative")
+
+    def test_overlapping_phrases_are_all_counted(self):
+        # "opportunity to" contains "opportunity"; "growth potential" contains "growth".
+        result = _classify("An opportunity to unlock growth potential, however slowly.")
+        self.assertEqual(result.claim_type, "opportunity")
+        self.assertEqual(result.polarity, "positive")
+
+    def test_cautionary_and_durability(self):
+        self.assertEqual(_classify("However, the caution is warranted this quarter.").polarity, "cautionary")
+        self.assertEqual(_classify("However, the caution is warranted this quarter.").durability, "medium_term")
+        self.assertEqual(_classify("Right now the Q3 plan looks thin.").durability, "ephemeral")
+
+    def test_no_signal(self):
+        result = _classify("Plain text with nothing in it at all.")
+        self.assertIsNone(result.claim_type)
+        self.assertEqual(result.polarity, "neutral")
+        self.assertEqual(result.durability, "enduring")
+
+
 if __name__ == "__main__":
     unittest.main()
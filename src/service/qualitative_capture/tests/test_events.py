@@ -1,7 +1,9 @@
 import unittest
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
-from src.service.qualitative_capture.events import ingest_event
+from src.service.qualitative_capture import events as events_mod
+from src.service.qualitative_capture.events import _stored_event_id, ingest_event, ingest_events
 from src.service.qualitative_capture.models import ConversationEvent
 
 
@@ -52,6 +54,157 @@ class TestIngestEvent(unittest.TestCase):
             role="operator", message_text="Data quality matters.",
         )
         self.assertIsInstance(evt, ConversationEvent)
+        self.assertIsNone(evt.capture_queued_at)
+
+    @patch("src.service.qualitative_capture.events.insert_event")
+    def test_stored_event_is_queued_with_domain(self, mock_insert):
+        evt = ingest_event(
+            tenant_id="t1", session_id="s1", user_id="u1",
+            role="operator", message_text="Data quality matters.", domain="finance",
+        )
+        self.assertIsNotNone(evt.capture_queued_at)
+        self.assertEqual(mock_insert.call_args.kwargs["metadata"], {"capture_domain": "finance"})
+
+
+_EV = "src.service.qualitative_capture.events"
+_CLAIMS = "Our doctrine is that we will always protect margin before growth. The main risk is churn in the mid-market."
+
+
+@patch(f"{_EV}.list_foreign_event_ids", return_value=set())
+@patch(f"{_EV}.unit_of_work")
+@patch(f"{_EV}.insert_nuggets")
+@patch(f"{_EV}.insert_events")
+class TestIngestEvents(unittest.TestCase):
+    def _run(self, items, **kw):
+        return ingest_events(tenant_id="t1", user_id="u1", events=items, **kw)
+
+    def test_writes_events_and_nuggets_in_one_transaction(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_events.side_effect = lambda evts, metadata: {e.event_id for e in evts}
+        results = self._run(
+            [{"message_text": _CLAIMS, "event_id": "e1"}, {"message_text": _CLAIMS, "domain": "ops"}],
+            session_id="s1",
+        )
+        self.assertEqual([r.status for r in results], ["ingested", "ingested"])
+        self.assertEqual(results[0].client_event_id, "e1")
+        self.assertEqual(results[0].event_id, _stored_event_id("t1", "e1"))
+        self.assertGreater(results[0].nuggets_persisted, 0)
+        mock_uow.return_value.__enter__.return_value.begin_writes.assert_called_once()
+        mock_events.assert_called_once()
+        mock_nuggets.assert_called_once()
+
+        stored = mock_events.call_args.args[0]
+        self.assertTrue(all(e.capture_completed_at is not None for e in stored))
+        self.assertEqual(
+            mock_events.call_args.kwargs["metadata"],
+            [{"capture_domain": "strategy"}, {"capture_domain": "ops"}],
+        )
+        nuggets = mock_nuggets.call_args.args[0]
+        self.assertEqual(len(nuggets), results[0].nuggets_extracted + results[1].nuggets_extracted)
+        self.assertEqual({n.domain for n in nuggets}, {"strategy", "ops"})
+
+    def test_invalid_items_are_reported_without_blocking_the_batch(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_events.side_effect = lambda evts, metadata: {e.event_id for e in evts}
+        results = self._run([
+            {"message_text": _CLAIMS, "session_id": "s1", "event_id": "e1"},
+            {"message_text": "   ", "session_id": "s1"},
+            {"message_text": _CLAIMS, "session_id": "s1", "role": "robot"},
+            {"message_text": _CLAIMS},
+            {"message_text": _CLAIMS, "session_id": "s1", "event_id": "e1"},
+            {"message_text": _CLAIMS, "session_id": "s1", "token_count": True},
+        ])
+        self.assertEqual([r.status for r in results], ["ingested", "invalid", "invalid", "invalid", "invalid", "invalid"])
+        self.assertEqual([r.index for r in results], [0, 1, 2, 3, 4, 5])
+        self.assertIn("duplicate event_id", results[4].error)
+        self.assertEqual(results[5].error, "token_count must be an integer")
+        self.assertEqual(len(mock_events.call_args.args[0]), 1)
+
+    def test_existing_events_are_duplicates_and_skip_nuggets(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_events.return_value = {_stored_event_id("t1", "e2")}
+        results = self._run(
+            [{"message_text": _CLAIMS, "event_id": "e1"}, {"message_text": _CLAIMS, "event_id": "e2"}],
+            session_id="s1",
+        )
+        self.assertEqual([r.status for r in results], ["duplicate", "ingested"])
+        self.assertEqual(results[0].nuggets_persisted, 0)
+        self.assertEqual(
+            {n.source_event_id for n in mock_nuggets.call_args.args[0]}, {_stored_event_id("t1", "e2")},
+        )
+
+    def test_client_event_ids_are_scoped_per_tenant(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_events.side_effect = lambda evts, metadata: {e.event_id for e in evts}
+        a = ingest_events(tenant_id="t1", user_id="u1", events=[{"message_text": _CLAIMS, "event_id": "e1"}],
+                          session_id="s1")
+        b = ingest_events(tenant_id="t2", user_id="u1", events=[{"message_text": _CLAIMS, "event_id": "e1"}],
+                          session_id="s1")
+        self.assertNotEqual(a[0].event_id, b[0].event_id)
+
+    def test_conflict_with_another_tenants_event_is_invalid(self, mock_events, mock_nuggets, mock_uow, mock_foreign):
+        mock_events.return_value = set()
+        mock_foreign.return_value = {_stored_event_id("t1", "e1")}
+        results = self._run([{"message_text": _CLAIMS, "event_id": "e1"}], session_id="s1")
+        self.assertEqual(results[0].status, "invalid")
+        self.assertIn("conflicts", results[0].error)
+
+    def test_batch_preserves_message_order(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_events.side_effect = lambda evts, metadata: {e.event_id for e in evts}
+        self._run([{"message_text": _CLAIMS}, {"message_text": ""}, {"message_text": _CLAIMS}], session_id="s1")
+        stored = mock_events.call_args.args[0]
+        self.assertLess(stored[0].created_at, stored[1].created_at)
+
+    def test_transaction_failure_marks_every_event_failed(self, mock_events, mock_nuggets, mock_uow, _):
+        mock_nuggets.side_effect = Exception("db down")
+        results = self._run(
+            [{"message_text": _CLAIMS}, {"message_text": ""}], session_id="s1",
+        )
+        self.assertEqual([r.status for r in results], ["failed", "invalid"])
+        self.assertIn("persistence failed", results[0].error)
+        self.assertEqual(results[0].nuggets_persisted, 0)
+
+    def test_all_invalid_batch_touches_no_database(self, mock_events, mock_nuggets, mock_uow, _):
+        results = self._run([{"message_text": ""}], session_id="s1")
+        self.assertEqual(results[0].status, "invalid")
+        mock_uow.assert_not_called()
+
+
+class TestDeconstructAll(unittest.TestCase):
+    def setUp(self):
+        events_mod.shutdown_deconstruction_pool()
+        self.addCleanup(events_mod.shutdown_deconstruction_pool)
+
+    def _items(self, n):
+        from datetime import UTC, datetime
+        return [
+            (ConversationEvent(
+                event_id=f"e{i}", tenant_id="t1", session_id="s1", user_id="u1", role="operator",
+                message_text=_CLAIMS, created_at=datetime.now(UTC),
+            ), "strategy")
+            for i in range(n)
+        ]
+
+    @patch.dict("os.environ", {"EXECALC_QCR_DECONSTRUCT_WORKERS": "3"})
+    def test_large_batches_use_the_pool_and_keep_order(self):
+        items = self._items(events_mod._POOL_MIN_EVENTS + 5)
+        with patch(f"{_EV}._new_executor", side_effect=lambda w: ThreadPoolExecutor(max_workers=w)) as mk:
+            out = events_mod._deconstruct_all(items)
+        mk.assert_called_once_with(3)
+        self.assertEqual([nuggets[0].source_event_id for nuggets in out], [e.event_id for e, _ in items])
+
+    @patch.dict("os.environ", {"EXECALC_QCR_DECONSTRUCT_WORKERS": "3"})
+    def test_small_batches_run_inline(self):
+        with patch(f"{_EV}._new_executor") as mk:
+            out = events_mod._deconstruct_all(self._items(3))
+        mk.assert_not_called()
+        self.assertEqual(len(out), 3)
+
+    @patch.dict("os.environ", {"EXECALC_QCR_DECONSTRUCT_WORKERS": "2"})
+    def test_broken_pool_falls_back_inline(self):
+        from concurrent.futures.process import BrokenProcessPool
+        broken = MagicMock()
+        broken.map.side_effect = BrokenProcessPool("worker died")
+        with patch(f"{_EV}._new_executor", return_value=broken):
+            out = events_mod._deconstruct_all(self._items(events_mod._POOL_MIN_EVENTS))
+        self.assertEqual(len(out), events_mod._POOL_MIN_EVENTS)
+        self.assertIsNone(events_mod._executor)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,21 @@
+import json
 import unittest
-from unittest.mock import patch
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
+from src.service.qualitative_capture.repository import (
+    _NUGGET_LIST_COLUMNS,
+    list_nuggets_by_category,
+    search_nuggets,
+    stream_nuggets,
+)
 from src.service.qualitative_capture.retrieval import (
+    _encode_cursor,
+    _encode_search_cursor,
+    export_claims_ndjson,
+    list_claims_page,
+    retrieve_categories,
     retrieve_decisions,
     retrieve_doctrine,
     retrieve_open_questions,
@@ -11,6 +25,7 @@ from src.service.qualitative_capture.retrieval import (
     retrieve_risks,
     retrieve_session_conclusions,
     search_claims,
+    search_claims_page,
 )
 
 
@@ -30,62 +45,123 @@ def _nugget(claim_type: str, confidence: float = 0.50, rail_candidate: bool = Fa
     }
 
 
+_BY_CATEGORY = "src.service.qualitative_capture.retrieval.list_nuggets_by_category"
+
+
+def _by_category(**kwargs) -> dict:
+    return {c: [_nugget(types[0])] for c, types in kwargs["categories"].items()}
+
+
+class TestRetrieveCategories(unittest.TestCase):
+    @patch(_BY_CATEGORY, side_effect=_by_category)
+    def test_all_categories_in_one_call(self, mock_by_category):
+        result = retrieve_categories(
+            tenant_id="t1", categories=["risks", "decisions", "open", "risks"], limit=5,
+        )
+        self.assertEqual(list(result), ["risks", "decisions", "open"])
+        mock_by_category.assert_called_once()
+        kwargs = mock_by_category.call_args.kwargs
+        self.assertEqual(kwargs["categories"]["risks"], ["risk", "threat", "diagnostic_signal"])
+        self.assertEqual(kwargs["open_category"], "open")
+        self.assertEqual(kwargs["limit"], 5)
+
+    def test_unknown_category_raises(self):
+        with self.assertRaises(ValueError):
+            retrieve_categories(tenant_id="t1", categories=["risks", "gossip"])
+
+    @patch(_BY_CATEGORY, side_effect=Exception("db"))
+    def test_db_failure_returns_empty_lists(self, _):
+        result = retrieve_categories(tenant_id="t1", categories=["risks", "open"])
+        self.assertEqual(result, {"risks": [], "open": []})
+
+
 class TestRetrieveRisks(unittest.TestCase):
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
+    @patch(_BY_CATEGORY, side_effect=_by_category)
     def test_returns_risk_nuggets(self, mock_list):
-        mock_list.return_value = [_nugget("risk")]
         result = retrieve_risks(tenant_id="t1")
         self.assertGreaterEqual(len(result), 1)
         self.assertEqual(result[0]["claim_type"], "risk")
 
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets", side_effect=Exception("db"))
+    @patch(_BY_CATEGORY, side_effect=Exception("db"))
     def test_db_failure_returns_empty(self, mock_list):
         result = retrieve_risks(tenant_id="t1")
         self.assertEqual(result, [])
 
 
 class TestRetrieveDoctrine(unittest.TestCase):
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
+    @patch(_BY_CATEGORY, side_effect=_by_category)
     def test_returns_doctrine_nuggets(self, mock_list):
-        mock_list.return_value = [_nugget("doctrine"), _nugget("principle")]
-        result = retrieve_doctrine(tenant_id="t1")
-        self.assertGreaterEqual(len(result), 1)
+        result = retrieve_doctrine(tenant_id="t1", session_id="s1")
+        self.assertEqual(result[0]["claim_type"], "doctrine")
+        self.assertEqual(mock_list.call_args.kwargs["session_id"], "s1")
 
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets", side_effect=Exception("db"))
+    @patch(_BY_CATEGORY, side_effect=Exception("db"))
     def test_db_failure_returns_empty(self, mock_list):
         result = retrieve_doctrine(tenant_id="t1")
         self.assertEqual(result, [])
 
 
 class TestRetrieveOpportunities(unittest.TestCase):
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
+    @patch(_BY_CATEGORY, side_effect=_by_category)
     def test_returns_opportunities(self, mock_list):
-        mock_list.return_value = [_nugget("opportunity")]
         result = retrieve_opportunities(tenant_id="t1")
         self.assertEqual(len(result), 1)
 
 
 class TestRetrieveDecisions(unittest.TestCase):
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
+    @patch(_BY_CATEGORY, side_effect=_by_category)
     def test_returns_objective_claims(self, mock_list):
-        mock_list.return_value = [_nugget("objective")]
         result = retrieve_decisions(tenant_id="t1")
-        self.assertGreaterEqual(len(result), 1)
+        self.assertEqual(result[0]["claim_type"], "objective")
 
 
 class TestRetrieveOpenQuestions(unittest.TestCase):
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
-    def test_returns_low_confidence_items(self, mock_list):
-        mock_list.return_value = [_nugget("threshold_condition", confidence=0.50)]
+    @patch(_BY_CATEGORY, side_effect=_by_category)
+    def test_returns_open_loops(self, mock_list):
         result = retrieve_open_questions(tenant_id="t1")
-        self.assertGreaterEqual(len(result), 0)
+        self.assertEqual(result[0]["claim_type"], "threshold_condition")
 
-    @patch("src.service.qualitative_capture.retrieval.list_nuggets", side_effect=Exception("db"))
+    @patch(_BY_CATEGORY, side_effect=Exception("db"))
     def test_db_failure_returns_empty(self, mock_list):
         result = retrieve_open_questions(tenant_id="t1")
         self.assertEqual(result, [])
 
 
+class TestListNuggetsByCategory(unittest.TestCase):
+    def _run(self, rows, **kwargs):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = rows
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            out = list_nuggets_by_category(tenant_id="t1", **kwargs)
+        return out, cur
+
+    def test_one_statement_with_any_and_window(self):
+        row = ("risks", *[None] * len(_NUGGET_LIST_COLUMNS), 1)
+        out, cur = self._run(
+            [row],
+            categories={"risks": ["risk", "threat"], "open": ["threshold_condition"], "empty": []},
+            open_category="open",
+            limit=3,
+        )
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args.args
+        self.assertIn("claim_type = ANY(%s)", sql)
+        self.assertIn("PARTITION BY m.category", sql)
+        self.assertIn("UNION ALL", sql)
+        self.assertEqual(params[:4], [["risk", "threat"], ["risks", "risks"], "t1", ["risk", "threat"]])
+        self.assertEqual(params[-1], 3)
+        self.assertEqual(set(out), {"risks", "open", "empty"})
+        self.assertEqual(len(out["risks"]), 1)
+        self.assertEqual(set(out["risks"][0]), set(_NUGGET_LIST_COLUMNS))
+
+    def test_no_categories_skips_the_query(self):
+        out, cur = self._run([], categories={"empty": []})
+        cur.execute.assert_not_called()
+        self.assertEqual(out, {"empty": []})
+
+
 class TestRetrieveRailCandidates(unittest.TestCase):
     @patch("src.service.qualitative_capture.retrieval.list_nuggets")
     def test_filters_rail_candidates(self, mock_list):
@@ -116,6 +192,126 @@ class TestSearchClaims(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestSearchClaimsPage(unittest.TestCase):
+    def _rows(self, n):
+        return [
+            dict(_nugget("doctrine"), nugget_id=f"n{i}", search_rank=Decimal("0.900000") - Decimal(i) / 10)
+            for i in range(n)
+        ]
+
+    @patch("src.service.qualitative_capture.retrieval.search_nuggets")
+    def test_cursor_resumes_after_last_row(self, mock_search):
+        mock_search.return_value = self._rows(3)
+        page = search_claims_page(tenant_id="t1", query="margin", limit=2)
+        self.assertEqual([n["nugget_id"] for n in page.nuggets], ["n0", "n1"])
+        self.assertEqual(mock_search.call_args.kwargs["limit"], 3)
+        self.assertIsNone(mock_search.call_args.kwargs["after"])
+
+        mock_search.return_value = self._rows(1)
+        last = search_claims_page(tenant_id="t1", query="margin", cursor=page.next_cursor, limit=2)
+        self.assertEqual(mock_search.call_args.kwargs["after"], (Decimal("0.800000"), "n1"))
+        self.assertIsNone(last.next_cursor)
+
+    @patch("src.service.qualitative_capture.retrieval.search_nuggets")
+    def test_rank_round_trips_exactly_and_stays_out_of_rows(self, mock_search):
+        def rows(**kwargs):
+            found = self._rows(2)
+            found[0]["search_rank"] = Decimal("0.123457")
+            return found
+        mock_search.side_effect = rows
+        page = search_claims_page(tenant_id="t1", query="margin", limit=1)
+        self.assertNotIn("search_rank", page.nuggets[0])
+        search_claims_page(tenant_id="t1", query="margin", cursor=page.next_cursor, limit=1)
+        self.assertEqual(mock_search.call_args.kwargs["after"], (Decimal("0.123457"), "n0"))
+
+    def test_malformed_cursor_raises(self):
+        bad_cursors = (
+            "%%", "bm90IGpzb24", "WzFd",
+            _encode_search_cursor({"search_rank": "NaN", "nugget_id": "n1"}),
+            _encode_search_cursor({"search_rank": "high", "nugget_id": "n1"}),
+            # A float rank is not exact; only the text form is accepted.
+            _encode_cursor([0.5, "n1"]),
+        )
+        for bad in bad_cursors:
+            with self.assertRaises(ValueError):
+                search_claims_page(tenant_id="t1", query="margin", cursor=bad)
+
+
+class TestSearchNuggets(unittest.TestCase):
+    def test_rounds_rank_in_select_and_keyset(self):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = []
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            search_nuggets(tenant_id="t1", query="margin", after=(Decimal("0.5"), "n1"), limit=3)
+        sql, params = cur.execute.call_args.args
+        self.assertIn("round((ts_rank(claim_tsv, q, 32) * %s + confidence_score * %s)::numeric, %s)", sql)
+        self.assertIn("(search_rank, nugget_id) < (%s::numeric, %s)", sql)
+        self.assertEqual(params[2], 6)
+        self.assertEqual(params[-3:], [Decimal("0.5"), "n1", 3])
+
+
+class TestListClaimsPage(unittest.TestCase):
+    @patch("src.service.qualitative_capture.retrieval.list_nuggets")
+    def test_cursor_round_trips_through_keyset(self, mock_list):
+        created = datetime(2026, 5, 20, 12, 30, tzinfo=UTC)
+        rows = [
+            _nugget("risk", confidence=0.9, nugget_id=f"n{i}", created_at=created)
+            for i in range(3)
+        ]
+        mock_list.return_value = rows
+        page = list_claims_page(tenant_id="t1", limit=2)
+        self.assertEqual([r["nugget_id"] for r in page.nuggets], ["n0", "n1"])
+        self.assertEqual(mock_list.call_args.kwargs["limit"], 3)
+        self.assertIsNone(mock_list.call_args.kwargs["after"])
+
+        mock_list.return_value = rows[2:]
+        last = list_claims_page(tenant_id="t1", cursor=page.next_cursor, limit=2)
+        self.assertEqual(mock_list.call_args.kwargs["after"], (0.9, created, "n1"))
+        self.assertIsNone(last.next_cursor)
+
+    def test_search_cursor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            list_claims_page(tenant_id="t1", cursor=_encode_search_cursor({"search_rank": 0.5, "nugget_id": "n1"}))
+
+
+class TestExportClaimsNdjson(unittest.TestCase):
+    @patch("src.service.qualitative_capture.retrieval.stream_nuggets")
+    def test_one_json_line_per_row(self, mock_stream):
+        created = datetime(2026, 5, 20, tzinfo=UTC)
+        mock_stream.return_value = iter([{"nugget_id": "n1", "created_at": created}, {"nugget_id": "n2"}])
+        lines = list(export_claims_ndjson(tenant_id="t1", claim_type="risk"))
+        self.assertEqual(json.loads(lines[0]), {"nugget_id": "n1", "created_at": created.isoformat()})
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(line.endswith("\n") for line in lines))
+
+    @patch("src.service.qualitative_capture.retrieval.stream_nuggets")
+    def test_failure_mid_stream_marks_truncation(self, mock_stream):
+        def rows():
+            yield {"nugget_id": "n1"}
+            raise RuntimeError("connection lost")
+        mock_stream.return_value = rows()
+        lines = list(export_claims_ndjson(tenant_id="t1"))
+        self.assertEqual(json.loads(lines[-1]), {"error": "export_failed"})
+
+
+class TestStreamNuggets(unittest.TestCase):
+    def test_uses_named_server_side_cursor(self):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.__iter__.return_value = iter([tuple(range(len(_NUGGET_LIST_COLUMNS)))])
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            rows = list(stream_nuggets(tenant_id="t1", session_id="s1", fetch_size=100))
+        self.assertTrue(conn.cursor.call_args.kwargs["name"].startswith("qcr_nugget_export_"))
+        self.assertEqual(cur.itersize, 100)
+        sql, params = cur.execute.call_args.args
+        self.assertIn("ORDER BY created_at, nugget_id", sql)
+        self.assertEqual(params, ["t1", "s1"])
+        self.assertEqual(rows[0]["nugget_id"], 0)
+
+
 class TestRetrievePreservedIdeas(unittest.TestCase):
     @patch("src.service.qualitative_capture.retrieval.list_preserved_ideas_for_session")
     def test_returns_ideas(self, mock_list):
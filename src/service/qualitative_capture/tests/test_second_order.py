@@ -1,8 +1,18 @@
+import contextlib
+import threading
 import unittest
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, patch
 
+from src.service.qualitative_capture.repository import (
+    claim_artifact_batch,
+    complete_artifact_batch,
+    release_artifact_batch,
+)
 from src.service.qualitative_capture.second_order import (
+    SecondOrderSummary,
+    SecondOrderWorkerPool,
     _deconstruct_one_artifact,
+    deconstruct_artifact_batch,
     process_pending_artifacts,
 )
 
@@ -31,6 +41,7 @@ def _artifact(
         "second_order_deconstruction_status": "pending",
         "second_order_nugget_ids": [],
         "deconstructed_at": None,
+        "deconstruction_attempts": 1,
     }
 
 
@@ -74,93 +85,211 @@ class TestDeconstructOneArtifact(unittest.TestCase):
         self.assertEqual(nuggets, [])
 
 
-class TestProcessPendingArtifacts(unittest.TestCase):
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.mark_artifact_deconstructed", return_value=True)
-    @patch(f"{_REPO}.insert_nugget", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status", return_value=True)
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_returns_summary_dict(self, mock_list, mock_status, mock_insert,
-                                  mock_mark, mock_audit):
-        mock_list.return_value = [_artifact()]
-        result = process_pending_artifacts(tenant_id="t1")
-        self.assertIn("processed", result)
-        self.assertIn("nuggets_created", result)
-        self.assertIn("skipped", result)
-        self.assertIn("failed", result)
-
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.mark_artifact_deconstructed", return_value=True)
-    @patch(f"{_REPO}.insert_nugget", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status", return_value=True)
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_processes_artifact_with_detectable_claims(
-        self, mock_list, mock_status, mock_insert, mock_mark, mock_audit
+@contextlib.contextmanager
+def _fake_uow():
+    yield MagicMock()
+
+
+@patch(f"{_REPO}.unit_of_work", _fake_uow)
+@patch(f"{_REPO}.release_artifact_batch")
+@patch(f"{_REPO}.complete_artifact_batch", side_effect=lambda outcomes, leases: len(outcomes))
+@patch(f"{_REPO}.record_audits")
+@patch(f"{_REPO}.insert_nuggets", side_effect=len)
+@patch(f"{_REPO}.claim_artifact_batch")
+class TestDeconstructArtifactBatch(unittest.TestCase):
+    def test_writes_batch_with_one_call_per_table(
+        self, mock_claim, mock_nuggets, mock_audits, mock_complete, mock_release
     ):
-        mock_list.return_value = [_artifact()]
-        result = process_pending_artifacts(tenant_id="t1")
-        self.assertGreaterEqual(result["processed"], 1)
-        self.assertGreater(result["nuggets_created"], 0)
-        self.assertEqual(result["skipped"], 0)
-
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status", return_value=True)
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_artifact_with_no_claims_is_skipped(
-        self, mock_list, mock_status, mock_audit
+        mock_claim.return_value = [_artifact("a1"), _artifact("a2", tenant_id="t2")]
+        summary = deconstruct_artifact_batch(batch_size=5)
+        self.assertEqual(summary.claimed, 2)
+        self.assertEqual(summary.processed, 2)
+        self.assertGreater(summary.nuggets_created, 0)
+        mock_nuggets.assert_called_once()
+        mock_audits.assert_called_once()
+        mock_complete.assert_called_once()
+        mock_release.assert_not_called()
+        self.assertEqual(mock_claim.call_args.kwargs["limit"], 5)
+        self.assertIsNone(mock_claim.call_args.kwargs["tenant_id"])
+        outcomes = mock_complete.call_args.args[0]
+        self.assertEqual([o[0] for o in outcomes], ["a1", "a2"])
+        self.assertEqual({o[1] for o in outcomes}, {"complete"})
+        nugget_ids = [n.nugget_id for n in mock_nuggets.call_args.args[0]]
+        self.assertEqual(sum(len(o[2]) for o in outcomes), len(nugget_ids))
+        self.assertEqual(mock_complete.call_args.kwargs["leases"], {"a1": 1, "a2": 1})
+
+    def test_audit_events_emitted(self, mock_claim, mock_nuggets, mock_audits, *_):
+        mock_claim.return_value = [_artifact(tenant_id="t9")]
+        deconstruct_artifact_batch()
+        rows = mock_audits.call_args.args[0]
+        kinds = [r["event_kind"] for r in rows]
+        self.assertEqual(kinds[0], "artifact.deconstruction_started")
+        self.assertEqual(kinds[-1], "artifact.deconstruction_complete")
+        self.assertEqual(kinds.count("nugget.created"), len(mock_nuggets.call_args.args[0]))
+        self.assertEqual({r["tenant_id"] for r in rows}, {"t9"})
+        self.assertEqual(len({r["audit_id"] for r in rows}), len(rows))
+
+    def test_artifact_with_no_claims_is_skipped(self, mock_claim, mock_nuggets, mock_audits, mock_complete, _):
+        mock_claim.return_value = [_artifact(artifact_text="Ok.")]
+        summary = deconstruct_artifact_batch()
+        self.assertEqual(summary.skipped, 1)
+        self.assertEqual(summary.processed, 0)
+        self.assertEqual(mock_complete.call_args.args[0], [("a1", "skipped", [])])
+        kinds = [r["event_kind"] for r in mock_audits.call_args.args[0]]
+        self.assertIn("artifact.deconstruction_skipped", kinds)
+
+    def test_failed_write_releases_whole_batch(self, mock_claim, mock_nuggets, mock_audits, _, mock_release):
+        mock_claim.return_value = [_artifact("a1"), _artifact("a2")]
+        mock_nuggets.side_effect = RuntimeError("fk violation")
+        summary = deconstruct_artifact_batch()
+        self.assertEqual(summary.failed, 2)
+        self.assertEqual(summary.processed, 0)
+        self.assertEqual(summary.nuggets_created, 0)
+        kwargs = mock_release.call_args.kwargs
+        self.assertEqual(kwargs["leases"], {"a1": 1, "a2": 1})
+        self.assertIn("fk violation", kwargs["error"])
+        mock_audits.assert_not_called()
+
+    def test_lost_lease_rolls_back_and_releases_batch(
+        self, mock_claim, mock_nuggets, mock_audits, mock_complete, mock_release
     ):
-        mock_list.return_value = [_artifact(artifact_text="Ok.")]
-        result = process_pending_artifacts(tenant_id="t1")
-        self.assertEqual(result["skipped"], 1)
-        self.assertEqual(result["processed"], 0)
-        # Status transitions: in_progress → skipped
-        calls = [c.kwargs["new_status"] for c in mock_status.call_args_list]
-        self.assertIn("in_progress", calls)
-        self.assertIn("skipped", calls)
-
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction",
-           side_effect=Exception("db down"))
-    def test_db_failure_on_list_returns_zero_summary(self, _):
+        second = dict(_artifact("a2"), deconstruction_attempts=3)
+        mock_claim.return_value = [_artifact("a1"), second]
+        mock_complete.side_effect = lambda outcomes, leases: len(outcomes) - 1
+        with patch(f"{_REPO}.unit_of_work") as mock_uow:
+            summary = deconstruct_artifact_batch()
+        exc_type = mock_uow.return_value.__exit__.call_args.args[0]
+        self.assertIs(exc_type, RuntimeError)
+        self.assertEqual(summary.failed, 2)
+        self.assertEqual(summary.processed, 0)
+        self.assertEqual(summary.nuggets_created, 0)
+        kwargs = mock_release.call_args.kwargs
+        self.assertEqual(kwargs["leases"], {"a1": 1, "a2": 3})
+        self.assertIn("lease lost on 1 of 2", kwargs["error"])
+        mock_audits.assert_not_called()
+
+    def test_empty_claim_writes_nothing(self, mock_claim, mock_nuggets, *_):
+        mock_claim.return_value = []
+        summary = deconstruct_artifact_batch()
+        self.assertEqual(summary.claimed, 0)
+        mock_nuggets.assert_not_called()
+
+
+class TestProcessPendingArtifacts(unittest.TestCase):
+    @patch(f"{_REPO}.deconstruct_artifact_batch",
+           return_value=SecondOrderSummary(claimed=1, processed=1, nuggets_created=2))
+    def test_returns_summary_dict(self, mock_batch):
+        result = process_pending_artifacts(tenant_id="t1", batch_size=5)
+        for key in ("processed", "nuggets_created", "skipped", "failed", "artifacts_per_second"):
+            self.assertIn(key, result)
+        self.assertEqual(result["nuggets_created"], 2)
+        mock_batch.assert_called_once_with(batch_size=5, tenant_id="t1")
+
+    @patch(f"{_REPO}.claim_artifact_batch", side_effect=Exception("db down"))
+    def test_db_failure_on_claim_returns_zero_summary(self, _):
         result = process_pending_artifacts(tenant_id="t1")
         self.assertEqual(result["processed"], 0)
         self.assertEqual(result["nuggets_created"], 0)
         self.assertEqual(result["failed"], 0)
 
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.mark_artifact_deconstructed", return_value=True)
-    @patch(f"{_REPO}.insert_nugget", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status",
-           side_effect=Exception("lock timeout"))
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_status_update_failure_increments_failed(
-        self, mock_list, mock_status, mock_insert, mock_mark, mock_audit
-    ):
-        mock_list.return_value = [_artifact()]
-        result = process_pending_artifacts(tenant_id="t1")
-        self.assertEqual(result["failed"], 1)
-
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.mark_artifact_deconstructed", return_value=True)
-    @patch(f"{_REPO}.insert_nugget", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status", return_value=True)
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_batch_size_passed_to_repo(self, mock_list, *_):
-        mock_list.return_value = []
-        process_pending_artifacts(tenant_id="t1", batch_size=5)
-        mock_list.assert_called_once_with(tenant_id="t1", limit=5)
-
-    @patch(f"{_REPO}.insert_audit_event", return_value=True)
-    @patch(f"{_REPO}.mark_artifact_deconstructed", return_value=True)
-    @patch(f"{_REPO}.insert_nugget", return_value=True)
-    @patch(f"{_REPO}.update_artifact_deconstruction_status", return_value=True)
-    @patch(f"{_REPO}.list_rail_artifacts_pending_deconstruction")
-    def test_audit_events_emitted(self, mock_list, mock_status, mock_insert,
-                                   mock_mark, mock_audit):
-        mock_list.return_value = [_artifact()]
-        process_pending_artifacts(tenant_id="t1")
-        kinds = [c.kwargs["event_kind"] for c in mock_audit.call_args_list]
-        self.assertIn("artifact.deconstruction_started", kinds)
-        self.assertIn("artifact.deconstruction_complete", kinds)
+
+class TestSecondOrderSummary(unittest.TestCase):
+    def test_artifacts_per_second(self):
+        s = SecondOrderSummary(processed=8, skipped=2, elapsed_seconds=2.0)
+        self.assertEqual(s.artifacts_per_second, 5.0)
+        self.assertEqual(SecondOrderSummary().artifacts_per_second, 0.0)
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_workers_drain_until_stopped(self):
+        drained = threading.Event()
+        batches = [SecondOrderSummary(claimed=2, processed=2), SecondOrderSummary(claimed=1, skipped=1)]
+
+        def fake_batch(*, batch_size, tenant_id):
+            if batches:
+                return batches.pop(0)
+            drained.set()
+            return SecondOrderSummary()
+
+        with patch(f"{_REPO}.deconstruct_artifact_batch", side_effect=fake_batch):
+            pool = SecondOrderWorkerPool(workers=1, batch_size=2, poll_seconds=0.01)
+            pool.start()
+            self.assertTrue(drained.wait(2))
+            pool.stop(timeout=2)
+        report = pool.report()
+        self.assertEqual(report["processed"], 2)
+        self.assertEqual(report["skipped"], 1)
+        self.assertGreater(report["interval_artifacts_per_second"], 0)
+
+
+class TestClaimArtifactBatch(unittest.TestCase):
+    def _conn(self):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        return conn, conn.cursor.return_value.__enter__.return_value
+
+    def test_claims_with_skip_locked_across_tenants(self):
+        conn, cur = self._conn()
+        cur.fetchall.return_value = []
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            claim_artifact_batch(limit=10, lease_seconds=60, max_attempts=3)
+        sql, params = cur.execute.call_args.args
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertNotIn("AND tenant_id = %s", sql)
+        self.assertIn("deconstruction_attempts >= %s", sql)
+        self.assertEqual(params, [3, 60, 3, 10])
+
+    def test_tenant_filter(self):
+        conn, cur = self._conn()
+        row = ("a1", "t1", "s1", "card1", "text", "risk", False, "preserved", "u1", None, 1)
+        cur.fetchall.return_value = [row]
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn):
+            rows = claim_artifact_batch(limit=10, lease_seconds=60, max_attempts=3, tenant_id="t1")
+        sql, params = cur.execute.call_args.args
+        self.assertEqual(sql.count("AND tenant_id = %s"), 2)
+        self.assertEqual(params, [3, "t1", 60, 3, "t1", 10])
+        self.assertEqual(rows[0]["artifact_id"], "a1")
+        self.assertEqual(rows[0]["deconstruction_attempts"], 1)
+
+
+class TestLeaseCheckedWrites(unittest.TestCase):
+    def _run(self, call, returned):
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        execute_values = MagicMock(return_value=returned)
+        with patch("src.service.qualitative_capture.repository.connection", return_value=conn), \
+                patch("src.service.qualitative_capture.repository._load_execute_values",
+                      return_value=execute_values):
+            result = call()
+        return result, execute_values.call_args
+
+    def test_complete_requires_held_lease(self):
+        result, call = self._run(
+            lambda: complete_artifact_batch([("a1", "complete", ["n1"]), ("a2", "skipped", [])],
+                                            leases={"a1": 2, "a2": 1}),
+            returned=[("a1",)],
+        )
+        sql, rows = call.args[1], call.args[2]
+        self.assertIn("second_order_deconstruction_status = 'in_progress'", sql)
+        self.assertIn("deconstruction_attempts = v.attempts", sql)
+        self.assertEqual([r[:3] for r in rows], [("a1", 2, "complete"), ("a2", 1, "skipped")])
+        self.assertEqual(result, 1)
+
+    def test_release_requires_held_lease(self):
+        result, call = self._run(
+            lambda: release_artifact_batch(leases={"a1": 2}, error="boom"),
+            returned=[("a1",)],
+        )
+        sql, rows = call.args[1], call.args[2]
+        self.assertIn("second_order_deconstruction_status = 'in_progress'", sql)
+        self.assertIn("deconstruction_attempts = v.attempts", sql)
+        self.assertEqual(rows, [("a1", 2, "boom")])
+        self.assertEqual(result, 1)
+
+    def test_release_nothing_is_a_no_op(self):
+        with patch("src.service.qualitative_capture.repository.connection") as mock_conn:
+            self.assertEqual(release_artifact_batch(leases={}, error="x"), 0)
+        mock_conn.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 import unittest
+from datetime import UTC, datetime
 from unittest.mock import patch
 
+from src.service.qualitative_capture import session_packet
 from src.service.qualitative_capture.session_packet import (
     SessionIntelligencePacket,
-    _find_core_breakthrough,
     _infer_session_title,
     generate_session_packet,
 )
@@ -20,105 +21,126 @@ def _nugget(claim_type: str, confidence: float = 0.50, rail_candidate: bool = Fa
         "polarity": "neutral",
         "rail_candidate": rail_candidate,
         "selection_method": "machine_extracted",
-        "created_at": "2026-05-20T00:00:00+00:00",
+        "created_epoch": 1779235200.0,
     }
 
 
 class TestInferSessionTitle(unittest.TestCase):
-    def test_empty_nuggets_returns_fallback(self):
-        title = _infer_session_title([], domain=None)
+    def test_empty_counts_returns_fallback(self):
+        title = _infer_session_title({}, domain=None)
         self.assertIn("Empty session", title)
 
     def test_single_type_appears_in_title(self):
-        nuggets = [_nugget("doctrine")] * 3
-        title = _infer_session_title(nuggets, domain="strategy")
+        title = _infer_session_title({"doctrine": 3}, domain="strategy")
         self.assertIn("doctrine", title)
         self.assertIn("strategy", title)
 
-    def test_domain_appears_in_title(self):
-        nuggets = [_nugget("risk")]
-        title = _infer_session_title(nuggets, domain="capital")
-        self.assertIn("capital", title)
+    def test_top_three_types_by_count_then_name(self):
+        counts = {"risk": 5, "opportunity": 2, "doctrine": 2, "tactic": 1, "causal_claim": 2}
+        title = _infer_session_title(counts, domain=None)
+        self.assertEqual(title, "risk · causal claim · doctrine")
 
     def test_no_domain_omits_brackets(self):
-        nuggets = [_nugget("doctrine")]
-        title = _infer_session_title(nuggets, domain=None)
+        title = _infer_session_title({"doctrine": 1}, domain=None)
         self.assertNotIn("[", title)
 
 
-class TestFindCoreBreakthrough(unittest.TestCase):
-    def test_empty_returns_none(self):
-        self.assertIsNone(_find_core_breakthrough([]))
+_LOAD = "src.service.qualitative_capture.session_packet.load_session_packet_sources"
 
-    def test_rail_candidate_preferred(self):
-        nuggets = [
-            _nugget("observation", confidence=0.91, rail_candidate=False),
-            _nugget("doctrine", confidence=0.50, rail_candidate=True),
-        ]
-        result = _find_core_breakthrough(nuggets)
-        self.assertIn("doctrine", result)
 
-    def test_doctrine_preferred_over_other_rail_candidates(self):
-        nuggets = [
-            _nugget("risk", confidence=0.91, rail_candidate=True),
-            _nugget("doctrine", confidence=0.72, rail_candidate=True),
-        ]
-        result = _find_core_breakthrough(nuggets)
-        self.assertIn("doctrine", result)
+def _summary(nuggets=(), **fields) -> dict:
+    nuggets = list(nuggets)
+    counts: dict = {}
+    for n in nuggets:
+        counts[n["claim_type"]] = counts.get(n["claim_type"], 0) + 1
+    summary = {
+        "nugget_count": len(nuggets),
+        "claim_type_counts": counts,
+        "top_nuggets": nuggets[:10],
+        "doctrine_candidates": [n for n in nuggets if n["claim_type"] in ("doctrine", "principle")][:10],
+        "decisions_made": [],
+        "open_questions": [],
+        "core_breakthrough": nuggets[:1],
+    }
+    summary.update(fields)
+    return summary
 
-    def test_returns_claim_text(self):
-        nuggets = [_nugget("doctrine", confidence=0.72, rail_candidate=True)]
-        result = _find_core_breakthrough(nuggets)
-        self.assertIsInstance(result, str)
-        self.assertGreater(len(result), 0)
+
+def _sources(nuggets=(), **sections) -> dict:
+    out = {
+        "summary": _summary(nuggets) if nuggets else None,
+        "preserved_ideas": [], "pending_promotions": [], "conclusions": [],
+    }
+    out.update(sections)
+    return out
 
 
 class TestGenerateSessionPacket(unittest.TestCase):
-    @patch("src.service.qualitative_capture.session_packet.list_conclusions", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_promotion_candidates", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_preserved_ideas_for_session", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_nuggets")
-    def test_returns_packet(self, mock_nuggets, mock_ideas, mock_promo, mock_conclusions):
-        mock_nuggets.return_value = [
+    def setUp(self):
+        session_packet.clear_cache()
+        self.addCleanup(session_packet.clear_cache)
+
+    @patch(_LOAD)
+    def test_returns_packet(self, mock_load):
+        mock_load.return_value = _sources([
             _nugget("doctrine", confidence=0.72, rail_candidate=True),
             _nugget("risk", confidence=0.50),
-        ]
+        ])
         packet = generate_session_packet(tenant_id="t1", session_id="s1", domain="strategy")
         self.assertIsInstance(packet, SessionIntelligencePacket)
         self.assertEqual(packet.session_id, "s1")
         self.assertEqual(packet.tenant_id, "t1")
         self.assertEqual(packet.nugget_count, 2)
         self.assertFalse(packet.is_empty)
+        kwargs = mock_load.call_args.kwargs
+        self.assertEqual((kwargs["tenant_id"], kwargs["session_id"]), ("t1", "s1"))
 
-    @patch("src.service.qualitative_capture.session_packet.list_conclusions", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_promotion_candidates", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_preserved_ideas_for_session", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_nuggets", return_value=[])
-    def test_empty_session_is_empty(self, mock_nuggets, mock_ideas, mock_promo, mock_conclusions):
+    @patch(_LOAD, return_value=_sources())
+    def test_empty_session_is_empty(self, mock_load):
         packet = generate_session_packet(tenant_id="t1", session_id="s1")
         self.assertTrue(packet.is_empty)
         self.assertEqual(packet.nugget_count, 0)
         self.assertIsNone(packet.core_breakthrough)
 
-    @patch("src.service.qualitative_capture.session_packet.list_conclusions", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_promotion_candidates", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_preserved_ideas_for_session", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_nuggets")
-    def test_doctrine_candidates_populated(self, mock_nuggets, *_):
-        mock_nuggets.return_value = [
+    @patch(_LOAD)
+    def test_packet_reflects_summary_beyond_old_row_cap(self, mock_load):
+        top = [_nugget("doctrine", confidence=0.9, rail_candidate=True)]
+        mock_load.return_value = _sources(summary=_summary(
+            top, nugget_count=12000, claim_type_counts={"doctrine": 7000, "risk": 5000},
+        ))
+        packet = generate_session_packet(tenant_id="t1", session_id="s1", domain="strategy")
+        self.assertEqual(packet.nugget_count, 12000)
+        self.assertEqual(packet.claim_type_breakdown, {"doctrine": 7000, "risk": 5000})
+        self.assertEqual(packet.session_title, "doctrine · risk [strategy]")
+        self.assertEqual(packet.core_breakthrough, top[0]["claim_text"])
+        self.assertNotIn("created_epoch", packet.top_nuggets[0])
+
+    @patch(_LOAD)
+    def test_doctrine_candidates_populated(self, mock_load):
+        mock_load.return_value = _sources([
             _nugget("doctrine", confidence=0.72),
             _nugget("principle", confidence=0.50),
             _nugget("risk", confidence=0.50),
-        ]
+        ])
         packet = generate_session_packet(tenant_id="t1", session_id="s1")
         self.assertEqual(len(packet.doctrine_candidates), 2)
 
-    @patch("src.service.qualitative_capture.session_packet.list_conclusions", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_promotion_candidates", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_preserved_ideas_for_session", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_nuggets")
-    def test_to_dict_is_serializable(self, mock_nuggets, *_):
-        mock_nuggets.return_value = [_nugget("doctrine", confidence=0.72)]
+    @patch(_LOAD)
+    def test_sections_come_from_the_single_load(self, mock_load):
+        mock_load.return_value = _sources(
+            preserved_ideas=[{"idea_id": "i1"}],
+            pending_promotions=[{"candidate_id": "c1"}],
+            conclusions=[{"conclusion_id": "x1"}],
+        )
+        packet = generate_session_packet(tenant_id="t1", session_id="s1")
+        self.assertEqual(packet.preserved_ideas, [{"idea_id": "i1"}])
+        self.assertEqual(packet.pending_promotions, [{"candidate_id": "c1"}])
+        self.assertEqual(packet.executive_conclusions, [{"conclusion_id": "x1"}])
+        mock_load.assert_called_once()
+
+    @patch(_LOAD)
+    def test_to_dict_is_serializable(self, mock_load):
+        mock_load.return_value = _sources([_nugget("doctrine", confidence=0.72)])
         packet = generate_session_packet(tenant_id="t1", session_id="s1")
         d = packet.to_dict()
         self.assertIn("session_title", d)
@@ -128,13 +150,99 @@ class TestGenerateSessionPacket(unittest.TestCase):
         self.assertIn("decisions_made", d)
         self.assertIn("open_questions", d)
 
-    @patch("src.service.qualitative_capture.session_packet.list_conclusions", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_promotion_candidates", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_preserved_ideas_for_session", return_value=[])
-    @patch("src.service.qualitative_capture.session_packet.list_nuggets", side_effect=Exception("db down"))
-    def test_db_failure_returns_empty_packet(self, *_):
+    @patch(_LOAD, side_effect=Exception("db down"))
+    def test_db_failure_returns_empty_packet(self, mock_load):
         packet = generate_session_packet(tenant_id="t1", session_id="s1")
         self.assertTrue(packet.is_empty)
+        generate_session_packet(tenant_id="t1", session_id="s1")
+        self.assertEqual(mock_load.call_count, 2)   # failures are not cached
+
+
+class TestPacketCache(unittest.TestCase):
+    def setUp(self):
+        session_packet.clear_cache()
+        self.addCleanup(session_packet.clear_cache)
+
+    @patch(_LOAD, return_value=_sources([_nugget("doctrine", confidence=0.72)]))
+    def test_repeat_polls_are_served_from_cache(self, mock_load):
+        first = generate_session_packet(tenant_id="t1", session_id="s1", domain="strategy")
+        second = generate_session_packet(tenant_id="t1", session_id="s1", domain="strategy")
+        self.assertIs(first, second)
+        generate_session_packet(tenant_id="t1", session_id="s1", domain="ops")
+        self.assertEqual(mock_load.call_count, 2)
+
+    @patch(_LOAD, return_value=_sources())
+    def test_session_invalidation_drops_only_that_session(self, mock_load):
+        generate_session_packet(tenant_id="t1", session_id="s1")
+        generate_session_packet(tenant_id="t1", session_id="s2")
+        session_packet.invalidate("t1", "s1")
+        generate_session_packet(tenant_id="t1", session_id="s1")
+        generate_session_packet(tenant_id="t1", session_id="s2")
+        self.assertEqual(mock_load.call_count, 3)
+
+    @patch(_LOAD, return_value=_sources())
+    def test_tenant_invalidation_drops_every_session(self, mock_load):
+        generate_session_packet(tenant_id="t1", session_id="s1")
+        generate_session_packet(tenant_id="t2", session_id="s1")
+        session_packet.invalidate("t1")
+        generate_session_packet(tenant_id="t1", session_id="s1")
+        generate_session_packet(tenant_id="t2", session_id="s1")
+        self.assertEqual(mock_load.call_count, 3)
+
+    def test_build_racing_an_invalidation_is_not_cached(self):
+        def load(**_):
+            session_packet.invalidate("t1", "s1")   # a write commits mid-build
+            return _sources()
+
+        with patch(_LOAD, side_effect=load) as mock_load:
+            generate_session_packet(tenant_id="t1", session_id="s1")
+            generate_session_packet(tenant_id="t1", session_id="s1")
+        self.assertEqual(mock_load.call_count, 2)
+
+    def test_entries_expire_after_ttl(self):
+        cache = session_packet._PacketCache(max_size=4, ttl=0.0)
+        key = ("t1", "s1", None)
+        cache.put(key, object(), cache.generation("t1", "s1"))
+        self.assertIsNone(cache.get(key))
+
+    @patch("src.service.qualitative_capture.repository.connection")
+    def test_repository_writes_invalidate_the_session(self, mock_conn):
+        from src.service.qualitative_capture.models import PreservedIdea
+        from src.service.qualitative_capture.repository import insert_preserved_idea
+
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value.rowcount = 1
+        with patch(_LOAD, return_value=_sources()) as mock_load:
+            generate_session_packet(tenant_id="t1", session_id="s1")
+            insert_preserved_idea(PreservedIdea(
+                idea_id="i1", tenant_id="t1", nugget_id="n1", session_id="s1",
+                source_event_id="e1", selected_text="Fire hose.", memorialized_by="u1",
+                memorialized_at=datetime(2026, 5, 20, tzinfo=UTC),
+            ))
+            generate_session_packet(tenant_id="t1", session_id="s1")
+        self.assertEqual(mock_load.call_count, 2)
+
+
+class TestLoadSessionPacketSources(unittest.TestCase):
+    @patch("src.service.qualitative_capture.repository.connection")
+    def test_one_statement_and_restored_timestamps(self, mock_conn):
+        from src.service.qualitative_capture.repository import load_session_packet_sources
+
+        cur = mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cur.fetchone.return_value = (
+            {"nugget_count": 3, "claim_type_counts": {"risk": 3}, "updated_at": "2026-05-20T10:00:00.5+00:00"},
+            [{"idea_id": "i1", "memorialized_at": "2026-05-20T11:00:00+00:00",
+              "structural_threshold_crossed_at": None}],
+            None,
+            [],
+        )
+        out = load_session_packet_sources(tenant_id="t1", session_id="s1", section_limit=10)
+        cur.execute.assert_called_once()
+        self.assertEqual(out["summary"]["nugget_count"], 3)
+        self.assertEqual(out["summary"]["updated_at"], datetime(2026, 5, 20, 10, 0, 0, 500000, tzinfo=UTC))
+        self.assertEqual(out["preserved_ideas"][0]["memorialized_at"].hour, 11)
+        self.assertEqual(out["pending_promotions"], [])
+        self.assertEqual(out["conclusions"], [])
 
 
 if __name__ == "__main__":
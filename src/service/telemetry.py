@@ -0,0 +1,233 @@
+"""
+Request-scoped stage timing and process-wide latency histograms.
+
+A trace collects spans for one request in the current context:
+
+    with telemetry.trace() as t:
+        with telemetry.span("activation"):
+            ...
+        out["execution_trace"]["timings"] = t.to_dict()
+
+Each span records its monotonic duration and the number of DB round trips
+made while it was open (counted by the pooled connections; see
+db/postgres.get_conn). Nested spans are named by path ("engine.polymorphia").
+
+Every finished span is also observed into a process-wide histogram,
+whether or not a trace is active, and render_prometheus() exports them in
+the Prometheus text format for the /metrics endpoint. No client library is
+needed; histograms are fixed-bucket counters behind one lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Seconds. Covers sub-millisecond in-memory stages up to slow DB writes.
+_DURATION_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+_ROUND_TRIP_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+
+# ---------------------------------------------------------------------------
+# Traces and spans
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SpanRecord:
+    name: str
+    duration_ms: float
+    db_round_trips: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration_ms": self.duration_ms,
+            "db_round_trips": self.db_round_trips,
+        }
+
+
+@dataclass
+class Trace:
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: List[SpanRecord] = field(default_factory=list)
+    _path: List[str] = field(default_factory=list)
+    _trips_base: int = 0
+    _trips_final: Optional[int] = None
+
+    @property
+    def db_round_trips(self) -> int:
+        if self._trips_final is not None:
+            return self._trips_final
+        return _round_trips.get() - self._trips_base
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot so far; safe to call while the trace is still open."""
+        return {
+            "total_ms": round((time.perf_counter() - self.started_at) * 1000.0, 3),
+            "db_round_trips": self.db_round_trips,
+            "stages": [s.to_dict() for s in self.spans],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("telemetry_trace", default=None)
+
+# Round trips outside any trace still feed the per-span histograms, so the
+# counter lives in its own context variable rather than on the Trace.
+_round_trips: ContextVar[int] = ContextVar("telemetry_db_round_trips", default=0)
+
+
+@contextmanager
+def trace() -> Iterator[Trace]:
+    """Start a trace for the current context. Nested calls join the outer trace."""
+    outer = _current_trace.get()
+    if outer is not None:
+        yield outer
+        return
+    t = Trace(_trips_base=_round_trips.get())
+    token = _current_trace.set(t)
+    try:
+        yield t
+    finally:
+        t._trips_final = t.db_round_trips
+        _current_trace.reset(token)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time one stage and count the DB round trips it made."""
+    t = _current_trace.get()
+    full_name = ".".join([*t._path, name]) if t is not None and t._path else name
+    if t is not None:
+        t._path.append(name)
+    trips_before = _round_trips.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        trips = _round_trips.get() - trips_before
+        if t is not None:
+            t._path.pop()
+            t.spans.append(SpanRecord(
+                name=full_name,
+                duration_ms=round(elapsed * 1000.0, 3),
+                db_round_trips=trips,
+            ))
+        STAGE_DURATION.observe(elapsed, stage=full_name)
+        STAGE_DB_ROUND_TRIPS.observe(trips, stage=full_name)
+
+
+def note_db_round_trip(n: int = 1) -> None:
+    """Called by the DB layer once per statement or commit sent to the server."""
+    _round_trips.set(_round_trips.get() + n)
+
+
+# ---------------------------------------------------------------------------
+# Histograms
+# ---------------------------------------------------------------------------
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, label: str, buckets: Tuple[float, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label value -> (per-bucket counts with a trailing +Inf slot, [sum])
+        self._series: Dict[str, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = labels[self.label]
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[key] = series
+            counts, total = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Cumulative bucket counts per label value (Prometheus semantics)."""
+        with self._lock:
+            items = [(k, list(c), s[0]) for k, (c, s) in self._series.items()]
+        out: Dict[str, Dict[str, Any]] = {}
+        for key, counts, total in items:
+            running = 0
+            cumulative: List[Tuple[float, int]] = []
+            for bound, c in zip(self.buckets, counts):
+                running += c
+                cumulative.append((bound, running))
+            out[key] = {"buckets": cumulative, "count": running + counts[-1], "sum": total}
+        return out
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, s in sorted(self.snapshot().items()):
+            lbl = f'{self.label}="{_escape(key)}"'
+            for bound, c in s["buckets"]:
+                lines.append(f'{self.name}_bucket{{{lbl},le="{_fmt(bound)}"}} {c}')
+            lines.append(f'{self.name}_bucket{{{lbl},le="+Inf"}} {s["count"]}')
+            lines.append(f"{self.name}_sum{{{lbl}}} {_fmt(s['sum'])}")
+            lines.append(f"{self.name}_count{{{lbl}}} {s['count']}")
+        return lines
+
+
+def _fmt(v: float) -> str:
+    f = float(v)
+    return str(int(f)) if f.is_integer() else repr(f)
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+STAGE_DURATION = Histogram(
+    "execalc_stage_duration_seconds",
+    "Duration of an instrumented request stage.",
+    "stage", _DURATION_BUCKETS,
+)
+STAGE_DB_ROUND_TRIPS = Histogram(
+    "execalc_stage_db_round_trips",
+    "DB round trips made during an instrumented request stage.",
+    "stage", _ROUND_TRIP_BUCKETS,
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "execalc_http_request_duration_seconds",
+    "Duration of an HTTP request, by Flask endpoint.",
+    "endpoint", _DURATION_BUCKETS,
+)
+
+_HISTOGRAMS = (STAGE_DURATION, STAGE_DB_ROUND_TRIPS, HTTP_REQUEST_DURATION)
+
+
+def render_prometheus() -> str:
+    lines: List[str] = []
+    for h in _HISTOGRAMS:
+        lines.extend(h.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """Clear every histogram (tests)."""
+    for h in _HISTOGRAMS:
+        h.reset()
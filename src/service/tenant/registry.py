@@ -18,9 +18,9 @@ from src.service.tenant.errors import TenantNotFound
 
 try:
     # Runtime canonical store (Cloud SQL / Postgres)
-    from src.service.db.postgres import get_conn  # type: ignore
+    from src.service.db.postgres import connection  # type: ignore
 except Exception:
-    get_conn = None  # type: ignore
+    connection = None  # type: ignore
 
 
 def _truthy_env(name: str, default: str = "0") -> bool:
@@ -39,16 +39,12 @@ def tenant_exists(tenant_id: str) -> bool:
     Returns True if tenant_id exists in Postgres tenants table.
     Raises RuntimeError if enforcement is on but DB access is unavailable.
     """
-    if get_conn is None:
+    if connection is None:
         raise RuntimeError("tenant registry DB module not available")
 
-    conn = get_conn()
-    try:
-        with conn, conn.cursor() as cur:
-            cur.execute("SELECT 1 FROM tenants WHERE tenant_id = %s LIMIT 1", (tenant_id,))
-            return cur.fetchone() is not None
-    finally:
-        conn.close()
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM tenants WHERE tenant_id = %s LIMIT 1", (tenant_id,))
+        return cur.fetchone() is not None
 
 
 def ensure_tenant_registered(tenant_id: str) -> None:
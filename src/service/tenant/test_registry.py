@@ -15,7 +15,7 @@ class TestTenantRegistry(unittest.TestCase):
     def test_registry_enforcement_enabled_db_missing_raises(self):
         with mock.patch.dict(os.environ, {"EXECALC_ENFORCE_TENANT_REGISTRY": "1"}, clear=False):
             # Force DB module unavailable to prove deterministic failure when enforcement is on.
-            with mock.patch.object(reg, "get_conn", None, create=True):
+            with mock.patch.object(reg, "connection", None, create=True):
                 with self.assertRaisesRegex(RuntimeError, "tenant registry DB module not available"):
                     reg.ensure_tenant_registered("tenant_any")
 
@@ -76,6 +76,43 @@ class TestDecisionAPI(unittest.TestCase):
         self.assertIn("envelope_id", audit)
         self.assertIn("persist", audit)
 
+        timings = report["execution_trace"]["timings"]
+        stages = [s["name"] for s in timings["stages"]]
+        for stage in ("activation", "engine", "boundary", "extraction", "persistence"):
+            self.assertIn(stage, stages)
+        self.assertIn("engine.polymorphia", stages)
+        self.assertGreaterEqual(timings["total_ms"], 0)
+
+    def test_metrics_exposes_stage_histograms(self):
+        self.client.post(
+            "/decision/run",
+            headers=self.headers,
+            json={"scenario": {"scenario_type": "feasibility", "prompt": "p"}},
+        )
+        resp = self.client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        text = resp.get_data(as_text=True)
+        self.assertIn('execalc_stage_duration_seconds_count{stage="engine"}', text)
+        self.assertIn('execalc_http_request_duration_seconds_count{endpoint="decision_run"}', text)
+
+    def test_metrics_requires_bearer_token_outside_dev_harness(self):
+        os.environ["EXECALC_DEV_HARNESS"] = "0"
+        prev = os.environ.pop("EXECALC_METRICS_TOKEN", None)
+        try:
+            self.assertEqual(self.client.get("/metrics").status_code, 403)
+            os.environ["EXECALC_METRICS_TOKEN"] = "s3cret"
+            self.assertEqual(
+                self.client.get("/metrics", headers={"Authorization": "Bearer nope"}).status_code, 403,
+            )
+            self.assertEqual(
+                self.client.get("/metrics", headers={"Authorization": "Bearer s3cret"}).status_code, 200,
+            )
+        finally:
+            if prev is None:
+                os.environ.pop("EXECALC_METRICS_TOKEN", None)
+            else:
+                os.environ["EXECALC_METRICS_TOKEN"] = prev
+
     def test_decision_run_rejects_non_object_scenario(self):
         resp = self.client.post(
             "/decision/run",
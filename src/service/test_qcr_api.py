@@ -108,6 +108,24 @@ class TestQCRIngestEvent(TestQCRApiBase):
         self.assertEqual(body["event_id"], "evt1")
         self.assertIn("nuggets_extracted", body)
 
+    @patch(f"{_MOD}.capture_queue")
+    @patch(f"{_MOD}.deconstruct_event", return_value=[])
+    @patch(f"{_MOD}.ingest_event")
+    def test_queued_event_returns_202_without_inline_capture(self, mock_ingest, mock_dec, mock_queue):
+        mock_ingest.return_value = _event(capture_queued_at=datetime(2026, 5, 20, tzinfo=UTC))
+        resp = self.client.post(
+            "/qcr/events",
+            headers=_HEADERS,
+            json={"session_id": "s1", "message_text": "We will always own quality.", "domain": "ops"},
+        )
+        self.assertEqual(resp.status_code, 202)
+        body = resp.get_json()
+        self.assertEqual(body["event_id"], "evt1")
+        self.assertEqual(body["capture_status"], "queued")
+        self.assertEqual(mock_ingest.call_args.kwargs["domain"], "ops")
+        mock_queue.notify.assert_called_once()
+        mock_dec.assert_not_called()
+
     @patch(f"{_MOD}.insert_nugget", return_value=True)
     @patch(f"{_MOD}.deconstruct_event", return_value=[])
     @patch(f"{_MOD}.ingest_event")
@@ -147,6 +165,57 @@ class TestQCRIngestEvent(TestQCRApiBase):
         self.assertEqual(resp.status_code, 403)
 
 
+class TestQCRIngestEventsBatch(TestQCRApiBase):
+    @patch(f"{_MOD}.ingest_events")
+    def test_returns_per_event_results(self, mock_ingest):
+        from src.service.qualitative_capture.events import EventIngestResult
+        mock_ingest.return_value = [
+            EventIngestResult(index=0, status="ingested", event_id="e0", nuggets_extracted=2, nuggets_persisted=2),
+            EventIngestResult(index=1, status="invalid", error="message_text must not be empty"),
+        ]
+        resp = self.client.post(
+            "/qcr/events:batch",
+            headers=_HEADERS,
+            json={"session_id": "s1", "domain": "ops", "events": [
+                {"message_text": "We will always own quality."}, {"message_text": ""},
+            ]},
+        )
+        self.assertEqual(resp.status_code, 200)
+        body = resp.get_json()
+        self.assertTrue(body["ok"])
+        self.assertEqual([r["status"] for r in body["results"]], ["ingested", "invalid"])
+        self.assertEqual(body["summary"]["nuggets_persisted"], 2)
+        self.assertEqual(body["summary"]["invalid"], 1)
+        kwargs = mock_ingest.call_args.kwargs
+        self.assertEqual((kwargs["tenant_id"], kwargs["session_id"], kwargs["domain"]), ("t1", "s1", "ops"))
+
+    @patch(f"{_MOD}.ingest_events")
+    def test_persistence_failure_returns_503(self, mock_ingest):
+        from src.service.qualitative_capture.events import EventIngestResult
+        mock_ingest.return_value = [EventIngestResult(index=0, status="failed", event_id="e0", error="x")]
+        resp = self.client.post(
+            "/qcr/events:batch", headers=_HEADERS, json={"events": [{"message_text": "Msg."}]},
+        )
+        self.assertEqual(resp.status_code, 503)
+        self.assertFalse(resp.get_json()["ok"])
+
+    @patch(f"{_MOD}.ingest_events")
+    def test_rejects_empty_and_oversized_batches(self, mock_ingest):
+        resp = self.client.post("/qcr/events:batch", headers=_HEADERS, json={"events": []})
+        self.assertEqual(resp.status_code, 400)
+        with patch.dict(os.environ, {"EXECALC_QCR_BATCH_MAX_EVENTS": "2"}):
+            resp = self.client.post(
+                "/qcr/events:batch", headers=_HEADERS, json={"events": [{"message_text": "m"}] * 3},
+            )
+        self.assertEqual(resp.status_code, 413)
+        mock_ingest.assert_not_called()
+
+    def test_rejects_non_operator_role(self):
+        headers = {**_HEADERS, "X-Role": "viewer"}
+        resp = self.client.post("/qcr/events:batch", headers=headers, json={})
+        self.assertEqual(resp.status_code, 403)
+
+
 class TestQCRMemorialize(TestQCRApiBase):
     @patch(f"{_MOD}.memorialize")
     def test_returns_idea(self, mock_mem):
@@ -222,32 +291,85 @@ class TestQCRSessionRail(TestQCRApiBase):
 
 
 class TestQCRGetNuggets(TestQCRApiBase):
-    @patch(f"{_MOD}.search_claims", return_value=[{"nugget_id": "n1"}])
+    @patch(f"{_MOD}.search_claims_page")
     def test_query_mode_delegates_to_search(self, mock_search):
-        resp = self.client.get("/qcr/nuggets?q=doctrine", headers=_HEADERS)
+        from src.service.qualitative_capture.retrieval import NuggetPage
+        mock_search.return_value = NuggetPage(nuggets=[{"nugget_id": "n1"}], next_cursor="abc")
+        resp = self.client.get("/qcr/nuggets?q=doctrine&limit=500&cursor=xyz", headers=_HEADERS)
         self.assertEqual(resp.status_code, 200)
         body = resp.get_json()
         self.assertTrue(body["ok"])
         self.assertEqual(body["count"], 1)
-        mock_search.assert_called_once()
+        self.assertEqual(body["next_cursor"], "abc")
+        kwargs = mock_search.call_args.kwargs
+        self.assertEqual((kwargs["cursor"], kwargs["limit"]), ("xyz", 100))
+
+    def test_query_mode_rejects_malformed_cursor(self):
+        resp = self.client.get("/qcr/nuggets?q=doctrine&cursor=%25%25", headers=_HEADERS)
+        self.assertEqual(resp.status_code, 400)
 
-    @patch(f"{_MOD}.retrieve_doctrine", return_value=[{"nugget_id": "n2"}])
+    @patch(f"{_MOD}.retrieve_categories", return_value={"doctrine": [{"nugget_id": "n2"}]})
     def test_category_doctrine_delegates(self, mock_retrieve):
         resp = self.client.get("/qcr/nuggets?category=doctrine", headers=_HEADERS)
         self.assertEqual(resp.status_code, 200)
-        mock_retrieve.assert_called_once()
+        self.assertEqual(resp.get_json()["nuggets"], [{"nugget_id": "n2"}])
+        self.assertEqual(mock_retrieve.call_args.kwargs["categories"], ["doctrine"])
 
-    @patch(f"{_MOD}.retrieve_risks", return_value=[])
-    def test_category_risks_delegates(self, mock_retrieve):
-        resp = self.client.get("/qcr/nuggets?category=risks", headers=_HEADERS)
+    @patch(f"{_MOD}.retrieve_categories", return_value={"risks": [{"nugget_id": "n1"}], "open": []})
+    def test_several_categories_in_one_call(self, mock_retrieve):
+        resp = self.client.get("/qcr/nuggets?category=risks,open&limit=5", headers=_HEADERS)
         self.assertEqual(resp.status_code, 200)
+        body = resp.get_json()
+        self.assertEqual(body["categories"], {"risks": [{"nugget_id": "n1"}], "open": []})
+        self.assertEqual(body["count"], 1)
         mock_retrieve.assert_called_once()
+        kwargs = mock_retrieve.call_args.kwargs
+        self.assertEqual((kwargs["categories"], kwargs["limit"]), (["risks", "open"], 5))
+
+    def test_unknown_category_returns_400(self):
+        resp = self.client.get("/qcr/nuggets?category=gossip", headers=_HEADERS)
+        self.assertEqual(resp.status_code, 400)
 
     def test_no_category_or_query_returns_400(self):
         resp = self.client.get("/qcr/nuggets", headers=_HEADERS)
         self.assertEqual(resp.status_code, 400)
 
 
+class TestQCRPageNuggets(TestQCRApiBase):
+    @patch(f"{_MOD}.list_claims_page")
+    def test_returns_page_and_cursor(self, mock_page):
+        from src.service.qualitative_capture.retrieval import NuggetPage
+        mock_page.return_value = NuggetPage(nuggets=[{"nugget_id": "n1"}], next_cursor="abc")
+        resp = self.client.get(
+            "/qcr/nuggets:page?limit=9999&cursor=xyz&claim_type=risk", headers=_HEADERS,
+        )
+        self.assertEqual(resp.status_code, 200)
+        body = resp.get_json()
+        self.assertEqual((body["count"], body["next_cursor"]), (1, "abc"))
+        kwargs = mock_page.call_args.kwargs
+        self.assertEqual((kwargs["limit"], kwargs["cursor"], kwargs["claim_type"]), (500, "xyz", "risk"))
+
+    def test_malformed_cursor_returns_400(self):
+        resp = self.client.get("/qcr/nuggets:page?cursor=bm90LWEtY3Vyc29y", headers=_HEADERS)
+        self.assertEqual(resp.status_code, 400)
+
+
+class TestQCRExportNuggets(TestQCRApiBase):
+    _ADMIN = {**_HEADERS, "X-Role": "admin"}
+
+    @patch(f"{_MOD}.export_claims_ndjson", return_value=iter(['{"nugget_id": "n1"}\n', '{"nugget_id": "n2"}\n']))
+    def test_streams_ndjson(self, mock_export):
+        resp = self.client.get("/qcr/nuggets:export?session_id=s1", headers=self._ADMIN)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.mimetype, "application/x-ndjson")
+        self.assertEqual(resp.get_data(as_text=True).splitlines(), ['{"nugget_id": "n1"}', '{"nugget_id": "n2"}'])
+        self.assertEqual(mock_export.call_args.kwargs["session_id"], "s1")
+
+    def test_operator_forbidden(self):
+        resp = self.client.get("/qcr/nuggets:export", headers=_HEADERS)
+        self.assertEqual(resp.status_code, 403)
+
+
 class TestQCRSecondOrderRun(TestQCRApiBase):
     @patch(f"{_MOD}.process_pending_artifacts",
            return_value={"processed": 3, "nuggets_created": 7, "skipped": 1, "failed": 0})
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from src.service import telemetry
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics():
+    telemetry.reset_metrics()
+    yield
+    telemetry.reset_metrics()
+
+
+def test_spans_record_duration_and_round_trips_in_trace():
+    with telemetry.trace() as t:
+        with telemetry.span("activation"):
+            telemetry.note_db_round_trip()
+            telemetry.note_db_round_trip()
+        with telemetry.span("engine"):
+            with telemetry.span("polymorphia"):
+                pass
+        out = t.to_dict()
+
+    names = [s["name"] for s in out["stages"]]
+    assert names == ["activation", "engine.polymorphia", "engine"]
+    assert out["stages"][0]["db_round_trips"] == 2
+    assert out["stages"][2]["db_round_trips"] == 0
+    assert out["db_round_trips"] == 2
+    assert all(s["duration_ms"] >= 0 for s in out["stages"])
+
+
+def test_nested_trace_joins_outer():
+    with telemetry.trace() as outer:
+        with telemetry.trace() as inner:
+            assert inner is outer
+    assert telemetry.current_trace() is None
+
+
+def test_span_without_trace_still_feeds_histograms():
+    with telemetry.span("standalone"):
+        telemetry.note_db_round_trip()
+    durations = telemetry.STAGE_DURATION.snapshot()["standalone"]
+    trips = telemetry.STAGE_DB_ROUND_TRIPS.snapshot()["standalone"]
+    assert durations["count"] == 1
+    assert trips["sum"] == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    h = telemetry.Histogram("h", "help", "stage", (1.0, 2.0))
+    for v in (0.5, 1.5, 1.5, 9.0):
+        h.observe(v, stage="s")
+    snap = h.snapshot()["s"]
+    assert snap["buckets"] == [(1.0, 1), (2.0, 3)]
+    assert snap["count"] == 4
+    assert snap["sum"] == 12.5
+
+
+def test_render_prometheus_text_format():
+    telemetry.STAGE_DURATION.observe(0.003, stage='we"ird')
+    text = telemetry.render_prometheus()
+    assert "# TYPE execalc_stage_duration_seconds histogram" in text
+    assert 'execalc_stage_duration_seconds_bucket{stage="we\\"ird",le="0.0025"} 0' in text
+    assert 'execalc_stage_duration_seconds_bucket{stage="we\\"ird",le="0.005"} 1' in text
+    assert 'execalc_stage_duration_seconds_bucket{stage="we\\"ird",le="+Inf"} 1' in text
+    assert 'execalc_stage_duration_seconds_count{stage="we\\"ird"} 1' in text
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks import run, suite
+from benchmarks.harness import BenchResult, _percentile, compare, load_baseline, measure, write_results
+
+
+def _result(name: str = "x", **overrides) -> BenchResult:
+    fields = dict(
+        name=name, iterations=100, ops_per_sec=1000.0, mean_us=1000.0,
+        p50_us=900.0, p99_us=2000.0, peak_alloc_bytes=4096.0, retained_bytes_per_op=0.0,
+    )
+    fields.update(overrides)
+    return BenchResult(**fields)
+
+
+def test_percentile_interpolates():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert _percentile(values, 50) == 3.0
+    assert _percentile(values, 100) == 5.0
+    assert _percentile(values, 25) == 2.0
+    assert _percentile([], 99) == 0.0
+
+
+def test_measure_reports_counts_and_allocations():
+    result = measure("alloc", lambda: [0] * 1000, iterations=20, warmup=1)
+    assert result.iterations == 20
+    assert result.ops_per_sec > 0
+    assert result.p99_us >= result.p50_us
+    assert result.peak_alloc_bytes >= 8000
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {"x": _result().to_dict()}
+    current = [_result(p50_us=990.0, p99_us=2600.0, ops_per_sec=700.0)]
+    regressions = {r.metric: r for r in compare(current, baseline, threshold=0.15)}
+    assert set(regressions) == {"p99_us", "ops_per_sec"}
+    assert regressions["p99_us"].change == 0.3
+    assert regressions["ops_per_sec"].change == 0.3
+
+
+def test_compare_ignores_improvements_and_unknown_cases():
+    baseline = {"x": _result().to_dict()}
+    current = [_result(p50_us=100.0, ops_per_sec=9000.0), _result("new", p50_us=1e9)]
+    assert compare(current, baseline, threshold=0.15) == []
+
+
+def test_results_round_trip_through_baseline_file(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    write_results(path, [_result()], {"corpus_size": 10})
+    assert json.loads(open(path).read())["meta"] == {"corpus_size": 10}
+    assert load_baseline(path)["x"]["p50_us"] == 900.0
+
+
+def test_select_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        suite.select(["nope"])
+
+
+def test_every_case_runs_on_a_tiny_corpus():
+    results = run.run(corpus_size=60, iterations=3)
+    assert [r.name for r in results] == [c.name for c in suite.CASES]
+    assert all(r.ops_per_sec > 0 for r in results)
+
+
+def test_main_exits_nonzero_on_regression(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+    write_results(path, [_result("evaluate_type_gate", ops_per_sec=1e12, p50_us=1e-6, p99_us=1e-6)], {})
+    code = run.main(["--only", "evaluate_type_gate", "--iterations", "5", "--baseline", path])
+    assert code == 1
+    assert "regression" in capsys.readouterr().out